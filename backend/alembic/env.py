@@ -11,7 +11,9 @@ import os
 from app.models import (
     User, Installer, Process, Dossier, Document, DocumentType,
     ExtractedField, FieldSchema, ValidationRule, ValidationResult,
-    HumanFeedback, Invoice, ActivityLog, AIConfiguration, ModelPerformanceMetrics
+    HumanFeedback, Invoice, ActivityLog, AIConfiguration, ModelPerformanceMetrics,
+    SearchOutbox, ReferenceCounter, ReviewSnapshot, ReviewSnapshotChange,
+    IngestionJob, UploadSession
 )
 # Import Base after models are loaded
 from app.core.database import Base
@@ -0,0 +1,47 @@
+"""add_review_snapshots
+
+Revision ID: a7c4e9f1d236
+Revises: f6b3d8e2a147
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c4e9f1d236'
+down_revision: Union[str, None] = 'f6b3d8e2a147'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Snapshots are built on first read; no backfill
+    op.create_table(
+        'review_snapshots',
+        sa.Column('dossier_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('generation', sa.BigInteger(), nullable=False),
+        sa.Column('built_generation', sa.BigInteger(), nullable=False),
+        sa.Column('snapshot', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['dossier_id'], ['dossiers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('dossier_id')
+    )
+    op.create_table(
+        'review_snapshot_changes',
+        sa.Column('dossier_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('changes', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['dossier_id'], ['dossiers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('dossier_id', 'version')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('review_snapshot_changes')
+    op.drop_table('review_snapshots')
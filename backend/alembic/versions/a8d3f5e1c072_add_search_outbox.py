@@ -0,0 +1,36 @@
+"""add_search_outbox
+
+Revision ID: a8d3f5e1c072
+Revises: f3a9c1d6b274
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d3f5e1c072'
+down_revision: Union[str, None] = 'f3a9c1d6b274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'search_outbox',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('entity_type', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('operation', sa.String(length=10), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_search_outbox_created_at', 'search_outbox', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_search_outbox_created_at', table_name='search_outbox')
+    op.drop_table('search_outbox')
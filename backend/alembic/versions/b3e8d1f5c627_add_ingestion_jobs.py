@@ -0,0 +1,52 @@
+"""add_ingestion_jobs
+
+Revision ID: b3e8d1f5c627
+Revises: a7c4e9f1d236
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8d1f5c627'
+down_revision: Union[str, None] = 'a7c4e9f1d236'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    ingestion_status_enum = postgresql.ENUM('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED', name='ingestionstatus', create_type=False)
+    ingestion_status_enum.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        'ingestion_jobs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('installer_id', sa.UUID(), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=False),
+        sa.Column('status', ingestion_status_enum, nullable=False),
+        sa.Column('total_dossiers', sa.Integer(), nullable=False),
+        sa.Column('total_documents', sa.Integer(), nullable=False),
+        sa.Column('processed_dossiers', sa.Integer(), nullable=False),
+        sa.Column('processed_documents', sa.Integer(), nullable=False),
+        sa.Column('total_bytes', sa.BigInteger(), nullable=False),
+        sa.Column('results', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('error', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['installer_id'], ['installers.id']),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ingestion_jobs_installer_id_created_at', 'ingestion_jobs', ['installer_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ingestion_jobs_installer_id_created_at', table_name='ingestion_jobs')
+    op.drop_table('ingestion_jobs')
+    postgresql.ENUM(name='ingestionstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,66 @@
+"""add_search_vectors
+
+Revision ID: b5e2c8f4a391
+Revises: a8d3f5e1c072
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e2c8f4a391'
+down_revision: Union[str, None] = 'a8d3f5e1c072'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table: generated tsvector expression (must match the models)
+SEARCH_VECTORS = {
+    'dossiers': (
+        "to_tsvector('simple', reference || ' ' || beneficiary_name || ' ' || beneficiary_address || ' ' "
+        "|| beneficiary_city || ' ' || beneficiary_postal_code)"
+    ),
+    'documents': "to_tsvector('french', original_filename || ' ' || left(coalesce(ocr_text, ''), 500000))",
+    'installers': "to_tsvector('simple', company_name || ' ' || siret || ' ' || city || ' ' || contact_name)",
+}
+
+# Table: column matched by substring
+TRIGRAM_COLUMNS = {
+    'dossiers': 'reference',
+    'documents': 'original_filename',
+    'installers': 'siret',
+}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, expression in SEARCH_VECTORS.items():
+        # Stored generated column: rewrites the table once, then maintained by Postgres
+        op.add_column(table, sa.Column(
+            'search_vector', postgresql.TSVECTOR(), sa.Computed(expression, persisted=True), nullable=True
+        ))
+
+    with op.get_context().autocommit_block():
+        for table, column in TRIGRAM_COLUMNS.items():
+            op.create_index(
+                f'ix_{table}_search_vector', table, ['search_vector'],
+                unique=False, postgresql_concurrently=True, postgresql_using='gin'
+            )
+            op.create_index(
+                f'ix_{table}_{column}_trgm', table, [column],
+                unique=False, postgresql_concurrently=True, postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'}
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in TRIGRAM_COLUMNS.items():
+            op.drop_index(f'ix_{table}_{column}_trgm', table_name=table, postgresql_concurrently=True)
+            op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_concurrently=True)
+
+    for table in SEARCH_VECTORS:
+        op.drop_column(table, 'search_vector')
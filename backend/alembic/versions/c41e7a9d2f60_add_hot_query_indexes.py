@@ -0,0 +1,86 @@
+"""add_hot_query_indexes
+
+Revision ID: c41e7a9d2f60
+Revises: dbb8b0321b3d
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7a9d2f60'
+down_revision: Union[str, None] = 'dbb8b0321b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    # ListDossiers: filters on installer/process/status/validator, ordered by created_at
+    ('ix_dossiers_created_at', 'dossiers', ['created_at'], None),
+    ('ix_dossiers_installer_id_created_at', 'dossiers', ['installer_id', 'created_at'], None),
+    ('ix_dossiers_process_id_created_at', 'dossiers', ['process_id', 'created_at'], None),
+    ('ix_dossiers_status_created_at', 'dossiers', ['status', 'created_at'], None),
+    ('ix_dossiers_assigned_validator_id_status', 'dossiers', ['assigned_validator_id', 'status'],
+     'assigned_validator_id IS NOT NULL'),
+    # Validation state, field review
+    ('ix_extracted_fields_dossier_id_status', 'extracted_fields', ['dossier_id', 'status'], None),
+    ('ix_validation_results_dossier_id_rule_id', 'validation_results', ['dossier_id', 'rule_id'], None),
+    # Billing: invoice lookup per dossier, listings and summaries by date
+    ('ix_invoices_dossier_id', 'invoices', ['dossier_id'], None),
+    ('ix_invoices_installer_id_created_at', 'invoices', ['installer_id', 'created_at'], None),
+    ('ix_invoices_created_at', 'invoices', ['created_at'], None),
+    # Feedback listings
+    ('ix_human_feedback_feedback_type_created_at', 'human_feedback', ['feedback_type', 'created_at'], None),
+    ('ix_human_feedback_dossier_id', 'human_feedback', ['dossier_id'], None),
+    # Activity timelines per entity and per user
+    ('ix_activity_logs_user_id_created_at', 'activity_logs', ['user_id', 'created_at'], None),
+]
+
+# Single-column indexes covered by a composite index above (same leading column).
+# Both tables take the heaviest write volume, so the redundant index is dropped.
+REDUNDANT_INDEXES = [
+    ('ix_extracted_fields_dossier_id', 'extracted_fields', ['dossier_id']),
+    ('ix_validation_results_dossier_id', 'validation_results', ['dossier_id']),
+]
+
+
+def upgrade() -> None:
+    # Build concurrently so large tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None
+            )
+
+        # Entity timelines filter on (entity_type, entity_id) and order by created_at
+        op.create_index(
+            'idx_activity_logs_entity_created', 'activity_logs', ['entity_type', 'entity_id', 'created_at'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.drop_index('idx_activity_logs_entity', table_name='activity_logs', postgresql_concurrently=True)
+        op.execute('ALTER INDEX idx_activity_logs_entity_created RENAME TO idx_activity_logs_entity')
+
+        for name, table, columns in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REDUNDANT_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+        op.create_index(
+            'idx_activity_logs_entity_old', 'activity_logs', ['entity_type', 'entity_id'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.drop_index('idx_activity_logs_entity', table_name='activity_logs', postgresql_concurrently=True)
+        op.execute('ALTER INDEX idx_activity_logs_entity_old RENAME TO idx_activity_logs_entity')
+
+        for name, table, columns, where in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""add_upload_sessions
+
+Revision ID: c9f2a6d4e813
+Revises: b3e8d1f5c627
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9f2a6d4e813'
+down_revision: Union[str, None] = 'b3e8d1f5c627'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'upload_sessions',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('dossier_id', sa.UUID(), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=False),
+        sa.Column('document_type_id', sa.UUID(), nullable=True),
+        sa.Column('filename', sa.String(), nullable=False),
+        sa.Column('content_type', sa.String(), nullable=False),
+        sa.Column('total_size', sa.BigInteger(), nullable=False),
+        sa.Column('offset', sa.BigInteger(), nullable=False),
+        sa.Column('checksum', sa.String(), nullable=True),
+        sa.Column('storage_path', sa.String(), nullable=False),
+        sa.Column('s3_upload_id', sa.String(), nullable=True),
+        sa.Column('parts', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['dossier_id'], ['dossiers.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
+        sa.ForeignKeyConstraint(['document_type_id'], ['document_types.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_upload_sessions_expires_at', 'upload_sessions', ['expires_at'], unique=False)
+    op.create_index('ix_upload_sessions_dossier_id', 'upload_sessions', ['dossier_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_upload_sessions_dossier_id', table_name='upload_sessions')
+    op.drop_index('ix_upload_sessions_expires_at', table_name='upload_sessions')
+    op.drop_table('upload_sessions')
@@ -0,0 +1,35 @@
+"""add_updated_at_indexes
+
+Revision ID: d2f7a4b9c613
+Revises: b5e2c8f4a391
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f7a4b9c613'
+down_revision: Union[str, None] = 'b5e2c8f4a391'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Rows changed since the last autocomplete refresh
+        op.create_index(
+            'ix_dossiers_updated_at', 'dossiers', ['updated_at'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_installers_updated_at', 'installers', ['updated_at'],
+            unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_installers_updated_at', table_name='installers', postgresql_concurrently=True)
+        op.drop_index('ix_dossiers_updated_at', table_name='dossiers', postgresql_concurrently=True)
@@ -0,0 +1,46 @@
+"""add_reference_counters
+
+Revision ID: e4a1c7d3b958
+Revises: d2f7a4b9c613
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a1c7d3b958'
+down_revision: Union[str, None] = 'd2f7a4b9c613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'reference_counters',
+        sa.Column('prefix', sa.String(length=10), nullable=False),
+        sa.Column('year', sa.Integer(), nullable=False),
+        sa.Column('value', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('prefix', 'year')
+    )
+    # Continue after the highest number already issued for each year
+    op.execute(r"""
+        INSERT INTO reference_counters (prefix, year, value)
+        SELECT 'DOS', split_part(reference, '-', 2)::integer, max(split_part(reference, '-', 3)::bigint)
+        FROM dossiers
+        WHERE reference ~ '^DOS-\d{4}-\d+$'
+        GROUP BY 2
+    """)
+    op.execute(r"""
+        INSERT INTO reference_counters (prefix, year, value)
+        SELECT 'INV', split_part(invoice_number, '-', 2)::integer, max(split_part(invoice_number, '-', 3)::bigint)
+        FROM invoices
+        WHERE invoice_number ~ '^INV-\d{4}-\d+$'
+        GROUP BY 2
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('reference_counters')
@@ -0,0 +1,110 @@
+"""partition_activity_logs
+
+Revision ID: e7b2d4c8a915
+Revises: c41e7a9d2f60
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2d4c8a915'
+down_revision: Union[str, None] = 'c41e7a9d2f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, user_id, action_type, entity_type, entity_id, entity_reference, description, "
+    "metadata, ip_address, user_agent, duration_ms, created_at"
+)
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_activity_logs_id', 'activity_logs', ['id'], unique=False)
+    op.create_index('ix_activity_logs_created_at', 'activity_logs', ['created_at'], unique=False)
+    op.create_index('ix_activity_logs_entity_type', 'activity_logs', ['entity_type'], unique=False)
+    op.create_index('ix_activity_logs_user_id', 'activity_logs', ['user_id'], unique=False)
+    op.create_index('idx_activity_logs_entity', 'activity_logs', ['entity_type', 'entity_id', 'created_at'], unique=False)
+    op.create_index('ix_activity_logs_user_id_created_at', 'activity_logs', ['user_id', 'created_at'], unique=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.execute('ALTER TABLE activity_logs RENAME TO activity_logs_unpartitioned')
+
+    # The partition key must be part of the primary key
+    op.execute("""
+        CREATE TABLE activity_logs (
+            id UUID NOT NULL,
+            user_id UUID REFERENCES users (id),
+            action_type VARCHAR(100) NOT NULL,
+            entity_type VARCHAR(50) NOT NULL,
+            entity_id UUID,
+            entity_reference VARCHAR(100),
+            description TEXT,
+            metadata JSON NOT NULL,
+            ip_address INET,
+            user_agent TEXT,
+            duration_ms INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    # Monthly partitions from the oldest row to a few months ahead
+    oldest = bind.execute(sa.text(
+        "SELECT date_trunc('month', min(created_at))::date FROM activity_logs_unpartitioned"
+    )).scalar()
+    current = date.today().replace(day=1)
+    month = min(oldest, current) if oldest else current
+    last = _add_months(current, MONTHS_AHEAD)
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE activity_logs_y{month.year}m{month.month:02d} PARTITION OF activity_logs "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+    # Safety net for rows outside the maintained range
+    op.execute('CREATE TABLE activity_logs_default PARTITION OF activity_logs DEFAULT')
+
+    op.execute(f'INSERT INTO activity_logs ({COLUMNS}) SELECT {COLUMNS} FROM activity_logs_unpartitioned')
+    op.execute('DROP TABLE activity_logs_unpartitioned')
+
+    # Indexes on the parent cascade to every partition
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE activity_logs RENAME TO activity_logs_partitioned')
+    op.create_table('activity_logs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=True),
+        sa.Column('action_type', sa.String(length=100), nullable=False),
+        sa.Column('entity_type', sa.String(length=50), nullable=False),
+        sa.Column('entity_id', sa.UUID(), nullable=True),
+        sa.Column('entity_reference', sa.String(length=100), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('metadata', sa.JSON(), nullable=False),
+        sa.Column('ip_address', sa.dialects.postgresql.INET(), nullable=True),
+        sa.Column('user_agent', sa.Text(), nullable=True),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(f'INSERT INTO activity_logs ({COLUMNS}) SELECT {COLUMNS} FROM activity_logs_partitioned')
+    # Dropping the parent drops its partitions and their indexes
+    op.execute('DROP TABLE activity_logs_partitioned')
+    _create_indexes()
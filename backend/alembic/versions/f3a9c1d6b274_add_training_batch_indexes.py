@@ -0,0 +1,37 @@
+"""add_training_batch_indexes
+
+Revision ID: f3a9c1d6b274
+Revises: e7b2d4c8a915
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c1d6b274'
+down_revision: Union[str, None] = 'e7b2d4c8a915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Unbatched feedback, oldest first, for the training dataset builder
+        op.create_index(
+            'ix_human_feedback_unbatched_created_at', 'human_feedback', ['created_at'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text('training_batch_id IS NULL')
+        )
+        op.create_index(
+            'ix_human_feedback_training_batch_id', 'human_feedback', ['training_batch_id'],
+            unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_human_feedback_training_batch_id', table_name='human_feedback', postgresql_concurrently=True)
+        op.drop_index('ix_human_feedback_unbatched_created_at', table_name='human_feedback', postgresql_concurrently=True)
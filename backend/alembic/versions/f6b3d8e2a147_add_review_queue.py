@@ -0,0 +1,45 @@
+"""add_review_queue
+
+Revision ID: f6b3d8e2a147
+Revises: e4a1c7d3b958
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b3d8e2a147'
+down_revision: Union[str, None] = 'e4a1c7d3b958'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('dossiers', sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('dossiers', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+    with op.get_context().autocommit_block():
+        # Next dossier to review: highest priority, oldest submission
+        op.create_index(
+            'ix_dossiers_review_queue', 'dossiers', [sa.text('priority DESC'), 'submitted_at'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text("status = 'AWAITING_REVIEW'")
+        )
+        # Claims whose lease expired
+        op.create_index(
+            'ix_dossiers_lease_expires_at', 'dossiers', ['lease_expires_at'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text("status = 'IN_REVIEW'")
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_dossiers_lease_expires_at', table_name='dossiers', postgresql_concurrently=True)
+        op.drop_index('ix_dossiers_review_queue', table_name='dossiers', postgresql_concurrently=True)
+
+    op.drop_column('dossiers', 'lease_expires_at')
+    op.drop_column('dossiers', 'claimed_at')
@@ -5,7 +5,7 @@ from datetime import date
 from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, require_role
@@ -13,6 +13,7 @@ from app.models.user import User, UserRole
 from app.models.invoice import Invoice
 from app.models.dossier import Dossier
 from app.schemas.billing import InvoiceResponse, BillingSummary, PaymentRecord
+from app.services.reference_numbers import INVOICE_PREFIX, next_reference
 
 router = APIRouter(prefix="/api/billing", tags=["billing"])
 
@@ -109,9 +110,7 @@ async def generate_invoice(
         )
     
     # Generate invoice number
-    count_result = await db.execute(select(func.count(Invoice.id)))
-    count = count_result.scalar() or 0
-    invoice_number = f"INV-{date.today().year}-{count + 1:06d}"
+    invoice_number = await next_reference(db, INVOICE_PREFIX)
     
     # Calculate total amount
     total_amount = Decimal("0.00")
@@ -1,7 +1,6 @@
 """Dossier management endpoints."""
 from typing import Annotated, Optional
 from uuid import UUID
-from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
@@ -14,6 +13,7 @@ from app.models.installer import Installer
 from app.models.process import Process
 from app.schemas.dossier import DossierCreate, DossierUpdate, DossierResponse, DossierListResponse
 from app.services.activity import ActivityLogger
+from app.services.reference_numbers import DOSSIER_PREFIX, next_reference
 
 router = APIRouter(prefix="/api/dossiers", tags=["dossiers"])
 
@@ -41,10 +41,8 @@ async def create_dossier(
     if not installer:
         raise HTTPException(status_code=404, detail="Installer not found")
     
-    # Generate reference
-    count_result = await db.execute(select(func.count(Dossier.id)))
-    count = count_result.scalar() or 0
-    reference = f"DOS-{datetime.now().year}-{count + 1:06d}"
+    # Allocate reference (counter row stays locked until commit)
+    reference = await next_reference(db, DOSSIER_PREFIX)
     
     # Create dossier
     dossier = Dossier(
@@ -25,7 +25,15 @@ class Settings(BaseSettings):
     # Redis (for caching and state management)
     REDIS_URL: str = "redis://localhost:6379"
     REDIS_TTL: int = 3600  # Default TTL in seconds
-    
+
+    # Cache (in-process LRU tier + optional Redis tier)
+    CACHE_ENABLED: bool = True
+    CACHE_REDIS_ENABLED: bool = False  # Enable the shared Redis tier and pub/sub invalidation
+    CACHE_LOCAL_MAX_ENTRIES: int = 2048
+    CACHE_LOCAL_TTL: int = 300  # TTL of in-process entries in seconds
+    CACHE_KEY_PREFIX: str = "cee"
+    CACHE_ACCOUNT_CHECK_TTL: int = 5  # Seconds a user's active flag and role are trusted for response cache hits
+
     # JWT
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
@@ -47,6 +55,24 @@ class Settings(BaseSettings):
     TYPESENSE_PORT: int = 8108
     TYPESENSE_PROTOCOL: str = "http"
     TYPESENSE_API_KEY: str = "xyz"
+    TYPESENSE_POOL_SIZE: int = 20  # Keep-alive connections shared by all searches
+    TYPESENSE_TIMEOUT_SECONDS: float = 2.0
+    SEARCH_CACHE_TTL: int = 10  # Seconds a search result is reused
+    SEARCH_CACHE_MAX_ENTRIES: int = 2048
+    SEARCH_BACKEND: str = "auto"  # auto (Typesense, Postgres while it is unhealthy), typesense or postgres
+    SEARCH_HEALTH_CHECK_INTERVAL: int = 15  # Seconds between Typesense health checks
+    SEARCH_HEALTH_CHECK_TIMEOUT_SECONDS: float = 0.5
+    SEARCH_INDEXER_ENABLED: bool = True  # Drain the search outbox into Typesense in the background
+    SEARCH_INDEX_BATCH_SIZE: int = 500  # Outbox rows (and reindex documents) per import call
+    SEARCH_INDEX_INTERVAL_MS: int = 1000  # Poll interval when the outbox is drained
+    TYPESENSE_IMPORT_TIMEOUT_SECONDS: float = 30.0
+    AUTOCOMPLETE_ENABLED: bool = True  # In-memory prefix index for /api/search/autocomplete
+    AUTOCOMPLETE_REFRESH_INTERVAL_MS: int = 2000  # Poll interval for changed dossiers and installers
+    AUTOCOMPLETE_REBUILD_INTERVAL_MINUTES: int = 60  # Full rebuild (drops entities deleted by other workers)
+    QUEUE_LEASE_SECONDS: int = 900  # A claimed dossier returns to the review queue unless renewed
+    QUEUE_DEFAULT_MAX_CONCURRENT: int = 10  # Claimed dossiers per validator without a Validator record
+    QUEUE_RECLAIM_INTERVAL_SECONDS: int = 30  # Expired lease sweep and queue metrics (0 disables)
+    QUEUE_RECLAIM_BATCH_SIZE: int = 500
     
     # AI Providers (defaults, can be overridden in database)
     OPENAI_API_KEY: Optional[str] = None
@@ -61,6 +87,38 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     PORT: int = 8000
     
+    # Response serialization and compression
+    JSON_SERIALIZER: str = "auto"  # "auto" (orjson when installed), "orjson" or "stdlib"
+    RESPONSE_COMPRESSION_ENABLED: bool = True
+    RESPONSE_COMPRESSION_MIN_SIZE: int = 1024  # Bytes; smaller bodies are sent uncompressed
+    RESPONSE_GZIP_LEVEL: int = 6
+    RESPONSE_BROTLI_QUALITY: int = 4
+
+    # Instrumentation
+    METRICS_ENABLED: bool = True  # Per-step metrics at GET /metrics
+    SERVER_TIMING_ENABLED: bool = False  # Add Server-Timing headers (db/app durations) to responses
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: int = 200
+    SLOW_QUERY_LOG_SIZE: int = 200  # Entries kept in the in-memory ring buffer
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.2  # Fraction of slow queries re-planned with EXPLAIN ANALYZE
+
+    # Activity logging
+    ACTIVITY_LOG_ASYNC: bool = True  # Queue entries and write them in batches
+    ACTIVITY_LOG_BATCH_SIZE: int = 500
+    ACTIVITY_LOG_FLUSH_INTERVAL_MS: int = 200
+    ACTIVITY_LOG_MAX_QUEUE: int = 10000  # Producers wait for a flush beyond this
+    ACTIVITY_LOG_PARTITION_MONTHS_AHEAD: int = 3  # Monthly partitions created ahead of time
+    ACTIVITY_LOG_RETENTION_MONTHS: int = 12  # Older partitions are archived to storage and dropped (0 keeps all)
+    ACTIVITY_LOG_MAINTENANCE_INTERVAL_HOURS: int = 6  # Background partition maintenance (0 disables)
+
+    # Server-sent events
+    EVENTS_ENABLED: bool = True
+    EVENTS_REDIS_ENABLED: bool = False  # Fan events out to all workers over Redis pub/sub
+    EVENTS_HEARTBEAT_SECONDS: int = 15
+    EVENTS_REPLAY_SIZE: int = 1000  # Recent events kept per worker for Last-Event-ID resume
+    EVENTS_MAX_QUEUED: int = 256  # Per connection; slower clients are disconnected and resume
+    EVENTS_MAX_QUEUED_BYTES: int = 1048576
+
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 100
     
@@ -68,6 +126,33 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
     
+    # Bulk operations
+    BULK_MAX_DOSSIERS: int = 500  # Dossier ids accepted per bulk request
+    
+    # Bulk ingestion
+    INGEST_MAX_DOSSIERS: int = 2000  # Dossiers accepted per ingestion job
+    INGEST_MAX_UPLOAD_BYTES: int = 2 * 1024 * 1024 * 1024  # Whole request body (archive or files), 2GB
+    INGEST_CHUNK_SIZE: int = 100  # Dossiers created per transaction
+    INGEST_UPLOAD_CONCURRENCY: int = 8  # Documents streamed to storage at once
+    INGEST_JOB_STALE_MINUTES: int = 60  # Unfinished jobs without progress for this long are failed (0 disables)
+    
+    # Resumable uploads
+    UPLOAD_MAX_SIZE: int = 2 * 1024 * 1024 * 1024  # Largest document accepted through resumable uploads, 2GB
+    UPLOAD_MAX_CHUNK_SIZE: int = 64 * 1024 * 1024  # Bytes accepted per PATCH request
+    UPLOAD_EXPIRATION_HOURS: int = 24  # Uploads without a chunk for this long are aborted
+    UPLOAD_CLEANUP_INTERVAL_MINUTES: int = 30  # How often expired uploads are aborted (0 disables)
+    
+    # Review snapshots
+    REVIEW_SNAPSHOT_HISTORY: int = 50  # Versions of changes kept per dossier for ?since_version=
+    
+    # Exports
+    EXPORT_CHUNK_SIZE: int = 1000  # Rows fetched and encoded per batch
+    
+    # Training dataset builder
+    TRAINING_DATASET_FORMAT: str = "jsonl"  # jsonl (gzip) or parquet
+    TRAINING_SHARD_SIZE: int = 10000  # Records per shard file
+    TRAINING_BATCH_MAX_FEEDBACK: int = 100000  # Feedback rows claimed per run
+    
     class Config:
         # Prioritize environment variables over .env file
         # Environment variables take precedence by default in Pydantic Settings
@@ -3,6 +3,8 @@ from typing import AsyncGenerator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker, AsyncEngine
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.slow_queries import slow_query_log
 import logging
 
 logger = logging.getLogger(__name__)
@@ -68,6 +70,8 @@ def get_engine() -> AsyncEngine:
                 echo=settings.DEBUG,
                 future=True,
             )
+            instrument_engine(_engine)
+            slow_query_log.attach(_engine)
         except Exception as e:
             logger.error(f"Failed to create database engine: {e}")
             raise ValueError(
@@ -0,0 +1,262 @@
+"""Per-step request and SQL instrumentation.
+
+Each request handled by the Motia server gets a ``RequestStats`` object in a
+context variable; SQLAlchemy engine events add statement counts and database
+time to it. When the request finishes, the stats are folded into
+Prometheus-style counters and histograms labelled by step name
+(``config["name"]``), rendered at ``GET /metrics``.
+"""
+import bisect
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+UNMATCHED_STEP = "unmatched"
+
+
+@dataclass
+class RequestStats:
+    """Measurements collected while a single request is handled."""
+    step: str = UNMATCHED_STEP
+    started_at: float = field(default_factory=time.perf_counter)
+    sql_statements: int = 0
+    sql_seconds: float = 0.0
+    # Named sub-operation durations (seconds), reported in Server-Timing
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("motia_request_stats", default=None)
+
+
+def begin_request() -> RequestStats:
+    """Start collecting stats for the current request."""
+    stats = RequestStats()
+    _current_request.set(stats)
+    return stats
+
+
+def current_request() -> Optional[RequestStats]:
+    """Stats of the request being handled, or None outside a request."""
+    return _current_request.get()
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """Add a named duration (e.g. one search collection) to the current request."""
+    stats = _current_request.get()
+    if stats is not None:
+        stats.timings[name] = stats.timings.get(name, 0.0) + seconds
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    """Monotonic counter with labels."""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self):
+        for labels, value in self.values.items():
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+class Gauge:
+    """Value that goes up and down, with labels."""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self.values[labels] = value
+
+    def samples(self):
+        for labels, value in self.values.items():
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+class Histogram:
+    """Cumulative histogram with labels."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        # [per-bucket counts..., +Inf count, sum]
+        series = self.values.get(labels)
+        if series is None:
+            series = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def samples(self):
+        for labels, series in self.values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                yield f"{self.name}_bucket", _format_labels(self.labelnames, labels, f'le="{le}"'), cumulative
+            yield f"{self.name}_sum", _format_labels(self.labelnames, labels), series[-1]
+            yield f"{self.name}_count", _format_labels(self.labelnames, labels), cumulative
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+step_requests = registry.register(Counter(
+    "motia_step_requests_total", "Requests handled per step.", ("step", "method", "status")
+))
+step_latency = registry.register(Histogram(
+    "motia_step_duration_seconds", "Request latency per step.", ("step",)
+))
+step_sql_statements = registry.register(Histogram(
+    "motia_step_sql_statements", "SQL statements executed per request.", ("step",), buckets=STATEMENT_BUCKETS
+))
+step_sql_duration = registry.register(Histogram(
+    "motia_step_sql_duration_seconds", "Total database time per request.", ("step",)
+))
+step_request_bytes = registry.register(Histogram(
+    "motia_step_request_bytes", "Request body size per step.", ("step",), buckets=SIZE_BUCKETS
+))
+step_response_bytes = registry.register(Histogram(
+    "motia_step_response_bytes", "Response body size per step.", ("step",), buckets=SIZE_BUCKETS
+))
+search_latency = registry.register(Histogram(
+    "search_collection_duration_seconds", "Search latency per collection and backend (cache misses).", ("collection", "backend")
+))
+search_indexed_documents = registry.register(Counter(
+    "search_indexed_documents_total", "Documents written to or deleted from Typesense.", ("collection", "action")
+))
+
+queue_depth = registry.register(Gauge(
+    "validation_queue_depth", "Dossiers awaiting review per priority.", ("priority",)
+))
+queue_oldest_age = registry.register(Gauge(
+    "validation_queue_oldest_age_seconds", "Age of the oldest dossier awaiting review per priority.", ("priority",)
+))
+queue_claims = registry.register(Counter(
+    "validation_queue_claims_total", "Next-dossier requests by outcome.", ("outcome",)
+))
+queue_reclaimed = registry.register(Counter(
+    "validation_queue_reclaimed_total", "Claimed dossiers returned to the queue after their lease expired."
+))
+ingested_dossiers = registry.register(Counter(
+    "ingestion_dossiers_total", "Dossiers created by bulk ingestion jobs."
+))
+ingested_documents = registry.register(Counter(
+    "ingestion_documents_total", "Documents stored and created by bulk ingestion jobs."
+))
+ingestion_jobs = registry.register(Counter(
+    "ingestion_jobs_total", "Finished bulk ingestion jobs by status.", ("status",)
+))
+upload_bytes = registry.register(Counter(
+    "resumable_upload_bytes_total", "Bytes stored by resumable upload chunks."
+))
+uploads_finished = registry.register(Counter(
+    "resumable_uploads_total", "Finished resumable uploads by outcome.", ("outcome",)
+))
+
+def record_request(stats: RequestStats, method: str, status: int, request_bytes: int, response_bytes: int) -> float:
+    """Fold a finished request into the step metrics. Returns its latency in seconds."""
+    elapsed = stats.elapsed
+    step_requests.inc(stats.step, method, str(status))
+    step_latency.observe(elapsed, stats.step)
+    step_sql_statements.observe(stats.sql_statements, stats.step)
+    step_sql_duration.observe(stats.sql_seconds, stats.step)
+    step_request_bytes.observe(request_bytes, stats.step)
+    step_response_bytes.observe(response_bytes, stats.step)
+    return elapsed
+
+
+def server_timing(stats: RequestStats, elapsed: float) -> str:
+    """``Server-Timing`` header value for a finished request."""
+    parts = [
+        f'db;dur={stats.sql_seconds * 1000:.1f};desc="{stats.sql_statements} queries"',
+        *(f"{name};dur={seconds * 1000:.1f}" for name, seconds in stats.timings.items()),
+        f"app;dur={elapsed * 1000:.1f}",
+    ]
+    return ", ".join(parts)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = _current_request.get()
+    if stats is not None:
+        stats.sql_statements += 1
+        stats.sql_seconds += time.perf_counter() - started
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Count statements and database time of ``engine`` against the current request."""
+    if not settings.METRICS_ENABLED:
+        return
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
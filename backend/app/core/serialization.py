@@ -0,0 +1,136 @@
+"""JSON serialization and compression for HTTP responses.
+
+Handlers may return UUID, datetime/date/time, Decimal, Enum and IP address
+values directly; they are encoded as strings, ISO 8601 strings, floats, enum
+values and strings respectively. orjson is used when installed, the stdlib otherwise.
+"""
+import enum
+import gzip
+import ipaddress
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Optional, Protocol
+from uuid import UUID
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    brotli = None
+
+from app.core.config import settings
+
+
+def json_default(obj: Any) -> Any:
+    """Encode types the JSON encoders do not handle natively."""
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (ipaddress.IPv4Address, ipaddress.IPv6Address, ipaddress.IPv4Interface, ipaddress.IPv6Interface)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONSerializer(Protocol):
+    """Serializer interface used by the Motia server."""
+    name: str
+
+    def dumps(self, obj: Any) -> bytes:
+        ...
+
+
+class StdlibJSONSerializer:
+    """Serializer backed by the standard library ``json`` module."""
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, default=json_default, separators=(",", ":")).encode()
+
+
+class OrjsonSerializer:
+    """Serializer backed by orjson (UUID, datetime and Enum are native)."""
+    name = "orjson"
+
+    def __init__(self):
+        if not ORJSON_AVAILABLE:
+            raise ImportError("orjson module not installed. Install it with: pip install orjson")
+        self.option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=json_default, option=self.option)
+
+
+def _create_serializer(name: str) -> JSONSerializer:
+    if name == "orjson" or (name == "auto" and ORJSON_AVAILABLE):
+        return OrjsonSerializer()
+    return StdlibJSONSerializer()
+
+
+_serializer: JSONSerializer = _create_serializer(settings.JSON_SERIALIZER)
+
+
+def get_serializer() -> JSONSerializer:
+    """Return the active serializer."""
+    return _serializer
+
+
+def set_serializer(serializer: JSONSerializer) -> None:
+    """Replace the active serializer (e.g. for benchmarks)."""
+    global _serializer
+    _serializer = serializer
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to JSON bytes with the active serializer."""
+    return _serializer.dumps(obj)
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> set:
+    """Content codings of an Accept-Encoding header, without those refused with q=0."""
+    accepted = set()
+    for item in (accept_encoding or "").lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip())
+    return accepted
+
+
+def choose_encoding(accept_encoding: Optional[str], size: int) -> Optional[str]:
+    """Pick a content coding for a body of ``size`` bytes, or None to send it as is."""
+    if not settings.RESPONSE_COMPRESSION_ENABLED or size < settings.RESPONSE_COMPRESSION_MIN_SIZE:
+        return None
+    if not accept_encoding:
+        return None
+
+    accepted = accepted_encodings(accept_encoding)
+    if BROTLI_AVAILABLE and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress ``body`` with the given content coding."""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.RESPONSE_BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=settings.RESPONSE_GZIP_LEVEL)
+    raise ValueError(f"Unsupported content coding: {encoding}")
@@ -0,0 +1,183 @@
+"""Slow-query log with sampled EXPLAIN capture.
+
+Statements slower than ``SLOW_QUERY_THRESHOLD_MS`` are kept in a ring buffer
+with the step that issued them and the shape (not the values) of their
+parameters. A sample of them is re-planned in the background with
+``EXPLAIN (ANALYZE, BUFFERS)`` inside a rolled-back transaction; statements
+other than SELECT, and SELECTs calling functions with side effects such as
+``pg_advisory_lock``, are only planned, never executed again. The log is shown
+in Database Studio.
+"""
+import asyncio
+import contextvars
+import itertools
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.metrics import current_request
+
+logger = logging.getLogger(__name__)
+
+MAX_STATEMENT_LENGTH = 4000
+EXPLAIN_TIMEOUT_MS = 10000
+EXPLAIN_DEDUP_SECONDS = 300  # Do not re-plan an identical statement within this window
+
+# Functions with side effects that a rollback does not undo (session-level
+# advisory locks, sequence values, notifications, session settings); statements
+# calling them are only planned
+VOLATILE_FUNCTIONS = (
+    "pg_advisory", "pg_try_advisory", "nextval", "setval", "pg_notify",
+    "set_config", "pg_cancel_backend", "pg_terminate_backend",
+)
+
+
+@dataclass
+class SlowQuery:
+    """A statement that exceeded the slow-query threshold."""
+    id: int
+    statement: str
+    duration_ms: float
+    step: Optional[str]
+    parameters: List[str]
+    executemany: bool
+    recorded_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    plan: Optional[Any] = None
+    plan_status: str = "not_sampled"  # not_sampled, pending, captured, skipped, failed
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def parameter_shape(parameters: Any, executemany: bool) -> List[str]:
+    """Describe parameters by type only, so values never reach the log."""
+    if executemany and parameters:
+        parameters = parameters[0]
+    if isinstance(parameters, dict):
+        return [f"{name}:{type(value).__name__}" for name, value in parameters.items()]
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return []
+
+
+def _is_read_only(statement: str) -> bool:
+    """Whether re-executing the statement under EXPLAIN ANALYZE is harmless."""
+    upper = statement.lstrip().upper()
+    head = upper.split(None, 1)[0] if upper else ""
+    if head not in ("SELECT", "WITH", "VALUES", "TABLE"):
+        return False
+    if any(clause in upper for clause in ("FOR UPDATE", "FOR SHARE", "FOR NO KEY UPDATE", "INSERT ", "UPDATE ", "DELETE ")):
+        return False
+    lower = upper.lower()
+    return not any(function in lower for function in VOLATILE_FUNCTIONS)
+
+
+class SlowQueryLog:
+    """Ring buffer of slow statements attached to an engine."""
+
+    def __init__(self, max_entries: int = 200):
+        self.entries: Deque[SlowQuery] = deque(maxlen=max_entries)
+        self._ids = itertools.count(1)
+        self._engine: Optional[AsyncEngine] = None
+        self._explained_at: Dict[str, float] = {}
+        self._explain_tasks: set = set()
+        self.explain_running = False
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Time every statement executed through ``engine``."""
+        if not settings.SLOW_QUERY_LOG_ENABLED:
+            return
+        self._engine = engine
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._slow_query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slow_query_started", None)
+        if started is None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS or statement.lstrip().upper().startswith("EXPLAIN"):
+            return
+
+        request = current_request()
+        entry = SlowQuery(
+            id=next(self._ids),
+            statement=statement[:MAX_STATEMENT_LENGTH],
+            duration_ms=round(duration_ms, 2),
+            step=request.step if request is not None else None,
+            parameters=parameter_shape(parameters, executemany),
+            executemany=executemany,
+        )
+        self.entries.append(entry)
+        logger.warning(f"Slow query ({entry.duration_ms} ms, step={entry.step}): {entry.statement[:200]}")
+
+        if not executemany and self._should_explain(statement):
+            entry.plan_status = "pending"
+            self._schedule_explain(entry, statement, parameters)
+
+    def _should_explain(self, statement: str) -> bool:
+        if self.explain_running or random.random() >= settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE:
+            return False
+        now = time.monotonic()
+        if now - self._explained_at.get(statement, float("-inf")) < EXPLAIN_DEDUP_SECONDS:
+            return False
+        if len(self._explained_at) > 1000:
+            self._explained_at.clear()
+        self._explained_at[statement] = now
+        return True
+
+    def _schedule_explain(self, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            entry.plan_status = "skipped"
+            return
+        self.explain_running = True
+        # Run outside the request context so the EXPLAIN is not counted against the step
+        task = contextvars.Context().run(loop.create_task, self._capture_plan(entry, statement, parameters))
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+    async def _capture_plan(self, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        """EXPLAIN a statement on a separate connection, always rolling back."""
+        options = "ANALYZE, BUFFERS, FORMAT JSON" if _is_read_only(statement) else "FORMAT JSON"
+        params = tuple(parameters.values()) if isinstance(parameters, dict) else tuple(parameters or ())
+        try:
+            async with self._engine.connect() as conn:
+                transaction = await conn.begin()
+                try:
+                    await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {EXPLAIN_TIMEOUT_MS}")
+                    result = await conn.exec_driver_sql(f"EXPLAIN ({options}) {statement}", params)
+                    entry.plan = result.scalar()
+                    entry.plan_status = "captured"
+                finally:
+                    await transaction.rollback()
+        except Exception as e:
+            entry.plan_status = "failed"
+            entry.plan = str(e)[:500]
+            logger.warning(f"Could not capture plan for slow query {entry.id}: {e}")
+        finally:
+            self.explain_running = False
+
+    def recent(self, limit: int = 100) -> List[dict]:
+        """Most recent entries first."""
+        return [entry.to_dict() for entry in itertools.islice(reversed(self.entries), limit)]
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self._explained_at.clear()
+
+
+slow_query_log = SlowQueryLog(max_entries=settings.SLOW_QUERY_LOG_SIZE)
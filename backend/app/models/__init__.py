@@ -15,6 +15,11 @@ from app.models.invoice import Invoice
 from app.models.activity_log import ActivityLog
 from app.models.ai_configuration import AIConfiguration
 from app.models.model_performance import ModelPerformanceMetrics
+from app.models.search_outbox import SearchOutbox
+from app.models.reference_counter import ReferenceCounter
+from app.models.review_snapshot import ReviewSnapshot, ReviewSnapshotChange
+from app.models.ingestion_job import IngestionJob, IngestionStatus
+from app.models.upload_session import UploadSession
 
 __all__ = [
     "User",
@@ -38,4 +43,11 @@ __all__ = [
     "ActivityLog",
     "AIConfiguration",
     "ModelPerformanceMetrics",
+    "SearchOutbox",
+    "ReferenceCounter",
+    "ReviewSnapshot",
+    "ReviewSnapshotChange",
+    "IngestionJob",
+    "IngestionStatus",
+    "UploadSession",
 ]
@@ -21,10 +21,13 @@ class ActivityLog(Base):
     ip_address = Column(INET, nullable=True)
     user_agent = Column(Text, nullable=True)
     duration_ms = Column(Integer, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    # Partition key of the monthly range partitions, hence part of the primary key
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False, index=True)
     
     # Indexes for common queries
     __table_args__ = (
-        Index("idx_activity_logs_entity", "entity_type", "entity_id"),
+        Index("idx_activity_logs_entity", "entity_type", "entity_id", "created_at"),
+        Index("ix_activity_logs_user_id_created_at", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
@@ -1,6 +1,6 @@
 """Document model."""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Numeric, Integer, BigInteger
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Computed, String, DateTime, ForeignKey, Enum, Numeric, Integer, BigInteger, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -40,6 +40,11 @@ class Document(Base):
     processed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Postgres full-text search fallback; OCR text is capped to stay under the tsvector size limit
+    search_vector = Column(TSVECTOR, Computed(
+        "to_tsvector('french', original_filename || ' ' || left(coalesce(ocr_text, ''), 500000))",
+        persisted=True
+    ))
     
     # Relationships
     dossier = relationship("Dossier", back_populates="documents")
@@ -47,3 +52,10 @@ class Document(Base):
     extracted_fields = relationship("ExtractedField", back_populates="document", cascade="all, delete-orphan")
     feedback = relationship("HumanFeedback", back_populates="document")
 
+    __table_args__ = (
+        Index("ix_documents_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_documents_original_filename_trgm", "original_filename",
+            postgresql_using="gin", postgresql_ops={"original_filename": "gin_trgm_ops"}
+        ),
+    )
@@ -1,6 +1,6 @@
 """Dossier model."""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Numeric, Integer
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Computed, String, DateTime, ForeignKey, Enum, Numeric, Integer, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -50,8 +50,17 @@ class Dossier(Base):
     validated_at = Column(DateTime(timezone=True), nullable=True)
     validated_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     processing_time_ms = Column(Integer, nullable=True)
+    # Work queue lease: set when a validator claims the dossier (see app.services.work_queue)
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Postgres full-text search fallback (see app.services.search.postgres_search)
+    search_vector = Column(TSVECTOR, Computed(
+        "to_tsvector('simple', reference || ' ' || beneficiary_name || ' ' || beneficiary_address || ' ' "
+        "|| beneficiary_city || ' ' || beneficiary_postal_code)",
+        persisted=True
+    ))
     
     # Relationships
     process = relationship("Process", back_populates="dossiers")
@@ -63,4 +72,31 @@ class Dossier(Base):
     validation_results = relationship("ValidationResult", back_populates="dossier", cascade="all, delete-orphan")
     feedback = relationship("HumanFeedback", back_populates="dossier")
     invoices = relationship("Invoice", back_populates="dossier")
-
+    
+    # Indexes for common queries
+    __table_args__ = (
+        Index("ix_dossiers_created_at", "created_at"),
+        Index("ix_dossiers_installer_id_created_at", "installer_id", "created_at"),
+        Index("ix_dossiers_process_id_created_at", "process_id", "created_at"),
+        Index("ix_dossiers_status_created_at", "status", "created_at"),
+        Index(
+            "ix_dossiers_assigned_validator_id_status", "assigned_validator_id", "status",
+            postgresql_where=text("assigned_validator_id IS NOT NULL")
+        ),
+        # Work queue: next dossier to review, expired leases
+        Index(
+            "ix_dossiers_review_queue", text("priority DESC"), "submitted_at",
+            postgresql_where=text("status = 'AWAITING_REVIEW'")
+        ),
+        Index(
+            "ix_dossiers_lease_expires_at", "lease_expires_at",
+            postgresql_where=text("status = 'IN_REVIEW'")
+        ),
+        Index("ix_dossiers_search_vector", "search_vector", postgresql_using="gin"),
+        # Incremental autocomplete refresh (rows changed since the last poll)
+        Index("ix_dossiers_updated_at", "updated_at"),
+        Index(
+            "ix_dossiers_reference_trgm", "reference",
+            postgresql_using="gin", postgresql_ops={"reference": "gin_trgm_ops"}
+        ),
+    )
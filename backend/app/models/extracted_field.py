@@ -1,5 +1,5 @@
 """Extracted Field model."""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Numeric, Integer, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Numeric, Integer, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -22,7 +22,8 @@ class ExtractedField(Base):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)
-    dossier_id = Column(UUID(as_uuid=True), ForeignKey("dossiers.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Indexed by the composite index below (leading column)
+    dossier_id = Column(UUID(as_uuid=True), ForeignKey("dossiers.id", ondelete="CASCADE"), nullable=False)
     field_schema_id = Column(UUID(as_uuid=True), ForeignKey("field_schemas.id"), nullable=True)
     field_name = Column(String(100), nullable=False)
     display_name = Column(String(255), nullable=False)
@@ -49,4 +50,8 @@ class ExtractedField(Base):
     marked_wrong_by_user = relationship("User", foreign_keys=[marked_wrong_by])
     confirmed_by_user = relationship("User", foreign_keys=[confirmed_by])
     feedback = relationship("HumanFeedback", back_populates="extracted_field")
-
+    
+    # Indexes for common queries
+    __table_args__ = (
+        Index("ix_extracted_fields_dossier_id_status", "dossier_id", "status"),
+    )
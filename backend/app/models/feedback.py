@@ -1,7 +1,7 @@
 """Human Feedback model."""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Numeric, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Numeric, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 import uuid
@@ -35,4 +35,15 @@ class HumanFeedback(Base):
     document = relationship("Document", back_populates="feedback")
     extracted_field = relationship("ExtractedField", back_populates="feedback")
     validator = relationship("User", foreign_keys=[validator_id])
-
+    
+    # Indexes for common queries
+    __table_args__ = (
+        Index("ix_human_feedback_feedback_type_created_at", "feedback_type", "created_at"),
+        Index("ix_human_feedback_dossier_id", "dossier_id"),
+        # Training dataset builder: unbatched feedback oldest first, then the rows of one batch
+        Index(
+            "ix_human_feedback_unbatched_created_at", "created_at",
+            postgresql_where=text("training_batch_id IS NULL")
+        ),
+        Index("ix_human_feedback_training_batch_id", "training_batch_id"),
+    )
@@ -0,0 +1,41 @@
+"""Ingestion job model."""
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Integer, BigInteger, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+import uuid
+import enum
+
+
+class IngestionStatus(str, enum.Enum):
+    """Ingestion job status enumeration."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class IngestionJob(Base):
+    """Batch of dossiers and documents submitted in one bulk ingestion request."""
+    __tablename__ = "ingestion_jobs"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    installer_id = Column(UUID(as_uuid=True), ForeignKey("installers.id"), nullable=False)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    status = Column(Enum(IngestionStatus), default=IngestionStatus.QUEUED, nullable=False)
+    total_dossiers = Column(Integer, nullable=False)
+    total_documents = Column(Integer, nullable=False)
+    processed_dossiers = Column(Integer, default=0, nullable=False)
+    processed_documents = Column(Integer, default=0, nullable=False)
+    total_bytes = Column(BigInteger, default=0, nullable=False)
+    # Created dossiers in manifest order: index, external_id, dossier_id, reference
+    results = Column(JSONB, default=list, nullable=False)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_ingestion_jobs_installer_id_created_at", "installer_id", "created_at"),
+    )
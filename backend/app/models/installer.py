@@ -1,6 +1,6 @@
 """Installer model."""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Date, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Computed, String, DateTime, ForeignKey, Boolean, Date, JSON, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -30,8 +30,21 @@ class Installer(Base):
     active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Postgres full-text search fallback (see app.services.search.postgres_search)
+    search_vector = Column(TSVECTOR, Computed(
+        "to_tsvector('simple', company_name || ' ' || siret || ' ' || city || ' ' || contact_name)",
+        persisted=True
+    ))
     
     # Relationships
     user = relationship("User", backref="installer")
     dossiers = relationship("Dossier", back_populates="installer")
 
+    __table_args__ = (
+        Index("ix_installers_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_installers_updated_at", "updated_at"),
+        Index(
+            "ix_installers_siret_trgm", "siret",
+            postgresql_using="gin", postgresql_ops={"siret": "gin_trgm_ops"}
+        ),
+    )
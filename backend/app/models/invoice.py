@@ -1,5 +1,5 @@
 """Invoice model."""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, Date, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, Date, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -32,4 +32,10 @@ class Invoice(Base):
     # Relationships
     dossier = relationship("Dossier", back_populates="invoices")
     installer = relationship("Installer", backref="invoices")
-
+    
+    # Indexes for common queries
+    __table_args__ = (
+        Index("ix_invoices_dossier_id", "dossier_id"),
+        Index("ix_invoices_installer_id_created_at", "installer_id", "created_at"),
+        Index("ix_invoices_created_at", "created_at"),
+    )
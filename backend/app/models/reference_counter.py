@@ -0,0 +1,12 @@
+"""Reference counter model."""
+from sqlalchemy import BigInteger, Column, Integer, String
+from app.core.database import Base
+
+
+class ReferenceCounter(Base):
+    """Last number allocated per reference prefix and year (``DOS``/``INV``)."""
+    __tablename__ = "reference_counters"
+    
+    prefix = Column(String(10), primary_key=True)
+    year = Column(Integer, primary_key=True)
+    value = Column(BigInteger, nullable=False)
@@ -0,0 +1,76 @@
+"""Review snapshot model.
+
+A review snapshot is the per-dossier part of the review screen (dossier,
+documents, validation results, extracted fields) materialized as JSONB. Any
+change to those rows bumps ``generation`` in the same transaction, through a
+session ``after_flush`` hook (set-based UPDATEs call
+``invalidate_snapshots``); the snapshot is rebuilt on the next read when
+``built_generation`` lags behind. Every rebuild that changes the content
+gets a new ``version`` and a ``ReviewSnapshotChange`` row with the diff, so
+clients can fetch the changes since the version they hold.
+"""
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, any_, bindparam, event, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.core.database import Base
+from app.models.document import Document
+from app.models.dossier import Dossier
+from app.models.extracted_field import ExtractedField
+from app.models.validation_result import ValidationResult
+
+
+class ReviewSnapshot(Base):
+    """Materialized review data of one dossier."""
+    __tablename__ = "review_snapshots"
+    
+    dossier_id = Column(UUID(as_uuid=True), ForeignKey("dossiers.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=1)
+    generation = Column(BigInteger, nullable=False, default=0)  # Bumped by every change to the review data
+    built_generation = Column(BigInteger, nullable=False, default=0)  # Generation the snapshot was built from
+    snapshot = Column(JSONB, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class ReviewSnapshotChange(Base):
+    """Diff between a snapshot version and the previous one."""
+    __tablename__ = "review_snapshot_changes"
+    
+    dossier_id = Column(UUID(as_uuid=True), ForeignKey("dossiers.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(BigInteger, primary_key=True)
+    changes = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+def invalidate_snapshots(dossier_ids):
+    """Statement marking the snapshots of ``dossier_ids`` stale (for changes made outside the ORM)."""
+    ids = bindparam("snapshot_ids", list(dossier_ids), type_=ARRAY(UUID(as_uuid=True)))
+    return (
+        update(ReviewSnapshot)
+        .where(ReviewSnapshot.dossier_id == any_(ids))
+        .values(generation=ReviewSnapshot.generation + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _review_dossier_id(obj):
+    if isinstance(obj, Dossier):
+        return obj.id
+    if isinstance(obj, (Document, ExtractedField, ValidationResult)):
+        return obj.dossier_id
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_review_snapshots(session: Session, flush_context) -> None:
+    """Mark the snapshots of dossiers whose review data this flush changed as stale."""
+    dossier_ids = set()
+    for obj in list(session.new) + list(session.deleted):
+        dossier_ids.add(_review_dossier_id(obj))
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            dossier_ids.add(_review_dossier_id(obj))
+    dossier_ids.discard(None)
+
+    if dossier_ids:
+        session.connection().execute(invalidate_snapshots(dossier_ids))
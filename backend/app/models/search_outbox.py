@@ -0,0 +1,94 @@
+"""Search outbox model.
+
+Changes to indexed entities (dossiers, documents, installers) are recorded in
+``search_outbox`` in the same transaction as the change itself, by a session
+``after_flush`` hook. The search indexer drains the table into Typesense, so a
+committed change is never lost and a rolled back one is never indexed.
+
+Indexed documents also embed columns of related rows (installer and process
+names in dossiers, dossier reference and document type in documents); when
+one of those changes, the dependent entities are queued with one
+``INSERT ... SELECT``.
+"""
+from sqlalchemy import BigInteger, Column, DateTime, String, event, insert, inspect, literal, select
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.core.database import Base
+from app.models.document import Document
+from app.models.document_type import DocumentType
+from app.models.dossier import Dossier
+from app.models.installer import Installer
+from app.models.process import Process
+
+UPSERT = "upsert"
+DELETE = "delete"
+
+# Indexed model: Typesense collection (alias) name
+INDEXED_MODELS = {
+    Dossier: "dossiers",
+    Document: "documents",
+    Installer: "installers",
+}
+
+# Columns embedded in the documents of another collection:
+# (model, attributes, dependent collection, dependent id column, foreign key to the model)
+DEPENDENT_COLUMNS = (
+    (Installer, ("company_name",), "dossiers", Dossier.id, Dossier.installer_id),
+    (Process, ("code", "name"), "dossiers", Dossier.id, Dossier.process_id),
+    (Dossier, ("reference",), "documents", Document.id, Document.dossier_id),
+    (DocumentType, ("code",), "documents", Document.id, Document.document_type_id),
+)
+
+
+class SearchOutbox(Base):
+    """Pending search index change."""
+    __tablename__ = "search_outbox"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    entity_type = Column(String(20), nullable=False)  # 'dossiers', 'documents', 'installers'
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    operation = Column(String(10), nullable=False)  # 'upsert' or 'delete'
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+
+def outbox_rows(entity_type: str, entity_ids, operation: str = UPSERT) -> list[dict]:
+    """Outbox rows for changes made outside the ORM unit of work (bulk UPDATEs)."""
+    return [{"entity_type": entity_type, "entity_id": entity_id, "operation": operation} for entity_id in entity_ids]
+
+
+@event.listens_for(Session, "after_flush")
+def _capture_search_changes(session: Session, flush_context) -> None:
+    """Queue an outbox row for every indexed entity written by this flush."""
+    changes = {}
+    for obj in session.new:
+        collection = INDEXED_MODELS.get(type(obj))
+        if collection:
+            changes[(collection, obj.id)] = UPSERT
+    for obj in session.dirty:
+        collection = INDEXED_MODELS.get(type(obj))
+        if collection and session.is_modified(obj, include_collections=False):
+            changes[(collection, obj.id)] = UPSERT
+    for obj in session.deleted:
+        collection = INDEXED_MODELS.get(type(obj))
+        if collection:
+            changes[(collection, obj.id)] = DELETE
+
+    if changes:
+        session.connection().execute(insert(SearchOutbox.__table__), [
+            {"entity_type": collection, "entity_id": entity_id, "operation": operation}
+            for (collection, entity_id), operation in changes.items()
+        ])
+
+    dependents = {}
+    for obj in session.dirty:
+        for model, attributes, collection, id_column, foreign_key in DEPENDENT_COLUMNS:
+            if type(obj) is model and any(inspect(obj).attrs[name].history.has_changes() for name in attributes):
+                dependents.setdefault((collection, id_column, foreign_key), set()).add(obj.id)
+    for (collection, id_column, foreign_key), ids in dependents.items():
+        session.connection().execute(
+            insert(SearchOutbox.__table__).from_select(
+                ["entity_type", "entity_id", "operation"],
+                select(literal(collection), id_column, literal(UPSERT)).where(foreign_key.in_(ids))
+            )
+        )
@@ -0,0 +1,36 @@
+"""Resumable upload session model."""
+from sqlalchemy import Column, String, DateTime, ForeignKey, BigInteger, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+import uuid
+
+
+class UploadSession(Base):
+    """Document upload received in chunks, until it is completed or aborted."""
+    __tablename__ = "upload_sessions"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    dossier_id = Column(UUID(as_uuid=True), ForeignKey("dossiers.id", ondelete="CASCADE"), nullable=False)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    document_type_id = Column(UUID(as_uuid=True), ForeignKey("document_types.id"), nullable=True)
+    filename = Column(String, nullable=False)
+    content_type = Column(String, nullable=False)
+    total_size = Column(BigInteger, nullable=False)
+    # Bytes received so far; chunks are appended at this offset
+    offset = Column(BigInteger, default=0, nullable=False)
+    # Expected digest of the whole document as "algorithm:hex", checked on completion
+    checksum = Column(String, nullable=True)
+    storage_path = Column(String, nullable=False)
+    # S3 multipart upload id and uploaded parts ({"PartNumber", "ETag", "Size"}); unused locally
+    s3_upload_id = Column(String, nullable=True)
+    parts = Column(JSONB, default=list, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Pushed back on every chunk; expired sessions are aborted by the cleanup task
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_upload_sessions_expires_at", "expires_at"),
+        Index("ix_upload_sessions_dossier_id", "dossier_id"),
+    )
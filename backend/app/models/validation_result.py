@@ -1,5 +1,5 @@
 """Validation Result model."""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -12,7 +12,8 @@ class ValidationResult(Base):
     __tablename__ = "validation_results"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    dossier_id = Column(UUID(as_uuid=True), ForeignKey("dossiers.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Indexed by the composite index below (leading column)
+    dossier_id = Column(UUID(as_uuid=True), ForeignKey("dossiers.id", ondelete="CASCADE"), nullable=False)
     rule_id = Column(UUID(as_uuid=True), ForeignKey("validation_rules.id"), nullable=False)
     status = Column(String(20), nullable=False)  # 'passed', 'warning', 'error'
     message = Column(Text, nullable=True)
@@ -28,4 +29,8 @@ class ValidationResult(Base):
     dossier = relationship("Dossier", back_populates="validation_results")
     rule = relationship("ValidationRule", back_populates="validation_results")
     overridden_by_user = relationship("User", foreign_keys=[overridden_by])
-
+    
+    # Indexes for common queries
+    __table_args__ = (
+        Index("ix_validation_results_dossier_id_rule_id", "dossier_id", "rule_id"),
+    )
@@ -1,12 +1,12 @@
 """Pure Python Motia server (no FastAPI)."""
 import asyncio
 import importlib
-import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 from urllib.parse import parse_qs, urlparse
 import re
+import sys
 from aiohttp import web
 from aiohttp.web import Request, Response
 try:
@@ -16,12 +16,42 @@ except ImportError:
     cors_setup = None
     ResourceOptions = None
 from app.core.config import settings
+from app.core import metrics, serialization
+from app.services.cache import cache_service, response_cache, CachePolicy, CachedResponse
+from app.services.cache.response_cache import (
+    compute_etag,
+    etag_matches,
+    principal_scope,
+    verify_principal,
+    render_tags,
+    SCOPE_PUBLIC,
+)
 
 logger = logging.getLogger(__name__)
 
 # Step registry
 STEPS: Dict[str, Dict[str, Any]] = {}
 
+# Callbacks run whenever the step registry is (re)built, keyed by owner name
+_steps_listeners: Dict[str, Callable[[], None]] = {}
+
+
+def add_steps_listener(name: str, callback: Callable[[], None]) -> None:
+    """Register a callback run after discover_steps() or reload_steps().
+    
+    Registering again under the same name replaces the previous callback, so
+    reloaded modules do not accumulate listeners.
+    """
+    _steps_listeners[name] = callback
+
+
+def _notify_steps_changed() -> None:
+    for name, callback in list(_steps_listeners.items()):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Steps listener {name} failed: {e}", exc_info=True)
+
 
 def discover_steps():
     """Discover all Motia steps in the steps directory."""
@@ -77,6 +107,23 @@ def discover_steps():
                 logger.info(f"Registered step: {config.get('name')} at {step_key}")
         except Exception as e:
             logger.error(f"Error loading step from {module_path}: {e}", exc_info=True)
+    
+    _notify_steps_changed()
+
+
+def reload_steps():
+    """Re-import every step module and rebuild the registry."""
+    for module_path in sorted({info["module"] for info in STEPS.values()}):
+        module = sys.modules.get(module_path)
+        if module is None:
+            continue
+        try:
+            importlib.reload(module)
+        except Exception as e:
+            logger.error(f"Error reloading step module {module_path}: {e}", exc_info=True)
+    
+    STEPS.clear()
+    discover_steps()
 
 
 def _path_to_regex(path: str):
@@ -106,8 +153,12 @@ def _match_path(path_pattern: re.Pattern, path: str) -> Optional[Dict[str, str]]
     return match.groups()
 
 
-async def _extract_request_data(request: Request) -> Dict[str, Any]:
-    """Extract all data from aiohttp request into Motia format."""
+async def _extract_request_data(request: Request, parse_body: bool = True) -> Dict[str, Any]:
+    """Extract all data from aiohttp request into Motia format.
+    
+    Steps declaring ``"streamBody": True`` read the body themselves from
+    ``context.request`` (large uploads), so it is left unread.
+    """
     # Parse query parameters
     query = {}
     for key, values in request.query.items():
@@ -121,7 +172,7 @@ async def _extract_request_data(request: Request) -> Dict[str, Any]:
     
     # Parse body for POST/PUT/PATCH
     body = {}
-    if request.method in ["POST", "PUT", "PATCH"]:
+    if parse_body and request.method in ["POST", "PUT", "PATCH"]:
         try:
             if request.content_type == "application/json":
                 body = await request.json()
@@ -170,6 +221,60 @@ async def _extract_request_data(request: Request) -> Dict[str, Any]:
     }
 
 
+def _encode_body(request: Request, body: bytes, headers: Dict[str, str]) -> bytes:
+    """Compress a body when the client accepts it and it is large enough."""
+    encoding = serialization.choose_encoding(request.headers.get("Accept-Encoding"), len(body))
+    if encoding is None:
+        return body
+    headers["Content-Encoding"] = encoding
+    headers["Vary"] = "Accept-Encoding"
+    return serialization.compress(body, encoding)
+
+
+def _json_response(request: Request, body: Any, status: int, headers: Dict[str, str]) -> Response:
+    """Serialize a handler body with the active serializer and compress it if worthwhile."""
+    headers = dict(headers)
+    payload = _encode_body(request, serialization.dumps(body), headers)
+    return web.Response(
+        body=payload,
+        status=status,
+        content_type="application/json",
+        headers=headers
+    )
+
+
+def _cached_response(request: Request, cached: CachedResponse, cache_status: str) -> Response:
+    """Build a response from a cache entry, answering 304 when the ETag matches.
+    
+    Compressed variants are memoized on the entry and get their own ETag.
+    """
+    encoding = serialization.choose_encoding(request.headers.get("Accept-Encoding"), len(cached.body))
+    etag = cached.etag if encoding is None else f'{cached.etag[:-1]}-{encoding}"'
+    headers = {**cached.headers, "ETag": etag, "X-Cache": cache_status}
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+        headers["Vary"] = "Accept-Encoding"
+    
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        response_cache.not_modified += 1
+        headers.pop("Content-Encoding", None)
+        return web.Response(status=304, headers=headers)
+    
+    if encoding is None:
+        body = cached.body
+    else:
+        body = cached.encoded.get(encoding)
+        if body is None:
+            body = cached.encoded[encoding] = serialization.compress(cached.body, encoding)
+    
+    return web.Response(
+        body=body,
+        status=cached.status,
+        content_type=cached.content_type,
+        headers=headers
+    )
+
+
 async def _handle_request(request: Request) -> Response:
     """Handle HTTP request and route to appropriate Motia step."""
     # Handle CORS preflight requests
@@ -224,9 +329,29 @@ async def _handle_request(request: Request) -> Response:
             headers=cors_headers
         )
     
+    request_stats = metrics.current_request()
+    if request_stats is not None:
+        request_stats.step = matched_step["config"].get("name") or step_key
+    
+    # Serve cacheable GETs from the response cache
+    cache_policy = CachePolicy.from_config(matched_step["config"]) if settings.CACHE_ENABLED else None
+    cache_key = None
+    if cache_policy:
+        principal = principal_scope(cache_policy, request.headers)
+        if principal is not None:
+            principal = await verify_principal(principal)
+        if principal is not None:
+            normalized_query = {key: request.query.getall(key) for key in request.query.keys()}
+            cache_key = response_cache.build_key(
+                matched_step["config"].get("name"), path, normalized_query, principal
+            )
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return _cached_response(request, cached, "HIT")
+    
     # Extract request data
     try:
-        motia_req = await _extract_request_data(request)
+        motia_req = await _extract_request_data(request, parse_body=not matched_step["config"].get("streamBody"))
         motia_req["pathParams"] = path_params
         
         # Create context
@@ -238,11 +363,21 @@ async def _handle_request(request: Request) -> Response:
         # Call step handler
         result = await matched_step["handler"](motia_req, context)
         
+        # Streaming handlers (server-sent events) prepare and return their own response
+        if isinstance(result, web.StreamResponse):
+            return result
+        
         # Handle response
         status_code = result.get("status", 200)
         response_body = result.get("body", {})
         headers = result.get("headers", {})
         
+        # Invalidate cached responses declared by write steps
+        if method != "GET" and status_code < 400 and matched_step["config"].get("invalidates"):
+            await cache_service.invalidate_tags(
+                render_tags(matched_step["config"]["invalidates"], path_params)
+            )
+        
         # Handle file downloads
         if isinstance(response_body, dict) and "file_content" in response_body:
             file_content = response_body["file_content"]
@@ -282,6 +417,14 @@ async def _handle_request(request: Request) -> Response:
         }
         headers.update(cors_headers)
         
+        # Handle pre-serialized bodies (headers carry Content-Type/Content-Encoding)
+        if isinstance(response_body, (bytes, bytearray)):
+            return web.Response(
+                body=bytes(response_body),
+                status=status_code,
+                headers=headers
+            )
+        
         # Handle HTML responses (like Swagger UI)
         if isinstance(response_body, str) and ("<html" in response_body.lower() or "<!doctype" in response_body.lower()):
             return web.Response(
@@ -290,14 +433,30 @@ async def _handle_request(request: Request) -> Response:
                 headers=headers
             )
         
-        # Remove Content-Type from headers if present (web.json_response sets it automatically)
+        # Remove Content-Type from headers if present (set from the serialized body)
         json_headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
         
-        return web.json_response(
-            response_body,
-            status=status_code,
-            headers=json_headers
-        )
+        if cache_key and status_code == 200:
+            body_bytes = serialization.dumps(response_body)
+            json_headers["Cache-Control"] = (
+                "public, no-cache" if cache_policy.scope == SCOPE_PUBLIC else "private, no-cache"
+            )
+            cached = CachedResponse(
+                body=body_bytes,
+                status=status_code,
+                content_type="application/json",
+                etag=compute_etag(body_bytes),
+                headers=json_headers
+            )
+            response_cache.store(
+                cache_key,
+                cached,
+                ttl=cache_policy.ttl,
+                tags=render_tags(cache_policy.tags, path_params)
+            )
+            return _cached_response(request, cached, "MISS")
+        
+        return _json_response(request, response_body, status_code, json_headers)
     except Exception as e:
         logger.error(f"Error in step handler {matched_step['config'].get('name')}: {e}", exc_info=True)
         return web.json_response(
@@ -306,13 +465,217 @@ async def _handle_request(request: Request) -> Response:
         )
 
 
+@web.middleware
+async def _metrics_middleware(request: Request, handler: Callable) -> Response:
+    """Record per-step metrics and optionally add a Server-Timing header."""
+    stats = metrics.begin_request()
+    try:
+        response = await handler(request)
+    except Exception as e:
+        status = e.status if isinstance(e, web.HTTPException) else 500
+        metrics.record_request(stats, request.method, status, request.content_length or 0, 0)
+        raise
+    
+    elapsed = metrics.record_request(
+        stats,
+        request.method,
+        response.status,
+        request.content_length or 0,
+        response.content_length or 0
+    )
+    if settings.SERVER_TIMING_ENABLED and not response.prepared:
+        response.headers["Server-Timing"] = metrics.server_timing(stats, elapsed)
+    return response
+
+
+async def _start_cache(app: web.Application) -> None:
+    """Connect the shared cache tier on startup."""
+    await cache_service.start()
+
+
+async def _stop_cache(app: web.Application) -> None:
+    """Close the shared cache tier on shutdown."""
+    await cache_service.stop()
+
+
+async def _start_event_bus(app: web.Application) -> None:
+    """Connect the event bus to Redis on startup."""
+    from app.services.events import event_bus
+    await event_bus.start()
+
+
+async def _stop_event_bus(app: web.Application) -> None:
+    """Close event streams and the Redis listener on shutdown."""
+    from app.services.events import event_bus
+    await event_bus.stop()
+
+
+async def _stop_activity_sink(app: web.Application) -> None:
+    """Flush buffered activity logs on shutdown."""
+    from app.services.activity import activity_sink
+    await activity_sink.stop()
+
+
+async def _maintain_activity_partitions() -> None:
+    """Create upcoming activity log partitions and archive expired ones, periodically."""
+    from app.services.activity.partitions import maintain_partitions
+    while True:
+        try:
+            await maintain_partitions()
+        except Exception as e:
+            logger.error(f"Activity log partition maintenance failed: {e}", exc_info=True)
+        await asyncio.sleep(settings.ACTIVITY_LOG_MAINTENANCE_INTERVAL_HOURS * 3600)
+
+
+async def _start_partition_maintenance(app: web.Application) -> None:
+    """Schedule activity log partition maintenance on startup."""
+    if settings.ACTIVITY_LOG_MAINTENANCE_INTERVAL_HOURS > 0:
+        app["partition_maintenance"] = asyncio.create_task(_maintain_activity_partitions())
+
+
+async def _stop_partition_maintenance(app: web.Application) -> None:
+    """Cancel activity log partition maintenance on shutdown."""
+    task = app.get("partition_maintenance")
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+async def _close_ai_providers(app: web.Application) -> None:
+    """Close AI provider connection pools on shutdown."""
+    from app.services.ai.provider_factory import AIProviderFactory
+    await AIProviderFactory.close_all()
+
+
+async def _start_search_indexer(app: web.Application) -> None:
+    """Start draining the search outbox into Typesense on startup."""
+    if settings.SEARCH_INDEXER_ENABLED:
+        from app.services.search import search_indexer
+        app["search_indexer"] = asyncio.create_task(search_indexer.run())
+
+
+async def _stop_search_indexer(app: web.Application) -> None:
+    """Cancel the search indexer on shutdown."""
+    task = app.get("search_indexer")
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+async def _start_autocomplete(app: web.Application) -> None:
+    """Build the autocomplete index and keep it refreshed in the background."""
+    if settings.AUTOCOMPLETE_ENABLED:
+        from app.services.search import autocomplete_index
+        app["autocomplete"] = asyncio.create_task(autocomplete_index.run())
+
+
+async def _stop_autocomplete(app: web.Application) -> None:
+    """Cancel autocomplete index refreshes on shutdown."""
+    task = app.get("autocomplete")
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+async def _start_work_queue(app: web.Application) -> None:
+    """Reclaim expired review leases and refresh queue metrics in the background."""
+    if settings.QUEUE_RECLAIM_INTERVAL_SECONDS > 0:
+        from app.services.work_queue import work_queue
+        app["work_queue"] = asyncio.create_task(work_queue.run())
+
+
+async def _stop_work_queue(app: web.Application) -> None:
+    """Cancel review queue maintenance on shutdown."""
+    task = app.get("work_queue")
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+async def _start_upload_cleanup(app: web.Application) -> None:
+    """Abort expired resumable uploads in the background."""
+    if settings.UPLOAD_CLEANUP_INTERVAL_MINUTES > 0:
+        from app.services.resumable_uploads import upload_service
+        app["upload_cleanup"] = asyncio.create_task(upload_service.run())
+
+
+async def _stop_upload_cleanup(app: web.Application) -> None:
+    """Cancel resumable upload cleanup on shutdown."""
+    task = app.get("upload_cleanup")
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+async def _start_ingestion(app: web.Application) -> None:
+    """Fail bulk ingestion jobs orphaned by a dead worker, on startup and periodically."""
+    if settings.INGEST_JOB_STALE_MINUTES > 0:
+        from app.services.ingestion import ingestion_service
+        app["ingestion_sweep"] = asyncio.create_task(ingestion_service.run())
+
+
+async def _stop_ingestion(app: web.Application) -> None:
+    """Cancel running bulk ingestion jobs on shutdown (they are marked failed)."""
+    from app.services.ingestion import ingestion_service
+    task = app.get("ingestion_sweep")
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await ingestion_service.shutdown()
+
+
+async def _close_search_client(app: web.Application) -> None:
+    """Close the Typesense connection pool on shutdown."""
+    from app.services.search import async_typesense_client
+    await async_typesense_client.close()
+
+
 def create_motia_app() -> web.Application:
     """Create aiohttp app with Motia steps."""
-    app = web.Application()
+    app = web.Application(middlewares=[_metrics_middleware] if settings.METRICS_ENABLED else [])
     
     # Discover and register steps
     discover_steps()
     
+    # Cache tier lifecycle (Redis connection and invalidation listener)
+    app.on_startup.append(_start_cache)
+    app.on_cleanup.append(_stop_cache)
+    app.on_cleanup.append(_close_ai_providers)
+    app.on_startup.append(_start_search_indexer)
+    app.on_cleanup.append(_stop_search_indexer)
+    app.on_cleanup.append(_close_search_client)
+    app.on_startup.append(_start_autocomplete)
+    app.on_cleanup.append(_stop_autocomplete)
+    app.on_startup.append(_start_work_queue)
+    app.on_cleanup.append(_stop_work_queue)
+    app.on_startup.append(_start_ingestion)
+    app.on_cleanup.append(_stop_ingestion)
+    app.on_startup.append(_start_upload_cleanup)
+    app.on_cleanup.append(_stop_upload_cleanup)
+    app.on_cleanup.append(_stop_activity_sink)
+    app.on_startup.append(_start_partition_maintenance)
+    app.on_cleanup.append(_stop_partition_maintenance)
+    app.on_startup.append(_start_event_bus)
+    app.on_shutdown.append(_stop_event_bus)
+    
     # Register catch-all route handler
     catch_all_route = app.router.add_route("*", "/{path:.*}", _handle_request)
     
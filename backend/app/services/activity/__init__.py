@@ -1,5 +1,5 @@
 """Activity logging services."""
 from .activity_logger import ActivityLogger
+from .activity_sink import ActivitySink, activity_sink
 
-__all__ = ["ActivityLogger"]
-
+__all__ = ["ActivityLogger", "ActivitySink", "activity_sink"]
@@ -1,10 +1,14 @@
 """Activity Logger Service."""
+import base64
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import select, func
+from uuid import UUID
+from sqlalchemy import insert, select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.models.activity_log import ActivityLog
+from .activity_sink import activity_sink, build_activity_row
 
 
 class ActivityLogger:
@@ -24,27 +28,54 @@ class ActivityLogger:
         metadata: Optional[dict] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
-        duration_ms: Optional[int] = None
-    ) -> ActivityLog:
-        """Log an activity entry."""
-        activity = ActivityLog(
+        duration_ms: Optional[int] = None,
+        durable: bool = False
+    ) -> Optional[ActivityLog]:
+        """Log an activity entry.
+
+        By default the entry is queued and written in a later batch. With
+        ``durable=True`` it is added to this session instead, so it commits
+        (or rolls back) with the caller's transaction; call it before commit.
+        """
+        row = build_activity_row(
             user_id=user_id,
             action_type=action_type,
             entity_type=entity_type,
             entity_id=entity_id,
             entity_reference=entity_reference,
             description=description,
-            meta_data=metadata or {},
+            metadata=metadata,
             ip_address=ip_address,
             user_agent=user_agent,
             duration_ms=duration_ms
         )
 
-        self.db.add(activity)
-        await self.db.commit()
-        await self.db.refresh(activity)
+        if durable or not settings.ACTIVITY_LOG_ASYNC:
+            activity = ActivityLog(**row)
+            self.db.add(activity)
+            if not durable:
+                await self.db.commit()
+            return activity
+
+        await activity_sink.enqueue(row)
+        return None
+
+    async def log_many(self, rows: list[dict], durable: bool = False) -> None:
+        """Log several entries built with ``build_activity_row`` in one batch.
+
+        With ``durable=True`` they are inserted with a single multi-row INSERT
+        in this session's transaction; call it before commit.
+        """
+        if not rows:
+            return
+        if durable or not settings.ACTIVITY_LOG_ASYNC:
+            await self.db.execute(insert(ActivityLog), rows)
+            if not durable:
+                await self.db.commit()
+            return
 
-        return activity
+        for row in rows:
+            await activity_sink.enqueue(row)
 
     async def get_activities(
         self,
@@ -55,39 +86,65 @@ class ActivityLogger:
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        before: Optional[tuple[datetime, UUID]] = None,
+        include_total: bool = True
     ) -> dict:
-        """Query activity logs with filters."""
-        query = select(ActivityLog)
-        count_query = select(func.count(ActivityLog.id))
+        """Query activity logs with filters, newest first.
 
+        Pass the decoded ``next_cursor`` as ``before`` to fetch the next page
+        without OFFSET; it also bounds ``created_at`` so only the partitions
+        at or before it are scanned.
+        """
+        conditions = []
         if user_id:
-            query = query.where(ActivityLog.user_id == user_id)
-            count_query = count_query.where(ActivityLog.user_id == user_id)
+            conditions.append(ActivityLog.user_id == user_id)
         if entity_type:
-            query = query.where(ActivityLog.entity_type == entity_type)
-            count_query = count_query.where(ActivityLog.entity_type == entity_type)
+            conditions.append(ActivityLog.entity_type == entity_type)
         if entity_id:
-            query = query.where(ActivityLog.entity_id == entity_id)
-            count_query = count_query.where(ActivityLog.entity_id == entity_id)
+            conditions.append(ActivityLog.entity_id == entity_id)
         if action_types:
-            query = query.where(ActivityLog.action_type.in_(action_types))
-            count_query = count_query.where(ActivityLog.action_type.in_(action_types))
+            conditions.append(ActivityLog.action_type.in_(action_types))
         if date_from:
-            query = query.where(ActivityLog.created_at >= date_from)
-            count_query = count_query.where(ActivityLog.created_at >= date_from)
+            conditions.append(ActivityLog.created_at >= date_from)
         if date_to:
-            query = query.where(ActivityLog.created_at <= date_to)
-            count_query = count_query.where(ActivityLog.created_at <= date_to)
+            conditions.append(ActivityLog.created_at <= date_to)
 
-        query = query.order_by(ActivityLog.created_at.desc())
-        query = query.limit(limit).offset(offset)
+        query = select(ActivityLog).where(*conditions)
+        if before:
+            created_at, activity_id = before
+            query = query.where(
+                ActivityLog.created_at <= created_at,
+                tuple_(ActivityLog.created_at, ActivityLog.id) < tuple_(created_at, activity_id)
+            )
+        else:
+            query = query.offset(offset)
+        query = query.order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc()).limit(limit)
 
         result = await self.db.execute(query)
         activities = result.scalars().all()
 
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
+        total = None
+        if include_total:
+            count_result = await self.db.execute(select(func.count()).select_from(ActivityLog).where(*conditions))
+            total = count_result.scalar()
+
+        next_cursor = None
+        if len(activities) == limit:
+            last = activities[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return {"activities": activities, "total": total, "next_cursor": next_cursor}
+
+
+def encode_cursor(created_at: datetime, activity_id: UUID) -> str:
+    """Opaque keyset cursor for the entry after which the next page starts."""
+    raw = f"{created_at.isoformat()}|{activity_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
 
-        return {"activities": activities, "total": total}
 
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Inverse of :func:`encode_cursor`. Raises ValueError for malformed cursors."""
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    created_at, activity_id = raw.split("|")
+    return datetime.fromisoformat(created_at), UUID(activity_id)
@@ -0,0 +1,179 @@
+"""Asynchronous, batched writer for activity logs.
+
+Entries are buffered in memory and written with a single multi-row INSERT
+every ``ACTIVITY_LOG_FLUSH_INTERVAL_MS`` or as soon as
+``ACTIVITY_LOG_BATCH_SIZE`` entries are waiting. When the buffer reaches
+``ACTIVITY_LOG_MAX_QUEUE`` producers wait for the next flush (backpressure).
+The buffer is flushed on shutdown.
+"""
+import asyncio
+import contextvars
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.models.activity_log import ActivityLog
+
+logger = logging.getLogger(__name__)
+
+MAX_FLUSH_ATTEMPTS = 3
+
+
+def _as_uuid(value: Any) -> Optional[uuid.UUID]:
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    return uuid.UUID(str(value))
+
+
+def build_activity_row(
+    user_id: Any,
+    action_type: str,
+    entity_type: str,
+    entity_id: Any = None,
+    entity_reference: Optional[str] = None,
+    description: Optional[str] = None,
+    metadata: Optional[dict] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    duration_ms: Optional[int] = None
+) -> Dict[str, Any]:
+    """Activity log values keyed by ORM attribute, timestamped at event time."""
+    return {
+        "id": uuid.uuid4(),
+        "user_id": _as_uuid(user_id),
+        "action_type": action_type,
+        "entity_type": entity_type,
+        "entity_id": _as_uuid(entity_id),
+        "entity_reference": entity_reference,
+        "description": description,
+        "meta_data": metadata or {},
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "duration_ms": duration_ms,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+class ActivitySink:
+    """In-memory buffer of activity rows flushed in batches."""
+
+    def __init__(self, batch_size: int = 500, flush_interval_ms: int = 200, max_queue: int = 10000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_queue = max_queue
+        self._buffer: List[Dict[str, Any]] = []
+        self._attempts = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._drained: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.written = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.backpressure_waits = 0
+
+    def start(self) -> None:
+        """Start the background flusher on the running loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        # Detach from the current request so flush statements are not attributed to it
+        self._task = contextvars.Context().run(loop.create_task, self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        self._stopping = True
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        for _ in range(MAX_FLUSH_ATTEMPTS):
+            if not self._buffer:
+                break
+            await self.flush()
+
+    async def enqueue(self, row: Dict[str, Any]) -> None:
+        """Buffer a row, waiting for a flush if the buffer is full."""
+        if self._task is None or self._task.done():
+            self.start()
+        while len(self._buffer) >= self.max_queue and not self._stopping:
+            self.backpressure_waits += 1
+            self._drained.clear()
+            self._wakeup.set()
+            await self._drained.wait()
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._buffer:
+                await self.flush()
+
+    async def flush(self) -> int:
+        """Write buffered rows in batches. Returns the number written."""
+        written = 0
+        lock = self._flush_lock or asyncio.Lock()
+        async with lock:
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                try:
+                    await self._write(batch)
+                    written += len(batch)
+                except Exception as e:
+                    self.failed_flushes += 1
+                    self._attempts += 1
+                    if self._attempts < MAX_FLUSH_ATTEMPTS:
+                        logger.warning(f"Activity log flush failed ({len(batch)} rows, will retry): {e}")
+                        break
+                    logger.error(f"Dropping {len(batch)} activity log rows after {self._attempts} failed flushes: {e}")
+                    self.dropped += len(batch)
+                del self._buffer[:len(batch)]
+                self._attempts = 0
+            if self._drained is not None:
+                self._drained.set()
+        return written
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> None:
+        start = time.perf_counter()
+        session_maker = get_session_maker()
+        async with session_maker() as db:
+            await db.execute(insert(ActivityLog), rows)
+            await db.commit()
+        self.written += len(rows)
+        self.flushes += 1
+        logger.debug(f"Wrote {len(rows)} activity log rows in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def stats(self) -> dict:
+        return {
+            "buffered": len(self._buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
+
+activity_sink = ActivitySink(
+    batch_size=settings.ACTIVITY_LOG_BATCH_SIZE,
+    flush_interval_ms=settings.ACTIVITY_LOG_FLUSH_INTERVAL_MS,
+    max_queue=settings.ACTIVITY_LOG_MAX_QUEUE,
+)
@@ -0,0 +1,199 @@
+"""Maintenance of the monthly activity_logs partitions.
+
+``activity_logs`` is range-partitioned by ``created_at`` into one partition
+per month (``activity_logs_yYYYYmMM``) plus a default partition catching rows
+outside the maintained range. Queries bounded by ``created_at`` only scan the
+matching partitions.
+
+Maintenance creates partitions ahead of time, moves rows that landed in the
+default partition (e.g. back-dated imports) into partitions of their own,
+and archives partitions older than ``ACTIVITY_LOG_RETENTION_MONTHS``: rows
+are exported to a gzipped JSON Lines file in storage, then the partition is
+detached and dropped, which is far cheaper than a bulk DELETE.
+"""
+import gzip
+import logging
+import re
+import tempfile
+from datetime import date, datetime, timezone
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_engine, get_session_maker
+from app.core.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "activity_logs"
+DEFAULT_PARTITION = "activity_logs_default"
+ARCHIVE_PREFIX = "archives/activity_logs"
+
+# Serializes maintenance between workers (arbitrary application-wide key)
+MAINTENANCE_LOCK_KEY = 7_301_245_001
+
+_PARTITION_NAME = re.compile(r"^activity_logs_y(\d{4})m(\d{2})$")
+
+
+def add_months(month: date, count: int) -> date:
+    """First day of the month ``count`` months after ``month``."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"activity_logs_y{month.year}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Month covered by a monthly partition, or None for other tables."""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def current_month() -> date:
+    return datetime.now(timezone.utc).date().replace(day=1)
+
+
+async def list_partitions(db: AsyncSession) -> List[Dict[str, Any]]:
+    """Partitions of activity_logs with their bounds, oldest first."""
+    result = await db.execute(text("""
+        SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = :parent
+    """), {"parent": PARENT_TABLE})
+    partitions = [
+        {"name": name, "month": partition_month(name), "bound": bound}
+        for name, bound in result.all()
+    ]
+    return sorted(partitions, key=lambda p: (p["month"] is None, p["month"] or date.min))
+
+
+async def create_partition(db: AsyncSession, month: date) -> None:
+    """Create and attach the partition for ``month``.
+
+    Rows of that month already caught by the default partition are moved into
+    the new partition first, otherwise attaching it would fail.
+    """
+    name = partition_name(month)
+    lower, upper = month.isoformat(), add_months(month, 1).isoformat()
+    await db.execute(text(
+        f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+    await db.execute(text(f"""
+        WITH moved AS (
+            DELETE FROM {DEFAULT_PARTITION}
+            WHERE created_at >= :lower AND created_at < :upper
+            RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved
+    """), {"lower": month, "upper": add_months(month, 1)})
+    await db.execute(text(
+        f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    ))
+
+
+async def default_partition_months(db: AsyncSession) -> List[date]:
+    """Months having rows in the default partition."""
+    result = await db.execute(text(
+        f"SELECT DISTINCT date_trunc('month', created_at)::date FROM {DEFAULT_PARTITION}"
+    ))
+    return sorted(result.scalars().all())
+
+
+async def ensure_partitions(db: AsyncSession, months_ahead: int) -> List[str]:
+    """Create missing partitions from the current month to ``months_ahead``,
+    and for every other month with rows in the default partition.
+
+    The latter keeps back-dated rows within reach of retention. Returns the
+    names of the partitions created. The caller commits.
+    """
+    existing = {p["month"] for p in await list_partitions(db)}
+    start = current_month()
+    months = {add_months(start, offset) for offset in range(months_ahead + 1)}
+    months.update(await default_partition_months(db))
+    created = []
+    for month in sorted(months):
+        if month in existing:
+            continue
+        await create_partition(db, month)
+        created.append(partition_name(month))
+    return created
+
+
+async def export_partition(db: AsyncSession, name: str, fileobj: BinaryIO) -> int:
+    """Write the rows of a partition to ``fileobj`` as gzipped JSON Lines. Returns the row count."""
+    rows = 0
+    with gzip.GzipFile(fileobj=fileobj, mode="wb") as archive:
+        result = await db.stream(text(f"SELECT * FROM {name} ORDER BY created_at, id"))
+        async for partition in result.mappings().partitions(1000):
+            for row in partition:
+                archive.write(dumps(dict(row)) + b"\n")
+                rows += 1
+    return rows
+
+
+async def archive_partitions(db: AsyncSession, retention_months: int) -> List[Dict[str, Any]]:
+    """Export, detach and drop partitions older than the retention window.
+
+    Each partition is committed on its own so a failure keeps earlier work.
+    """
+    from app.services.pdf_storage import pdf_storage_service
+
+    cutoff = add_months(current_month(), -retention_months)
+    archived = []
+    for partition in await list_partitions(db):
+        month = partition["month"]
+        if month is None or month >= cutoff:
+            continue
+        name = partition["name"]
+        key = f"{ARCHIVE_PREFIX}/{month:%Y-%m}.jsonl.gz"
+        # Spooled to disk and streamed to storage, so a month of logs is never held in memory
+        with tempfile.TemporaryFile() as spool:
+            rows = await export_partition(db, name, spool)
+            spool.seek(0)
+            location = await pdf_storage_service.save_stream(key, spool, "application/gzip")
+        await db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        await db.execute(text(f"DROP TABLE {name}"))
+        await db.commit()
+        logger.info(f"Archived activity log partition {name} ({rows} rows) to {location}")
+        archived.append({"partition": name, "rows": rows, "location": location})
+    return archived
+
+
+async def maintain_partitions(
+    months_ahead: Optional[int] = None,
+    retention_months: Optional[int] = None
+) -> Dict[str, Any]:
+    """Create upcoming partitions, empty the default one and archive expired ones.
+
+    Only one worker runs maintenance at a time; others return immediately
+    with ``skipped`` set.
+    """
+    months_ahead = settings.ACTIVITY_LOG_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    retention_months = settings.ACTIVITY_LOG_RETENTION_MONTHS if retention_months is None else retention_months
+
+    # Session-level lock on its own connection, held across the commits below
+    async with get_engine().connect() as lock_conn:
+        locked = await lock_conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+        if not locked.scalar():
+            return {"skipped": True, "created": [], "archived": []}
+        try:
+            session_maker = get_session_maker()
+            async with session_maker() as db:
+                created = await ensure_partitions(db, months_ahead)
+                await db.commit()
+                archived = []
+                if retention_months > 0:
+                    archived = await archive_partitions(db, retention_months)
+        finally:
+            await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+    if created:
+        logger.info(f"Created activity log partitions: {', '.join(created)}")
+    return {"skipped": False, "created": created, "archived": archived}
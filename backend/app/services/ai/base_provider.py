@@ -127,3 +127,11 @@ class AIProvider(ABC):
         """Check provider availability."""
         pass
 
+    async def close(self) -> None:
+        """Release network resources (HTTP sessions, connection pools).
+
+        Called by the provider registry when the instance is replaced after a
+        configuration change. Providers holding clients should override it.
+        """
+        return None
+
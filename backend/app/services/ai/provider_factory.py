@@ -1,11 +1,34 @@
 """AI Provider Factory."""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Any, Callable, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base_provider import AIProvider, AIProviderConfig
+from app.core.database import get_session_maker
 from app.models.ai_configuration import AIConfiguration
+from app.services.cache import cache_service, CacheNamespace
+
+logger = logging.getLogger(__name__)
+
+# Seconds a replaced provider stays open so in-flight calls can finish
+PROVIDER_CLOSE_GRACE_SECONDS = 30
+
+# Provider methods whose latency and errors are recorded
+INSTRUMENTED_METHODS = frozenset({
+    "classify_document",
+    "extract_fields",
+    "extract_text",
+    "detect_signatures",
+    "analyze_image",
+    "health_check",
+})
 
 
 class AITask(str, Enum):
@@ -17,10 +40,172 @@ class AITask(str, Enum):
     VISION_ANALYSIS = "vision_analysis"
 
 
+@dataclass
+class ProviderStats:
+    """Latency and error counters for one provider/model pair."""
+    calls: int = 0
+    errors: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    last_error: Optional[str] = None
+    by_method: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    def record(self, method: str, latency_ms: float, error: Optional[BaseException] = None) -> None:
+        """Record one call."""
+        self.calls += 1
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+
+        method_stats = self.by_method.setdefault(method, {"calls": 0, "errors": 0, "total_latency_ms": 0.0})
+        method_stats["calls"] += 1
+        method_stats["total_latency_ms"] += latency_ms
+
+        if error is not None:
+            self.errors += 1
+            method_stats["errors"] += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.calls, 4) if self.calls else None,
+            "avg_latency_ms": round(self.total_latency_ms / self.calls, 2) if self.calls else None,
+            "max_latency_ms": round(self.max_latency_ms, 2),
+            "last_error": self.last_error,
+            "by_method": {
+                name: {
+                    "calls": int(s["calls"]),
+                    "errors": int(s["errors"]),
+                    "avg_latency_ms": round(s["total_latency_ms"] / s["calls"], 2) if s["calls"] else None,
+                }
+                for name, s in self.by_method.items()
+            },
+        }
+
+
+class InstrumentedProvider:
+    """Transparent proxy recording latency and errors of provider calls."""
+
+    def __init__(self, provider: AIProvider, stats: ProviderStats):
+        self._provider = provider
+        self._stats = stats
+
+    @property
+    def wrapped(self) -> AIProvider:
+        return self._provider
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._provider, name)
+        if name not in INSTRUMENTED_METHODS or not callable(attr):
+            return attr
+
+        stats = self._stats
+
+        async def instrumented(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await attr(*args, **kwargs)
+            except Exception as e:
+                stats.record(name, (time.perf_counter() - start) * 1000, e)
+                raise
+            stats.record(name, (time.perf_counter() - start) * 1000)
+            return result
+
+        return instrumented
+
+
+@dataclass
+class _ProviderEntry:
+    """A live provider instance and the configuration it was built from."""
+    fingerprint: str
+    stats_key: str
+    provider: AIProvider
+    instrumented: InstrumentedProvider
+
+
+def _serialize_config(config: AIConfiguration) -> dict:
+    """Serialize an AI configuration for caching.
+
+    The API key is left out: the cache may be shared (Redis). It is read from
+    the database when a provider is built (see ``AIProviderFactory._api_key``),
+    and ``updated_at`` tells when it may have changed.
+    """
+    return {
+        "id": str(config.id),
+        "config_key": config.config_key,
+        "provider": config.provider,
+        "model_name": config.model_name,
+        "model_version": config.model_version,
+        "api_endpoint": config.api_endpoint,
+        "parameters": config.parameters or {},
+        "priority": config.priority,
+        "updated_at": config.updated_at.isoformat() if config.updated_at else None,
+    }
+
+
+def _fingerprint(config: dict, api_key: Optional[str]) -> str:
+    """Hash of every setting that requires a new provider instance when changed."""
+    relevant = {k: config.get(k) for k in (
+        "provider", "model_name", "model_version", "api_endpoint", "parameters"
+    )}
+    relevant["api_key"] = api_key
+    payload = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 class AIProviderFactory:
-    """Factory for creating AI provider instances."""
+    """Registry of AI provider instances.
 
-    _providers: dict[str, AIProvider] = {}
+    The active configuration per task is cached (see ``CacheNamespace.AI_CONFIGURATIONS``).
+    Provider instances are shared between tasks with identical settings and are
+    rebuilt only when their configuration changes; replaced instances are closed
+    after a grace period. Configuration invalidations (local or from other workers)
+    trigger a background reload so changes are picked up without a restart.
+    """
+
+    _provider_classes: dict[str, type[AIProvider]] = {}
+    _instances: dict[str, _ProviderEntry] = {}
+    _task_fingerprints: dict[AITask, str] = {}
+    _stats: dict[str, ProviderStats] = {}
+    _api_keys: dict[tuple[str, Optional[str]], Optional[str]] = {}
+    _change_listeners: list[Callable[[AITask, Optional[AIProvider]], Any]] = []
+    _background_tasks: set[asyncio.Task] = set()
+    _lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def register_provider_class(cls, name: str, provider_class: type[AIProvider]) -> None:
+        """Register the implementation used for ``AIConfiguration.provider == name``."""
+        cls._provider_classes[name] = provider_class
+
+    @classmethod
+    def add_change_listener(cls, callback: Callable[[AITask, Optional[AIProvider]], Any]) -> None:
+        """Register ``callback(task, provider)``, called when a task's provider changes.
+
+        ``provider`` is None when the task no longer has an active configuration.
+        """
+        cls._change_listeners.append(callback)
+
+    @classmethod
+    async def get_active_config(cls, task: AITask, db: AsyncSession) -> Optional[dict]:
+        """Return the highest-priority active configuration for a task."""
+
+        async def load() -> Optional[dict]:
+            result = await db.execute(
+                select(AIConfiguration)
+                .where(AIConfiguration.config_key == task.value)
+                .where(AIConfiguration.is_active == True)
+                .order_by(AIConfiguration.priority.desc())
+                .limit(1)
+            )
+            config = result.scalar_one_or_none()
+            return _serialize_config(config) if config else None
+
+        return await cache_service.get_or_load(
+            CacheNamespace.AI_CONFIGURATIONS,
+            ("active", task.value),
+            load
+        )
 
     @classmethod
     async def get_provider(
@@ -29,55 +214,171 @@ class AIProviderFactory:
         db: AsyncSession
     ) -> AIProvider:
         """Get AI provider for a specific task."""
-
-        # Query configuration from database
-        result = await db.execute(
-            select(AIConfiguration)
-            .where(AIConfiguration.config_key == task.value)
-            .where(AIConfiguration.is_active == True)
-            .order_by(AIConfiguration.priority.desc())
-            .limit(1)
-        )
-        config = result.scalar_one_or_none()
+        config = await cls.get_active_config(task, db)
 
         if not config:
+            cls._release_task(task)
             raise ValueError(f"No AI provider configured for task: {task}")
 
-        cache_key = f"{config.provider}-{config.model_name}"
+        api_key = await cls._api_key(config, db)
+        fingerprint = _fingerprint(config, api_key)
+        entry = cls._instances.get(fingerprint)
+        if entry is not None and cls._task_fingerprints.get(task) == fingerprint:
+            return entry.instrumented
 
-        if cache_key in cls._providers:
-            return cls._providers[cache_key]
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
 
-        provider = cls._create_provider(config)
-        cls._providers[cache_key] = provider
+        async with cls._lock:
+            entry = cls._instances.get(fingerprint)
+            if entry is None:
+                provider = cls._create_provider(config, api_key)
+                stats_key = f"{config['provider']}-{config['model_name']}"
+                stats = cls._stats.setdefault(stats_key, ProviderStats())
+                entry = _ProviderEntry(
+                    fingerprint=fingerprint,
+                    stats_key=stats_key,
+                    provider=provider,
+                    instrumented=InstrumentedProvider(provider, stats)
+                )
+                cls._instances[fingerprint] = entry
+                logger.info(f"Created AI provider {stats_key} for task {task.value}")
 
-        return provider
+            previous = cls._task_fingerprints.get(task)
+            cls._task_fingerprints[task] = fingerprint
+            if previous != fingerprint:
+                if previous is not None:
+                    cls._retire_if_unused(previous)
+                cls._notify(task, entry.instrumented)
+
+        return entry.instrumented
 
     @classmethod
-    def _create_provider(cls, config: AIConfiguration) -> AIProvider:
+    async def _api_key(cls, config: dict, db: AsyncSession) -> Optional[str]:
+        """API key of a cached configuration, kept in this process only.
+
+        Memoized per configuration version, so the database is queried once
+        after each change rather than on every call.
+        """
+        version = (config["id"], config.get("updated_at"))
+        if version not in cls._api_keys:
+            result = await db.execute(
+                select(AIConfiguration.api_key_encrypted).where(AIConfiguration.id == config["id"])
+            )
+            # Drop keys of older versions of the same configuration
+            for stale in [v for v in cls._api_keys if v[0] == config["id"]]:
+                del cls._api_keys[stale]
+            cls._api_keys[version] = result.scalar_one_or_none()
+        return cls._api_keys[version]
+
+    @classmethod
+    def _create_provider(cls, config: dict, api_key: Optional[str]) -> AIProvider:
         """Create provider instance based on configuration."""
-        # TODO: Implement actual provider creation
-        # For now, return a placeholder
-        from .base_provider import AIProviderConfig
-        
         provider_config = AIProviderConfig(
-            api_key=config.api_key_encrypted,  # TODO: Decrypt
-            api_endpoint=config.api_endpoint,
-            model=config.model_name,
-            parameters=config.parameters or {}
+            api_key=api_key,  # TODO: Decrypt
+            api_endpoint=config.get("api_endpoint"),
+            model=config.get("model_name") or "",
+            parameters=config.get("parameters") or {}
         )
 
-        # TODO: Import and instantiate actual providers
-        # providers = {
-        #     "openai": OpenAIProvider,
-        #     "anthropic": AnthropicProvider,
-        #     "mistral": MistralProvider,
-        #     "local": LocalProvider,
-        # }
-        # provider_class = providers.get(config.provider)
-        # if not provider_class:
-        #     raise ValueError(f"Unknown provider: {config.provider}")
-        # return provider_class(provider_config)
-        
-        raise NotImplementedError("Provider creation not yet implemented")
+        provider_class = cls._provider_classes.get(config.get("provider"))
+        if provider_class is None:
+            raise NotImplementedError(
+                f"Provider creation not yet implemented for: {config.get('provider')}"
+            )
+        return provider_class(provider_config)
+
+    @classmethod
+    def _release_task(cls, task: AITask) -> None:
+        """Forget the provider of a task whose configuration disappeared."""
+        previous = cls._task_fingerprints.pop(task, None)
+        if previous is not None:
+            cls._retire_if_unused(previous)
+            cls._notify(task, None)
+
+    @classmethod
+    def _retire_if_unused(cls, fingerprint: str) -> None:
+        """Close an instance once no task refers to it any more."""
+        if fingerprint in cls._task_fingerprints.values():
+            return
+        entry = cls._instances.pop(fingerprint, None)
+        if entry is not None:
+            cls._spawn(cls._close_later(entry))
+
+    @classmethod
+    async def _close_later(cls, entry: _ProviderEntry) -> None:
+        """Close a replaced provider after in-flight calls had time to finish."""
+        await asyncio.sleep(PROVIDER_CLOSE_GRACE_SECONDS)
+        try:
+            await entry.provider.close()
+            logger.info(f"Closed stale AI provider {entry.stats_key}")
+        except Exception as e:
+            logger.warning(f"Error closing AI provider {entry.stats_key}: {e}")
+
+    @classmethod
+    def _notify(cls, task: AITask, provider: Optional[AIProvider]) -> None:
+        for callback in cls._change_listeners:
+            try:
+                callback(task, provider)
+            except Exception as e:
+                logger.warning(f"AI provider change listener failed: {e}")
+
+    @classmethod
+    def _spawn(cls, coro) -> None:
+        """Run a coroutine in the background, keeping a reference until done."""
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            coro.close()
+            return
+        cls._background_tasks.add(task)
+        task.add_done_callback(cls._background_tasks.discard)
+
+    @classmethod
+    async def reload(cls) -> None:
+        """Re-resolve every task in use, rebuilding providers whose config changed."""
+        if not cls._task_fingerprints:
+            return
+
+        session_maker = get_session_maker()
+        async with session_maker() as db:
+            for task in list(cls._task_fingerprints):
+                try:
+                    await cls.get_provider(task, db)
+                except Exception as e:
+                    logger.warning(f"Reloading AI provider for task {task.value} failed: {e}")
+                    cls._release_task(task)
+
+    @classmethod
+    def _on_cache_invalidated(cls, namespace: str, key: Optional[str]) -> None:
+        if namespace == CacheNamespace.AI_CONFIGURATIONS.value:
+            cls._spawn(cls.reload())
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close every provider immediately (application shutdown)."""
+        for task in list(cls._background_tasks):
+            task.cancel()
+        entries = list(cls._instances.values())
+        cls._instances.clear()
+        cls._task_fingerprints.clear()
+        for entry in entries:
+            try:
+                await entry.provider.close()
+            except Exception as e:
+                logger.warning(f"Error closing AI provider {entry.stats_key}: {e}")
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Per-provider latency/error counters and the task assignment."""
+        by_fingerprint = {fp: entry.stats_key for fp, entry in cls._instances.items()}
+        return {
+            "providers": {key: s.to_dict() for key, s in cls._stats.items()},
+            "tasks": {
+                task.value: by_fingerprint.get(fp)
+                for task, fp in cls._task_fingerprints.items()
+            },
+        }
+
 
+cache_service.add_invalidation_listener(AIProviderFactory._on_cache_invalidated)
@@ -1,7 +1,9 @@
 """Audit logging service."""
 from typing import Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
 from app.models.activity_log import ActivityLog
+from app.services.activity.activity_sink import activity_sink, build_activity_row
 import uuid
 
 
@@ -16,7 +18,8 @@ class AuditService:
         resource_type: Optional[str] = None,
         resource_id: Optional[uuid.UUID] = None,
         details: Optional[Dict[str, Any]] = None,
-        ip_address: Optional[str] = None
+        ip_address: Optional[str] = None,
+        durable: bool = False
     ) -> None:
         """
         Log an audit action.
@@ -29,17 +32,24 @@ class AuditService:
             resource_id: ID of resource (UUID)
             details: Additional details as dictionary
             ip_address: IP address of requester
+            durable: Add the entry to ``db`` so it commits with the caller's
+                transaction instead of being queued for a batched write
         """
-        activity_log = ActivityLog(
+        row = build_activity_row(
             user_id=user_id,
             action_type=action,
             entity_type=resource_type or "system",
             entity_id=resource_id,
-            meta_data=details or {},
+            metadata=details,
             ip_address=ip_address
         )
-        db.add(activity_log)
-        await db.commit()
+        if durable or not settings.ACTIVITY_LOG_ASYNC:
+            db.add(ActivityLog(**row))
+            if not durable:
+                await db.commit()
+            return
+        
+        await activity_sink.enqueue(row)
 
 
 audit_service = AuditService()
@@ -0,0 +1,195 @@
+"""Bulk dossier operations.
+
+Each operation locks the requested dossiers with one SELECT, applies the
+change with one set-based UPDATE over the affected ids, records the activity
+log entries with one multi-row INSERT in the same transaction and reports an
+outcome per id.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import any_, bindparam, case, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.document import Document, ProcessingStatus
+from app.models.dossier import Dossier, DossierStatus
+from app.models.review_snapshot import invalidate_snapshots
+from app.models.search_outbox import SearchOutbox, outbox_rows
+from app.models.user import User, UserRole
+from app.services.activity import ActivityLogger
+from app.services.activity.activity_sink import build_activity_row
+
+# Roles allowed to run each action, matching the single-dossier endpoints
+BULK_ACTIONS: Dict[str, List[UserRole]] = {
+    "approve": [UserRole.VALIDATOR],
+    "reject": [UserRole.VALIDATOR],
+    "assign": [UserRole.ADMINISTRATOR],
+    "archive": [UserRole.ADMINISTRATOR],
+    "reprocess": [UserRole.ADMINISTRATOR, UserRole.VALIDATOR],
+}
+
+TARGET_STATUS = {
+    "approve": DossierStatus.APPROVED,
+    "reject": DossierStatus.REJECTED,
+    "archive": DossierStatus.ARCHIVED,
+}
+
+# Same action types as the single-dossier endpoints
+ACTION_TYPES = {
+    "approve": "dossier.approved",
+    "reject": "dossier.rejected",
+    "assign": "dossier.assigned",
+    "archive": "dossier.archived",
+    "reprocess": "dossier.reprocessed",
+}
+
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+NOT_FOUND = "not_found"
+
+
+def _ids_param(ids: List[UUID]):
+    """Bind ``ids`` as one array parameter (``= ANY(:ids)``), whatever their number."""
+    return any_(bindparam("ids", ids, type_=ARRAY(PG_UUID(as_uuid=True))))
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a bulk operation, per dossier id in request order."""
+    action: str
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    # Rows of the changed dossiers after the update, and their previous state
+    dossiers: List[Any] = field(default_factory=list)
+    previous: Dict[UUID, Any] = field(default_factory=dict)
+    # Rows of the documents reset by ``reprocess``
+    documents: List[Any] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for result in self.results if result["result"] in (UPDATED, UNCHANGED))
+
+
+class BulkDossierService:
+    """Apply one action to many dossiers in a single transaction."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _lock(self, ids: List[UUID]) -> Dict[UUID, Any]:
+        result = await self.db.execute(
+            select(Dossier.id, Dossier.reference, Dossier.status, Dossier.assigned_validator_id)
+            .where(Dossier.id == _ids_param(ids))
+            .with_for_update()
+        )
+        return {row.id: row for row in result.all()}
+
+    async def apply(
+        self,
+        action: str,
+        dossier_ids: List[UUID],
+        user: User,
+        validator_id: Optional[UUID] = None,
+        reason: Optional[str] = None
+    ) -> BulkResult:
+        """Run ``action`` on ``dossier_ids`` and commit.
+
+        The caller checks the role (``BULK_ACTIONS``) and, for ``assign``,
+        that ``validator_id`` is an existing validator.
+        """
+        ids = list(dict.fromkeys(dossier_ids))
+        rows = await self._lock(ids)
+        outcome = BulkResult(action=action)
+
+        if action == "assign":
+            changed = [i for i in ids if i in rows and rows[i].assigned_validator_id != validator_id]
+        elif action == "reprocess":
+            changed = [i for i in ids if i in rows]
+        else:
+            changed = [i for i in ids if i in rows and rows[i].status != TARGET_STATUS[action]]
+
+        returned = (Dossier.id, Dossier.reference, Dossier.status, Dossier.assigned_validator_id)
+        if changed:
+            if action == "assign":
+                result = await self.db.execute(
+                    update(Dossier)
+                    .where(Dossier.id == _ids_param(changed))
+                    .values(
+                        assigned_validator_id=validator_id,
+                        status=case(
+                            (Dossier.status == DossierStatus.SUBMITTED, DossierStatus.AWAITING_REVIEW),
+                            else_=Dossier.status
+                        )
+                    )
+                    .returning(*returned)
+                    .execution_options(synchronize_session=False)
+                )
+                outcome.dossiers = result.all()
+            elif action == "reprocess":
+                result = await self.db.execute(
+                    update(Document)
+                    .where(Document.dossier_id == _ids_param(changed))
+                    .values(processing_status=ProcessingStatus.PENDING, processed_at=None, classification_confidence=None)
+                    .returning(Document.id, Document.dossier_id, Document.original_filename, Document.processing_status)
+                    .execution_options(synchronize_session=False)
+                )
+                outcome.documents = result.all()
+            else:
+                result = await self.db.execute(
+                    update(Dossier)
+                    .where(Dossier.id == _ids_param(changed))
+                    .values(status=TARGET_STATUS[action])
+                    .returning(*returned)
+                    .execution_options(synchronize_session=False)
+                )
+                outcome.dossiers = result.all()
+
+            # Set-based UPDATEs bypass the ORM flush hooks that feed the search outbox and review snapshots
+            changes = outbox_rows("dossiers", [row.id for row in outcome.dossiers])
+            changes += outbox_rows("documents", [row.id for row in outcome.documents])
+            if changes:
+                await self.db.execute(insert(SearchOutbox), changes)
+            await self.db.execute(invalidate_snapshots(changed))
+
+        documents: Dict[UUID, int] = {}
+        for document in outcome.documents:
+            documents[document.dossier_id] = documents.get(document.dossier_id, 0) + 1
+
+        changed_set = set(changed)
+        for dossier_id in ids:
+            row = rows.get(dossier_id)
+            if row is None:
+                outcome.results.append({"id": dossier_id, "result": NOT_FOUND})
+                continue
+            entry = {
+                "id": dossier_id,
+                "reference": row.reference,
+                "result": UPDATED if dossier_id in changed_set else UNCHANGED
+            }
+            if action == "reprocess":
+                entry["documents"] = documents.get(dossier_id, 0)
+            outcome.results.append(entry)
+
+        outcome.previous = {i: rows[i] for i in changed}
+
+        logger = ActivityLogger(self.db)
+        await logger.log_many([
+            build_activity_row(
+                user_id=user.id,
+                action_type=ACTION_TYPES[action],
+                entity_type="dossier",
+                entity_id=dossier_id,
+                entity_reference=rows[dossier_id].reference,
+                description=f"Dossier {rows[dossier_id].reference} {ACTION_TYPES[action].split('.')[1]} (bulk)",
+                metadata={k: v for k, v in {
+                    "bulk_size": len(ids),
+                    "validator_id": str(validator_id) if validator_id else None,
+                    "reason": reason,
+                }.items() if v is not None}
+            )
+            for dossier_id in changed
+        ], durable=True)
+
+        await self.db.commit()
+        return outcome
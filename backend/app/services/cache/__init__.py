@@ -0,0 +1,17 @@
+"""Caching services."""
+from .lru import LRUCache, MISSING
+from .cache_service import CacheService, CacheNamespace, TAG_NAMESPACE, cache_service
+from .response_cache import ResponseCache, CachePolicy, CachedResponse, response_cache
+
+__all__ = [
+    "LRUCache",
+    "MISSING",
+    "CacheService",
+    "CacheNamespace",
+    "TAG_NAMESPACE",
+    "cache_service",
+    "ResponseCache",
+    "CachePolicy",
+    "CachedResponse",
+    "response_cache",
+]
@@ -0,0 +1,385 @@
+"""Multi-level cache service (in-process LRU + optional Redis)."""
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from enum import Enum
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    aioredis = None
+
+from app.core.config import settings
+from .lru import LRUCache, MISSING
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of cached values changes so old entries are never read.
+CACHE_SCHEMA_VERSION = 1
+
+INVALIDATION_CHANNEL = f"{settings.CACHE_KEY_PREFIX}:cache:invalidate"
+
+# Pseudo-namespace passed to invalidation listeners for free-form tags
+TAG_NAMESPACE = "tag"
+
+
+class CacheNamespace(str, Enum):
+    """Cache namespaces for reference data."""
+    PROCESSES = "processes"
+    FIELD_SCHEMAS = "field_schemas"
+    VALIDATION_RULES = "validation_rules"
+    AI_CONFIGURATIONS = "ai_configurations"
+
+
+KeyPart = Union[str, int, None, uuid.UUID, list, tuple]
+
+
+def _normalize_key(key: KeyPart) -> str:
+    """Build a stable string key from a scalar or a sequence of parts."""
+    if isinstance(key, (list, tuple)):
+        return ":".join(_normalize_key(part) for part in key)
+    if key is None:
+        return "-"
+    return str(key)
+
+
+class CacheService:
+    """Two-tier cache for rarely changing reference data.
+
+    Reads check the in-process LRU first, then Redis (when enabled), then fall
+    back to the loader. Every namespace carries a version that is embedded in
+    the key; invalidating a namespace bumps the version, which orphans all of
+    its entries at once, and is broadcast to other workers over Redis pub/sub.
+    """
+
+    def __init__(self):
+        self.enabled = settings.CACHE_ENABLED
+        self.local = LRUCache(
+            max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+            ttl=settings.CACHE_LOCAL_TTL
+        )
+        self.redis_ttl = settings.REDIS_TTL
+        self.redis = None
+        self.worker_id = uuid.uuid4().hex
+        self._versions: dict[str, int] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._listener_task: Optional[asyncio.Task] = None
+        self._listeners: list[Callable[[str, Optional[str]], Any]] = []
+        self._stats: dict[str, dict[str, int]] = defaultdict(lambda: {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "invalidations": 0,
+        })
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Connect the Redis tier and subscribe to invalidation messages."""
+        if not (self.enabled and settings.CACHE_REDIS_ENABLED):
+            return
+        if not REDIS_AVAILABLE:
+            logger.warning("CACHE_REDIS_ENABLED is set but the redis package is not installed")
+            return
+
+        try:
+            self.redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+            await self.redis.ping()
+        except Exception as e:
+            logger.warning(f"Redis cache tier unavailable, using in-process cache only: {e}")
+            self.redis = None
+            return
+
+        self._listener_task = asyncio.create_task(self._listen_for_invalidations())
+
+    async def stop(self) -> None:
+        """Stop the invalidation listener and close the Redis connection."""
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        if self.redis is not None:
+            try:
+                await self.redis.close()
+            except Exception:
+                pass
+            self.redis = None
+
+    # Keys
+
+    async def _get_version(self, namespace: str) -> int:
+        """Return the current version of a namespace."""
+        version = self._versions.get(namespace)
+        if version is not None:
+            return version
+
+        version = 0
+        if self.redis is not None:
+            try:
+                stored = await self.redis.get(self._version_key(namespace))
+                version = int(stored) if stored else 0
+            except Exception as e:
+                logger.warning(f"Failed to read cache version for {namespace}: {e}")
+        self._versions[namespace] = version
+        return version
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}:cache:version:{namespace}"
+
+    def _namespace_prefix(self, namespace: str) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}:s{CACHE_SCHEMA_VERSION}:{namespace}:"
+
+    async def make_key(self, namespace: Union[CacheNamespace, str], key: KeyPart) -> str:
+        """Build the fully qualified, versioned key for ``key`` in ``namespace``."""
+        namespace = CacheNamespace(namespace).value if isinstance(namespace, CacheNamespace) else namespace
+        version = await self._get_version(namespace)
+        return f"{self._namespace_prefix(namespace)}v{version}:{_normalize_key(key)}"
+
+    # Reads and writes
+
+    async def get(self, namespace: Union[CacheNamespace, str], key: KeyPart) -> Any:
+        """Return a cached value or ``MISSING``."""
+        if not self.enabled:
+            return MISSING
+
+        ns = getattr(namespace, "value", namespace)
+        full_key = await self.make_key(ns, key)
+
+        value = self.local.get(full_key)
+        if value is not MISSING:
+            self._stats[ns]["local_hits"] += 1
+            return value
+
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(full_key)
+            except Exception as e:
+                logger.warning(f"Redis cache read failed: {e}")
+                raw = None
+            if raw is not None:
+                value = json.loads(raw)
+                self.local.set(full_key, value)
+                self._stats[ns]["redis_hits"] += 1
+                return value
+
+        self._stats[ns]["misses"] += 1
+        return MISSING
+
+    async def set(
+        self,
+        namespace: Union[CacheNamespace, str],
+        key: KeyPart,
+        value: Any,
+        ttl: Optional[int] = None
+    ) -> None:
+        """Store a JSON-serializable value in both tiers."""
+        if not self.enabled:
+            return
+
+        ns = getattr(namespace, "value", namespace)
+        await self._store(ns, await self.make_key(ns, key), value, ttl)
+
+    async def _store(self, ns: str, full_key: str, value: Any, ttl: Optional[int]) -> None:
+        self.local.set(full_key, value)
+        self._stats[ns]["sets"] += 1
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(full_key, json.dumps(value, default=str), ex=ttl or self.redis_ttl)
+            except Exception as e:
+                logger.warning(f"Redis cache write failed: {e}")
+
+    async def get_or_load(
+        self,
+        namespace: Union[CacheNamespace, str],
+        key: KeyPart,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None
+    ) -> Any:
+        """Return the cached value, calling ``loader`` on a miss.
+
+        Concurrent misses for the same key share a single loader call.
+        """
+        value = await self.get(namespace, key)
+        if value is not MISSING:
+            return value
+
+        if not self.enabled:
+            return await loader()
+
+        ns = getattr(namespace, "value", namespace)
+        full_key = await self.make_key(ns, key)
+        pending = self._inflight.get(full_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[full_key] = future
+        try:
+            value = await loader()
+            # Stored under the version read before loading: if the namespace was
+            # invalidated meanwhile, the value lands under the old version and is never served
+            await self._store(ns, full_key, value, ttl)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(full_key, None)
+
+    # Invalidation
+
+    async def invalidate(self, namespace: Union[CacheNamespace, str], key: KeyPart = None) -> None:
+        """Invalidate one key, or a whole namespace when ``key`` is None.
+
+        Local entries are dropped immediately; other workers are notified via
+        Redis pub/sub.
+        """
+        ns = getattr(namespace, "value", namespace)
+        self._stats[ns]["invalidations"] += 1
+
+        if key is None:
+            version = await self._get_version(ns) + 1
+            if self.redis is not None:
+                try:
+                    version = int(await self.redis.incr(self._version_key(ns)))
+                except Exception as e:
+                    logger.warning(f"Failed to bump cache version for {ns}: {e}")
+            self._apply_namespace_version(ns, version)
+            message = {"origin": self.worker_id, "namespace": ns, "key": None, "version": version}
+        else:
+            full_key = await self.make_key(ns, key)
+            self.local.delete(full_key)
+            if self.redis is not None:
+                try:
+                    await self.redis.delete(full_key)
+                except Exception as e:
+                    logger.warning(f"Redis cache delete failed: {e}")
+            message = {"origin": self.worker_id, "namespace": ns, "key": full_key, "version": None}
+
+        self._notify_listeners(ns, message["key"])
+
+        if self.redis is not None:
+            try:
+                await self.redis.publish(INVALIDATION_CHANNEL, json.dumps(message))
+            except Exception as e:
+                logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Broadcast free-form invalidation tags (e.g. ``dossier:<id>``).
+
+        Tags carry no cached data of their own; listeners such as the response
+        cache use them to drop entries derived from the tagged entity.
+        """
+        tags = sorted(set(tags))
+        if not tags:
+            return
+
+        for tag in tags:
+            self._stats[TAG_NAMESPACE]["invalidations"] += 1
+            self._notify_listeners(TAG_NAMESPACE, tag)
+
+        if self.redis is not None:
+            try:
+                await self.redis.publish(
+                    INVALIDATION_CHANNEL,
+                    json.dumps({"origin": self.worker_id, "tags": tags})
+                )
+            except Exception as e:
+                logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def _apply_namespace_version(self, namespace: str, version: int) -> None:
+        """Move a namespace to ``version`` and drop its local entries."""
+        if version >= self._versions.get(namespace, 0):
+            self._versions[namespace] = version
+        self.local.delete_prefix(self._namespace_prefix(namespace))
+
+    def add_invalidation_listener(self, callback: Callable[[str, Optional[str]], Any]) -> None:
+        """Register ``callback(namespace, key)`` for local and remote invalidations."""
+        self._listeners.append(callback)
+
+    def _notify_listeners(self, namespace: str, key: Optional[str]) -> None:
+        for callback in self._listeners:
+            try:
+                callback(namespace, key)
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {e}")
+
+    async def _listen_for_invalidations(self) -> None:
+        """Apply invalidations published by other workers."""
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.redis.pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        payload = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    if payload.get("origin") == self.worker_id:
+                        continue
+
+                    if payload.get("tags"):
+                        for tag in payload["tags"]:
+                            self._notify_listeners(TAG_NAMESPACE, tag)
+                        continue
+
+                    namespace = payload.get("namespace")
+                    if payload.get("key"):
+                        self.local.delete(payload["key"])
+                    elif payload.get("version") is not None:
+                        self._apply_namespace_version(namespace, int(payload["version"]))
+                    self._notify_listeners(namespace, payload.get("key"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error, reconnecting: {e}")
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+    # Metrics
+
+    def stats(self) -> dict:
+        """Return hit/miss counters per namespace plus tier information."""
+        namespaces = {}
+        for ns, counters in self._stats.items():
+            lookups = counters["local_hits"] + counters["redis_hits"] + counters["misses"]
+            hits = counters["local_hits"] + counters["redis_hits"]
+            namespaces[ns] = {
+                **counters,
+                "hit_ratio": round(hits / lookups, 4) if lookups else None,
+                "version": self._versions.get(ns, 0),
+            }
+
+        return {
+            "enabled": self.enabled,
+            "redis_connected": self.redis is not None,
+            "local_entries": len(self.local),
+            "local_max_entries": self.local.max_entries,
+            "local_evictions": self.local.evictions,
+            "namespaces": namespaces,
+        }
+
+
+cache_service = CacheService()
@@ -0,0 +1,77 @@
+"""In-process LRU cache with per-entry TTL."""
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class _Missing:
+    """Sentinel type for cache misses (``None`` is a valid cached value)."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+class LRUCache:
+    """Bounded least-recently-used cache.
+
+    Entries expire after ``ttl`` seconds; the least recently used entry is
+    evicted once ``max_entries`` is reached. Not thread-safe: it is meant to be
+    used from a single asyncio event loop.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple[Optional[float], Any]]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key: str) -> Any:
+        """Return the cached value or ``MISSING``."""
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return MISSING
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        if key in self._data:
+            self._data.move_to_end(key)
+        self._data[key] = (expires_at, value)
+
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Remove a key. Returns True if it was present."""
+        return self._data.pop(key, None) is not None
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every key starting with ``prefix``. Returns the number removed."""
+        keys = [k for k in self._data if k.startswith(prefix)]
+        for k in keys:
+            del self._data[k]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not MISSING
@@ -0,0 +1,154 @@
+"""Cached loaders for reference data (processes, schemas, rules).
+
+Values are plain JSON-serializable dicts so they can live in the Redis tier;
+treat them as read-only since the in-process tier hands out shared objects.
+"""
+from typing import Iterable, Optional
+from uuid import UUID
+from sqlalchemy import select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.process import Process
+from app.models.field_schema import FieldSchema
+from app.models.validation_rule import ValidationRule
+from .cache_service import cache_service, CacheNamespace
+
+
+def _sorted_ids(ids: Iterable[Optional[UUID]]) -> list[str]:
+    """Deduplicate and sort ids so equivalent lookups share a cache key."""
+    return sorted({str(i) for i in ids if i})
+
+
+def serialize_rule(rule: ValidationRule) -> dict:
+    """Serialize a validation rule for caching."""
+    return {
+        "id": str(rule.id),
+        "code": rule.code,
+        "name": rule.name,
+        "description": rule.description,
+        "process_id": str(rule.process_id) if rule.process_id else None,
+        "document_type_id": str(rule.document_type_id) if rule.document_type_id else None,
+        "rule_type": rule.rule_type,
+        "severity": rule.severity,
+        "expression": rule.expression,
+        "error_message": rule.error_message,
+        "can_override": rule.can_override,
+        "is_active": rule.is_active,
+        "version": rule.version
+    }
+
+
+def serialize_field_schema(schema: FieldSchema) -> dict:
+    """Serialize a field schema for caching."""
+    return {
+        "id": str(schema.id),
+        "document_type_id": str(schema.document_type_id) if schema.document_type_id else None,
+        "field_name": schema.field_name,
+        "display_name": schema.display_name,
+        "description": schema.description,
+        "data_type": schema.data_type,
+        "is_required": schema.is_required,
+        "validation_pattern": schema.validation_pattern,
+        "extraction_hints": schema.extraction_hints,
+        "default_value": schema.default_value,
+        "display_order": schema.display_order,
+        "is_active": schema.is_active
+    }
+
+
+def serialize_process(process: Process) -> dict:
+    """Serialize a process for caching."""
+    return {
+        "id": str(process.id),
+        "code": process.code,
+        "name": process.name,
+        "category": process.category,
+        "is_active": process.is_active,
+        "created_at": process.created_at.isoformat() if process.created_at else None
+    }
+
+
+async def get_applicable_rules(
+    db: AsyncSession,
+    process_id: Optional[UUID],
+    document_type_ids: Iterable[Optional[UUID]]
+) -> list[dict]:
+    """Active rules that apply to a process and a set of document types.
+
+    Rules match when they are process-specific (or general) and
+    document-type-specific (or general).
+    """
+    type_ids = _sorted_ids(document_type_ids)
+
+    async def load() -> list[dict]:
+        conditions = [ValidationRule.is_active == True]
+        if process_id:
+            conditions.append(
+                or_(
+                    ValidationRule.process_id == process_id,
+                    ValidationRule.process_id.is_(None)
+                )
+            )
+        if type_ids:
+            conditions.append(
+                or_(
+                    ValidationRule.document_type_id.in_([UUID(i) for i in type_ids]),
+                    ValidationRule.document_type_id.is_(None)
+                )
+            )
+        result = await db.execute(select(ValidationRule).where(*conditions))
+        return [serialize_rule(r) for r in result.scalars().all()]
+
+    return await cache_service.get_or_load(
+        CacheNamespace.VALIDATION_RULES,
+        ("applicable", process_id, ",".join(type_ids)),
+        load
+    )
+
+
+async def get_active_field_schemas(
+    db: AsyncSession,
+    document_type_ids: Iterable[Optional[UUID]]
+) -> list[dict]:
+    """Active field schemas for a set of document types, in display order."""
+    type_ids = _sorted_ids(document_type_ids)
+    if not type_ids:
+        return []
+
+    async def load() -> list[dict]:
+        result = await db.execute(
+            select(FieldSchema).where(
+                FieldSchema.document_type_id.in_([UUID(i) for i in type_ids]),
+                FieldSchema.is_active == True
+            ).order_by(FieldSchema.display_order)
+        )
+        return [serialize_field_schema(s) for s in result.scalars().all()]
+
+    return await cache_service.get_or_load(
+        CacheNamespace.FIELD_SCHEMAS,
+        ("active", ",".join(type_ids)),
+        load
+    )
+
+
+async def list_processes(
+    db: AsyncSession,
+    is_active: Optional[bool] = None,
+    category: Optional[str] = None
+) -> list[dict]:
+    """Processes ordered by code, optionally filtered."""
+
+    async def load() -> list[dict]:
+        query = select(Process)
+        if is_active is not None:
+            query = query.where(Process.is_active == is_active)
+        if category:
+            query = query.where(Process.category == category)
+        result = await db.execute(query.order_by(Process.code))
+        return [serialize_process(p) for p in result.scalars().all()]
+
+    return await cache_service.get_or_load(
+        CacheNamespace.PROCESSES,
+        ("list", is_active, category),
+        load
+    )
@@ -0,0 +1,241 @@
+"""HTTP response cache for read-heavy Motia steps.
+
+Steps opt in declaratively through their ``config`` dict::
+
+    "cache": {
+        "ttl": 30,                                  # seconds
+        "scope": "user",                            # "user" (per JWT subject) or "public"
+        "tags": ["dossier:{dossier_id}", "validation_rules"],
+    }
+
+Write steps declare the tags they invalidate with ``"invalidates": [...]``;
+templates are rendered from path parameters. Reference-data namespace
+invalidations (``CacheNamespace``) also drop entries tagged with the
+namespace name, so rule/schema/process edits flush dependent responses.
+
+User-scoped hits skip the step handler, so the account behind the token is
+checked separately: its active flag and role are looked up at most every
+``CACHE_ACCOUNT_CHECK_TTL`` seconds, and the role is part of the key. A
+deactivated user or a role change stops being served cached responses within
+that delay rather than the response TTL.
+"""
+import hashlib
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional
+
+from app.core.config import settings
+from app.core.security import decode_access_token
+from .cache_service import cache_service, TAG_NAMESPACE
+from .lru import LRUCache, MISSING
+
+SCOPE_USER = "user"
+SCOPE_PUBLIC = "public"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching policy declared in a step config."""
+    ttl: int
+    scope: str = SCOPE_USER
+    tags: tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> Optional["CachePolicy"]:
+        """Build the policy of a step, or None if the step is not cacheable."""
+        cache_config = config.get("cache")
+        if not cache_config or (config.get("method") or "GET").upper() != "GET":
+            return None
+        return cls(
+            ttl=int(cache_config.get("ttl", 30)),
+            scope=cache_config.get("scope", SCOPE_USER),
+            tags=tuple(cache_config.get("tags", ())),
+        )
+
+
+@dataclass
+class CachedResponse:
+    """A serialized response ready to be replayed."""
+    body: bytes
+    status: int
+    content_type: str
+    etag: str
+    headers: dict[str, str] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+    encoded: dict[str, bytes] = field(default_factory=dict)  # Compressed variants by content coding
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag derived from the response bytes."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate ``If-None-Match`` against an ETag (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def render_tags(templates: Iterable[str], params: Mapping[str, str]) -> list[str]:
+    """Render tag templates such as ``dossier:{dossier_id}`` from path params.
+
+    Templates referring to a missing parameter are skipped.
+    """
+    tags = []
+    for template in templates:
+        try:
+            tags.append(template.format(**params))
+        except (KeyError, IndexError):
+            continue
+    return tags
+
+
+def principal_scope(policy: CachePolicy, headers: Mapping[str, str]) -> Optional[str]:
+    """Identify whose view of the resource a request sees.
+
+    Returns None when the request cannot be served from cache (e.g. missing or
+    invalid token), so the step handler produces the proper error response.
+    """
+    if policy.scope == SCOPE_PUBLIC:
+        return SCOPE_PUBLIC
+
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    if not auth_header.startswith("Bearer "):
+        return None
+    payload = decode_access_token(auth_header.replace("Bearer ", ""))
+    if not payload or not payload.get("sub"):
+        return None
+    return f"user:{payload['sub']}"
+
+
+# User id -> role of the active account, or "" when it is missing or inactive
+_accounts = LRUCache(max_entries=4096, ttl=settings.CACHE_ACCOUNT_CHECK_TTL)
+
+
+async def _account_role(user_id: str) -> str:
+    from uuid import UUID
+    from sqlalchemy import select
+    from app.core.database import get_session_maker
+    from app.models.user import User
+
+    try:
+        user_uuid = UUID(user_id)
+    except ValueError:
+        return ""
+    async with get_session_maker()() as db:
+        row = (await db.execute(select(User.active, User.role).where(User.id == user_uuid))).first()
+    if row is None or not row.active:
+        return ""
+    return getattr(row.role, "value", row.role)
+
+
+async def verify_principal(principal: str) -> Optional[str]:
+    """Bind a user principal to the current role of an active account.
+
+    Returns None for missing or inactive accounts, so the step handler
+    produces the proper error response.
+    """
+    if principal == SCOPE_PUBLIC:
+        return principal
+    user_id = principal.split(":", 1)[1]
+    role = _accounts.get(user_id)
+    if role is MISSING:
+        role = await _account_role(user_id)
+        _accounts.set(user_id, role)
+    return f"{principal}:{role}" if role else None
+
+
+class ResponseCache:
+    """In-process cache of serialized step responses, indexed by tag."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.entries = LRUCache(max_entries=max_entries)
+        self._tag_index: dict[str, set[str]] = defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+
+    def build_key(
+        self,
+        step_name: str,
+        path: str,
+        query: Mapping[str, Any],
+        principal: str
+    ) -> str:
+        """Cache key from route, normalized query parameters and principal."""
+        items = []
+        for name in sorted(query):
+            value = query[name]
+            values = sorted(value) if isinstance(value, (list, tuple)) else [value]
+            items.extend(f"{name}={v}" for v in values)
+        return f"{step_name}|{path}|{'&'.join(items)}|{principal}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self.entries.get(key)
+        if entry is MISSING:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def store(self, key: str, response: CachedResponse, ttl: int, tags: Iterable[str]) -> None:
+        self.entries.set(key, response, ttl=ttl)
+        for tag in tags:
+            self._tag_index[tag].add(key)
+        if len(self._tag_index) > 4 * self.entries.max_entries:
+            self._prune_tag_index()
+
+    def _prune_tag_index(self) -> None:
+        """Forget evicted or expired keys so the tag index stays bounded."""
+        for tag in list(self._tag_index):
+            live = {key for key in self._tag_index[tag] if key in self.entries}
+            if live:
+                self._tag_index[tag] = live
+            else:
+                del self._tag_index[tag]
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Drop every entry carrying ``tag``. Returns the number removed."""
+        keys = self._tag_index.pop(tag, set())
+        removed = sum(1 for key in keys if self.entries.delete(key))
+        if keys:
+            self.invalidations += 1
+        return removed
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self._tag_index.clear()
+
+    def _on_invalidation(self, namespace: str, key: Optional[str]) -> None:
+        """Map cache-service invalidations (local or remote) onto tags."""
+        if namespace == TAG_NAMESPACE:
+            if key:
+                self.invalidate_tag(key)
+        elif key is None:
+            self.invalidate_tag(namespace)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.entries),
+            "tags": len(self._tag_index),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+        }
+
+
+response_cache = ResponseCache(max_entries=settings.CACHE_LOCAL_MAX_ENTRIES)
+cache_service.add_invalidation_listener(response_cache._on_invalidation)
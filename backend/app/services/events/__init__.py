@@ -0,0 +1,20 @@
+"""Server-sent status events."""
+from .event_bus import EventBus, Subscription, event_bus
+from .status_events import (
+    dossier_channel,
+    validator_channel,
+    publish_dossier_status,
+    publish_document_status,
+    publish_validation_result,
+)
+
+__all__ = [
+    "EventBus",
+    "Subscription",
+    "event_bus",
+    "dossier_channel",
+    "validator_channel",
+    "publish_dossier_status",
+    "publish_document_status",
+    "publish_validation_result",
+]
@@ -0,0 +1,302 @@
+"""Status-change events pushed to clients over server-sent events.
+
+Events are published to channels (``dossier:<id>``, ``validator:<user id>``)
+and fanned out to local subscriptions. With ``EVENTS_REDIS_ENABLED`` they are
+also broadcast over Redis pub/sub so every worker sees every event, and event
+ids come from a shared Redis counter.
+
+Each worker keeps the last ``EVENTS_REPLAY_SIZE`` events so a reconnecting
+client can resume from its ``Last-Event-ID``; when the gap is no longer
+covered it gets a ``resync`` event and should refetch its state. Each
+subscription buffers at most ``EVENTS_MAX_QUEUED`` events /
+``EVENTS_MAX_QUEUED_BYTES`` bytes; a slow client exceeding that is marked
+overflowed and disconnected, and resumes from the replay buffer.
+"""
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    aioredis = None
+
+from app.core.config import settings
+from app.core.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = f"{settings.CACHE_KEY_PREFIX}:events"
+EVENT_ID_KEY = f"{settings.CACHE_KEY_PREFIX}:events:last_id"
+
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+
+
+@dataclass
+class Event:
+    """A published event with its pre-encoded SSE frame."""
+    id: Optional[int]
+    type: str
+    channels: Tuple[str, ...]
+    frame: bytes
+
+
+def encode_frame(event_id: Optional[int], event_type: str, payload: bytes) -> bytes:
+    """Encode one SSE frame. ``payload`` is compact JSON without newlines."""
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{id_line}event: {event_type}\ndata: ".encode() + payload + b"\n\n"
+
+
+class Subscription:
+    """Bounded buffer of events for one client connection."""
+
+    def __init__(self, bus: "EventBus", channels: Iterable[str], max_events: int, max_bytes: int):
+        self.bus = bus
+        self.channels = frozenset(channels)
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.overflowed = False
+        self.closed = False
+        self._queue: Deque[Event] = deque()
+        self._bytes = 0
+        self._ready = asyncio.Event()
+
+    def push(self, event: Event) -> None:
+        if self.overflowed or self.closed:
+            return
+        if len(self._queue) >= self.max_events or self._bytes + len(event.frame) > self.max_bytes:
+            # Drop the backlog; the client resumes from the replay buffer
+            self.overflowed = True
+            self._queue.clear()
+            self._bytes = 0
+            self.bus.overflows += 1
+        else:
+            self._queue.append(event)
+            self._bytes += len(event.frame)
+        self._ready.set()
+
+    async def next(self, timeout: float) -> List[Event]:
+        """Wait up to ``timeout`` seconds and return the buffered events."""
+        if not self._queue and not (self.overflowed or self.closed):
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return []
+        self._ready.clear()
+        events = list(self._queue)
+        self._queue.clear()
+        self._bytes = 0
+        return events
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """Channel-based fan-out of events to SSE subscriptions."""
+
+    def __init__(self, replay_size: int = 1000, max_queued: int = 256, max_queued_bytes: int = 1048576):
+        self.enabled = settings.EVENTS_ENABLED
+        self.max_queued = max_queued
+        self.max_queued_bytes = max_queued_bytes
+        self.redis = None
+        self.worker_id = uuid.uuid4().hex
+        self._recent: Deque[Event] = deque(maxlen=replay_size)
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._last_id = 0
+        self._listener_task: Optional[asyncio.Task] = None
+        self.published = 0
+        self.delivered = 0
+        self.overflows = 0
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Connect to Redis and listen for events published by other workers."""
+        if not (self.enabled and settings.EVENTS_REDIS_ENABLED):
+            return
+        if not REDIS_AVAILABLE:
+            logger.warning("EVENTS_REDIS_ENABLED is set but the redis package is not installed")
+            return
+
+        try:
+            self.redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+            await self.redis.ping()
+        except Exception as e:
+            logger.warning(f"Redis unavailable, events are delivered to this worker only: {e}")
+            self.redis = None
+            return
+
+        self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Close open subscriptions, the listener and the Redis connection."""
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
+
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        if self.redis is not None:
+            try:
+                await self.redis.close()
+            except Exception:
+                pass
+            self.redis = None
+
+    # Subscriptions
+
+    def subscribe(self, channels: Iterable[str], last_event_id: Optional[int] = None) -> Subscription:
+        """Subscribe to ``channels``, replaying events after ``last_event_id``."""
+        subscription = Subscription(self, channels, self.max_queued, self.max_queued_bytes)
+        if last_event_id is not None:
+            missed = [
+                event for event in self._recent
+                if event.id > last_event_id and subscription.channels.intersection(event.channels)
+            ]
+            oldest = self._recent[0].id if self._recent else None
+            covered = oldest is not None and oldest <= last_event_id + 1
+            too_large = len(missed) > self.max_queued or sum(len(e.frame) for e in missed) > self.max_queued_bytes
+            if not covered or too_large:
+                # Events may have been missed, or are too many to replay; the client must refetch
+                missed = [Event(None, "resync", (), RESYNC_FRAME)]
+            for event in missed:
+                subscription.push(event)
+        for channel in subscription.channels:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for channel in subscription.channels:
+            subscriptions = self._subscriptions.get(channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[channel]
+
+    # Publishing
+
+    async def _next_id(self) -> int:
+        if self.redis is not None:
+            try:
+                return int(await self.redis.incr(EVENT_ID_KEY))
+            except Exception as e:
+                logger.warning(f"Failed to allocate event id from Redis: {e}")
+        return self._last_id + 1
+
+    async def publish(self, event_type: str, channels: Iterable[str], data: Dict[str, Any]) -> Optional[int]:
+        """Publish an event to local subscribers and other workers.
+
+        Failures are logged, never raised: events are best effort and must not
+        fail the request that caused them. Returns the event id.
+        """
+        if not self.enabled:
+            return None
+        channels = tuple(channels)
+        try:
+            event_id = await self._next_id()
+            payload = dumps(data)
+            self._dispatch(Event(event_id, event_type, channels, encode_frame(event_id, event_type, payload)))
+            self.published += 1
+        except Exception as e:
+            logger.warning(f"Failed to publish {event_type} event: {e}")
+            return None
+
+        if self.redis is not None:
+            try:
+                message = b'{"origin":"%s","id":%d,"type":%s,"channels":%s,"data":%s}' % (
+                    self.worker_id.encode(), event_id, dumps(event_type), dumps(list(channels)), payload
+                )
+                await self.redis.publish(EVENTS_CHANNEL, message)
+            except Exception as e:
+                logger.warning(f"Failed to broadcast {event_type} event: {e}")
+        return event_id
+
+    def _dispatch(self, event: Event) -> None:
+        self._last_id = max(self._last_id, event.id)
+        self._recent.append(event)
+        targets = set()
+        for channel in event.channels:
+            targets.update(self._subscriptions.get(channel, ()))
+        for subscription in targets:
+            subscription.push(event)
+        self.delivered += len(targets)
+
+    async def _listen(self) -> None:
+        """Dispatch events published by other workers."""
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.redis.pubsub()
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        payload = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    if payload.get("origin") == self.worker_id:
+                        continue
+                    event_id = int(payload["id"])
+                    self._dispatch(Event(
+                        event_id,
+                        payload["type"],
+                        tuple(payload["channels"]),
+                        encode_frame(event_id, payload["type"], dumps(payload["data"]))
+                    ))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Event listener error, reconnecting: {e}")
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+    # Metrics
+
+    def stats(self) -> dict:
+        connections = set()
+        for subscriptions in self._subscriptions.values():
+            connections.update(subscriptions)
+        return {
+            "enabled": self.enabled,
+            "redis_connected": self.redis is not None,
+            "connections": len(connections),
+            "channels": len(self._subscriptions),
+            "replay_buffer": len(self._recent),
+            "last_event_id": self._last_id,
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflows": self.overflows,
+        }
+
+
+event_bus = EventBus(
+    replay_size=settings.EVENTS_REPLAY_SIZE,
+    max_queued=settings.EVENTS_MAX_QUEUED,
+    max_queued_bytes=settings.EVENTS_MAX_QUEUED_BYTES,
+)
@@ -0,0 +1,64 @@
+"""Publishers for dossier, document and validation status changes.
+
+Call these after the change is committed. Events go to the dossier channel
+and, when the dossier is assigned, to the validator's queue channel.
+"""
+from typing import Any, Optional
+
+from .event_bus import event_bus
+
+
+def dossier_channel(dossier_id: Any) -> str:
+    return f"dossier:{dossier_id}"
+
+
+def validator_channel(validator_id: Any) -> str:
+    return f"validator:{validator_id}"
+
+
+def _channels(dossier_id: Any, validator_id: Any = None) -> list[str]:
+    channels = [dossier_channel(dossier_id)]
+    if validator_id is not None:
+        channels.append(validator_channel(validator_id))
+    return channels
+
+
+async def publish_dossier_status(dossier, previous_status: Any = None, previous_validator_id: Any = None) -> None:
+    """Publish a ``dossier.status`` event for a status or assignment change.
+
+    A validator the dossier was taken from is notified as well, so it can
+    drop the dossier from its queue.
+    """
+    channels = _channels(dossier.id, dossier.assigned_validator_id)
+    if previous_validator_id is not None and previous_validator_id != dossier.assigned_validator_id:
+        channels.append(validator_channel(previous_validator_id))
+    await event_bus.publish("dossier.status", channels, {
+        "dossier_id": dossier.id,
+        "reference": dossier.reference,
+        "status": dossier.status,
+        "previous_status": previous_status,
+        "assigned_validator_id": dossier.assigned_validator_id,
+    })
+
+
+async def publish_document_status(document, validator_id: Optional[Any] = None) -> None:
+    """Publish a ``document.status`` event for a processing status change."""
+    await event_bus.publish("document.status", _channels(document.dossier_id, validator_id), {
+        "document_id": document.id,
+        "dossier_id": document.dossier_id,
+        "filename": document.original_filename,
+        "processing_status": document.processing_status,
+    })
+
+
+async def publish_validation_result(result, validator_id: Optional[Any] = None) -> None:
+    """Publish a ``validation.result`` event for a new or overridden result."""
+    await event_bus.publish("validation.result", _channels(result.dossier_id, validator_id), {
+        "id": result.id,
+        "dossier_id": result.dossier_id,
+        "rule_id": result.rule_id,
+        "status": result.status,
+        "message": result.message,
+        "affected_fields": result.affected_fields,
+        "overridden": result.overridden,
+    })
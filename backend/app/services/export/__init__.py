@@ -0,0 +1,17 @@
+"""Streaming data exports (CSV, JSON Lines, JSON, Parquet)."""
+from .datasets import DATASETS, ExportDataset
+from .exporter import export_chunks, export_filename, export_to_storage, stream_response
+from .writers import PYARROW_AVAILABLE, WRITERS, ExportWriter, get_writer
+
+__all__ = [
+    "DATASETS",
+    "ExportDataset",
+    "ExportWriter",
+    "PYARROW_AVAILABLE",
+    "WRITERS",
+    "export_chunks",
+    "export_filename",
+    "export_to_storage",
+    "get_writer",
+    "stream_response",
+]
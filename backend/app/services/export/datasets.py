@@ -0,0 +1,158 @@
+"""Exportable datasets: selected columns, ordering and accepted filters."""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, select, true
+
+from app.models.activity_log import ActivityLog
+from app.models.dossier import Dossier, DossierStatus
+from app.models.feedback import HumanFeedback
+from app.models.invoice import Invoice
+
+
+def _bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ("1", "true", "yes")
+
+
+def _date_filters(column) -> Dict[str, Callable[[Any], Any]]:
+    return {
+        "date_from": lambda value: column >= datetime.fromisoformat(str(value)),
+        "date_to": lambda value: column <= datetime.fromisoformat(str(value)),
+    }
+
+
+@dataclass
+class ExportDataset:
+    """Columns (output name, expression) and filters (parameter, clause builder)."""
+    name: str
+    columns: List[Tuple[str, Any]]
+    order_by: List[Any]
+    filters: Dict[str, Callable[[Any], Any]] = field(default_factory=dict)
+
+    @property
+    def column_names(self) -> List[str]:
+        return [name for name, _ in self.columns]
+
+    def build_query(self, params: Mapping[str, Any]) -> Select:
+        """Query for the given filter parameters. Raises ValueError for bad values."""
+        query = select(*(expression.label(name) for name, expression in self.columns))
+        for param, build_clause in self.filters.items():
+            value = params.get(param)
+            if value is None or value == "":
+                continue
+            query = query.where(build_clause(value))
+        return query.order_by(*self.order_by)
+
+
+DATASETS: Dict[str, ExportDataset] = {
+    "feedback": ExportDataset(
+        name="feedback",
+        columns=[
+            ("id", HumanFeedback.id),
+            ("dossier_id", HumanFeedback.dossier_id),
+            ("document_id", HumanFeedback.document_id),
+            ("extracted_field_id", HumanFeedback.extracted_field_id),
+            ("feedback_type", HumanFeedback.feedback_type),
+            ("original_value", HumanFeedback.original_value),
+            ("corrected_value", HumanFeedback.corrected_value),
+            ("field_name", HumanFeedback.field_name),
+            ("document_type", HumanFeedback.document_type),
+            ("context_data", HumanFeedback.context_data),
+            ("model_used", HumanFeedback.model_used),
+            ("model_version", HumanFeedback.model_version),
+            ("confidence_before", HumanFeedback.confidence_before),
+            ("validator_id", HumanFeedback.validator_id),
+            ("notes", HumanFeedback.notes),
+            ("used_for_training", HumanFeedback.used_for_training),
+            ("created_at", HumanFeedback.created_at),
+        ],
+        order_by=[HumanFeedback.created_at.desc()],
+        filters={
+            "used_for_training_only": lambda value: HumanFeedback.used_for_training.is_(True) if _bool(value) else true(),
+            "feedback_type": lambda value: HumanFeedback.feedback_type == value,
+            **_date_filters(HumanFeedback.created_at),
+        },
+    ),
+    "invoices": ExportDataset(
+        name="invoices",
+        columns=[
+            ("id", Invoice.id),
+            ("invoice_number", Invoice.invoice_number),
+            ("dossier_id", Invoice.dossier_id),
+            ("installer_id", Invoice.installer_id),
+            ("status", Invoice.status),
+            ("kwh_cumac", Invoice.kwh_cumac),
+            ("price_per_kwh", Invoice.price_per_kwh),
+            ("total_amount", Invoice.total_amount),
+            ("payment_on_validation", Invoice.payment_on_validation),
+            ("payment_on_emmy", Invoice.payment_on_emmy),
+            ("due_date", Invoice.due_date),
+            ("paid_at", Invoice.paid_at),
+            ("payment_reference", Invoice.payment_reference),
+            ("payment_method", Invoice.payment_method),
+            ("created_at", Invoice.created_at),
+        ],
+        order_by=[Invoice.created_at.desc()],
+        filters={
+            "status": lambda value: Invoice.status == value,
+            "installer_id": lambda value: Invoice.installer_id == UUID(str(value)),
+            **_date_filters(Invoice.created_at),
+        },
+    ),
+    "dossiers": ExportDataset(
+        name="dossiers",
+        columns=[
+            ("id", Dossier.id),
+            ("reference", Dossier.reference),
+            ("process_id", Dossier.process_id),
+            ("installer_id", Dossier.installer_id),
+            ("assigned_validator_id", Dossier.assigned_validator_id),
+            ("status", Dossier.status),
+            ("priority", Dossier.priority),
+            ("beneficiary_name", Dossier.beneficiary_name),
+            ("beneficiary_city", Dossier.beneficiary_city),
+            ("beneficiary_postal_code", Dossier.beneficiary_postal_code),
+            ("precarity_status", Dossier.precarity_status),
+            ("confidence_score", Dossier.confidence_score),
+            ("submitted_at", Dossier.submitted_at),
+            ("validated_at", Dossier.validated_at),
+            ("created_at", Dossier.created_at),
+            ("updated_at", Dossier.updated_at),
+        ],
+        order_by=[Dossier.created_at.desc()],
+        filters={
+            "status": lambda value: Dossier.status == DossierStatus(value),
+            "installer_id": lambda value: Dossier.installer_id == UUID(str(value)),
+            "process_id": lambda value: Dossier.process_id == UUID(str(value)),
+            **_date_filters(Dossier.created_at),
+        },
+    ),
+    "activity_logs": ExportDataset(
+        name="activity_logs",
+        columns=[
+            ("id", ActivityLog.id),
+            ("user_id", ActivityLog.user_id),
+            ("action_type", ActivityLog.action_type),
+            ("entity_type", ActivityLog.entity_type),
+            ("entity_id", ActivityLog.entity_id),
+            ("entity_reference", ActivityLog.entity_reference),
+            ("description", ActivityLog.description),
+            ("metadata", ActivityLog.meta_data),
+            ("ip_address", ActivityLog.ip_address),
+            ("duration_ms", ActivityLog.duration_ms),
+            ("created_at", ActivityLog.created_at),
+        ],
+        order_by=[ActivityLog.created_at.desc()],
+        filters={
+            "user_id": lambda value: ActivityLog.user_id == UUID(str(value)),
+            "entity_type": lambda value: ActivityLog.entity_type == value,
+            "action_type": lambda value: ActivityLog.action_type == value,
+            # Bounded ranges only scan the matching monthly partitions
+            **_date_filters(ActivityLog.created_at),
+        },
+    ),
+}
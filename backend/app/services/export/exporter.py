@@ -0,0 +1,111 @@
+"""Streaming export engine.
+
+Rows are read through a server-side cursor (``yield_per``) in batches of
+``EXPORT_CHUNK_SIZE`` and encoded batch by batch, so memory stays constant
+whatever the number of rows. The encoded chunks are written to the HTTP
+response as they are produced (``stream_response``) or spooled to a
+temporary file and uploaded to storage (``export_to_storage``).
+"""
+import logging
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+
+from aiohttp import web
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_session_maker
+from .datasets import ExportDataset
+from .writers import ExportWriter, get_writer
+
+logger = logging.getLogger(__name__)
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, PATCH, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Allow-Credentials": "true"
+}
+
+
+async def export_chunks(
+    db: AsyncSession,
+    query: Select,
+    writer: ExportWriter,
+    chunk_size: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """Encoded chunks of the rows of ``query`` (see ``ExportDataset.build_query``).
+
+    The query is built by the caller so that invalid filter values surface
+    before any byte of the response has been sent.
+    """
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    query = query.execution_options(yield_per=chunk_size)
+
+    header = writer.begin()
+    if header:
+        yield header
+    result = await db.stream(query)
+    async for partition in result.mappings().partitions():
+        data = writer.write([dict(row) for row in partition])
+        if data:
+            yield data
+    footer = writer.end()
+    if footer:
+        yield footer
+
+
+def export_filename(dataset: ExportDataset, writer: ExportWriter) -> str:
+    return f"{dataset.name}_export_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.{writer.extension}"
+
+
+async def stream_response(
+    request: web.Request,
+    chunks: AsyncIterator[bytes],
+    content_type: str,
+    filename: Optional[str] = None
+) -> web.StreamResponse:
+    """Send ``chunks`` with chunked transfer encoding as they are produced."""
+    headers = {**CORS_HEADERS, "Content-Type": content_type}
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response = web.StreamResponse(status=200, headers=headers)
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    try:
+        async for chunk in chunks:
+            await response.write(chunk)
+        await response.write_eof()
+    except ConnectionResetError:
+        logger.info(f"Client disconnected during export of {filename or content_type}")
+    return response
+
+
+async def export_to_storage(
+    dataset: ExportDataset,
+    export_format: str,
+    params: Mapping[str, Any],
+    key: Optional[str] = None
+) -> Dict[str, Any]:
+    """Export to a file in storage, e.g. from a background job or script.
+
+    Chunks are spooled to a temporary file (on disk beyond a few MB) and
+    uploaded from there. Returns the storage location and row count.
+    """
+    from app.services.pdf_storage import pdf_storage_service
+
+    query = dataset.build_query(params)
+    writer = get_writer(export_format, dataset.columns)
+    key = key or f"exports/{dataset.name}/{export_filename(dataset, writer)}"
+    session_maker = get_session_maker()
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as spool:
+        async with session_maker() as db:
+            async for chunk in export_chunks(db, query, writer):
+                spool.write(chunk)
+        size = spool.tell()
+        spool.seek(0)
+        location = await pdf_storage_service.save_stream(key, spool, writer.content_type)
+    logger.info(f"Exported {writer.rows} {dataset.name} rows ({size} bytes) to {location}")
+    return {"location": location, "rows": writer.rows, "bytes": size, "content_type": writer.content_type}
@@ -0,0 +1,266 @@
+"""Chunked writers for streaming exports.
+
+A writer turns batches of row dicts into encoded bytes: ``begin()`` once,
+``write(rows)`` per batch and ``end()`` once. Nothing but the current batch is
+kept in memory, so output can be sent to the client (or storage) as it is
+produced.
+"""
+import csv
+import enum
+import io
+import ipaddress
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy import types as sa_types
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pq = None
+
+from app.core.serialization import dumps, json_default
+
+
+def _flat_value(value: Any) -> Any:
+    """Scalar representation for tabular formats (CSV, Parquet)."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=json_default)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (UUID, ipaddress.IPv4Address, ipaddress.IPv6Address, ipaddress.IPv4Interface, ipaddress.IPv6Interface)):
+        return str(value)
+    return value
+
+
+# Output column names, or (name, SQL expression) pairs whose types fix the Parquet schema
+Columns = Sequence[Union[str, Tuple[str, Any]]]
+
+
+class ExportWriter:
+    """Base writer; subclasses encode batches of rows."""
+    content_type = "application/octet-stream"
+    extension = "bin"
+
+    def __init__(self, columns: Columns):
+        self.columns = [column if isinstance(column, str) else column[0] for column in columns]
+        self.column_types = [
+            None if isinstance(column, str) else getattr(column[1], "type", None) for column in columns
+        ]
+        self.rows = 0
+
+    def begin(self) -> bytes:
+        return b""
+
+    def write(self, rows: List[Dict[str, Any]]) -> bytes:
+        raise NotImplementedError
+
+    def end(self) -> bytes:
+        return b""
+
+
+class CSVWriter(ExportWriter):
+    content_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def __init__(self, columns: Columns):
+        super().__init__(columns)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return _flat_value(value)
+
+    def begin(self) -> bytes:
+        self._writer.writerow(self.columns)
+        return self._drain()
+
+    def write(self, rows: List[Dict[str, Any]]) -> bytes:
+        for row in rows:
+            self._writer.writerow([
+                self._cell(row[column]) for column in self.columns
+            ])
+        self.rows += len(rows)
+        return self._drain()
+
+
+class JSONLinesWriter(ExportWriter):
+    content_type = "application/x-ndjson"
+    extension = "jsonl"
+
+    def write(self, rows: List[Dict[str, Any]]) -> bytes:
+        self.rows += len(rows)
+        return b"".join(dumps(row) + b"\n" for row in rows)
+
+
+class JSONDocumentWriter(ExportWriter):
+    """A single JSON document: ``{"data": [...], "total": n, "exported_at": ...}``."""
+    content_type = "application/json"
+    extension = "json"
+
+    def begin(self) -> bytes:
+        return b'{"data":['
+
+    def write(self, rows: List[Dict[str, Any]]) -> bytes:
+        if not rows:
+            return b""
+        prefix = b"," if self.rows else b""
+        self.rows += len(rows)
+        return prefix + b",".join(dumps(row) for row in rows)
+
+    def end(self) -> bytes:
+        return b'],"total":%d,"exported_at":%s}' % (self.rows, dumps(datetime.now(timezone.utc)))
+
+
+class _DrainableSink:
+    """Write-only file object whose content can be taken as it is written."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_type(sql_type: Optional[Any]):
+    """Arrow type of a SQLAlchemy column type, as written by ``_flat_value``."""
+    if sql_type is None:
+        return pa.string()
+    if isinstance(sql_type, sa_types.Enum):
+        return pa.string()
+    if isinstance(sql_type, sa_types.Boolean):
+        return pa.bool_()
+    if isinstance(sql_type, sa_types.SmallInteger):
+        return pa.int16()
+    if isinstance(sql_type, sa_types.Integer):
+        return pa.int64()
+    if isinstance(sql_type, sa_types.Float):
+        return pa.float64()
+    if isinstance(sql_type, sa_types.Numeric):
+        if sql_type.precision:
+            return pa.decimal128(sql_type.precision, sql_type.scale or 0)
+        return pa.float64()
+    if isinstance(sql_type, sa_types.DateTime):
+        return pa.timestamp("us", tz="UTC") if sql_type.timezone else pa.timestamp("us")
+    if isinstance(sql_type, sa_types.Date):
+        return pa.date32()
+    if isinstance(sql_type, sa_types.Time):
+        return pa.time64("us")
+    if isinstance(sql_type, sa_types.LargeBinary):
+        return pa.binary()
+    # Strings, UUIDs, JSON, arrays and addresses are written as text
+    return pa.string()
+
+
+class ParquetWriter(ExportWriter):
+    """Parquet with one row group per batch.
+
+    The schema is built from the column types up front rather than inferred
+    from the first batch, where a column that happens to be all null would
+    get the wrong type and make a later batch fail mid-stream.
+    """
+    content_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self, columns: Columns):
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("Parquet export requires the pyarrow package")
+        super().__init__(columns)
+        self._sink = _DrainableSink()
+        self._writer = None
+        self._schema = pa.schema([
+            pa.field(name, _arrow_type(sql_type)) for name, sql_type in zip(self.columns, self.column_types)
+        ])
+
+    @staticmethod
+    def _cell(value: Any, arrow_type) -> Any:
+        value = _flat_value(value)
+        if value is None:
+            return None
+        if pa.types.is_string(arrow_type) and not isinstance(value, str):
+            return value.isoformat() if isinstance(value, (datetime, date)) else str(value)
+        if pa.types.is_floating(arrow_type) and isinstance(value, Decimal):
+            return float(value)
+        return value
+
+    def _table(self, rows: List[Dict[str, Any]]):
+        data = {
+            f.name: [self._cell(row[f.name], f.type) for row in rows] for f in self._schema
+        }
+        return pa.table(data, schema=self._schema)
+
+    def write(self, rows: List[Dict[str, Any]]) -> bytes:
+        if not rows:
+            return b""
+        table = self._table(rows)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._sink, self._schema)
+        self._writer.write_table(table)
+        self.rows += len(rows)
+        return self._sink.drain()
+
+    def end(self) -> bytes:
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._sink, self._schema)
+        self._writer.close()
+        return self._sink.drain()
+
+
+WRITERS = {
+    "csv": CSVWriter,
+    "jsonl": JSONLinesWriter,
+    "json": JSONDocumentWriter,
+    "parquet": ParquetWriter,
+}
+
+
+def get_writer(export_format: str, columns: Columns) -> ExportWriter:
+    """Instantiate the writer for ``export_format``. Raises ValueError if unknown.
+
+    Pass ``(name, expression)`` pairs (``ExportDataset.columns``) so typed
+    formats such as Parquet get their schema from the column types.
+    """
+    writer_class = WRITERS.get(export_format)
+    if writer_class is None:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    return writer_class(columns)
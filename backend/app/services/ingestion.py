@@ -0,0 +1,615 @@
+"""Bulk dossier ingestion.
+
+Large installers submit a batch of dossiers in one request instead of one
+``CreateDossier`` plus one ``UploadDocument`` per file: either a ZIP archive
+(``archive`` part) holding ``manifest.json`` and the documents, or a
+``manifest`` part followed by one part per document. The manifest lists the
+dossiers and, for each, its documents by file name::
+
+    {
+        "installer_id": "...",  # administrators only
+        "dossiers": [
+            {
+                "external_id": "CRM-1042",  # optional, echoed in the job results
+                "process_id": "...",
+                "priority": "normal",
+                "beneficiary": {"name": "...", "address": "...", "city": "...", "postal_code": "..."},
+                "documents": [{"file": "1042/devis.pdf", "document_type_id": "..."}]
+            }
+        ]
+    }
+
+The body is streamed to a temporary directory, never held in memory. The
+whole manifest is validated before anything is created, then a job is
+recorded and returned at once; it runs in the background of the receiving
+worker and creates the dossiers in chunks of ``INGEST_CHUNK_SIZE``. For each
+chunk the documents are streamed to storage (``INGEST_UPLOAD_CONCURRENCY``
+at a time), then references are allocated with one counter increment and
+dossiers, documents, search outbox and activity rows are written with
+set-based INSERTs, committed together with the job progress. Documents are
+created ``PENDING``, which queues them for processing like single uploads.
+A failed chunk is rolled back and its stored files deleted; the chunks
+before it stay created and are listed in the job results. Jobs orphaned by
+a worker that died are failed once they made no progress for
+``INGEST_JOB_STALE_MINUTES`` (see ``IngestionService.run``).
+"""
+import asyncio
+import json
+import logging
+import mimetypes
+import os
+import shutil
+import tempfile
+import uuid
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.models.document import Document, ProcessingStatus
+from app.models.document_type import DocumentType
+from app.models.dossier import Dossier, DossierStatus
+from app.models.ingestion_job import IngestionJob, IngestionStatus
+from app.models.installer import Installer
+from app.models.process import Process
+from app.models.search_outbox import SearchOutbox, outbox_rows
+from app.schemas.dossier import DossierCreate
+from app.services.activity import ActivityLogger
+from app.services.activity.activity_sink import build_activity_row
+from app.services.pdf_storage import pdf_storage_service
+from app.services.reference_numbers import DOSSIER_PREFIX, next_references
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+ARCHIVE_PART = "archive"
+MANIFEST_PART = "manifest"
+
+# Bytes read from the request per write to the spool files
+SPOOL_CHUNK_SIZE = 256 * 1024
+# Manifest errors reported back; the rest are counted
+MAX_REPORTED_ERRORS = 50
+
+
+class _DirectorySource:
+    """Documents spooled from multipart file parts, by part file name."""
+
+    def __init__(self):
+        self.files: Dict[str, Tuple[str, int, Optional[str]]] = {}
+
+    def size(self, name: str) -> Optional[int]:
+        entry = self.files.get(name)
+        return entry[1] if entry else None
+
+    def content_type(self, name: str) -> str:
+        content_type = self.files[name][2]
+        if not content_type or content_type == "application/octet-stream":
+            content_type = mimetypes.guess_type(name)[0]
+        return content_type or "application/pdf"
+
+    def open(self, name: str) -> BinaryIO:
+        return open(self.files[name][0], "rb")
+
+    def manifest(self) -> Optional[bytes]:
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+class _ZipSource:
+    """Documents read from a spooled ZIP archive, by path in the archive (never extracted)."""
+
+    def __init__(self, path: str):
+        try:
+            self._zip = zipfile.ZipFile(path)
+        except zipfile.BadZipFile:
+            raise ValueError("The archive is not a valid ZIP file")
+        self._infos = {info.filename: info for info in self._zip.infolist() if not info.is_dir()}
+
+    def size(self, name: str) -> Optional[int]:
+        info = self._infos.get(name)
+        return info.file_size if info else None
+
+    def content_type(self, name: str) -> str:
+        return mimetypes.guess_type(name)[0] or "application/pdf"
+
+    def open(self, name: str) -> BinaryIO:
+        return self._zip.open(self._infos[name])
+
+    def manifest(self) -> Optional[bytes]:
+        info = self._infos.get(MANIFEST_NAME)
+        if info is None:
+            return None
+        if info.file_size > settings.MAX_FILE_SIZE:
+            raise ValueError(f"{MANIFEST_NAME} is too large")
+        return self._zip.read(info)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+@dataclass
+class IngestionDocument:
+    file: str
+    document_type_id: Optional[UUID]
+    size: int
+    content_type: str
+
+
+@dataclass
+class IngestionDossier:
+    index: int
+    external_id: Optional[str]
+    data: DossierCreate
+    documents: List[IngestionDocument]
+
+
+@dataclass
+class IngestionBatch:
+    """A received and validated upload, ready to be ingested."""
+    workdir: str
+    source: Any
+    manifest: Optional[bytes] = None
+    installer_id: Optional[UUID] = None
+    dossiers: List[IngestionDossier] = field(default_factory=list)
+
+    @property
+    def total_documents(self) -> int:
+        return sum(len(dossier.documents) for dossier in self.dossiers)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(document.size for dossier in self.dossiers for document in dossier.documents)
+
+    def close(self) -> None:
+        """Close the source and delete the spooled upload."""
+        try:
+            self.source.close()
+        finally:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+async def _spool(part, path: str, limit: int, label: str) -> int:
+    """Write a multipart part to ``path`` chunk by chunk. Returns its size."""
+    size = 0
+    with open(path, "wb") as f:
+        while True:
+            chunk = await part.read_chunk(SPOOL_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > limit:
+                raise ValueError(f"{label} exceeds maximum of {limit} bytes")
+            f.write(chunk)
+    return size
+
+
+async def receive_upload(request) -> IngestionBatch:
+    """Stream a multipart ingestion body to a temporary directory.
+
+    Raises ``ValueError`` for bodies that are not an ingestion upload or
+    exceed the size limits; nothing is kept on disk then.
+    """
+    workdir = tempfile.mkdtemp(prefix="ingest-")
+    files = _DirectorySource()
+    batch = IngestionBatch(workdir=workdir, source=files)
+    try:
+        if not request.content_type or "multipart/form-data" not in request.content_type:
+            raise ValueError("Expected a multipart/form-data body")
+        reader = await request.multipart()
+        archive_path = None
+        total = 0
+        async for part in reader:
+            remaining = settings.INGEST_MAX_UPLOAD_BYTES - total
+            if part.name == MANIFEST_PART:
+                path = os.path.join(workdir, MANIFEST_NAME)
+                total += await _spool(part, path, min(remaining, settings.MAX_FILE_SIZE), MANIFEST_NAME)
+                with open(path, "rb") as f:
+                    batch.manifest = f.read()
+            elif part.name == ARCHIVE_PART and part.filename:
+                archive_path = os.path.join(workdir, "archive.zip")
+                total += await _spool(part, archive_path, remaining, "Upload")
+            elif part.filename:
+                if part.filename in files.files:
+                    raise ValueError(f"Duplicate file {part.filename}")
+                path = os.path.join(workdir, f"file-{len(files.files)}")
+                size = await _spool(part, path, min(remaining, settings.MAX_FILE_SIZE), part.filename)
+                files.files[part.filename] = (path, size, part.headers.get("Content-Type"))
+                total += size
+
+        if archive_path is not None:
+            if files.files:
+                raise ValueError("Send either an archive or separate files, not both")
+            batch.source = _ZipSource(archive_path)
+            batch.manifest = batch.manifest or batch.source.manifest()
+        if batch.manifest is None:
+            raise ValueError(f"Missing manifest (a {MANIFEST_PART} part or {MANIFEST_NAME} in the archive)")
+        return batch
+    except BaseException:
+        batch.close()
+        raise
+
+
+def batch_from_directory(workdir: str, manifest: bytes) -> IngestionBatch:
+    """Batch of the files under ``workdir``, by relative path (scripts). ``close()`` deletes ``workdir``."""
+    files = _DirectorySource()
+    for root, _, names in os.walk(workdir):
+        for name in names:
+            path = os.path.join(root, name)
+            files.files[os.path.relpath(path, workdir).replace(os.sep, "/")] = (path, os.path.getsize(path), None)
+    return IngestionBatch(workdir=workdir, source=files, manifest=manifest)
+
+
+async def validate_manifest(db: AsyncSession, batch: IngestionBatch, installer_id: Optional[UUID]) -> List[Dict[str, Any]]:
+    """Parse and check the manifest of ``batch``, filling in its dossiers.
+
+    ``installer_id`` is the installer of an installer user, None for
+    administrators (the manifest names the installer then). Returns the
+    errors, by dossier index; the batch can only be ingested without any.
+    """
+    try:
+        manifest = json.loads(batch.manifest)
+    except (ValueError, UnicodeDecodeError) as e:
+        return [{"index": None, "detail": f"Invalid manifest JSON: {e}"}]
+    entries = manifest.get("dossiers") if isinstance(manifest, dict) else None
+    if not isinstance(entries, list) or not entries:
+        return [{"index": None, "detail": "The manifest must list at least one dossier under \"dossiers\""}]
+    if len(entries) > settings.INGEST_MAX_DOSSIERS:
+        return [{"index": None, "detail": f"At most {settings.INGEST_MAX_DOSSIERS} dossiers per job"}]
+
+    errors: List[Dict[str, Any]] = []
+    if installer_id is None:
+        try:
+            installer_id = UUID(str(manifest.get("installer_id")))
+        except ValueError:
+            return [{"index": None, "detail": "installer_id is required"}]
+    result = await db.execute(select(Installer.id).where(Installer.id == installer_id))
+    if result.scalar_one_or_none() is None:
+        return [{"index": None, "detail": "Installer not found"}]
+    batch.installer_id = installer_id
+
+    referenced_files = set()
+    for index, entry in enumerate(entries):
+        try:
+            if not isinstance(entry, dict):
+                raise ValueError("Expected an object")
+            data = DossierCreate(**{**entry, "installer_id": installer_id})
+            documents = []
+            for document in entry.get("documents") or []:
+                name = document.get("file") if isinstance(document, dict) else None
+                size = batch.source.size(name) if isinstance(name, str) else None
+                if size is None:
+                    raise ValueError(f"File {name!r} is not in the upload")
+                if size > settings.MAX_FILE_SIZE:
+                    raise ValueError(f"File {name} exceeds maximum of {settings.MAX_FILE_SIZE} bytes")
+                if name in referenced_files:
+                    raise ValueError(f"File {name} is used by another document")
+                referenced_files.add(name)
+                document_type_id = document.get("document_type_id")
+                documents.append(IngestionDocument(
+                    file=name,
+                    document_type_id=UUID(document_type_id) if document_type_id else None,
+                    size=size,
+                    content_type=batch.source.content_type(name),
+                ))
+            external_id = entry.get("external_id")
+            batch.dossiers.append(IngestionDossier(
+                index=index,
+                external_id=str(external_id) if external_id is not None else None,
+                data=data,
+                documents=documents,
+            ))
+        except (ValueError, TypeError, AttributeError) as e:
+            errors.append({"index": index, "detail": str(e).splitlines()[0] if str(e) else type(e).__name__})
+    if errors:
+        return errors
+
+    # Referenced processes and document types, one query each
+    process_ids = {dossier.data.process_id for dossier in batch.dossiers}
+    result = await db.execute(select(Process.id).where(Process.id.in_(process_ids)))
+    missing_processes = process_ids - set(result.scalars().all())
+    type_ids = {d.document_type_id for dossier in batch.dossiers for d in dossier.documents if d.document_type_id}
+    missing_types = set()
+    if type_ids:
+        result = await db.execute(select(DocumentType.id).where(DocumentType.id.in_(type_ids)))
+        missing_types = type_ids - set(result.scalars().all())
+    for dossier in batch.dossiers:
+        if dossier.data.process_id in missing_processes:
+            errors.append({"index": dossier.index, "detail": f"Process {dossier.data.process_id} not found"})
+        for document in dossier.documents:
+            if document.document_type_id in missing_types:
+                errors.append({"index": dossier.index, "detail": f"Document type {document.document_type_id} not found"})
+    return errors
+
+
+def serialize_job(job: IngestionJob, include_results: bool = True) -> Dict[str, Any]:
+    """Job status and progress as returned by the API."""
+    elapsed = None
+    if job.started_at:
+        elapsed = ((job.completed_at or datetime.now(timezone.utc)) - job.started_at).total_seconds()
+    body = {
+        "id": str(job.id),
+        "installer_id": str(job.installer_id),
+        "status": job.status.value if hasattr(job.status, "value") else str(job.status),
+        "total_dossiers": job.total_dossiers,
+        "total_documents": job.total_documents,
+        "total_bytes": job.total_bytes,
+        "processed_dossiers": job.processed_dossiers,
+        "processed_documents": job.processed_documents,
+        "progress": round(job.processed_dossiers / job.total_dossiers, 4) if job.total_dossiers else 1.0,
+        "elapsed_seconds": round(elapsed, 1) if elapsed is not None else None,
+        "dossiers_per_minute": round(job.processed_dossiers / elapsed * 60, 1) if elapsed else None,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+    }
+    if include_results:
+        body["results"] = job.results or []
+    return body
+
+
+class IngestionService:
+    """Create and run bulk ingestion jobs."""
+
+    def __init__(self):
+        self._tasks: Dict[UUID, asyncio.Task] = {}
+
+    async def create_job(self, db: AsyncSession, batch: IngestionBatch, user_id: UUID) -> IngestionJob:
+        """Record a job for a validated batch and commit."""
+        job = IngestionJob(
+            installer_id=batch.installer_id,
+            created_by=user_id,
+            status=IngestionStatus.QUEUED,
+            total_dossiers=len(batch.dossiers),
+            total_documents=batch.total_documents,
+            processed_dossiers=0,
+            processed_documents=0,
+            total_bytes=batch.total_bytes,
+            results=[],
+        )
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+        return job
+
+    def start(self, job_id: UUID, batch: IngestionBatch, user_id: UUID) -> asyncio.Task:
+        """Run a job in the background of this worker; the batch is closed when it ends."""
+        task = asyncio.create_task(self.run_job(job_id, batch, user_id))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job_id, None))
+        return task
+
+    async def _set_status(self, job_id: UUID, status: IngestionStatus, error: Optional[str] = None) -> None:
+        values: Dict[str, Any] = {"status": status, "error": error}
+        if status == IngestionStatus.RUNNING:
+            values["started_at"] = func.now()
+        else:
+            values["completed_at"] = func.now()
+        session_maker = get_session_maker()
+        async with session_maker() as db:
+            await db.execute(update(IngestionJob).where(IngestionJob.id == job_id).values(**values))
+            await db.commit()
+
+    async def run_job(
+        self,
+        job_id: UUID,
+        batch: IngestionBatch,
+        user_id: UUID,
+        reference_prefix: str = DOSSIER_PREFIX
+    ) -> IngestionStatus:
+        """Ingest a batch chunk by chunk, recording progress on the job."""
+        try:
+            await self._set_status(job_id, IngestionStatus.RUNNING)
+            session_maker = get_session_maker()
+            chunk_size = settings.INGEST_CHUNK_SIZE
+            for start in range(0, len(batch.dossiers), chunk_size):
+                async with session_maker() as db:
+                    await self._ingest_chunk(
+                        db, job_id, batch, batch.dossiers[start:start + chunk_size], user_id, reference_prefix
+                    )
+        except asyncio.CancelledError:
+            await self._set_status(job_id, IngestionStatus.FAILED, "Interrupted by a server shutdown")
+            metrics.ingestion_jobs.inc(IngestionStatus.FAILED.value)
+            raise
+        except Exception as e:
+            logger.error(f"Ingestion job {job_id} failed: {e}", exc_info=True)
+            await self._set_status(job_id, IngestionStatus.FAILED, str(e))
+            metrics.ingestion_jobs.inc(IngestionStatus.FAILED.value)
+            return IngestionStatus.FAILED
+        finally:
+            batch.close()
+
+        await self._set_status(job_id, IngestionStatus.COMPLETED)
+        metrics.ingestion_jobs.inc(IngestionStatus.COMPLETED.value)
+        logger.info(f"Ingestion job {job_id} completed: {len(batch.dossiers)} dossiers, {batch.total_documents} documents")
+        return IngestionStatus.COMPLETED
+
+    async def _store_documents(
+        self,
+        batch: IngestionBatch,
+        documents: List[Tuple[UUID, IngestionDocument]],
+        stored: List[str]
+    ) -> List[str]:
+        """Stream documents to storage concurrently. Paths are also appended to ``stored`` for cleanup."""
+        semaphore = asyncio.Semaphore(settings.INGEST_UPLOAD_CONCURRENCY)
+
+        async def store(dossier_id: UUID, document: IngestionDocument) -> str:
+            async with semaphore:
+                with batch.source.open(document.file) as fileobj:
+                    path = await pdf_storage_service.save_document_stream(
+                        fileobj, dossier_id, document.file, document.content_type
+                    )
+                stored.append(path)
+                return path
+
+        paths = await asyncio.gather(*(store(*item) for item in documents), return_exceptions=True)
+        for path in paths:
+            if isinstance(path, BaseException):
+                raise path
+        return paths
+
+    async def _ingest_chunk(
+        self,
+        db: AsyncSession,
+        job_id: UUID,
+        batch: IngestionBatch,
+        chunk: List[IngestionDossier],
+        user_id: UUID,
+        reference_prefix: str
+    ) -> None:
+        stored: List[str] = []
+        try:
+            dossier_ids = [uuid.uuid4() for _ in chunk]
+            documents = [
+                (dossier_id, document)
+                for dossier_id, dossier in zip(dossier_ids, chunk)
+                for document in dossier.documents
+            ]
+            paths = await self._store_documents(batch, documents, stored)
+
+            # The counter row stays locked until commit: allocate after the uploads
+            references = await next_references(db, reference_prefix, len(chunk))
+            dossier_rows = [
+                {
+                    "id": dossier_id,
+                    "reference": reference,
+                    "process_id": dossier.data.process_id,
+                    "installer_id": batch.installer_id,
+                    "status": DossierStatus.DRAFT,
+                    "priority": dossier.data.priority,
+                    "beneficiary_name": dossier.data.beneficiary.name,
+                    "beneficiary_address": dossier.data.beneficiary.address,
+                    "beneficiary_city": dossier.data.beneficiary.city,
+                    "beneficiary_postal_code": dossier.data.beneficiary.postal_code,
+                    "beneficiary_email": dossier.data.beneficiary.email,
+                    "beneficiary_phone": dossier.data.beneficiary.phone,
+                    "precarity_status": dossier.data.beneficiary.precarity_status,
+                }
+                for dossier_id, reference, dossier in zip(dossier_ids, references, chunk)
+            ]
+            document_rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "dossier_id": dossier_id,
+                    "document_type_id": document.document_type_id,
+                    "filename": path.split("/")[-1],
+                    "original_filename": os.path.basename(document.file)[:255],
+                    "storage_path": path,
+                    "mime_type": document.content_type,
+                    "file_size": document.size,
+                    "processing_status": ProcessingStatus.PENDING,
+                }
+                for (dossier_id, document), path in zip(documents, paths)
+            ]
+            await db.execute(insert(Dossier), dossier_rows)
+            if document_rows:
+                await db.execute(insert(Document), document_rows)
+
+            # Set-based INSERTs bypass the ORM flush hook that feeds the search outbox
+            changes = outbox_rows("dossiers", dossier_ids)
+            changes += outbox_rows("documents", [row["id"] for row in document_rows])
+            await db.execute(insert(SearchOutbox), changes)
+
+            activity = ActivityLogger(db)
+            await activity.log_many([
+                build_activity_row(
+                    user_id=user_id,
+                    action_type="dossier.created",
+                    entity_type="dossier",
+                    entity_id=row["id"],
+                    entity_reference=row["reference"],
+                    description=f"Dossier {row['reference']} created (bulk ingestion)",
+                    metadata={"ingestion_job_id": str(job_id), "documents": len(dossier.documents)}
+                )
+                for row, dossier in zip(dossier_rows, chunk)
+            ], durable=True)
+
+            results = [
+                {
+                    "index": dossier.index,
+                    "external_id": dossier.external_id,
+                    "dossier_id": str(row["id"]),
+                    "reference": row["reference"],
+                    "documents": len(dossier.documents),
+                }
+                for row, dossier in zip(dossier_rows, chunk)
+            ]
+            await db.execute(
+                update(IngestionJob)
+                .where(IngestionJob.id == job_id)
+                .values(
+                    processed_dossiers=IngestionJob.processed_dossiers + len(dossier_rows),
+                    processed_documents=IngestionJob.processed_documents + len(document_rows),
+                    results=IngestionJob.results.op("||")(bindparam("chunk_results", results, type_=JSONB)),
+                )
+            )
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            for path in stored:
+                await pdf_storage_service.delete_file(path)
+            raise
+
+        metrics.ingested_dossiers.inc(amount=len(dossier_rows))
+        metrics.ingested_documents.inc(amount=len(document_rows))
+
+    async def fail_orphaned_jobs(self) -> int:
+        """Fail queued or running jobs without progress for ``INGEST_JOB_STALE_MINUTES``.
+
+        Their worker stopped without recording the outcome (a crash or a
+        kill); jobs running in this worker are left alone. Returns how many
+        jobs were failed.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=settings.INGEST_JOB_STALE_MINUTES)
+        query = (
+            update(IngestionJob)
+            .where(IngestionJob.status.in_([IngestionStatus.QUEUED, IngestionStatus.RUNNING]))
+            .where(IngestionJob.updated_at < cutoff)
+            .values(
+                status=IngestionStatus.FAILED,
+                error="Interrupted: the worker running the job stopped",
+                completed_at=func.now()
+            )
+        )
+        if self._tasks:
+            query = query.where(IngestionJob.id.notin_(list(self._tasks)))
+        session_maker = get_session_maker()
+        async with session_maker() as db:
+            result = await db.execute(query)
+            await db.commit()
+        if result.rowcount:
+            metrics.ingestion_jobs.inc(IngestionStatus.FAILED.value, amount=result.rowcount)
+        return result.rowcount
+
+    async def run(self) -> None:
+        """Fail orphaned jobs forever, starting at once."""
+        while True:
+            try:
+                failed = await self.fail_orphaned_jobs()
+                if failed:
+                    logger.warning(f"Marked {failed} orphaned ingestion jobs failed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Orphaned ingestion job sweep failed: {e}")
+            await asyncio.sleep(settings.INGEST_JOB_STALE_MINUTES * 60)
+
+    async def shutdown(self) -> None:
+        """Cancel running jobs (they are marked failed)."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+ingestion_service = IngestionService()
@@ -1,7 +1,10 @@
 """PDF storage service with AWS S3 support."""
+import asyncio
+import hashlib
+import shutil
 import uuid
 from pathlib import Path
-from typing import Optional, Protocol
+from typing import BinaryIO, Optional, Protocol
 from uuid import UUID
 import boto3
 from botocore.exceptions import ClientError, BotoCoreError
@@ -125,6 +128,292 @@ class PDFStorageService:
             
             return str(file_path), file_size
     
+    async def save_document_stream(
+        self,
+        fileobj: BinaryIO,
+        dossier_id: UUID,
+        filename: str,
+        content_type: str = "application/pdf"
+    ) -> str:
+        """
+        Save a dossier document from a file object, with the same layout as
+        ``save_file`` but without loading it into memory.
+        
+        Args:
+            fileobj: Readable binary file object, positioned at the start
+            dossier_id: Dossier ID
+            filename: Original filename (for the extension)
+            content_type: MIME type of the document
+        
+        Returns:
+            S3 key or local file path
+        """
+        unique_filename = f"{uuid.uuid4()}{Path(filename or 'file').suffix or '.pdf'}"
+        
+        # Blocking I/O runs in a thread, so that many documents can be stored concurrently
+        if self.use_s3:
+            s3_key = self._get_s3_key(dossier_id, unique_filename)
+            try:
+                await asyncio.to_thread(
+                    self.s3_client.upload_fileobj,
+                    fileobj, self.bucket_name, s3_key, ExtraArgs={"ContentType": content_type}
+                )
+                return s3_key
+            except (ClientError, BotoCoreError) as e:
+                raise Exception(f"Failed to upload file to S3: {e}")
+        
+        dossier_dir = self.upload_dir / str(dossier_id)
+        dossier_dir.mkdir(parents=True, exist_ok=True)
+        file_path = dossier_dir / unique_filename
+        
+        def copy():
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(fileobj, f)
+        
+        await asyncio.to_thread(copy)
+        return str(file_path)
+    
+    async def save_object(self, key: str, content: bytes, content_type: str = "application/octet-stream") -> str:
+        """
+        Save arbitrary content under a storage key (e.g. archives).
+        
+        Args:
+            key: Relative key such as "archives/activity_logs/2024-01.jsonl.gz"
+            content: Bytes to store
+            content_type: MIME type of the content
+        
+        Returns:
+            S3 key or local file path
+        """
+        if self.use_s3:
+            try:
+                await asyncio.to_thread(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=content,
+                    ContentType=content_type
+                )
+                return key
+            except (ClientError, BotoCoreError) as e:
+                raise Exception(f"Failed to upload object to S3: {e}")
+        else:
+            file_path = self.upload_dir / key
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(file_path.write_bytes, content)
+            return str(file_path)
+    
+    async def save_stream(self, key: str, fileobj: BinaryIO, content_type: str = "application/octet-stream") -> str:
+        """
+        Save the content of a file object under a storage key without
+        loading it into memory (multipart upload on S3).
+        
+        Args:
+            key: Relative key such as "exports/dossiers/20240101_120000.csv"
+            fileobj: Readable binary file object, positioned at the start
+            content_type: MIME type of the content
+        
+        Returns:
+            S3 key or local file path
+        """
+        # Blocking I/O runs in a thread so large exports do not stall the event loop
+        if self.use_s3:
+            try:
+                await asyncio.to_thread(
+                    self.s3_client.upload_fileobj,
+                    fileobj, self.bucket_name, key, ExtraArgs={"ContentType": content_type}
+                )
+                return key
+            except (ClientError, BotoCoreError) as e:
+                raise Exception(f"Failed to upload object to S3: {e}")
+        else:
+            file_path = self.upload_dir / key
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            def copy():
+                with open(file_path, "wb") as f:
+                    shutil.copyfileobj(fileobj, f)
+            
+            await asyncio.to_thread(copy)
+            return str(file_path)
+    
+    async def start_multipart(self, dossier_id: UUID, filename: str, content_type: str = "application/pdf") -> tuple[str, Optional[str]]:
+        """
+        Start a document upload received in parts (resumable uploads).
+        
+        On S3 this creates a multipart upload; locally the parts are appended
+        to ``<path>.part``, renamed to ``<path>`` when completed.
+        
+        Args:
+            dossier_id: Dossier ID
+            filename: Original filename (for the extension)
+            content_type: MIME type of the document
+        
+        Returns:
+            Tuple of (S3 key or local file path, S3 upload id or None)
+        """
+        unique_filename = f"{uuid.uuid4()}{Path(filename or 'file').suffix or '.pdf'}"
+        
+        if self.use_s3:
+            s3_key = self._get_s3_key(dossier_id, unique_filename)
+            try:
+                response = await asyncio.to_thread(
+                    self.s3_client.create_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    ContentType=content_type,
+                    Metadata={"original_filename": filename or "unknown", "dossier_id": str(dossier_id)}
+                )
+                return s3_key, response["UploadId"]
+            except (ClientError, BotoCoreError) as e:
+                raise Exception(f"Failed to start S3 multipart upload: {e}")
+        
+        dossier_dir = self.upload_dir / str(dossier_id)
+        dossier_dir.mkdir(parents=True, exist_ok=True)
+        file_path = dossier_dir / unique_filename
+        Path(f"{file_path}.part").touch()
+        return str(file_path), None
+    
+    async def upload_part(
+        self,
+        file_path: str,
+        upload_id: Optional[str],
+        part_number: int,
+        fileobj: BinaryIO,
+        offset: int
+    ) -> Optional[str]:
+        """
+        Store one part of a multipart upload.
+        
+        Args:
+            file_path: S3 key or local file path returned by ``start_multipart``
+            upload_id: S3 upload id (None locally)
+            part_number: 1-based part number (S3)
+            fileobj: Readable binary file object holding the part, positioned at the start
+            offset: Byte offset of the part in the document (local storage)
+        
+        Returns:
+            The part ETag on S3, None locally
+        """
+        if self.use_s3:
+            try:
+                response = await asyncio.to_thread(
+                    self.s3_client.upload_part,
+                    Bucket=self.bucket_name,
+                    Key=file_path,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=fileobj
+                )
+                return response["ETag"]
+            except (ClientError, BotoCoreError) as e:
+                raise Exception(f"Failed to upload part to S3: {e}")
+        
+        def write():
+            with open(f"{file_path}.part", "r+b") as f:
+                # Drops whatever a previous, interrupted write left past the offset
+                f.truncate(offset)
+                f.seek(offset)
+                shutil.copyfileobj(fileobj, f)
+        
+        await asyncio.to_thread(write)
+        return None
+    
+    async def complete_multipart(self, file_path: str, upload_id: Optional[str], parts: list) -> None:
+        """
+        Assemble the parts of a multipart upload into the document.
+        
+        Args:
+            file_path: S3 key or local file path returned by ``start_multipart``
+            upload_id: S3 upload id (None locally)
+            parts: Uploaded parts as ``{"PartNumber": n, "ETag": etag}``, in order (S3)
+        """
+        if self.use_s3:
+            try:
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=file_path,
+                    UploadId=upload_id,
+                    MultipartUpload={
+                        "Parts": [{"PartNumber": p["PartNumber"], "ETag": p["ETag"]} for p in parts]
+                    }
+                )
+                return
+            except ClientError as e:
+                # Already completed by an earlier attempt (e.g. one that crashed before recording it)
+                if e.response.get("Error", {}).get("Code") == "NoSuchUpload" and await asyncio.to_thread(self.file_exists, file_path):
+                    return
+                raise Exception(f"Failed to complete S3 multipart upload: {e}")
+            except BotoCoreError as e:
+                raise Exception(f"Failed to complete S3 multipart upload: {e}")
+        
+        part_path = Path(f"{file_path}.part")
+        # Already completed by an earlier attempt
+        if not part_path.exists() and Path(file_path).exists():
+            return
+        await asyncio.to_thread(part_path.replace, file_path)
+    
+    async def abort_multipart(self, file_path: str, upload_id: Optional[str]) -> bool:
+        """
+        Discard the parts of an unfinished multipart upload.
+        
+        Args:
+            file_path: S3 key or local file path returned by ``start_multipart``
+            upload_id: S3 upload id (None locally)
+        
+        Returns:
+            True if aborted, False otherwise
+        """
+        try:
+            if self.use_s3:
+                try:
+                    await asyncio.to_thread(
+                        self.s3_client.abort_multipart_upload,
+                        Bucket=self.bucket_name, Key=file_path, UploadId=upload_id
+                    )
+                    return True
+                except ClientError as e:
+                    # Already aborted or completed
+                    return e.response.get("Error", {}).get("Code") == "NoSuchUpload"
+                except BotoCoreError:
+                    return False
+            else:
+                path = Path(f"{file_path}.part")
+                if path.exists():
+                    path.unlink()
+                return True
+        except Exception:
+            return False
+    
+    async def file_digest(self, file_path: str, algorithm: str = "sha256") -> str:
+        """
+        Hash a stored file without loading it into memory.
+        
+        Args:
+            file_path: S3 key or local file path
+            algorithm: hashlib algorithm name
+        
+        Returns:
+            Hex digest of the file content
+        """
+        def digest():
+            hasher = hashlib.new(algorithm)
+            if self.use_s3:
+                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_path)
+                for chunk in response["Body"].iter_chunks(1024 * 1024):
+                    hasher.update(chunk)
+            else:
+                with open(file_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        hasher.update(chunk)
+            return hasher.hexdigest()
+        
+        try:
+            return await asyncio.to_thread(digest)
+        except (ClientError, BotoCoreError) as e:
+            raise Exception(f"Failed to read file from S3: {e}")
+    
     async def delete_file(self, file_path: str) -> bool:
         """
         Delete a file from S3 or local storage.
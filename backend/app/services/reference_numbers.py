@@ -0,0 +1,49 @@
+"""Dossier reference and invoice number allocation.
+
+Numbers come from ``reference_counters``, one row per prefix and year,
+incremented with a single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``.
+The row lock taken by the increment is held until the caller's transaction
+ends, so concurrent creations get distinct numbers, and a rolled back
+creation gives its number back: numbering is gapless, as invoice numbering
+must be. Call ``next_reference`` in the transaction that inserts the row,
+right before committing, to keep the lock short.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.reference_counter import ReferenceCounter
+
+DOSSIER_PREFIX = "DOS"
+INVOICE_PREFIX = "INV"
+
+
+def format_reference(prefix: str, year: int, number: int) -> str:
+    return f"{prefix}-{year}-{number:06d}"
+
+
+async def next_reference(db: AsyncSession, prefix: str, year: Optional[int] = None) -> str:
+    """Allocate the next ``<prefix>-<year>-<number>`` in the current transaction of ``db``."""
+    year = year or datetime.now().year
+    statement = insert(ReferenceCounter).values(prefix=prefix, year=year, value=1)
+    statement = statement.on_conflict_do_update(
+        index_elements=[ReferenceCounter.prefix, ReferenceCounter.year],
+        set_={"value": ReferenceCounter.value + 1}
+    ).returning(ReferenceCounter.value)
+    result = await db.execute(statement)
+    return format_reference(prefix, year, result.scalar_one())
+
+
+async def next_references(db: AsyncSession, prefix: str, count: int, year: Optional[int] = None) -> List[str]:
+    """Allocate ``count`` consecutive references with one increment (batch inserts)."""
+    year = year or datetime.now().year
+    statement = insert(ReferenceCounter).values(prefix=prefix, year=year, value=count)
+    statement = statement.on_conflict_do_update(
+        index_elements=[ReferenceCounter.prefix, ReferenceCounter.year],
+        set_={"value": ReferenceCounter.value + count}
+    ).returning(ReferenceCounter.value)
+    result = await db.execute(statement)
+    last = result.scalar_one()
+    return [format_reference(prefix, year, number) for number in range(last - count + 1, last + 1)]
@@ -0,0 +1,358 @@
+"""Resumable document uploads.
+
+Single uploads (``POST /api/dossiers/{id}/documents``) send the whole file in
+one multipart request, held in memory and capped at ``MAX_FILE_SIZE``; a
+dropped connection restarts from zero. Resumable uploads follow the tus
+protocol flow, with JSON bodies like the rest of the API:
+
+1. ``POST /api/dossiers/{id}/uploads`` declares the file (name, size,
+   optional whole-file checksum) and returns an upload id.
+2. ``PATCH /api/uploads/{upload_id}`` sends the next chunk as the raw body,
+   with ``Upload-Offset`` set to the bytes already received and optionally
+   ``Upload-Checksum: <algorithm> <base64 digest>`` for the chunk.
+3. ``GET /api/uploads/{upload_id}`` returns the offset to resume from after
+   an interruption.
+4. ``POST /api/uploads/{upload_id}/complete`` assembles the file, verifies
+   the checksum and creates the document, ``PENDING`` like single uploads.
+
+``DELETE /api/uploads/{upload_id}`` aborts an upload.
+
+Each chunk is streamed to a temporary file (never held in memory), checked,
+then stored as one part: an S3 multipart upload part, or written at its
+offset in ``<path>.part`` locally. A chunk is stored whole or not at all, so
+an interrupted request leaves the offset unchanged and the client resends
+that chunk. On S3 every chunk but the last must hold at least 5MB (the
+multipart part minimum); the limits are returned with the upload. The
+session row is locked while a chunk is stored, so concurrent requests for
+the same offset cannot both succeed. Uploads that receive no chunk for
+``UPLOAD_EXPIRATION_HOURS`` are aborted by a background task.
+"""
+import asyncio
+import base64
+import binascii
+import hashlib
+import logging
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from aiohttp import ClientPayloadError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.models.document import Document, ProcessingStatus
+from app.models.dossier import Dossier
+from app.models.upload_session import UploadSession
+from app.services.pdf_storage import pdf_storage_service
+
+logger = logging.getLogger(__name__)
+
+CHECKSUM_ALGORITHMS = ("sha256", "sha1", "md5")
+
+# S3 multipart limits: minimum size of every part but the last, and part count
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_MAX_PARTS = 10000
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Expired uploads aborted per cleanup transaction
+CLEANUP_BATCH_SIZE = 100
+
+
+def _expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(hours=settings.UPLOAD_EXPIRATION_HOURS)
+
+
+def min_chunk_size(upload: UploadSession) -> int:
+    """Smallest chunk accepted before the last one."""
+    if not pdf_storage_service.use_s3:
+        return 1
+    return max(S3_MIN_PART_SIZE, -(-upload.total_size // S3_MAX_PARTS))
+
+
+def parse_file_checksum(value: str) -> str:
+    """Normalize a whole-file checksum given as ``algorithm:hex``."""
+    algorithm, _, digest = value.partition(":")
+    algorithm = algorithm.strip().lower()
+    digest = digest.strip().lower()
+    if algorithm not in CHECKSUM_ALGORITHMS:
+        raise ValueError(f"Unsupported checksum algorithm, use one of {', '.join(CHECKSUM_ALGORITHMS)}")
+    try:
+        if len(bytes.fromhex(digest)) != hashlib.new(algorithm).digest_size:
+            raise ValueError
+    except ValueError:
+        raise ValueError(f"Invalid {algorithm} checksum")
+    return f"{algorithm}:{digest}"
+
+
+def parse_chunk_checksum(header: Optional[str]) -> Optional[Tuple[str, bytes]]:
+    """Parse an ``Upload-Checksum: <algorithm> <base64 digest>`` header."""
+    if not header:
+        return None
+    algorithm, _, digest = header.strip().partition(" ")
+    algorithm = algorithm.lower()
+    if algorithm not in CHECKSUM_ALGORITHMS:
+        raise ValueError(f"Unsupported checksum algorithm, use one of {', '.join(CHECKSUM_ALGORITHMS)}")
+    try:
+        return algorithm, base64.b64decode(digest.strip(), validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid Upload-Checksum header")
+
+
+def serialize_upload(upload: UploadSession) -> Dict[str, Any]:
+    return {
+        "id": str(upload.id),
+        "dossier_id": str(upload.dossier_id),
+        "filename": upload.filename,
+        "size": upload.total_size,
+        "offset": upload.offset,
+        "complete": upload.offset == upload.total_size,
+        "min_chunk_size": min_chunk_size(upload),
+        "max_chunk_size": settings.UPLOAD_MAX_CHUNK_SIZE,
+        "checksum_algorithms": list(CHECKSUM_ALGORITHMS),
+        "expires_at": upload.expires_at.isoformat() if upload.expires_at else None,
+        "upload_url": f"/api/uploads/{upload.id}",
+    }
+
+
+async def _lock(db: AsyncSession, upload_id: UUID) -> Optional[UploadSession]:
+    result = await db.execute(
+        select(UploadSession)
+        .where(UploadSession.id == upload_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+class ResumableUploadService:
+    """Chunked document uploads stored as S3 multipart uploads or local part files."""
+
+    async def create(
+        self,
+        db: AsyncSession,
+        dossier: Dossier,
+        user_id: UUID,
+        filename: str,
+        size: int,
+        content_type: str = "application/pdf",
+        document_type_id: Optional[UUID] = None,
+        checksum: Optional[str] = None,
+    ) -> UploadSession:
+        """Start an upload of ``size`` bytes to ``dossier``.
+
+        Raises ``ValueError`` for sizes outside the limits and malformed checksums.
+        """
+        if size <= 0:
+            raise ValueError("size must be a positive number of bytes")
+        if size > settings.UPLOAD_MAX_SIZE:
+            raise ValueError(f"File size exceeds maximum of {settings.UPLOAD_MAX_SIZE} bytes")
+        if checksum:
+            checksum = parse_file_checksum(checksum)
+
+        storage_path, s3_upload_id = await pdf_storage_service.start_multipart(dossier.id, filename, content_type)
+        upload = UploadSession(
+            dossier_id=dossier.id,
+            created_by=user_id,
+            document_type_id=document_type_id,
+            filename=filename,
+            content_type=content_type,
+            total_size=size,
+            offset=0,
+            checksum=checksum,
+            storage_path=storage_path,
+            s3_upload_id=s3_upload_id,
+            parts=[],
+            expires_at=_expiry(),
+        )
+        db.add(upload)
+        try:
+            await db.commit()
+        except Exception:
+            await pdf_storage_service.abort_multipart(storage_path, s3_upload_id)
+            raise
+        await db.refresh(upload)
+        return upload
+
+    async def get(self, db: AsyncSession, upload_id: UUID, owner_id: Optional[UUID] = None) -> Optional[UploadSession]:
+        """Load an upload, restricted to the uploads created by ``owner_id`` if given."""
+        query = select(UploadSession).where(UploadSession.id == upload_id)
+        if owner_id is not None:
+            query = query.where(UploadSession.created_by == owner_id)
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def receive_chunk(
+        self,
+        db: AsyncSession,
+        upload: UploadSession,
+        offset: int,
+        stream,
+        checksum: Optional[Tuple[str, bytes]] = None,
+    ) -> UploadSession:
+        """Store the chunk read from ``stream`` (the request body) at ``offset``.
+
+        Raises ``ValueError`` when the offset does not match the bytes
+        received so far, the chunk is empty or outside the size limits, or
+        its checksum does not match; nothing is stored then.
+        """
+        if offset != upload.offset:
+            raise ValueError(f"Upload-Offset {offset} does not match the current offset {upload.offset}")
+        upload_id = upload.id
+        remaining = upload.total_size - upload.offset
+        if remaining == 0:
+            raise ValueError(f"Upload-Offset {offset} does not match: all {upload.total_size} bytes were received")
+        limit = min(remaining, settings.UPLOAD_MAX_CHUNK_SIZE)
+        minimum = min(remaining, min_chunk_size(upload))
+
+        # Release the connection while the chunk is received, which can take minutes
+        await db.close()
+
+        hasher = hashlib.new(checksum[0]) if checksum else None
+        with tempfile.TemporaryFile(prefix="upload-") as spool:
+            size = 0
+            try:
+                while True:
+                    data = await stream.read(READ_CHUNK_SIZE)
+                    if not data:
+                        break
+                    size += len(data)
+                    if size > limit:
+                        raise ValueError(f"Chunk exceeds maximum of {limit} bytes")
+                    spool.write(data)
+                    if hasher is not None:
+                        hasher.update(data)
+            except (ClientPayloadError, ConnectionError) as e:
+                raise ValueError(f"Chunk interrupted after {size} bytes: {e}")
+
+            if size < minimum:
+                raise ValueError(f"Chunk of {size} bytes is below the minimum of {minimum} bytes")
+            if hasher is not None and hasher.digest() != checksum[1]:
+                raise ValueError("Checksum mismatch")
+
+            upload = await _lock(db, upload_id)
+            if upload is None:
+                raise ValueError("Upload not found")
+            if upload.offset != offset:
+                await db.rollback()
+                raise ValueError(f"Upload-Offset {offset} does not match the current offset {upload.offset}")
+
+            spool.seek(0)
+            part_number = len(upload.parts) + 1
+            etag = await pdf_storage_service.upload_part(
+                upload.storage_path, upload.s3_upload_id, part_number, spool, offset
+            )
+            if etag is not None:
+                upload.parts = [*upload.parts, {"PartNumber": part_number, "ETag": etag, "Size": size}]
+            upload.offset = offset + size
+            upload.expires_at = _expiry()
+            await db.commit()
+
+        metrics.upload_bytes.inc(amount=size)
+        return upload
+
+    async def complete(self, db: AsyncSession, upload: UploadSession) -> Document:
+        """Assemble a fully received upload and create its document. Commits.
+
+        Raises ``ValueError`` when bytes are missing, or when the file does
+        not match the checksum declared on creation; the upload is discarded
+        in the latter case.
+        """
+        upload_id = upload.id
+        upload = await _lock(db, upload_id)
+        if upload is None:
+            raise ValueError("Upload not found")
+        if upload.offset != upload.total_size:
+            await db.rollback()
+            raise ValueError(f"Upload is incomplete: {upload.offset} of {upload.total_size} bytes received")
+        # Assembly and hashing take minutes for large files: no transaction is held meanwhile.
+        # Both are idempotent, so concurrent or retried completions are harmless.
+        await db.commit()
+
+        await pdf_storage_service.complete_multipart(upload.storage_path, upload.s3_upload_id, upload.parts)
+
+        if upload.checksum:
+            algorithm, _, expected = upload.checksum.partition(":")
+            actual = await pdf_storage_service.file_digest(upload.storage_path, algorithm)
+            if actual != expected:
+                await pdf_storage_service.delete_file(upload.storage_path)
+                upload = await _lock(db, upload_id)
+                if upload is not None:
+                    await db.delete(upload)
+                await db.commit()
+                metrics.uploads_finished.inc("checksum_mismatch")
+                raise ValueError(f"Checksum mismatch: the {algorithm} of the assembled file is {actual}, upload discarded")
+
+        # Short transaction to record the document; a concurrent completion may have done it already
+        upload = await _lock(db, upload_id)
+        if upload is None:
+            await db.rollback()
+            raise ValueError("Upload not found")
+        document = Document(
+            dossier_id=upload.dossier_id,
+            document_type_id=upload.document_type_id,
+            filename=upload.storage_path.split("/")[-1],
+            original_filename=upload.filename,
+            storage_path=upload.storage_path,
+            mime_type=upload.content_type,
+            file_size=upload.total_size,
+            processing_status=ProcessingStatus.PENDING
+        )
+        db.add(document)
+        await db.delete(upload)
+        # If this fails the upload row survives, and a retried completion finds the file already assembled
+        await db.commit()
+        await db.refresh(document)
+        metrics.uploads_finished.inc("completed")
+        return document
+
+    async def abort(self, db: AsyncSession, upload: UploadSession, outcome: str = "aborted") -> None:
+        """Discard the stored parts and the session. Commits."""
+        await pdf_storage_service.abort_multipart(upload.storage_path, upload.s3_upload_id)
+        await db.delete(upload)
+        await db.commit()
+        metrics.uploads_finished.inc(outcome)
+
+    async def abort_expired(self) -> int:
+        """Abort the uploads past their expiry. Returns how many were aborted."""
+        aborted = 0
+        session_maker = get_session_maker()
+        while True:
+            async with session_maker() as db:
+                result = await db.execute(
+                    select(UploadSession)
+                    .where(UploadSession.expires_at < datetime.now(timezone.utc))
+                    .order_by(UploadSession.expires_at)
+                    .limit(CLEANUP_BATCH_SIZE)
+                    .with_for_update(skip_locked=True)
+                )
+                expired = result.scalars().all()
+                for upload in expired:
+                    await pdf_storage_service.abort_multipart(upload.storage_path, upload.s3_upload_id)
+                    await db.delete(upload)
+                await db.commit()
+            aborted += len(expired)
+            if expired:
+                metrics.uploads_finished.inc("expired", amount=len(expired))
+            if len(expired) < CLEANUP_BATCH_SIZE:
+                return aborted
+
+    async def run(self) -> None:
+        """Abort expired uploads forever."""
+        while True:
+            try:
+                aborted = await self.abort_expired()
+                if aborted:
+                    logger.info(f"Aborted {aborted} expired resumable uploads")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Resumable upload cleanup failed: {e}")
+            await asyncio.sleep(settings.UPLOAD_CLEANUP_INTERVAL_MINUTES * 60)
+
+
+upload_service = ResumableUploadService()
@@ -0,0 +1,268 @@
+"""Review snapshots: materialized per-dossier review data with versioned diffs.
+
+``get_snapshot`` serves the snapshot with one primary key lookup while it is
+current. When a change has marked it stale (see
+``app.models.review_snapshot``), it is rebuilt from the dossier row with its
+documents, validation results and extracted fields, aggregated by correlated
+``json_agg`` subqueries in one query. The rebuild is compared with the
+previous snapshot: if the content changed, the version is bumped and the
+diff stored, keeping the last ``REVIEW_SNAPSHOT_HISTORY`` versions per
+dossier for ``get_changes``.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import JSON, delete, func, insert, literal_column, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.document import Document, ProcessingStatus
+from app.models.dossier import Dossier
+from app.models.extracted_field import ExtractedField, FieldStatus
+from app.models.review_snapshot import ReviewSnapshot, ReviewSnapshotChange
+from app.models.validation_result import ValidationResult
+
+# Lists of the snapshot, each item identified by its "id"
+SECTIONS = ("documents", "validation_results", "extracted_fields")
+
+
+def _json_list(columns: Dict[str, Any], order_by, *where):
+    """Correlated subquery aggregating ``columns`` of the matching rows into a JSON array."""
+    pairs = [part for name, column in columns.items() for part in (name, column)]
+    return (
+        select(func.coalesce(
+            func.json_agg(aggregate_order_by(func.json_build_object(*pairs), order_by)),
+            literal_column("'[]'::json"),
+            type_=JSON
+        ))
+        .where(*where)
+        .scalar_subquery()
+    )
+
+
+def _iso(value: Optional[str]) -> Optional[str]:
+    """Timestamps from JSON (session time zone) in the UTC ``isoformat()`` form used elsewhere."""
+    return datetime.fromisoformat(value).astimezone(timezone.utc).isoformat() if value else None
+
+
+def _enum_value(enum_type, name: Optional[str]) -> Optional[str]:
+    """Enum columns come out of JSON by name (``CONFIRMED``); the API uses values."""
+    return enum_type[name].value if name in enum_type.__members__ else name
+
+
+def _review_query(dossier_id: UUID):
+    documents = _json_list(
+        {
+            "id": Document.id,
+            "document_type_id": Document.document_type_id,
+            "filename": Document.filename,
+            "processing_status": Document.processing_status,
+        },
+        Document.uploaded_at,
+        Document.dossier_id == Dossier.id
+    )
+    results = _json_list(
+        {
+            "id": ValidationResult.id,
+            "rule_id": ValidationResult.rule_id,
+            "status": ValidationResult.status,
+            "message": ValidationResult.message,
+            "affected_fields": ValidationResult.affected_fields,
+            "overridden": ValidationResult.overridden,
+            "override_reason": ValidationResult.override_reason,
+            "executed_at": ValidationResult.executed_at,
+        },
+        # Latest result first, so it wins for its rule
+        ValidationResult.executed_at.desc(),
+        ValidationResult.dossier_id == Dossier.id
+    )
+    fields = _json_list(
+        {
+            "id": ExtractedField.id,
+            "field_name": ExtractedField.field_name,
+            "value": ExtractedField.extracted_value,
+            "confidence": ExtractedField.confidence,
+            "status": ExtractedField.status,
+            "source_document_id": ExtractedField.document_id,
+            "extracted_at": ExtractedField.created_at,
+        },
+        ExtractedField.created_at,
+        ExtractedField.dossier_id == Dossier.id
+    )
+    return select(
+        Dossier, documents.label("documents"), results.label("results"), fields.label("fields"),
+    ).where(Dossier.id == dossier_id).execution_options(populate_existing=True)
+
+
+def serialize_dossier(dossier: Dossier) -> Dict[str, Any]:
+    """Dossier fields as returned by ``GetDossier``."""
+    return {
+        "id": str(dossier.id),
+        "reference": dossier.reference,
+        "process_id": str(dossier.process_id),
+        "installer_id": str(dossier.installer_id),
+        "assigned_validator_id": str(dossier.assigned_validator_id) if dossier.assigned_validator_id else None,
+        "status": dossier.status.value if hasattr(dossier.status, "value") else str(dossier.status),
+        "priority": dossier.priority.value if hasattr(dossier.priority, "value") else str(dossier.priority),
+        "beneficiary_name": dossier.beneficiary_name,
+        "beneficiary_address": dossier.beneficiary_address,
+        "beneficiary_city": dossier.beneficiary_city,
+        "beneficiary_postal_code": dossier.beneficiary_postal_code,
+        "beneficiary_email": dossier.beneficiary_email,
+        "beneficiary_phone": dossier.beneficiary_phone,
+        "precarity_status": dossier.precarity_status,
+        "created_at": dossier.created_at.isoformat() if dossier.created_at else None,
+        "updated_at": dossier.updated_at.isoformat() if dossier.updated_at else None
+    }
+
+
+async def load_review_data(db: AsyncSession, dossier_id: UUID) -> Optional[Dict[str, Any]]:
+    """Build the review data of a dossier from the database (one query), or None if it does not exist."""
+    row = (await db.execute(_review_query(dossier_id))).one_or_none()
+    if row is None:
+        return None
+    return {
+        "dossier": serialize_dossier(row.Dossier),
+        "documents": [
+            {**document, "processing_status": _enum_value(ProcessingStatus, document["processing_status"])}
+            for document in row.documents
+        ],
+        "validation_results": [
+            {
+                **result,
+                "affected_fields": result["affected_fields"] or [],
+                "executed_at": _iso(result["executed_at"]),
+            }
+            for result in row.results
+        ],
+        "extracted_fields": [
+            {
+                **field,
+                "confidence": float(field["confidence"]) if field["confidence"] else None,
+                "status": _enum_value(FieldStatus, field["status"]),
+                "extracted_at": _iso(field["extracted_at"]),
+            }
+            for field in row.fields
+        ],
+    }
+
+
+def diff_snapshots(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Changes from ``old`` to ``new``: the dossier if it changed, upserted items and removed ids per section."""
+    changes: Dict[str, Any] = {}
+    if old.get("dossier") != new["dossier"]:
+        changes["dossier"] = new["dossier"]
+    for section in SECTIONS:
+        before = {item["id"]: item for item in old.get(section, [])}
+        after = {item["id"]: item for item in new[section]}
+        upserted = [item for item_id, item in after.items() if before.get(item_id) != item]
+        removed = [item_id for item_id in before if item_id not in after]
+        if upserted or removed:
+            changes[section] = {"upserted": upserted, "removed": removed}
+    return changes
+
+
+def merge_changes(versions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine consecutive diffs (oldest first) into one."""
+    merged: Dict[str, Any] = {}
+    sections: Dict[str, Tuple[Dict[str, Any], Dict[str, None]]] = {}
+    for changes in versions:
+        if "dossier" in changes:
+            merged["dossier"] = changes["dossier"]
+        for section in SECTIONS:
+            if section not in changes:
+                continue
+            upserted, removed = sections.setdefault(section, ({}, {}))
+            for item in changes[section]["upserted"]:
+                upserted[item["id"]] = item
+                removed.pop(item["id"], None)
+            for item_id in changes[section]["removed"]:
+                upserted.pop(item_id, None)
+                removed[item_id] = None
+    for section, (upserted, removed) in sections.items():
+        merged[section] = {"upserted": list(upserted.values()), "removed": list(removed)}
+    return merged
+
+
+async def get_snapshot(
+    db: AsyncSession,
+    dossier_id: UUID,
+    rebuild: bool = True
+) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """Current ``(version, snapshot)`` of a dossier, rebuilding it (and committing) if stale.
+
+    Returns None if the dossier does not exist, or if the snapshot is
+    missing or stale and ``rebuild`` is False.
+    """
+    query = select(
+        ReviewSnapshot.version, ReviewSnapshot.generation, ReviewSnapshot.built_generation,
+        ReviewSnapshot.snapshot
+    ).where(ReviewSnapshot.dossier_id == dossier_id)
+    current = (await db.execute(query)).one_or_none()
+    if current is not None and current.built_generation == current.generation:
+        return current.version, current.snapshot
+    if not rebuild:
+        return None
+
+    if current is None:
+        if not await db.scalar(select(Dossier.id).where(Dossier.id == dossier_id)):
+            return None
+        # Commit an empty, stale row before reading the data, so that a change
+        # committed meanwhile bumps its generation instead of finding no row
+        await db.execute(
+            pg_insert(ReviewSnapshot)
+            .values(dossier_id=dossier_id, version=0, generation=0, built_generation=-1, snapshot={})
+            .on_conflict_do_nothing(index_elements=[ReviewSnapshot.dossier_id])
+        )
+        await db.commit()
+        current = (await db.execute(query)).one()
+
+    # Generation read before the data: a change committed meanwhile leaves the snapshot stale
+    generation = current.generation
+    data = await load_review_data(db, dossier_id)
+    if data is None:
+        return None
+
+    # Version 0 is the placeholder of a first build: no diff is recorded for it
+    changes = diff_snapshots(current.snapshot, data) if current.version else {}
+    version = current.version + 1 if changes or not current.version else current.version
+    # Only the first of concurrent rebuilds of the same version is stored
+    updated = await db.execute(
+        update(ReviewSnapshot)
+        .where(ReviewSnapshot.dossier_id == dossier_id, ReviewSnapshot.version == current.version)
+        .values(version=version, built_generation=generation, snapshot=data)
+        .returning(ReviewSnapshot.dossier_id)
+    )
+    if changes and updated.first() is not None:
+        await db.execute(insert(ReviewSnapshotChange).values(dossier_id=dossier_id, version=version, changes=changes))
+        await db.execute(
+            delete(ReviewSnapshotChange).where(
+                ReviewSnapshotChange.dossier_id == dossier_id,
+                ReviewSnapshotChange.version <= version - settings.REVIEW_SNAPSHOT_HISTORY
+            )
+        )
+    await db.commit()
+    return version, data
+
+
+async def get_changes(db: AsyncSession, dossier_id: UUID, since: int, version: int) -> Optional[Dict[str, Any]]:
+    """Merged changes from ``since`` to ``version``, or None when they are no longer kept (refetch)."""
+    if since == version:
+        return {}
+    if since < 1 or since > version:
+        return None
+    result = await db.execute(
+        select(ReviewSnapshotChange.changes)
+        .where(
+            ReviewSnapshotChange.dossier_id == dossier_id,
+            ReviewSnapshotChange.version > since,
+            ReviewSnapshotChange.version <= version
+        )
+        .order_by(ReviewSnapshotChange.version)
+    )
+    versions: List[Dict[str, Any]] = result.scalars().all()
+    if len(versions) != version - since:
+        return None
+    return merge_changes(versions)
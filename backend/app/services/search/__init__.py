@@ -1,6 +1,23 @@
 """Search services."""
-from .search_service import SearchService, SearchResult, GlobalSearchResult
-from .typesense_client import get_typesense_client
-
-__all__ = ["SearchService", "SearchResult", "GlobalSearchResult", "get_typesense_client"]
+from .search_service import SearchService, SearchResult, GlobalSearchResult, search_cache_stats, search_backend_status
+from .postgres_search import PostgresSearch, postgres_search
+from .typesense_client import AsyncTypesenseClient, async_typesense_client, get_typesense_client
+from .indexer import SearchIndexer, search_indexer
+from .autocomplete import AutocompleteIndex, autocomplete_index
 
+__all__ = [
+    "SearchService",
+    "SearchResult",
+    "GlobalSearchResult",
+    "search_cache_stats",
+    "search_backend_status",
+    "PostgresSearch",
+    "postgres_search",
+    "AsyncTypesenseClient",
+    "async_typesense_client",
+    "get_typesense_client",
+    "SearchIndexer",
+    "search_indexer",
+    "AutocompleteIndex",
+    "autocomplete_index",
+]
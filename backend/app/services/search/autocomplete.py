@@ -0,0 +1,277 @@
+"""In-memory prefix index for search-as-you-type.
+
+Dossier references and beneficiary names, installer SIRETs and company names
+are kept in sorted arrays of ``(term, key)`` pairs; a prefix lookup is a
+binary search followed by a short forward scan, so top-10 suggestions take
+well under a millisecond and never touch the database or Typesense.
+
+Installer users only see their own dossiers (and their own company): each
+installer has its own sorted array of its dossiers' terms, so scoped lookups
+do not scan other installers' entries.
+
+The index is built at startup and kept current incrementally: every
+``AUTOCOMPLETE_REFRESH_INTERVAL_MS`` the rows changed since the last refresh
+(``updated_at``, with an overlap for transactions committing late) are
+reloaded and their terms replaced. Deletions made by this worker are applied
+immediately; a full rebuild every ``AUTOCOMPLETE_REBUILD_INTERVAL_MINUTES``
+drops entities deleted through other workers.
+"""
+import asyncio
+import bisect
+import logging
+import time
+import unicodedata
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.models.dossier import Dossier
+from app.models.installer import Installer
+
+logger = logging.getLogger(__name__)
+
+DOSSIER = "dossier"
+INSTALLER = "installer"
+
+# Rows committed up to this long after their updated_at are still picked up
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+
+def normalize(text: str) -> str:
+    """Lowercase, accent-free, single-spaced form of ``text`` (for terms and prefixes)."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return " ".join("".join(c for c in decomposed if not unicodedata.combining(c)).lower().split())
+
+
+def name_terms(name: Optional[str]) -> List[str]:
+    """Terms of a name: the whole name and each suffix starting at a word ("jean dupont", "dupont")."""
+    words = normalize(name or "").split(" ")
+    return [" ".join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+class SortedTerms:
+    """Sorted array of ``(term, key)`` pairs answering prefix queries."""
+
+    def __init__(self, pairs: Optional[List[Tuple[str, str]]] = None):
+        self._pairs: List[Tuple[str, str]] = sorted(pairs) if pairs else []
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def add(self, term: str, key: str) -> None:
+        bisect.insort(self._pairs, (term, key))
+
+    def remove(self, term: str, key: str) -> None:
+        index = bisect.bisect_left(self._pairs, (term, key))
+        if index < len(self._pairs) and self._pairs[index] == (term, key):
+            del self._pairs[index]
+
+    def prefix(self, prefix: str, limit: int, accept=None) -> List[str]:
+        """Up to ``limit`` distinct keys with a term starting with ``prefix``, in term order."""
+        keys: List[str] = []
+        seen = set()
+        index = bisect.bisect_left(self._pairs, (prefix, ""))
+        while index < len(self._pairs) and len(keys) < limit:
+            term, key = self._pairs[index]
+            if not term.startswith(prefix):
+                break
+            if key not in seen and (accept is None or accept(key)):
+                seen.add(key)
+                keys.append(key)
+            index += 1
+        return keys
+
+
+class _Entry:
+    __slots__ = ("suggestion", "terms", "installer_id")
+
+    def __init__(self, suggestion: Dict[str, Any], terms: List[str], installer_id: Optional[str]):
+        self.suggestion = suggestion
+        self.terms = terms
+        self.installer_id = installer_id
+
+
+def _dossier_entry(row) -> Tuple[str, _Entry]:
+    terms = [normalize(row.reference)] + name_terms(row.beneficiary_name)
+    return f"{DOSSIER}:{row.id}", _Entry(
+        {"type": DOSSIER, "id": str(row.id), "label": row.reference, "detail": row.beneficiary_name},
+        terms,
+        str(row.installer_id),
+    )
+
+
+def _installer_entry(row) -> Tuple[str, _Entry]:
+    terms = [row.siret] + name_terms(row.company_name)
+    return f"{INSTALLER}:{row.id}", _Entry(
+        {"type": INSTALLER, "id": str(row.id), "label": row.company_name, "detail": row.siret},
+        terms,
+        # An installer's own entry is visible in its scope
+        str(row.id),
+    )
+
+
+def _dossiers_query():
+    return select(
+        Dossier.id, Dossier.reference, Dossier.beneficiary_name, Dossier.installer_id, Dossier.updated_at
+    )
+
+
+def _installers_query():
+    return select(Installer.id, Installer.company_name, Installer.siret, Installer.updated_at)
+
+
+SOURCES = {
+    DOSSIER: (_dossiers_query, Dossier.updated_at, _dossier_entry),
+    INSTALLER: (_installers_query, Installer.updated_at, _installer_entry),
+}
+
+
+class AutocompleteIndex:
+    """Prefix index over dossiers and installers, scoped per installer."""
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+        self._global = SortedTerms()
+        self._by_installer: Dict[str, SortedTerms] = {}
+        self._watermark: Optional[datetime] = None
+        self.ready = False
+        self.built_at: Optional[float] = None
+        self.last_refresh_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    # Lookups
+
+    def suggest(
+        self,
+        prefix: str,
+        limit: int = 10,
+        installer_id: Optional[str] = None,
+        types: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Top ``limit`` suggestions for ``prefix``; only the installer's own entries when ``installer_id`` is set."""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        wanted = set(types) if types else None
+        accept = (lambda key: key.split(":", 1)[0] in wanted) if wanted else None
+        terms = self._global if installer_id is None else self._by_installer.get(str(installer_id))
+        if terms is None:
+            return []
+        return [self._entries[key].suggestion for key in terms.prefix(prefix, limit, accept)]
+
+    # Maintenance
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        current = self._entries.get(key)
+        if current is not None and current.terms == entry.terms and current.installer_id == entry.installer_id:
+            # Most refreshed rows keep their terms (and rows in the overlap come back unchanged)
+            current.suggestion = entry.suggestion
+            return
+        self.remove_key(key)
+        self._entries[key] = entry
+        scoped = self._by_installer.setdefault(entry.installer_id, SortedTerms())
+        for term in entry.terms:
+            self._global.add(term, key)
+            scoped.add(term, key)
+
+    def remove_key(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        scoped = self._by_installer.get(entry.installer_id)
+        for term in entry.terms:
+            self._global.remove(term, key)
+            if scoped is not None:
+                scoped.remove(term, key)
+        if scoped is not None and not len(scoped):
+            del self._by_installer[entry.installer_id]
+
+    def remove(self, entity_type: str, entity_id: Any) -> None:
+        """Drop a deleted dossier or installer (call after the delete is committed)."""
+        self.remove_key(f"{entity_type}:{entity_id}")
+
+    @staticmethod
+    def _build(entries: Dict[str, _Entry]) -> Tuple[SortedTerms, Dict[str, SortedTerms]]:
+        global_pairs: List[Tuple[str, str]] = []
+        scoped_pairs: Dict[str, List[Tuple[str, str]]] = {}
+        for key, entry in entries.items():
+            pairs = [(term, key) for term in entry.terms]
+            global_pairs.extend(pairs)
+            scoped_pairs.setdefault(entry.installer_id, []).extend(pairs)
+        return SortedTerms(global_pairs), {installer_id: SortedTerms(pairs) for installer_id, pairs in scoped_pairs.items()}
+
+    async def _load(self, since: Optional[datetime]) -> Tuple[Dict[str, _Entry], Optional[datetime]]:
+        entries: Dict[str, _Entry] = {}
+        watermark = since
+        session_maker = get_session_maker()
+        async with session_maker() as db:
+            for build_query, updated_at, to_entry in SOURCES.values():
+                query = build_query()
+                if since is not None:
+                    query = query.where(updated_at > since - REFRESH_OVERLAP)
+                result = await db.stream(query.execution_options(yield_per=5000))
+                async for partition in result.partitions():
+                    for row in partition:
+                        key, entry = to_entry(row)
+                        entries[key] = entry
+                        if watermark is None or row.updated_at > watermark:
+                            watermark = row.updated_at
+        return entries, watermark
+
+    async def rebuild(self) -> int:
+        """Load every dossier and installer and swap in a freshly sorted index."""
+        started = time.perf_counter()
+        entries, watermark = await self._load(None)
+        # Sorting a large index takes a while; keep the event loop responsive
+        global_terms, by_installer = await asyncio.to_thread(self._build, entries)
+        self._entries, self._global, self._by_installer = entries, global_terms, by_installer
+        self._watermark = watermark
+        self.ready = True
+        self.built_at = time.time()
+        logger.info(f"Autocomplete index built: {len(entries)} entities, {len(global_terms)} terms in {time.perf_counter() - started:.1f}s")
+        return len(entries)
+
+    async def refresh(self) -> int:
+        """Apply rows changed since the last load. Returns the number of entities updated."""
+        entries, watermark = await self._load(self._watermark)
+        for key, entry in entries.items():
+            self._put(key, entry)
+        self._watermark = watermark
+        self.last_refresh_at = time.time()
+        return len(entries)
+
+    async def run(self) -> None:
+        """Build the index, then refresh it forever; rebuild periodically."""
+        rebuild_every = settings.AUTOCOMPLETE_REBUILD_INTERVAL_MINUTES * 60
+        next_rebuild = 0.0
+        while True:
+            try:
+                if time.monotonic() >= next_rebuild:
+                    await self.rebuild()
+                    next_rebuild = time.monotonic() + rebuild_every
+                else:
+                    await self.refresh()
+                self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning(f"Autocomplete index refresh failed: {e}")
+            await asyncio.sleep(settings.AUTOCOMPLETE_REFRESH_INTERVAL_MS / 1000)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "entities": len(self._entries),
+            "terms": len(self._global),
+            "installers": len(self._by_installer),
+            "built_at": self.built_at,
+            "last_refresh_at": self.last_refresh_at,
+            "last_error": self.last_error,
+        }
+
+
+autocomplete_index = AutocompleteIndex()
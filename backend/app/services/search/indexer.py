@@ -0,0 +1,295 @@
+"""Search indexer: keeps the Typesense collections in sync with the database.
+
+Writes to dossiers, documents and installers queue rows in ``search_outbox``
+(see ``app.models.search_outbox``). The indexer drains the outbox in batches:
+the latest operation per entity wins, current rows are loaded in one query
+per collection and sent with one ``import`` (upsert) call, deleted entities
+with one delete-by-filter call, and the processed outbox rows are removed in
+the same transaction. If Typesense fails, the transaction rolls back and the
+batch is retried.
+
+Collections are addressed through aliases (``dossiers`` -> ``dossiers_<ts>``).
+A full reindex builds a fresh collection from the database and swaps the
+alias, so searches are served throughout. While it runs, the outbox keeps
+filling and is applied to the new collection once the alias points to it.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import get_engine, get_session_maker
+from app.models.document import Document
+from app.models.document_type import DocumentType
+from app.models.dossier import Dossier
+from app.models.installer import Installer
+from app.models.process import Process
+from app.models.search_outbox import DELETE, SearchOutbox
+from .typesense_client import COLLECTIONS, async_typesense_client
+
+logger = logging.getLogger(__name__)
+
+# Serializes outbox batches and full reindexes across workers
+INDEXER_LOCK_KEY = 7_301_245_002
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[int]:
+    return int(value.timestamp()) if value else None
+
+
+def _enum_value(value) -> Optional[str]:
+    return getattr(value, "value", value)
+
+
+# Per collection: query of the indexed columns, and the row -> document mapping
+def _dossiers_query():
+    return (
+        select(
+            Dossier.id, Dossier.reference, Dossier.beneficiary_name, Dossier.beneficiary_address,
+            Dossier.beneficiary_city, Dossier.status, Dossier.priority, Dossier.confidence_score,
+            Dossier.submitted_at, Dossier.validated_at, Dossier.created_at,
+            Installer.company_name.label("installer_name"),
+            Process.code.label("process_code"), Process.name.label("process_name"),
+        )
+        .join(Installer, Installer.id == Dossier.installer_id)
+        .join(Process, Process.id == Dossier.process_id)
+    )
+
+
+def _dossier_document(row) -> Dict[str, Any]:
+    return {
+        "id": str(row.id),
+        "reference": row.reference,
+        "beneficiary_name": row.beneficiary_name,
+        "beneficiary_address": row.beneficiary_address,
+        "beneficiary_city": row.beneficiary_city,
+        "installer_name": row.installer_name,
+        "process_code": row.process_code,
+        "process_name": row.process_name,
+        "status": _enum_value(row.status),
+        "priority": _enum_value(row.priority),
+        "confidence_score": float(row.confidence_score or 0),
+        # Sorting field: drafts are not submitted yet
+        "submitted_at": _timestamp(row.submitted_at or row.created_at),
+        "validated_at": _timestamp(row.validated_at),
+    }
+
+
+def _documents_query():
+    return (
+        select(
+            Document.id, Document.dossier_id, Document.filename, Document.ocr_text,
+            Document.processing_status, Document.uploaded_at,
+            Dossier.reference.label("dossier_reference"),
+            DocumentType.code.label("document_type"),
+        )
+        .join(Dossier, Dossier.id == Document.dossier_id)
+        .outerjoin(DocumentType, DocumentType.id == Document.document_type_id)
+    )
+
+
+def _document_document(row) -> Dict[str, Any]:
+    return {
+        "id": str(row.id),
+        "dossier_id": str(row.dossier_id),
+        "dossier_reference": row.dossier_reference,
+        "document_type": row.document_type or "",
+        "filename": row.filename,
+        "ocr_text": row.ocr_text or "",
+        "processing_status": _enum_value(row.processing_status),
+        "uploaded_at": _timestamp(row.uploaded_at),
+    }
+
+
+def _installers_query():
+    return select(
+        Installer.id, Installer.company_name, Installer.siret, Installer.city, Installer.contact_name,
+        Installer.contact_email, Installer.rge_status, Installer.qualifications, Installer.active,
+    )
+
+
+def _installer_document(row) -> Dict[str, Any]:
+    return {
+        "id": str(row.id),
+        "company_name": row.company_name,
+        "siret": row.siret,
+        "city": row.city,
+        "contact_name": row.contact_name,
+        "contact_email": row.contact_email,
+        "rge_status": row.rge_status,
+        "qualifications": [str(q) for q in (row.qualifications or [])],
+        "active": row.active,
+    }
+
+
+SOURCES = {
+    "dossiers": (_dossiers_query, Dossier.id, _dossier_document),
+    "documents": (_documents_query, Document.id, _document_document),
+    "installers": (_installers_query, Installer.id, _installer_document),
+}
+
+
+class SearchIndexer:
+    """Outbox consumer and full reindexer for the Typesense collections."""
+
+    def __init__(self):
+        self.client = async_typesense_client
+        self.batch_size = settings.SEARCH_INDEX_BATCH_SIZE
+        self.last_run_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.ready = False
+
+    async def _load_documents(self, db: AsyncSession, collection: str, ids: List[UUID]) -> List[Dict[str, Any]]:
+        build_query, id_column, to_document = SOURCES[collection]
+        result = await db.execute(build_query().where(id_column.in_(ids)))
+        return [to_document(row) for row in result.all()]
+
+    async def _apply(self, collection: str, documents: List[Dict[str, Any]], deleted: List[str]) -> None:
+        failures = await self.client.import_documents(collection, documents, action="upsert")
+        if failures:
+            # Rejected documents (schema mismatch) are logged, not retried forever
+            logger.error(f"{len(failures)} documents rejected by {collection}: {failures[:3]}")
+        metrics.search_indexed_documents.inc(collection, "upsert", amount=len(documents) - len(failures))
+        if deleted:
+            await self.client.delete_documents(collection, deleted)
+            metrics.search_indexed_documents.inc(collection, "delete", amount=len(deleted))
+
+    async def run_once(self) -> int:
+        """Apply one batch of outbox rows. Returns the number of rows processed."""
+        session_maker = get_session_maker()
+        async with session_maker() as db:
+            locked = await db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": INDEXER_LOCK_KEY})
+            if not locked.scalar():
+                return 0
+
+            result = await db.execute(
+                select(SearchOutbox.id, SearchOutbox.entity_type, SearchOutbox.entity_id, SearchOutbox.operation)
+                .order_by(SearchOutbox.id)
+                .limit(self.batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                await db.rollback()
+                return 0
+
+            # Latest operation per entity
+            latest: Dict[str, Dict[UUID, str]] = {collection: {} for collection in SOURCES}
+            for row in rows:
+                if row.entity_type in latest:
+                    latest[row.entity_type][row.entity_id] = row.operation
+
+            for collection, operations in latest.items():
+                if not operations:
+                    continue
+                upserts = [entity_id for entity_id, operation in operations.items() if operation != DELETE]
+                documents = await self._load_documents(db, collection, upserts) if upserts else []
+                found = {document["id"] for document in documents}
+                # Rows deleted since they were queued are removed from the index too
+                deleted = [str(entity_id) for entity_id in operations if str(entity_id) not in found]
+                await self._apply(collection, documents, deleted)
+
+            await db.execute(delete(SearchOutbox).where(SearchOutbox.id.in_([row.id for row in rows])))
+            await db.commit()
+
+        self.last_run_at = datetime.now(timezone.utc)
+        return len(rows)
+
+    async def reindex(self, collection: str) -> Dict[str, Any]:
+        """Rebuild ``collection`` into a new Typesense collection and swap the alias to it."""
+        schema = COLLECTIONS[collection]
+        build_query, id_column, to_document = SOURCES[collection]
+        started = time.perf_counter()
+        target = f"{collection}_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
+
+        # Session-level lock on its own connection: outbox batches wait until the alias is swapped
+        async with get_engine().connect() as lock_conn:
+            await lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": INDEXER_LOCK_KEY})
+            try:
+                await self.client.create_collection({**schema, "name": target})
+                count = 0
+                try:
+                    session_maker = get_session_maker()
+                    async with session_maker() as db:
+                        result = await db.stream(
+                            build_query().order_by(id_column).execution_options(yield_per=self.batch_size)
+                        )
+                        async for partition in result.partitions():
+                            documents = [to_document(row) for row in partition]
+                            failures = await self.client.import_documents(target, documents, action="upsert")
+                            if failures:
+                                logger.error(f"{len(failures)} documents rejected by {target}: {failures[:3]}")
+                            count += len(documents) - len(failures)
+                except Exception:
+                    await self.client.delete_collection(target)
+                    raise
+
+                previous = await self.client.get_alias(collection)
+                if previous is None and await self.client.get_collection(collection) is not None:
+                    # A plain collection with the alias name predates aliasing
+                    await self.client.delete_collection(collection)
+                await self.client.upsert_alias(collection, target)
+                if previous and previous != target:
+                    await self.client.delete_collection(previous)
+            finally:
+                await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": INDEXER_LOCK_KEY})
+
+        metrics.search_indexed_documents.inc(collection, "reindex", amount=count)
+        elapsed = time.perf_counter() - started
+        logger.info(f"Reindexed {count} {collection} into {target} in {elapsed:.1f}s")
+        return {"collection": collection, "target": target, "previous": previous, "documents": count, "seconds": round(elapsed, 1)}
+
+    async def ensure_collections(self) -> None:
+        """Build every collection that has no alias yet (first start)."""
+        for collection in COLLECTIONS:
+            if await self.client.get_alias(collection) is None:
+                await self.reindex(collection)
+        self.ready = True
+
+    async def run(self) -> None:
+        """Drain the outbox forever; back off while Typesense is unreachable."""
+        failures = 0
+        while True:
+            try:
+                if not self.ready:
+                    await self.ensure_collections()
+                processed = await self.run_once()
+                failures = 0
+                self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                processed = 0
+                self.last_error = str(e)
+                logger.warning(f"Search indexing failed (attempt {failures}): {e}")
+            if processed < self.batch_size:
+                delay = settings.SEARCH_INDEX_INTERVAL_MS / 1000
+                await asyncio.sleep(min(60, delay * 2 ** failures) if failures else delay)
+
+    async def status(self, db: AsyncSession) -> Dict[str, Any]:
+        """Pending outbox rows and indexing lag (age of the oldest pending change)."""
+        result = await db.execute(select(func.count(SearchOutbox.id), func.min(SearchOutbox.created_at)))
+        pending, oldest = result.one()
+        lag = (datetime.now(timezone.utc) - oldest).total_seconds() if oldest else 0.0
+        by_collection = await db.execute(
+            select(SearchOutbox.entity_type, func.count(SearchOutbox.id)).group_by(SearchOutbox.entity_type)
+        )
+        return {
+            "pending": pending,
+            "pending_by_collection": {entity_type: count for entity_type, count in by_collection.all()},
+            "oldest_pending_at": oldest,
+            "lag_seconds": round(lag, 3),
+            "last_run_at": self.last_run_at,
+            "last_error": self.last_error,
+            "ready": self.ready,
+        }
+
+
+search_indexer = SearchIndexer()
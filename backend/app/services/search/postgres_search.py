@@ -0,0 +1,127 @@
+"""Postgres full-text search backend.
+
+Used when Typesense is unreachable (or ``SEARCH_BACKEND=postgres``, e.g. in
+tests). Each indexed table has a generated ``search_vector`` tsvector column
+with a GIN index; references, SIRETs and file names also have trigram
+indexes so partial identifiers (``2024-0001``, ``5512``) match. Results have
+the same shape as a Typesense search response and the same documents as the
+Typesense collections, so ``SearchService`` handles both backends alike.
+"""
+import re
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import String, cast, func, literal, literal_column, or_
+
+from app.core.database import get_session_maker
+from app.models.document import Document, ProcessingStatus
+from app.models.document_type import DocumentType
+from app.models.dossier import Dossier, DossierStatus, Priority
+from app.models.installer import Installer
+from app.models.process import Process
+from .indexer import SOURCES
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Text search configuration per table (must match the generated columns)
+TS_CONFIG = {
+    "dossiers": "simple",
+    "documents": "french",
+    "installers": "simple",
+}
+
+# Columns matched by substring through their trigram index
+TRIGRAM_COLUMNS = {
+    "dossiers": Dossier.reference,
+    "documents": Document.original_filename,
+    "installers": Installer.siret,
+}
+
+VECTORS = {
+    "dossiers": Dossier.search_vector,
+    "documents": Document.search_vector,
+    "installers": Installer.search_vector,
+}
+
+# Supported filters: field -> clause builder (same field names as the Typesense collections)
+FILTERS = {
+    "dossiers": {
+        "status": lambda value: Dossier.status == DossierStatus(value),
+        "priority": lambda value: Dossier.priority == Priority(value),
+        "process_code": lambda value: Process.code == value,
+    },
+    "documents": {
+        "dossier_id": lambda value: cast(Document.dossier_id, String) == value,
+        "document_type": lambda value: DocumentType.code == value,
+        "processing_status": lambda value: Document.processing_status == ProcessingStatus(value),
+    },
+    "installers": {
+        "city": lambda value: Installer.city == value,
+        "rge_status": lambda value: Installer.rge_status == value,
+        "active": lambda value: Installer.active.is_(str(value).lower() == "true"),
+    },
+}
+
+
+def prefix_tsquery(query: str) -> Optional[str]:
+    """``to_tsquery`` input matching every word of ``query`` as a prefix (search as you type)."""
+    words = _WORD.findall(query.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class PostgresSearch:
+    """Full-text search over the database, returning Typesense-shaped results."""
+
+    async def search(
+        self,
+        collection: str,
+        query: str,
+        filters: Optional[Dict[str, str]] = None,
+        page: int = 1,
+        per_page: int = 20
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        build_query, id_column, to_document = SOURCES[collection]
+        vector = VECTORS[collection]
+        trigram_column = TRIGRAM_COLUMNS[collection]
+
+        tsquery_text = prefix_tsquery(query)
+        ts_config = literal_column(f"'{TS_CONFIG[collection]}'::regconfig")
+        tsquery = func.to_tsquery(ts_config, tsquery_text) if tsquery_text else None
+        substring = trigram_column.ilike(f"%{_escape_like(query.strip())}%", escape="\\")
+
+        matches = or_(vector.op("@@")(tsquery), substring) if tsquery is not None else substring
+        rank = (func.ts_rank(vector, tsquery) if tsquery is not None else literal(0.0)) + func.similarity(
+            trigram_column, query.strip()
+        )
+
+        statement = (
+            build_query()
+            .add_columns(func.count().over().label("search_total"))
+            .where(matches)
+        )
+        for field, value in (filters or {}).items():
+            build_clause = FILTERS[collection].get(field)
+            if build_clause is not None and value not in (None, ""):
+                statement = statement.where(build_clause(value))
+        statement = statement.order_by(rank.desc(), id_column).limit(per_page).offset((page - 1) * per_page)
+
+        session_maker = get_session_maker()
+        async with session_maker() as db:
+            rows = (await db.execute(statement)).all()
+
+        return {
+            "hits": [{"document": to_document(row)} for row in rows],
+            "found": rows[0].search_total if rows else 0,
+            "page": page,
+            "search_time_ms": round((time.perf_counter() - started) * 1000),
+        }
+
+
+postgres_search = PostgresSearch()
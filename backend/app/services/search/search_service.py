@@ -1,8 +1,33 @@
 """Search Service."""
+import asyncio
+import logging
+import time
 from typing import Any, Optional
 from pydantic import BaseModel
 
-from .typesense_client import get_typesense_client, TYPESENSE_AVAILABLE
+from app.core import metrics
+from app.core.config import settings
+from app.services.cache.lru import LRUCache, MISSING
+from .postgres_search import postgres_search
+from .typesense_client import async_typesense_client
+
+logger = logging.getLogger(__name__)
+
+# Collection: fields searched (see COLLECTIONS for the indexed schema)
+QUERY_BY = {
+    "dossiers": "reference,beneficiary_name,beneficiary_address,installer_name",
+    "documents": "filename,dossier_reference,ocr_text",
+    "installers": "company_name,siret,city,contact_name",
+}
+
+TYPESENSE = "typesense"
+POSTGRES = "postgres"
+
+# Short-lived results shared by all requests of this worker
+_results = LRUCache(max_entries=settings.SEARCH_CACHE_MAX_ENTRIES, ttl=settings.SEARCH_CACHE_TTL)
+
+# Typesense health as last seen by this worker (SEARCH_BACKEND=auto)
+_health = {"healthy": True, "checked_at": 0.0}
 
 
 class SearchResult(BaseModel):
@@ -18,19 +43,120 @@ class GlobalSearchResult(BaseModel):
     dossiers: SearchResult
     documents: SearchResult
     installers: SearchResult
+    # Per collection: round trip and backend search time in ms, cache hit, backend
+    timings: dict[str, dict[str, Any]] = {}
 
 
-class SearchService:
-    """Service for Typesense search operations."""
-
-    def __init__(self):
-        if TYPESENSE_AVAILABLE:
-            try:
-                self.client = get_typesense_client()
-            except Exception:
-                self.client = None
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of ``query`` used in cache keys."""
+    return " ".join(query.lower().split())
+
+
+def _set_health(healthy: bool) -> None:
+    if healthy != _health["healthy"]:
+        if healthy:
+            logger.info("Typesense is healthy again, searching with Typesense")
         else:
-            self.client = None
+            logger.warning("Typesense is unavailable, searching with Postgres")
+    _health["healthy"] = healthy
+    _health["checked_at"] = time.monotonic()
+
+
+async def active_backend() -> str:
+    """Backend for the next search: ``SEARCH_BACKEND``, or by Typesense health when ``auto``."""
+    if settings.SEARCH_BACKEND != "auto":
+        return settings.SEARCH_BACKEND
+    if time.monotonic() - _health["checked_at"] >= settings.SEARCH_HEALTH_CHECK_INTERVAL:
+        # Claim the check first so concurrent searches do not all probe
+        _health["checked_at"] = time.monotonic()
+        _set_health(await async_typesense_client.health())
+    return TYPESENSE if _health["healthy"] else POSTGRES
+
+
+class SearchService:
+    """Service for search operations.
+
+    Searches go to Typesense through a shared non-blocking client, or to the
+    Postgres full-text fallback while Typesense is unhealthy (or when
+    ``SEARCH_BACKEND=postgres``). Results are cached for ``SEARCH_CACHE_TTL``
+    seconds per backend, normalized query, filters, page and ``scope`` (the
+    principal the results are computed for).
+    """
+
+    def __init__(self, scope: Optional[str] = None):
+        self.client = async_typesense_client
+        self.scope = scope
+
+    def _cache_key(self, backend: str, collection: str, query: str, filter_by: str, page: int, per_page: int) -> str:
+        return "|".join([
+            backend, self.scope or "-", collection, normalize_query(query), filter_by, str(page), str(per_page)
+        ])
+
+    async def _typesense_search(
+        self, collection: str, query: str, filter_by: str, page: int, per_page: int, extra: Optional[dict[str, Any]]
+    ) -> dict[str, Any]:
+        return await self.client.search(collection, {
+            "q": query,
+            "query_by": QUERY_BY[collection],
+            "filter_by": filter_by,
+            "page": page,
+            "per_page": per_page,
+            **(extra or {})
+        })
+
+    async def _search(
+        self,
+        collection: str,
+        query: str,
+        filters: Optional[dict[str, str]],
+        page: int,
+        per_page: int,
+        extra: Optional[dict[str, Any]] = None
+    ) -> tuple[SearchResult, dict[str, Any]]:
+        """Search one collection. Returns the result and its timing entry."""
+        filter_by = self._build_filter_string(filters) if filters else ""
+        backend = await active_backend()
+        key = self._cache_key(backend, collection, query, filter_by, page, per_page)
+        cached = _results.get(key)
+        if cached is not MISSING:
+            return cached, {"ms": 0.0, "search_time_ms": None, "cached": True, "backend": backend}
+
+        started = time.perf_counter()
+        try:
+            if backend == TYPESENSE:
+                try:
+                    result = await self._typesense_search(collection, query, filter_by, page, per_page, extra)
+                except Exception as e:
+                    if settings.SEARCH_BACKEND != "auto":
+                        raise
+                    # Fall back for this search; the next health check decides when to switch back
+                    logger.warning(f"Search in {collection} failed, falling back to Postgres: {e}")
+                    _set_health(False)
+                    backend = POSTGRES
+                    key = self._cache_key(backend, collection, query, filter_by, page, per_page)
+            if backend == POSTGRES:
+                result = await postgres_search.search(collection, query, filters, page, per_page)
+        except Exception as e:
+            # Return empty result if no backend is available
+            logger.warning(f"Search in {collection} failed: {e}")
+            return (
+                SearchResult(hits=[], total=0, page=page, total_pages=0),
+                {"ms": round((time.perf_counter() - started) * 1000, 1), "search_time_ms": None, "cached": False, "backend": backend}
+            )
+        elapsed = time.perf_counter() - started
+        metrics.search_latency.observe(elapsed, collection, backend)
+        metrics.record_timing(f"search_{collection}", elapsed)
+
+        search_result = SearchResult(
+            hits=[h["document"] for h in result.get("hits", [])],
+            total=result["found"],
+            page=result["page"],
+            total_pages=(result["found"] + per_page - 1) // per_page
+        )
+        _results.set(key, search_result)
+        return search_result, {
+            "ms": round(elapsed * 1000, 1), "search_time_ms": result.get("search_time_ms"), "cached": False, "backend": backend
+        }
 
     async def search_dossiers(
         self,
@@ -40,31 +166,11 @@ class SearchService:
         per_page: int = 20
     ) -> SearchResult:
         """Search dossiers collection."""
-        if not self.client:
-            # Return empty result if Typesense is not available
-            return SearchResult(hits=[], total=0, page=page, total_pages=0)
-        
-        filter_by = self._build_filter_string(filters) if filters else ""
-
-        try:
-            result = self.client.collections["dossiers"].documents.search({
-                "q": query,
-                "query_by": "reference,beneficiary_name,beneficiary_address,installer_name",
-                "filter_by": filter_by,
-                "page": page,
-                "per_page": per_page,
-                "highlight_full_fields": "beneficiary_name,reference"
-            })
-
-            return SearchResult(
-                hits=[h["document"] for h in result.get("hits", [])],
-                total=result["found"],
-                page=result["page"],
-                total_pages=(result["found"] + per_page - 1) // per_page
-            )
-        except Exception:
-            # Return empty result if Typesense is not available
-            return SearchResult(hits=[], total=0, page=page, total_pages=0)
+        result, _ = await self._search(
+            "dossiers", query, filters, page, per_page,
+            extra={"highlight_full_fields": "beneficiary_name,reference"}
+        )
+        return result
 
     async def search_documents(
         self,
@@ -74,29 +180,9 @@ class SearchService:
         per_page: int = 20
     ) -> SearchResult:
         """Search documents collection."""
-        if not self.client:
-            return SearchResult(hits=[], total=0, page=page, total_pages=0)
-        
-        filter_by = self._build_filter_string(filters) if filters else ""
-        
-        try:
-            result = self.client.collections["documents"].documents.search({
-                "q": query,
-                "query_by": "filename,original_filename,text_content",
-                "filter_by": filter_by,
-                "page": page,
-                "per_page": per_page
-            })
-            
-            return SearchResult(
-                hits=[h["document"] for h in result.get("hits", [])],
-                total=result["found"],
-                page=result["page"],
-                total_pages=(result["found"] + per_page - 1) // per_page
-            )
-        except Exception:
-            return SearchResult(hits=[], total=0, page=page, total_pages=0)
-    
+        result, _ = await self._search("documents", query, filters, page, per_page)
+        return result
+
     async def search_installers(
         self,
         query: str,
@@ -105,43 +191,43 @@ class SearchService:
         per_page: int = 20
     ) -> SearchResult:
         """Search installers collection."""
-        if not self.client:
-            return SearchResult(hits=[], total=0, page=page, total_pages=0)
-        
-        filter_by = self._build_filter_string(filters) if filters else ""
-        
-        try:
-            result = self.client.collections["installers"].documents.search({
-                "q": query,
-                "query_by": "name,siret,rge_number,address,city",
-                "filter_by": filter_by,
-                "page": page,
-                "per_page": per_page
-            })
-            
-            return SearchResult(
-                hits=[h["document"] for h in result.get("hits", [])],
-                total=result["found"],
-                page=result["page"],
-                total_pages=(result["found"] + per_page - 1) // per_page
-            )
-        except Exception:
-            return SearchResult(hits=[], total=0, page=page, total_pages=0)
+        result, _ = await self._search("installers", query, filters, page, per_page)
+        return result
 
     async def global_search(self, query: str) -> GlobalSearchResult:
-        """Search across all collections."""
-        dossiers = await self.search_dossiers(query, per_page=5)
-        documents = await self.search_documents(query, per_page=5)
-        installers = await self.search_installers(query, per_page=5)
+        """Search across all collections, concurrently."""
+        (dossiers, dossiers_timing), (documents, documents_timing), (installers, installers_timing) = await asyncio.gather(
+            self._search("dossiers", query, None, 1, 5, extra={"highlight_full_fields": "beneficiary_name,reference"}),
+            self._search("documents", query, None, 1, 5),
+            self._search("installers", query, None, 1, 5),
+        )
 
         return GlobalSearchResult(
             dossiers=dossiers,
             documents=documents,
-            installers=installers
+            installers=installers,
+            timings={
+                "dossiers": dossiers_timing,
+                "documents": documents_timing,
+                "installers": installers_timing,
+            }
         )
 
     def _build_filter_string(self, filters: dict[str, str]) -> str:
         """Build Typesense filter string from dict."""
-        parts = [f"{k}:={v}" for k, v in filters.items()]
+        parts = [f"{k}:={v}" for k, v in sorted(filters.items())]
         return " && ".join(parts)
 
+
+def search_cache_stats() -> dict:
+    """Entries and evictions of the search result cache."""
+    return {"entries": len(_results), "max_entries": _results.max_entries, "evictions": _results.evictions}
+
+
+def search_backend_status() -> dict:
+    """Configured search backend and the last Typesense health check of this worker."""
+    return {
+        "configured": settings.SEARCH_BACKEND,
+        "typesense_healthy": _health["healthy"],
+        "active": settings.SEARCH_BACKEND if settings.SEARCH_BACKEND != "auto" else (TYPESENSE if _health["healthy"] else POSTGRES),
+    }
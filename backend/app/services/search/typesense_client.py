@@ -1,4 +1,10 @@
 """Typesense client configuration."""
+import asyncio
+import json
+from typing import Any, Optional
+
+import aiohttp
+
 try:
     import typesense
     TYPESENSE_AVAILABLE = True
@@ -7,6 +13,7 @@ except ImportError:
     typesense = None
 
 from app.core.config import settings
+from app.core.serialization import dumps
 
 
 def get_typesense_client():
@@ -25,6 +32,132 @@ def get_typesense_client():
     })
 
 
+class AsyncTypesenseClient:
+    """Non-blocking Typesense search client over a pooled aiohttp session.
+
+    The session (and its keep-alive connection pool of ``TYPESENSE_POOL_SIZE``
+    connections) is created on first use inside the running event loop and
+    shared by all requests; ``close()`` releases it on shutdown.
+    """
+
+    def __init__(self):
+        self.base_url = f"{settings.TYPESENSE_PROTOCOL}://{settings.TYPESENSE_HOST}:{settings.TYPESENSE_PORT}"
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            async with self._lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(limit=settings.TYPESENSE_POOL_SIZE, keepalive_timeout=30),
+                        timeout=aiohttp.ClientTimeout(total=settings.TYPESENSE_TIMEOUT_SECONDS),
+                        headers={"X-TYPESENSE-API-KEY": settings.TYPESENSE_API_KEY}
+                    )
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        body: Any = None,
+        data: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+        missing_ok: bool = False,
+        text: bool = False
+    ) -> Any:
+        session = await self._get_session()
+        kwargs = {"params": params}
+        if body is not None:
+            kwargs["data"] = dumps(body)
+            kwargs["headers"] = {"Content-Type": "application/json"}
+        elif data is not None:
+            kwargs["data"] = data
+            kwargs["headers"] = {"Content-Type": "text/plain"}
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        async with session.request(method, f"{self.base_url}{path}", **kwargs) as response:
+            if response.status == 404 and missing_ok:
+                return None
+            raw = await response.read()
+            if response.status >= 400:
+                try:
+                    message = json.loads(raw).get("message", response.reason)
+                except ValueError:
+                    message = response.reason
+                raise Exception(f"Typesense error {response.status}: {message}")
+            return raw.decode("utf-8") if text else json.loads(raw)
+
+    async def search(self, collection: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Search one collection (``GET /collections/{collection}/documents/search``)."""
+        query = {key: str(value) for key, value in params.items() if value not in (None, "")}
+        return await self._request("GET", f"/collections/{collection}/documents/search", params=query)
+
+    async def health(self) -> bool:
+        """Whether the Typesense node reports itself healthy (``GET /health``)."""
+        try:
+            payload = await self._request("GET", "/health", timeout=settings.SEARCH_HEALTH_CHECK_TIMEOUT_SECONDS)
+        except Exception:
+            return False
+        return bool(payload.get("ok"))
+
+    async def multi_search(self, searches: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Several searches in one request; each entry names its ``collection``."""
+        payload = await self._request("POST", "/multi_search", body={"searches": searches})
+        return payload.get("results", [])
+
+    # Indexing
+
+    async def import_documents(self, collection: str, documents: list[dict[str, Any]], action: str = "upsert") -> list[dict[str, Any]]:
+        """Bulk import (JSON Lines). Returns the per-document results that failed."""
+        if not documents:
+            return []
+        data = b"\n".join(dumps(document) for document in documents)
+        raw = await self._request(
+            "POST", f"/collections/{collection}/documents/import",
+            params={"action": action}, data=data, timeout=settings.TYPESENSE_IMPORT_TIMEOUT_SECONDS, text=True
+        )
+        results = [json.loads(line) for line in raw.splitlines() if line.strip()]
+        return [result for result in results if not result.get("success")]
+
+    async def delete_documents(self, collection: str, ids: list[str]) -> int:
+        """Delete documents by id. Returns the number deleted."""
+        if not ids:
+            return 0
+        payload = await self._request(
+            "DELETE", f"/collections/{collection}/documents",
+            params={"filter_by": f"id:[{','.join(ids)}]", "batch_size": str(len(ids))}
+        )
+        return payload.get("num_deleted", 0)
+
+    async def get_collection(self, name: str) -> Optional[dict[str, Any]]:
+        return await self._request("GET", f"/collections/{name}", missing_ok=True)
+
+    async def create_collection(self, schema: dict[str, Any]) -> dict[str, Any]:
+        return await self._request("POST", "/collections", body=schema)
+
+    async def delete_collection(self, name: str) -> None:
+        await self._request("DELETE", f"/collections/{name}", missing_ok=True)
+
+    async def get_alias(self, name: str) -> Optional[str]:
+        """Collection an alias points to, or None."""
+        payload = await self._request("GET", f"/aliases/{name}", missing_ok=True)
+        return payload.get("collection_name") if payload else None
+
+    async def upsert_alias(self, name: str, collection: str) -> None:
+        """Point alias ``name`` at ``collection`` (atomic for searches)."""
+        await self._request("PUT", f"/aliases/{name}", body={"collection_name": collection})
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+async_typesense_client = AsyncTypesenseClient()
+
+
 # Collection schemas
 COLLECTIONS = {
     "dossiers": {
@@ -0,0 +1,268 @@
+"""Training dataset builder.
+
+Each run claims the feedback that is not in a batch yet, up to
+``TRAINING_BATCH_MAX_FEEDBACK`` rows, by stamping it with a new
+``training_batch_id`` (rows being claimed by a concurrent run are skipped).
+The claimed feedback is then streamed together with its document page and
+extracted field context, deduplicated, and written to storage as compressed
+shards plus a manifest:
+
+    training/batches/<batch_id>/part-00000.jsonl.gz
+    training/batches/<batch_id>/manifest.json
+
+The claim is committed only once the manifest is written, so a failed run
+leaves its feedback unbatched for the next one.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.serialization import dumps, json_default
+from app.models.document import Document
+from app.models.document_type import DocumentType
+from app.models.extracted_field import ExtractedField
+from app.models.feedback import HumanFeedback
+from app.services.export.writers import get_writer
+from app.services.pdf_storage import pdf_storage_service
+
+logger = logging.getLogger(__name__)
+
+TRAINING_PREFIX = "training/batches"
+
+FORMATS = {
+    # format: (shard extension, content type)
+    "jsonl": ("jsonl.gz", "application/gzip"),
+    "parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+# Record columns: feedback, the extracted field it corrects and the page region
+# to crop from the source document (page_number + bounding_box)
+RECORD_COLUMNS = [
+    ("feedback_id", HumanFeedback.id),
+    ("dossier_id", HumanFeedback.dossier_id),
+    ("document_id", HumanFeedback.document_id),
+    ("extracted_field_id", HumanFeedback.extracted_field_id),
+    ("feedback_type", HumanFeedback.feedback_type),
+    ("document_type", func.coalesce(HumanFeedback.document_type, DocumentType.code)),
+    ("field_name", func.coalesce(HumanFeedback.field_name, ExtractedField.field_name)),
+    ("field_display_name", ExtractedField.display_name),
+    ("field_data_type", ExtractedField.data_type),
+    ("original_value", HumanFeedback.original_value),
+    ("corrected_value", HumanFeedback.corrected_value),
+    ("extracted_value", ExtractedField.extracted_value),
+    ("field_confidence", ExtractedField.confidence),
+    ("confidence_before", HumanFeedback.confidence_before),
+    ("extraction_method", ExtractedField.extraction_method),
+    ("model_used", HumanFeedback.model_used),
+    ("model_version", HumanFeedback.model_version),
+    ("context_data", HumanFeedback.context_data),
+    ("page_number", ExtractedField.page_number),
+    ("bounding_box", ExtractedField.bounding_box),
+    ("document_storage_path", Document.storage_path),
+    ("document_mime_type", Document.mime_type),
+    ("document_page_count", Document.page_count),
+    ("created_at", HumanFeedback.created_at),
+]
+
+COLUMN_NAMES = [name for name, _ in RECORD_COLUMNS]
+
+
+def dedup_key(record: Dict[str, Any]) -> bytes:
+    """Records correcting the same field of the same document to the same value are duplicates."""
+    identity = [
+        record["document_id"] or record["dossier_id"],
+        record["extracted_field_id"] or record["field_name"],
+        record["feedback_type"],
+        record["corrected_value"],
+    ]
+    return hashlib.sha1(json.dumps(identity, sort_keys=True, default=json_default).encode("utf-8")).digest()
+
+
+@dataclass
+class TrainingBatch:
+    """Summary of one builder run; written to storage as the manifest."""
+    batch_id: UUID
+    format: str
+    feedback_count: int = 0
+    record_count: int = 0
+    duplicate_count: int = 0
+    shards: List[Dict[str, Any]] = field(default_factory=list)
+    first_feedback_at: Optional[datetime] = None
+    last_feedback_at: Optional[datetime] = None
+    manifest_key: Optional[str] = None
+
+    def manifest(self) -> Dict[str, Any]:
+        return {
+            "batch_id": self.batch_id,
+            "format": self.format,
+            "created_at": datetime.now(timezone.utc),
+            "columns": COLUMN_NAMES,
+            "feedback_count": self.feedback_count,
+            "record_count": self.record_count,
+            "duplicate_count": self.duplicate_count,
+            "first_feedback_at": self.first_feedback_at,
+            "last_feedback_at": self.last_feedback_at,
+            "shards": self.shards,
+        }
+
+
+class _Shard:
+    """One output file, encoded into a spooled temporary file."""
+
+    def __init__(self, key: str, export_format: str, content_type: str):
+        self.key = key
+        self.content_type = content_type
+        self.records = 0
+        self._spool = tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024)
+        self._out = gzip.GzipFile(fileobj=self._spool, mode="wb") if export_format == "jsonl" else self._spool
+        self._writer = get_writer(export_format, RECORD_COLUMNS)
+        self._out.write(self._writer.begin())
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        self._out.write(self._writer.write(records))
+        self.records += len(records)
+
+    async def upload(self) -> Dict[str, Any]:
+        self._out.write(self._writer.end())
+        if self._out is not self._spool:
+            self._out.close()
+        size = self._spool.tell()
+        self._spool.seek(0)
+        digest = hashlib.sha256()
+        for block in iter(lambda: self._spool.read(1024 * 1024), b""):
+            digest.update(block)
+        self._spool.seek(0)
+        try:
+            location = await pdf_storage_service.save_stream(self.key, self._spool, self.content_type)
+        finally:
+            self._spool.close()
+        return {"key": location, "records": self.records, "bytes": size, "sha256": digest.hexdigest()}
+
+
+class TrainingDatasetBuilder:
+    """Assemble the next training batch from unbatched ``HumanFeedback``."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        export_format: Optional[str] = None,
+        shard_size: Optional[int] = None,
+        max_feedback: Optional[int] = None
+    ):
+        self.db = db
+        self.format = export_format or settings.TRAINING_DATASET_FORMAT
+        if self.format not in FORMATS:
+            raise ValueError(f"Unsupported training dataset format: {self.format}")
+        self.shard_size = shard_size or settings.TRAINING_SHARD_SIZE
+        self.max_feedback = max_feedback or settings.TRAINING_BATCH_MAX_FEEDBACK
+
+    async def _claim(self, batch_id: UUID) -> int:
+        """Stamp the oldest unbatched feedback with ``batch_id``, skipping rows locked by another run."""
+        candidates = (
+            select(HumanFeedback.id)
+            .where(HumanFeedback.training_batch_id.is_(None))
+            .order_by(HumanFeedback.created_at)
+            .limit(self.max_feedback)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            update(HumanFeedback)
+            .where(HumanFeedback.id.in_(candidates.scalar_subquery()))
+            .values(training_batch_id=batch_id, used_for_training=True)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def _records_query(self, batch_id: UUID):
+        # Newest first, so the latest of several identical corrections is kept
+        return (
+            select(*(expression.label(name) for name, expression in RECORD_COLUMNS))
+            .select_from(HumanFeedback)
+            .outerjoin(ExtractedField, ExtractedField.id == HumanFeedback.extracted_field_id)
+            .outerjoin(Document, Document.id == func.coalesce(HumanFeedback.document_id, ExtractedField.document_id))
+            .outerjoin(DocumentType, DocumentType.id == Document.document_type_id)
+            .where(HumanFeedback.training_batch_id == batch_id)
+            .order_by(HumanFeedback.created_at.desc(), HumanFeedback.id)
+            .execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+        )
+
+    def _new_shard(self, batch: TrainingBatch) -> _Shard:
+        extension, content_type = FORMATS[self.format]
+        key = f"{TRAINING_PREFIX}/{batch.batch_id}/part-{len(batch.shards):05d}.{extension}"
+        return _Shard(key, self.format, content_type)
+
+    async def _write_records(self, batch: TrainingBatch) -> None:
+        seen = set()
+        shard = None
+        result = await self.db.stream(self._records_query(batch.batch_id))
+        async for partition in result.mappings().partitions():
+            records = []
+            for row in partition:
+                record = dict(row)
+                created_at = record["created_at"]
+                if batch.last_feedback_at is None:
+                    batch.last_feedback_at = created_at
+                batch.first_feedback_at = created_at
+                key = dedup_key(record)
+                if key in seen:
+                    batch.duplicate_count += 1
+                    continue
+                seen.add(key)
+                records.append(record)
+
+            while records:
+                if shard is None:
+                    shard = self._new_shard(batch)
+                room = self.shard_size - shard.records
+                shard.write(records[:room])
+                records = records[room:]
+                if shard.records >= self.shard_size:
+                    batch.shards.append(await shard.upload())
+                    shard = None
+
+        if shard is not None:
+            batch.shards.append(await shard.upload())
+        batch.record_count = sum(shard["records"] for shard in batch.shards)
+
+    async def _discard(self, batch: TrainingBatch) -> None:
+        for key in [shard["key"] for shard in batch.shards] + [batch.manifest_key]:
+            if key:
+                await pdf_storage_service.delete_file(key)
+
+    async def build(self) -> Optional[TrainingBatch]:
+        """Build and commit the next batch; ``None`` when there is no new feedback."""
+        batch = TrainingBatch(batch_id=uuid.uuid4(), format=self.format)
+        try:
+            batch.feedback_count = await self._claim(batch.batch_id)
+            if not batch.feedback_count:
+                await self.db.rollback()
+                return None
+
+            await self._write_records(batch)
+            batch.manifest_key = await pdf_storage_service.save_object(
+                f"{TRAINING_PREFIX}/{batch.batch_id}/manifest.json",
+                dumps(batch.manifest()),
+                "application/json"
+            )
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            await self._discard(batch)
+            raise
+
+        logger.info(
+            f"Training batch {batch.batch_id}: {batch.feedback_count} feedback, {batch.record_count} records "
+            f"({batch.duplicate_count} duplicates) in {len(batch.shards)} shards"
+        )
+        return batch
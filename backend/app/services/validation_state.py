@@ -0,0 +1,112 @@
+"""Validation state of a dossier (rules, results, fields, documents).
+
+The per-dossier part comes from the dossier's review snapshot
+(``app.services.review_snapshot``): one primary key lookup while it is
+current, one aggregated query to rebuild it after a change. The rule and
+field schema part depends only on the process and the document types and
+comes from the reference data cache (``get_applicable_rules`` /
+``get_active_field_schemas``). Results are joined to rules through a dict
+keyed by rule id.
+"""
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.extracted_field import FieldStatus
+from app.services.cache.reference_data import get_active_field_schemas, get_applicable_rules
+from app.services.review_snapshot import SECTIONS, get_changes, get_snapshot
+
+
+async def load_validation_state(
+    db: AsyncSession,
+    dossier_id: UUID,
+    since_version: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """Validation state of a dossier as returned by the API, or None if it does not exist.
+
+    With ``since_version``, the documents, results and fields are replaced by
+    the ``changes`` since that snapshot version, unless they are no longer
+    kept (the full state is returned then).
+    """
+    snapshot = await get_snapshot(db, dossier_id)
+    if snapshot is None:
+        return None
+    version, data = snapshot
+    dossier = data["dossier"]
+    documents = data["documents"]
+    validation_results = data["validation_results"]
+    fields = data["extracted_fields"]
+
+    document_type_ids = [UUID(d["document_type_id"]) for d in documents if d["document_type_id"]]
+    rules = await get_applicable_rules(db, UUID(dossier["process_id"]), document_type_ids)
+    field_schemas = await get_active_field_schemas(db, document_type_ids)
+
+    results_by_rule: Dict[str, Dict[str, Any]] = {}
+    for result in validation_results:
+        results_by_rule.setdefault(result["rule_id"], result)
+
+    rules_data: List[Dict[str, Any]] = []
+    for rule in rules:
+        rule_result = results_by_rule.get(rule["id"])
+        rules_data.append({
+            "id": rule["id"],
+            "code": rule["code"],
+            "name": rule["name"],
+            "description": rule["description"],
+            "rule_type": rule["rule_type"],
+            "severity": rule["severity"],
+            "expression": rule["expression"],
+            "error_message": rule["error_message"],
+            "can_override": rule["can_override"],
+            "status": rule_result["status"] if rule_result else None,
+            "message": rule_result["message"] if rule_result else None,
+            "overridden": rule_result["overridden"] if rule_result else False,
+            "executed_at": rule_result["executed_at"] if rule_result else None
+        })
+
+    schemas_data = [
+        {
+            "id": schema["id"],
+            "field_name": schema["field_name"],
+            "display_name": schema["display_name"],
+            "description": schema["description"],
+            "data_type": schema["data_type"],
+            "is_required": schema["is_required"],
+            "validation_pattern": schema["validation_pattern"],
+            "display_order": schema["display_order"]
+        }
+        for schema in field_schemas
+    ]
+
+    state = {
+        "dossier_id": dossier["id"],
+        "dossier_reference": dossier["reference"],
+        "dossier_status": dossier["status"],
+        "process_id": dossier["process_id"],
+        "assigned_validator_id": dossier["assigned_validator_id"],
+        "snapshot_version": version,
+        "rules": rules_data,
+        "validation_results": validation_results,
+        "extracted_fields": fields,
+        "field_schemas": schemas_data,
+        "documents": documents,
+        "summary": {
+            "total_rules": len(rules_data),
+            "passed_rules": len([r for r in validation_results if r["status"] == "passed"]),
+            "failed_rules": len([r for r in validation_results if r["status"] == "error"]),
+            "warning_rules": len([r for r in validation_results if r["status"] == "warning"]),
+            "total_fields": len(fields),
+            "confirmed_fields": len([f for f in fields if f["status"] == FieldStatus.CONFIRMED.value]),
+            "total_documents": len(documents)
+        }
+    }
+
+    if since_version is not None:
+        changes = await get_changes(db, dossier_id, since_version, version)
+        if changes is not None:
+            for section in SECTIONS:
+                del state[section]
+            state["since_version"] = since_version
+            state["changes"] = changes
+    return state
@@ -0,0 +1,233 @@
+"""Validator work queue.
+
+Validators pull work instead of picking it from dossier listings. A claim
+takes the highest-priority, oldest ``AWAITING_REVIEW`` dossier that is
+unassigned (or assigned to the claiming validator by an administrator) with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent claims never return the
+same dossier and never wait on each other. The dossier moves to
+``IN_REVIEW`` under a lease of ``QUEUE_LEASE_SECONDS``, renewed while the
+validator works on it; an expired lease returns the dossier to the queue.
+
+Validators hold at most ``max_concurrent_dossiers`` claimed dossiers (their
+``Validator`` record, ``QUEUE_DEFAULT_MAX_CONCURRENT`` without one), so work
+spreads over the validators that ask for it. Queue depth and age are
+exported as gauges, refreshed by the background reclaim loop.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.models.dossier import Dossier, DossierStatus, Priority
+from app.models.validator import Validator
+from app.services.cache import cache_service
+from app.services.events import publish_dossier_status
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock class for per-validator claims (two-key form, second key is the user)
+CLAIM_LOCK_CLASS = 7_301
+
+CLAIMED = "claimed"
+EMPTY = "empty"
+AT_CAPACITY = "at_capacity"
+
+
+def _capacity(validator: Optional[Validator]) -> int:
+    if validator is None:
+        return settings.QUEUE_DEFAULT_MAX_CONCURRENT
+    try:
+        return int(validator.max_concurrent_dossiers)
+    except (TypeError, ValueError):
+        return settings.QUEUE_DEFAULT_MAX_CONCURRENT
+
+
+class WorkQueue:
+    """Claims, leases and reclaims of dossiers awaiting review."""
+
+    def __init__(self):
+        self.lease = timedelta(seconds=settings.QUEUE_LEASE_SECONDS)
+
+    async def claim_next(self, db: AsyncSession, user_id: UUID) -> Tuple[str, Optional[Dossier]]:
+        """Claim the next dossier for the validator ``user_id``. The caller commits.
+
+        Returns ``(CLAIMED, dossier)``, ``(EMPTY, None)`` or ``(AT_CAPACITY, None)``.
+        """
+        # One claim at a time per validator, so the capacity check holds
+        await db.execute(
+            text("SELECT pg_advisory_xact_lock(:lock_class, hashtext(:user_id))"),
+            {"lock_class": CLAIM_LOCK_CLASS, "user_id": str(user_id)}
+        )
+        validator_result = await db.execute(select(Validator).where(Validator.user_id == user_id))
+        validator = validator_result.scalar_one_or_none()
+        if validator is not None and not validator.active:
+            raise ValueError("Validator account is inactive")
+
+        load_result = await db.execute(
+            select(func.count(Dossier.id)).where(
+                Dossier.assigned_validator_id == user_id,
+                Dossier.status == DossierStatus.IN_REVIEW
+            )
+        )
+        if load_result.scalar() >= _capacity(validator):
+            metrics.queue_claims.inc(AT_CAPACITY)
+            return AT_CAPACITY, None
+
+        result = await db.execute(
+            select(Dossier)
+            .where(
+                Dossier.status == DossierStatus.AWAITING_REVIEW,
+                or_(Dossier.assigned_validator_id.is_(None), Dossier.assigned_validator_id == user_id)
+            )
+            .order_by(Dossier.priority.desc(), Dossier.submitted_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        dossier = result.scalar_one_or_none()
+        if dossier is None:
+            metrics.queue_claims.inc(EMPTY)
+            return EMPTY, None
+
+        now = datetime.now(timezone.utc)
+        dossier.status = DossierStatus.IN_REVIEW
+        dossier.assigned_validator_id = user_id
+        dossier.claimed_at = now
+        dossier.lease_expires_at = now + self.lease
+        metrics.queue_claims.inc(CLAIMED)
+        return CLAIMED, dossier
+
+    async def _claimed(self, db: AsyncSession, dossier_id: UUID, user_id: UUID) -> Optional[Dossier]:
+        result = await db.execute(
+            select(Dossier)
+            .where(
+                Dossier.id == dossier_id,
+                Dossier.assigned_validator_id == user_id,
+                Dossier.status == DossierStatus.IN_REVIEW
+            )
+            .with_for_update()
+        )
+        return result.scalar_one_or_none()
+
+    async def renew(self, db: AsyncSession, dossier_id: UUID, user_id: UUID) -> Optional[Dossier]:
+        """Extend the lease of a dossier the validator holds. None if it is not held (any more)."""
+        dossier = await self._claimed(db, dossier_id, user_id)
+        if dossier is not None:
+            dossier.lease_expires_at = datetime.now(timezone.utc) + self.lease
+        return dossier
+
+    async def release(self, db: AsyncSession, dossier_id: UUID, user_id: UUID) -> Optional[Dossier]:
+        """Return a held dossier to the queue. None if it is not held."""
+        dossier = await self._claimed(db, dossier_id, user_id)
+        if dossier is not None:
+            dossier.status = DossierStatus.AWAITING_REVIEW
+            dossier.assigned_validator_id = None
+            dossier.claimed_at = None
+            dossier.lease_expires_at = None
+        return dossier
+
+    async def reclaim_expired(self) -> List[Tuple[Dossier, UUID]]:
+        """Return dossiers whose lease expired to the queue.
+
+        Returns the reclaimed dossiers with the validator that held them.
+        """
+        session_maker = get_session_maker()
+        async with session_maker() as db:
+            result = await db.execute(
+                select(Dossier)
+                .where(
+                    Dossier.status == DossierStatus.IN_REVIEW,
+                    Dossier.lease_expires_at < func.now()
+                )
+                .limit(settings.QUEUE_RECLAIM_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+            reclaimed = []
+            for dossier in result.scalars().all():
+                reclaimed.append((dossier, dossier.assigned_validator_id))
+                dossier.status = DossierStatus.AWAITING_REVIEW
+                dossier.assigned_validator_id = None
+                dossier.claimed_at = None
+                dossier.lease_expires_at = None
+            await db.commit()
+
+        if reclaimed:
+            metrics.queue_reclaimed.inc(amount=len(reclaimed))
+            logger.info(f"Returned {len(reclaimed)} dossiers with an expired lease to the review queue")
+        return reclaimed
+
+    async def stats(self, db: AsyncSession) -> Dict[str, Any]:
+        """Queue depth and oldest submission per priority, and claimed dossiers per validator."""
+        now = datetime.now(timezone.utc)
+        depth_result = await db.execute(
+            select(Dossier.priority, func.count(Dossier.id), func.min(Dossier.submitted_at))
+            .where(Dossier.status == DossierStatus.AWAITING_REVIEW)
+            .group_by(Dossier.priority)
+        )
+        by_priority = {priority.value: {"depth": 0, "oldest_age_seconds": 0.0} for priority in Priority}
+        for priority, depth, oldest in depth_result.all():
+            by_priority[priority.value] = {
+                "depth": depth,
+                "oldest_age_seconds": round((now - oldest).total_seconds(), 1) if oldest else 0.0,
+            }
+
+        load_result = await db.execute(
+            select(
+                Dossier.assigned_validator_id,
+                func.count(Dossier.id),
+                func.count(Dossier.id).filter(Dossier.lease_expires_at < now)
+            )
+            .where(Dossier.status == DossierStatus.IN_REVIEW, Dossier.assigned_validator_id.isnot(None))
+            .group_by(Dossier.assigned_validator_id)
+        )
+        loads = {user_id: (claimed, expired) for user_id, claimed, expired in load_result.all()}
+        validators_result = await db.execute(select(Validator).where(Validator.active == True))
+        validators = {validator.user_id: validator for validator in validators_result.scalars().all()}
+
+        return {
+            "depth": sum(entry["depth"] for entry in by_priority.values()),
+            "by_priority": by_priority,
+            "in_review": sum(claimed for claimed, _ in loads.values()),
+            "expired_leases": sum(expired for _, expired in loads.values()),
+            "validators": [
+                {
+                    "user_id": str(user_id),
+                    "claimed": loads.get(user_id, (0, 0))[0],
+                    "capacity": _capacity(validators.get(user_id)),
+                }
+                for user_id in sorted(set(loads) | set(validators), key=str)
+            ],
+        }
+
+    async def update_metrics(self) -> None:
+        session_maker = get_session_maker()
+        async with session_maker() as db:
+            stats = await self.stats(db)
+        for priority, entry in stats["by_priority"].items():
+            metrics.queue_depth.set(entry["depth"], priority)
+            metrics.queue_oldest_age.set(entry["oldest_age_seconds"], priority)
+
+    async def run(self) -> None:
+        """Reclaim expired leases and refresh the queue gauges forever."""
+        while True:
+            try:
+                reclaimed = await self.reclaim_expired()
+                if reclaimed:
+                    await cache_service.invalidate_tags([f"dossier:{dossier.id}" for dossier, _ in reclaimed])
+                for dossier, previous_validator_id in reclaimed:
+                    await publish_dossier_status(dossier, DossierStatus.IN_REVIEW, previous_validator_id)
+                await self.update_metrics()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Review queue maintenance failed: {e}")
+            await asyncio.sleep(settings.QUEUE_RECLAIM_INTERVAL_SECONDS)
+
+
+work_queue = WorkQueue()
@@ -5,6 +5,7 @@ from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token, require_role_from_user
 from app.models.user import UserRole
 from app.services.activity import ActivityLogger
+from app.services.activity.activity_logger import decode_cursor
 
 config = {
     "name": "ListActivities",
@@ -18,7 +19,8 @@ config = {
         },
         "total": {"type": "integer"},
         "page": {"type": "integer"},
-        "limit": {"type": "integer"}
+        "limit": {"type": "integer"},
+        "next_cursor": {"type": "string"}
     }
 }
 
@@ -45,6 +47,15 @@ async def handler(req, context):
     date_to_str = query.get("date_to")
     page = int(query.get("page", 1))
     limit = int(query.get("limit", 50))
+    cursor = query.get("cursor")
+    
+    # Keyset pagination: the cursor replaces page/offset and skips the total count
+    before = None
+    if cursor:
+        try:
+            before = decode_cursor(cursor)
+        except ValueError:
+            return {"status": 400, "body": {"detail": "Invalid cursor"}}
     
     session_maker = get_session_maker()
     async with session_maker() as db:
@@ -67,16 +78,35 @@ async def handler(req, context):
                 date_from=date_from,
                 date_to=date_to,
                 limit=limit,
-                offset=(page - 1) * limit
+                offset=(page - 1) * limit,
+                before=before,
+                include_total=before is None
             )
             
             return {
                 "status": 200,
                 "body": {
-                    "activities": result.get("activities", []),
-                    "total": result.get("total", 0),
+                    "activities": [
+                        {
+                            "id": activity.id,
+                            "user_id": activity.user_id,
+                            "action_type": activity.action_type,
+                            "entity_type": activity.entity_type,
+                            "entity_id": activity.entity_id,
+                            "entity_reference": activity.entity_reference,
+                            "description": activity.description,
+                            "metadata": activity.meta_data,
+                            "ip_address": activity.ip_address,
+                            "user_agent": activity.user_agent,
+                            "duration_ms": activity.duration_ms,
+                            "created_at": activity.created_at
+                        }
+                        for activity in result["activities"]
+                    ],
+                    "total": result["total"],
                     "page": page,
-                    "limit": limit
+                    "limit": limit,
+                    "next_cursor": result["next_cursor"]
                 }
             }
         except ValueError as e:
@@ -4,6 +4,7 @@ from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token, require_role_from_user
 from app.models.user import UserRole
 from app.models.ai_configuration import AIConfiguration
+from app.services.cache import cache_service, CacheNamespace
 from sqlalchemy import select
 
 config = {
@@ -99,6 +100,7 @@ async def handler(req, context):
                     config.priority = body["priority"]
             
             await db.commit()
+            await cache_service.invalidate(CacheNamespace.AI_CONFIGURATIONS)
             await db.refresh(config)
             
             # Log activity
@@ -7,7 +7,8 @@ from app.models.user import UserRole
 from app.models.dossier import Dossier, DossierStatus
 from app.models.invoice import Invoice
 from app.models.installer import Installer
-from sqlalchemy import select, func
+from app.services.reference_numbers import INVOICE_PREFIX, next_reference
+from sqlalchemy import select
 
 config = {
     "name": "GenerateInvoice",
@@ -107,9 +108,7 @@ async def handler(req, context):
             total_amount = (kwh_cumac * price_per_kwh) + payment_on_validation + payment_on_emmy
             
             # Generate invoice number
-            count_result = await db.execute(select(func.count(Invoice.id)))
-            count = count_result.scalar() or 0
-            invoice_number = f"INV-{datetime.now().year}-{count + 1:06d}"
+            invoice_number = await next_reference(db, INVOICE_PREFIX)
             
             # Parse due date
             due_date = None
@@ -0,0 +1,57 @@
+"""Cache statistics endpoint step."""
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.services.cache import cache_service, response_cache
+from app.services.search import search_cache_stats
+
+config = {
+    "name": "GetCacheStats",
+    "type": "api",
+    "path": "/api/cache/stats",
+    "method": "GET",
+    "responseSchema": {
+        "enabled": {"type": "boolean"},
+        "redis_connected": {"type": "boolean"},
+        "local_entries": {"type": "integer"},
+        "local_max_entries": {"type": "integer"},
+        "local_evictions": {"type": "integer"},
+        "namespaces": {"type": "object"},
+        "responses": {"type": "object"},
+        "search": {"type": "object"}
+    }
+}
+
+async def handler(req, context):
+    """Handle get cache stats request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+
+    token = auth_header.replace("Bearer ", "")
+
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+
+            return {
+                "status": 200,
+                "body": {
+                    **cache_service.stats(),
+                    "responses": response_cache.stats(),
+                    "search": search_cache_stats()
+                }
+            }
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error getting cache stats: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
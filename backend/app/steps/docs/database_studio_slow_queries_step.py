@@ -0,0 +1,59 @@
+"""Database Studio - Slow Query Log Endpoint."""
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.core.slow_queries import slow_query_log
+from app.models.user import UserRole
+
+config = {
+    "name": "DatabaseStudioSlowQueries",
+    "type": "api",
+    "path": "/api/db/studio/slow-queries",
+    "method": "GET",
+    "responseSchema": {
+        "enabled": {"type": "boolean"},
+        "threshold_ms": {"type": "integer"},
+        "explain_sample_rate": {"type": "number"},
+        "queries": {"type": "array"}
+    }
+}
+
+async def handler(req, context):
+    """Handle slow query log request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    query = req.get("query", {})
+    try:
+        limit = min(max(int(query.get("limit", 100)), 1), settings.SLOW_QUERY_LOG_SIZE)
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Query parameter 'limit' must be an integer"}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+            
+            return {
+                "status": 200,
+                "body": {
+                    "enabled": settings.SLOW_QUERY_LOG_ENABLED,
+                    "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+                    "explain_sample_rate": settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+                    "queries": slow_query_log.recent(limit)
+                }
+            }
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error getting slow queries: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
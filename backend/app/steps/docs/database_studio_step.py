@@ -468,6 +468,7 @@ def _generate_studio_html():
                 <div style="flex: 1;"></div>
                 <button onclick="refreshTable()">🔄 Refresh</button>
                 <button class="secondary" onclick="showSchema()">📋 Schema</button>
+                <button class="secondary" onclick="showSlowQueries()">🐢 Slow Queries</button>
             </div>
             <div class="content-area" id="contentArea">
                 <div class="empty-state">
@@ -642,6 +643,86 @@ def _generate_studio_html():
             }
         }
         
+        function escapeHtml(value) {
+            return String(value)
+                .replace(/&/g, '&amp;')
+                .replace(/</g, '&lt;')
+                .replace(/>/g, '&gt;')
+                .replace(/"/g, '&quot;');
+        }
+        
+        function formatPlan(plan) {
+            if (plan === null || plan === undefined) return '';
+            try {
+                const parsed = typeof plan === 'string' ? JSON.parse(plan) : plan;
+                return JSON.stringify(parsed, null, 2);
+            } catch (e) {
+                return String(plan);
+            }
+        }
+        
+        async function showSlowQueries() {
+            currentTable = null;
+            document.querySelectorAll('.table-item').forEach(item => item.classList.remove('active'));
+            document.getElementById('tableNameDisplay').textContent = 'Slow Queries';
+            document.getElementById('contentArea').innerHTML = '<div class="loading"><div class="spinner"></div><p>Loading slow queries...</p></div>';
+            
+            try {
+                const response = await fetch('/api/db/studio/slow-queries', {
+                    headers: {
+                        'Authorization': `Bearer ${getAuthToken()}`
+                    }
+                });
+                
+                if (!response.ok) {
+                    throw new Error('Failed to load slow queries');
+                }
+                
+                const data = await response.json();
+                renderSlowQueries(data);
+            } catch (error) {
+                document.getElementById('contentArea').innerHTML = 
+                    '<div class="empty-state"><p>Error loading slow queries: ' + error.message + '</p></div>';
+            }
+        }
+        
+        function renderSlowQueries(data) {
+            const queries = data.queries || [];
+            const html = `
+                <div class="table-view">
+                    <div class="table-header">
+                        <h2>Slow Queries</h2>
+                        <div class="table-stats">${queries.length} entries · threshold ${data.threshold_ms} ms · EXPLAIN sample ${Math.round(data.explain_sample_rate * 100)}%${data.enabled ? '' : ' · disabled'}</div>
+                    </div>
+                    <div style="overflow-x: auto;">
+                        <table class="data-table">
+                            <thead>
+                                <tr><th>Recorded</th><th>Duration</th><th>Step</th><th>Statement</th><th>Plan</th></tr>
+                            </thead>
+                            <tbody>
+                                ${queries.length > 0 ? queries.map(q => `
+                                    <tr>
+                                        <td class="cell-value">${escapeHtml(q.recorded_at)}</td>
+                                        <td class="cell-value">${q.duration_ms} ms</td>
+                                        <td class="cell-value">${q.step ? escapeHtml(q.step) : '<span class="cell-null">-</span>'}</td>
+                                        <td class="cell-value">
+                                            <pre style="white-space: pre-wrap; max-width: 600px;">${escapeHtml(q.statement)}</pre>
+                                            <div style="font-size: 11px; color: #64748b;">params: ${escapeHtml((q.parameters || []).join(', ') || 'none')}${q.executemany ? ' (executemany)' : ''}</div>
+                                        </td>
+                                        <td class="cell-value">
+                                            ${q.plan ? `<details><summary>${escapeHtml(q.plan_status)}</summary><pre style="white-space: pre-wrap; max-width: 600px;">${escapeHtml(formatPlan(q.plan))}</pre></details>` : `<span class="cell-null">${escapeHtml(q.plan_status)}</span>`}
+                                        </td>
+                                    </tr>
+                                `).join('') : '<tr><td colspan="5" style="text-align: center; padding: 40px; color: #94a3b8;">No slow queries recorded</td></tr>'}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+            `;
+            
+            document.getElementById('contentArea').innerHTML = html;
+        }
+        
         function getAuthToken() {
             return localStorage.getItem('db_studio_token') || '';
         }
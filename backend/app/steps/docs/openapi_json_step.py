@@ -1,6 +1,13 @@
 """OpenAPI JSON specification endpoint step."""
-from app.motia_server import STEPS
+from app.motia_server import STEPS, add_steps_listener
+from app.core.serialization import accepted_encodings
+from app.services.cache.response_cache import compute_etag, etag_matches
+from dataclasses import dataclass
+from typing import Optional
+import gzip
+import hashlib
 import json
+import time
 
 config = {
     "name": "OpenAPIJSON",
@@ -9,6 +16,24 @@ config = {
     "method": "GET"
 }
 
+# Minimum seconds between checks that step configs were not mutated in place
+SPEC_RECHECK_SECONDS = 5.0
+
+
+@dataclass
+class OpenAPISpecCache:
+    """Pre-serialized OpenAPI spec and its gzip variant."""
+    fingerprint: str
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    gzip_etag: str
+    built_at: float
+
+
+_spec_cache: Optional[OpenAPISpecCache] = None
+_last_checked_at = 0.0
+
 def generate_openapi_spec():
     """Generate OpenAPI 3.0 specification from registered steps."""
     paths = {}
@@ -304,12 +329,80 @@ def _convert_schema(schema):
         return result
     return schema
 
+def steps_fingerprint() -> str:
+    """Hash of every registered step config; changes when any config changes."""
+    payload = json.dumps(
+        [[key, info["config"]] for key, info in sorted(STEPS.items())],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def build_spec_cache() -> OpenAPISpecCache:
+    """Generate, serialize and compress the spec once."""
+    global _spec_cache, _last_checked_at
+    body = json.dumps(generate_openapi_spec()).encode()
+    etag = compute_etag(body)
+    _spec_cache = OpenAPISpecCache(
+        fingerprint=steps_fingerprint(),
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=9),
+        etag=etag,
+        gzip_etag=etag[:-1] + '-gzip"',
+        built_at=time.time()
+    )
+    _last_checked_at = time.monotonic()
+    return _spec_cache
+
+
+def get_spec_cache() -> OpenAPISpecCache:
+    """Return the memoized spec, rebuilding it if step configs changed at runtime."""
+    global _last_checked_at
+    if _spec_cache is None:
+        return build_spec_cache()
+
+    now = time.monotonic()
+    if now - _last_checked_at >= SPEC_RECHECK_SECONDS:
+        _last_checked_at = now
+        if steps_fingerprint() != _spec_cache.fingerprint:
+            return build_spec_cache()
+    return _spec_cache
+
+
+def invalidate_spec_cache() -> None:
+    """Drop the memoized spec and rebuild it from the current registry."""
+    global _spec_cache
+    _spec_cache = None
+    if STEPS:
+        build_spec_cache()
+
+
+# Rebuild once the registry is complete (after discover_steps() and reload_steps())
+add_steps_listener("openapi_spec", invalidate_spec_cache)
+
+
 async def handler(req, context):
     """Handle OpenAPI JSON request."""
-    spec = generate_openapi_spec()
-    return {
-        "status": 200,
-        "body": spec
-        # Note: Content-Type is automatically set by web.json_response
+    spec_cache = get_spec_cache()
+    headers = req.get("headers", {})
+    accept_encoding = headers.get("Accept-Encoding") or headers.get("accept-encoding", "")
+    use_gzip = "gzip" in accepted_encodings(accept_encoding)
+    
+    etag = spec_cache.gzip_etag if use_gzip else spec_cache.etag
+    response_headers = {
+        "Content-Type": "application/json",
+        "ETag": etag,
+        "Cache-Control": "public, no-cache",
+        "Vary": "Accept-Encoding"
     }
+    
+    if_none_match = headers.get("If-None-Match") or headers.get("if-none-match")
+    if etag_matches(if_none_match, etag):
+        return {"status": 304, "body": b"", "headers": response_headers}
+    
+    if use_gzip:
+        response_headers["Content-Encoding"] = "gzip"
+        return {"status": 200, "body": spec_cache.gzip_body, "headers": response_headers}
+    return {"status": 200, "body": spec_cache.body, "headers": response_headers}
 
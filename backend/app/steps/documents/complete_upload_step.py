@@ -0,0 +1,112 @@
+"""Complete resumable upload endpoint step."""
+from uuid import UUID
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.models.dossier import Dossier
+from app.services.activity import ActivityLogger
+from app.services.cache import cache_service
+from app.services.events import publish_document_status
+from app.services.resumable_uploads import upload_service
+from sqlalchemy import select
+
+config = {
+    "name": "CompleteUpload",
+    "type": "api",
+    "path": "/api/uploads/{upload_id}/complete",
+    "method": "POST",
+    "responseSchema": {
+        "id": {"type": "string", "format": "uuid"},
+        "filename": {"type": "string"},
+        "original_filename": {"type": "string"},
+        "file_size": {"type": "integer"},
+        "processing_status": {"type": "string"},
+        "uploaded_at": {"type": "string", "format": "date-time"}
+    }
+}
+
+async def handler(req, context):
+    """Handle complete upload request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    path_params = req.get("pathParams", {})
+    upload_id_str = path_params.get("upload_id")
+    
+    if not upload_id_str:
+        return {"status": 400, "body": {"detail": "upload_id is required"}}
+    
+    try:
+        upload_id = UUID(upload_id_str)
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Invalid upload_id format"}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            
+            owner_id = None
+            if current_user.role == UserRole.INSTALLER:
+                owner_id = current_user.id
+            else:
+                current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        
+        try:
+            upload = await upload_service.get(db, upload_id, owner_id)
+            if not upload:
+                return {"status": 404, "body": {"detail": "Upload not found"}}
+            
+            document = await upload_service.complete(db, upload)
+        except ValueError as e:
+            detail = str(e)
+            if "Checksum mismatch" in detail:
+                status = 460
+            elif "incomplete" in detail:
+                status = 409
+            else:
+                status = 404
+            return {"status": status, "body": {"detail": detail}}
+        except Exception as e:
+            context.logger.error(f"Error completing upload: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
+        
+        try:
+            dossier_result = await db.execute(select(Dossier).where(Dossier.id == document.dossier_id))
+            dossier = dossier_result.scalar_one()
+            await cache_service.invalidate_tags([f"dossier:{dossier.id}"])
+            await publish_document_status(document, dossier.assigned_validator_id)
+            
+            logger = ActivityLogger(db)
+            await logger.log(
+                user_id=str(current_user.id),
+                action_type="document.uploaded",
+                entity_type="document",
+                entity_id=str(document.id),
+                description=f"Document {document.original_filename} uploaded to dossier {dossier.reference}",
+                metadata={"resumable": True, "file_size": document.file_size}
+            )
+        except Exception as e:
+            context.logger.warning(f"Post-upload notifications failed for document {document.id}: {e}")
+        
+        return {
+            "status": 201,
+            "body": {
+                "id": str(document.id),
+                "filename": document.filename,
+                "original_filename": document.original_filename,
+                "file_size": document.file_size,
+                "processing_status": document.processing_status.value if hasattr(document.processing_status, "value") else str(document.processing_status),
+                "uploaded_at": document.uploaded_at.isoformat() if document.uploaded_at else None
+            }
+        }
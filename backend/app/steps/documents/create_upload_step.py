@@ -0,0 +1,145 @@
+"""Start resumable document upload endpoint step."""
+from uuid import UUID
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.models.dossier import Dossier
+from app.models.installer import Installer
+from app.services.resumable_uploads import upload_service, serialize_upload
+from sqlalchemy import select
+
+config = {
+    "name": "CreateUpload",
+    "type": "api",
+    "path": "/api/dossiers/{dossier_id}/uploads",
+    "method": "POST",
+    "bodySchema": {
+        "filename": {"type": "string", "required": True},
+        "size": {"type": "integer", "required": True},
+        "content_type": {"type": "string"},
+        "document_type_id": {"type": "string", "format": "uuid"},
+        "checksum": {"type": "string", "description": "Whole-file digest as algorithm:hex, e.g. sha256:9f86d0..."}
+    },
+    "responseSchema": {
+        "id": {"type": "string", "format": "uuid"},
+        "dossier_id": {"type": "string", "format": "uuid"},
+        "filename": {"type": "string"},
+        "size": {"type": "integer"},
+        "offset": {"type": "integer"},
+        "complete": {"type": "boolean"},
+        "min_chunk_size": {"type": "integer"},
+        "max_chunk_size": {"type": "integer"},
+        "checksum_algorithms": {"type": "array", "items": {"type": "string"}},
+        "expires_at": {"type": "string", "format": "date-time"},
+        "upload_url": {"type": "string"}
+    }
+}
+
+async def handler(req, context):
+    """Handle start upload request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    path_params = req.get("pathParams", {})
+    dossier_id_str = path_params.get("dossier_id")
+    body = req.get("body", {})
+    
+    if not dossier_id_str:
+        return {"status": 400, "body": {"detail": "dossier_id is required"}}
+    
+    try:
+        dossier_id = UUID(dossier_id_str)
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Invalid dossier_id format"}}
+    
+    filename = body.get("filename")
+    if not filename:
+        return {"status": 400, "body": {"detail": "filename is required"}}
+    
+    try:
+        size = int(body.get("size"))
+    except (TypeError, ValueError):
+        return {"status": 400, "body": {"detail": "size must be a positive number of bytes"}}
+    
+    document_type_id = None
+    if body.get("document_type_id"):
+        try:
+            document_type_id = UUID(body["document_type_id"])
+        except ValueError:
+            return {"status": 400, "body": {"detail": "Invalid document_type_id format"}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            
+            # Same access rules as single uploads: installers upload to their own dossiers only
+            if current_user.role == UserRole.INSTALLER:
+                installer_result = await db.execute(
+                    select(Installer).where(Installer.user_id == current_user.id)
+                )
+                installer = installer_result.scalar_one_or_none()
+                
+                if not installer:
+                    return {
+                        "status": 403,
+                        "body": {"detail": "Installer record not found for this user"}
+                    }
+                
+                dossier_result = await db.execute(
+                    select(Dossier).where(
+                        Dossier.id == dossier_id,
+                        Dossier.installer_id == installer.id
+                    )
+                )
+                dossier = dossier_result.scalar_one_or_none()
+                
+                if not dossier:
+                    return {
+                        "status": 403,
+                        "body": {"detail": "You can only upload documents to your own dossiers"}
+                    }
+            else:
+                current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+                dossier_result = await db.execute(select(Dossier).where(Dossier.id == dossier_id))
+                dossier = dossier_result.scalar_one_or_none()
+                
+                if not dossier:
+                    return {"status": 404, "body": {"detail": "Dossier not found"}}
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        
+        try:
+            upload = await upload_service.create(
+                db,
+                dossier,
+                current_user.id,
+                filename=filename,
+                size=size,
+                content_type=body.get("content_type") or "application/pdf",
+                document_type_id=document_type_id,
+                checksum=body.get("checksum")
+            )
+        except ValueError as e:
+            return {"status": 413 if "exceeds maximum" in str(e) else 400, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error starting upload: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
+        
+        return {
+            "status": 201,
+            "body": serialize_upload(upload),
+            "headers": {
+                "Location": f"/api/uploads/{upload.id}",
+                "Upload-Offset": "0",
+                "Upload-Length": str(upload.total_size)
+            }
+        }
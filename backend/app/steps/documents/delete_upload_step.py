@@ -0,0 +1,61 @@
+"""Abort resumable upload endpoint step."""
+from uuid import UUID
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.services.resumable_uploads import upload_service
+
+config = {
+    "name": "DeleteUpload",
+    "type": "api",
+    "path": "/api/uploads/{upload_id}",
+    "method": "DELETE"
+}
+
+async def handler(req, context):
+    """Handle abort upload request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    path_params = req.get("pathParams", {})
+    upload_id_str = path_params.get("upload_id")
+    
+    if not upload_id_str:
+        return {"status": 400, "body": {"detail": "upload_id is required"}}
+    
+    try:
+        upload_id = UUID(upload_id_str)
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Invalid upload_id format"}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            
+            owner_id = None
+            if current_user.role == UserRole.INSTALLER:
+                owner_id = current_user.id
+            else:
+                current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+            
+            upload = await upload_service.get(db, upload_id, owner_id)
+            if not upload:
+                return {"status": 404, "body": {"detail": "Upload not found"}}
+            
+            await upload_service.abort(db, upload)
+            
+            return {"status": 204, "body": {}}
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error aborting upload: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
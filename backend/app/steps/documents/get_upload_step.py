@@ -0,0 +1,80 @@
+"""Get resumable upload endpoint step."""
+from uuid import UUID
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.services.resumable_uploads import upload_service, serialize_upload
+
+config = {
+    "name": "GetUpload",
+    "type": "api",
+    "path": "/api/uploads/{upload_id}",
+    "method": "GET",
+    "responseSchema": {
+        "id": {"type": "string", "format": "uuid"},
+        "dossier_id": {"type": "string", "format": "uuid"},
+        "filename": {"type": "string"},
+        "size": {"type": "integer"},
+        "offset": {"type": "integer"},
+        "complete": {"type": "boolean"},
+        "min_chunk_size": {"type": "integer"},
+        "max_chunk_size": {"type": "integer"},
+        "checksum_algorithms": {"type": "array", "items": {"type": "string"}},
+        "expires_at": {"type": "string", "format": "date-time"},
+        "upload_url": {"type": "string"}
+    }
+}
+
+async def handler(req, context):
+    """Handle get upload request (the offset to resume from)."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    path_params = req.get("pathParams", {})
+    upload_id_str = path_params.get("upload_id")
+    
+    if not upload_id_str:
+        return {"status": 400, "body": {"detail": "upload_id is required"}}
+    
+    try:
+        upload_id = UUID(upload_id_str)
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Invalid upload_id format"}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            
+            owner_id = None
+            if current_user.role == UserRole.INSTALLER:
+                owner_id = current_user.id
+            else:
+                current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+            
+            upload = await upload_service.get(db, upload_id, owner_id)
+            if not upload:
+                return {"status": 404, "body": {"detail": "Upload not found"}}
+            
+            return {
+                "status": 200,
+                "body": serialize_upload(upload),
+                "headers": {
+                    "Upload-Offset": str(upload.offset),
+                    "Upload-Length": str(upload.total_size),
+                    "Cache-Control": "no-store"
+                }
+            }
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error getting upload: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
@@ -5,6 +5,8 @@ from app.core.dependencies import get_current_user_from_token, require_role_from
 from app.models.user import UserRole
 from app.models.document import Document, ProcessingStatus
 from app.services.activity import ActivityLogger
+from app.services.cache import cache_service
+from app.services.events import publish_document_status
 from sqlalchemy import select
 
 config = {
@@ -62,6 +64,8 @@ async def handler(req, context):
             
             await db.commit()
             await db.refresh(document)
+            await cache_service.invalidate_tags([f"dossier:{document.dossier_id}"])
+            await publish_document_status(document)
             
             logger = ActivityLogger(db)
             await logger.log(
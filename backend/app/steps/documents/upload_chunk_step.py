@@ -0,0 +1,109 @@
+"""Resumable upload chunk endpoint step."""
+from uuid import UUID
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.services.resumable_uploads import upload_service, parse_chunk_checksum, serialize_upload
+
+CHUNK_CONTENT_TYPES = ("application/offset+octet-stream", "application/octet-stream")
+
+config = {
+    "name": "UploadChunk",
+    "type": "api",
+    "path": "/api/uploads/{upload_id}",
+    "method": "PATCH",
+    # The raw chunk is streamed to disk by the handler
+    "streamBody": True,
+    "bodySchema": {
+        "content": {"type": "string", "format": "binary"}
+    },
+    "responseSchema": {
+        "id": {"type": "string", "format": "uuid"},
+        "size": {"type": "integer"},
+        "offset": {"type": "integer"},
+        "complete": {"type": "boolean"},
+        "expires_at": {"type": "string", "format": "date-time"}
+    }
+}
+
+async def handler(req, context):
+    """Handle upload chunk request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    path_params = req.get("pathParams", {})
+    upload_id_str = path_params.get("upload_id")
+    request = context.request
+    
+    if not upload_id_str:
+        return {"status": 400, "body": {"detail": "upload_id is required"}}
+    
+    try:
+        upload_id = UUID(upload_id_str)
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Invalid upload_id format"}}
+    
+    if request.content_type not in CHUNK_CONTENT_TYPES:
+        return {"status": 415, "body": {"detail": f"Content-Type must be {CHUNK_CONTENT_TYPES[0]}"}}
+    
+    try:
+        offset = int(request.headers.get("Upload-Offset", ""))
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Upload-Offset header is required"}}
+    
+    try:
+        checksum = parse_chunk_checksum(request.headers.get("Upload-Checksum"))
+    except ValueError as e:
+        return {"status": 400, "body": {"detail": str(e)}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            
+            # Installers resume their own uploads; administrators any upload
+            owner_id = None
+            if current_user.role == UserRole.INSTALLER:
+                owner_id = current_user.id
+            else:
+                current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        
+        try:
+            upload = await upload_service.get(db, upload_id, owner_id)
+            if not upload:
+                return {"status": 404, "body": {"detail": "Upload not found"}}
+            
+            upload = await upload_service.receive_chunk(db, upload, offset, request.content, checksum)
+        except ValueError as e:
+            detail = str(e)
+            if "does not match" in detail:
+                status = 409
+            elif "exceeds maximum" in detail:
+                status = 413
+            elif "Checksum mismatch" in detail:
+                # tus "Checksum Mismatch" status
+                status = 460
+            elif "not found" in detail:
+                status = 404
+            else:
+                status = 400
+            return {"status": status, "body": {"detail": detail}}
+        except Exception as e:
+            context.logger.error(f"Error receiving upload chunk: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
+        
+        return {
+            "status": 200,
+            "body": serialize_upload(upload),
+            "headers": {"Upload-Offset": str(upload.offset)}
+        }
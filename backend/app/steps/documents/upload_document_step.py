@@ -10,6 +10,7 @@ from app.models.installer import Installer
 from app.models.document import Document, ProcessingStatus
 from app.services.pdf_storage import PDFStorageService
 from app.services.activity import ActivityLogger
+from app.services.events import publish_document_status
 from sqlalchemy import select
 
 config = {
@@ -17,6 +18,7 @@ config = {
     "type": "api",
     "path": "/api/dossiers/{dossier_id}/documents",
     "method": "POST",
+    "invalidates": ["dossier:{dossier_id}"],
     "bodySchema": {
         "file": {
             "type": "object",
@@ -167,6 +169,7 @@ async def handler(req, context):
             db.add(document)
             await db.commit()
             await db.refresh(document)
+            await publish_document_status(document, dossier.assigned_validator_id)
             
             # Log activity
             logger = ActivityLogger(db)
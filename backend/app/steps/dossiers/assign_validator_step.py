@@ -5,6 +5,7 @@ from app.core.dependencies import get_current_user_from_token, require_role_from
 from app.models.user import User, UserRole
 from app.models.dossier import Dossier, DossierStatus
 from app.services.activity import ActivityLogger
+from app.services.events import publish_dossier_status
 from sqlalchemy import select
 
 config = {
@@ -12,6 +13,7 @@ config = {
     "type": "api",
     "path": "/api/dossiers/{dossier_id}/assign",
     "method": "POST",
+    "invalidates": ["dossier:{dossier_id}"],
     "bodySchema": {
         "validator_id": {"type": "string", "format": "uuid", "required": True}
     },
@@ -72,12 +74,15 @@ async def handler(req, context):
             if not validator:
                 return {"status": 404, "body": {"detail": "Validator not found"}}
             
+            previous_status = dossier.status
+            previous_validator_id = dossier.assigned_validator_id
             dossier.assigned_validator_id = validator_id
             if dossier.status == DossierStatus.SUBMITTED:
                 dossier.status = DossierStatus.AWAITING_REVIEW
             
             await db.commit()
             await db.refresh(dossier)
+            await publish_dossier_status(dossier, previous_status, previous_validator_id)
             
             logger = ActivityLogger(db)
             await logger.log(
@@ -0,0 +1,112 @@
+"""Bulk dossier operations endpoint step."""
+from uuid import UUID
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import User, UserRole
+from app.services.bulk_dossiers import BULK_ACTIONS, BulkDossierService
+from app.services.cache import cache_service
+from app.services.events import publish_dossier_status, publish_document_status
+from sqlalchemy import select
+
+config = {
+    "name": "BulkDossiers",
+    "type": "api",
+    "path": "/api/dossiers/bulk",
+    "method": "POST",
+    "bodySchema": {
+        "action": {"type": "string", "required": True, "enum": list(BULK_ACTIONS)},
+        "dossier_ids": {"type": "array", "required": True, "items": {"type": "string", "format": "uuid"}},
+        "validator_id": {"type": "string", "format": "uuid"},
+        "reason": {"type": "string"}
+    },
+    "responseSchema": {
+        "action": {"type": "string"},
+        "requested": {"type": "integer"},
+        "succeeded": {"type": "integer"},
+        "results": {
+            "type": "array",
+            "items": {"type": "object"}
+        }
+    }
+}
+
+async def handler(req, context):
+    """Handle bulk dossier operation request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    body = req.get("body", {})
+    action = body.get("action")
+    dossier_ids_raw = body.get("dossier_ids")
+    
+    if action not in BULK_ACTIONS:
+        return {"status": 400, "body": {"detail": f"action must be one of: {', '.join(BULK_ACTIONS)}"}}
+    if not isinstance(dossier_ids_raw, list) or not dossier_ids_raw:
+        return {"status": 400, "body": {"detail": "dossier_ids must be a non-empty list"}}
+    if len(dossier_ids_raw) > settings.BULK_MAX_DOSSIERS:
+        return {"status": 400, "body": {"detail": f"At most {settings.BULK_MAX_DOSSIERS} dossiers per request"}}
+    
+    try:
+        dossier_ids = [UUID(str(value)) for value in dossier_ids_raw]
+        validator_id = UUID(body["validator_id"]) if body.get("validator_id") else None
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Invalid UUID format"}}
+    
+    if action == "assign" and validator_id is None:
+        return {"status": 400, "body": {"detail": "validator_id is required"}}
+    if action == "reject" and not body.get("reason"):
+        return {"status": 400, "body": {"detail": "reason is required"}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            current_user = await require_role_from_user(current_user, BULK_ACTIONS[action])
+            
+            if action == "assign":
+                validator_result = await db.execute(
+                    select(User.id).where(User.id == validator_id).where(User.role == UserRole.VALIDATOR)
+                )
+                if validator_result.scalar_one_or_none() is None:
+                    return {"status": 404, "body": {"detail": "Validator not found"}}
+            
+            service = BulkDossierService(db)
+            outcome = await service.apply(
+                action,
+                dossier_ids,
+                current_user,
+                validator_id=validator_id,
+                reason=body.get("reason")
+            )
+            
+            touched = {row.id for row in outcome.dossiers} | {document.dossier_id for document in outcome.documents}
+            await cache_service.invalidate_tags([f"dossier:{dossier_id}" for dossier_id in touched])
+            for row in outcome.dossiers:
+                previous = outcome.previous[row.id]
+                await publish_dossier_status(row, previous.status, previous.assigned_validator_id)
+            for document in outcome.documents:
+                await publish_document_status(document, outcome.previous[document.dossier_id].assigned_validator_id)
+            
+            return {
+                "status": 200,
+                "body": {
+                    "action": action,
+                    "requested": len(outcome.results),
+                    "succeeded": outcome.succeeded,
+                    "results": outcome.results
+                }
+            }
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error running bulk dossier {action}: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
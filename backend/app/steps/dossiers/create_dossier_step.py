@@ -1,5 +1,4 @@
 """Create dossier endpoint step."""
-from datetime import datetime
 from uuid import UUID
 from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token, require_role_from_user
@@ -9,7 +8,8 @@ from app.models.installer import Installer
 from app.models.process import Process
 from app.schemas.dossier import DossierCreate
 from app.services.activity import ActivityLogger
-from sqlalchemy import select, func
+from app.services.reference_numbers import DOSSIER_PREFIX, next_reference
+from sqlalchemy import select
 
 config = {
     "name": "CreateDossier",
@@ -113,10 +113,8 @@ async def handler(req, context):
                         "body": {"detail": "You can only create dossiers for your own installer account"}
                     }
             
-            # Generate reference
-            count_result = await db.execute(select(func.count(Dossier.id)))
-            count = count_result.scalar() or 0
-            reference = f"DOS-{datetime.now().year}-{count + 1:06d}"
+            # Allocate reference (counter row stays locked until commit)
+            reference = await next_reference(db, DOSSIER_PREFIX)
             
             # Create dossier
             dossier = Dossier(
@@ -5,6 +5,7 @@ from app.core.dependencies import get_current_user_from_token, require_role_from
 from app.models.user import UserRole
 from app.models.dossier import Dossier
 from app.services.activity import ActivityLogger
+from app.services.search import autocomplete_index
 from sqlalchemy import select
 
 config = {
@@ -12,6 +13,7 @@ config = {
     "type": "api",
     "path": "/api/dossiers/{dossier_id}",
     "method": "DELETE",
+    "invalidates": ["dossier:{dossier_id}"],
     "responseSchema": {}
 }
 
@@ -53,8 +55,8 @@ async def handler(req, context):
             
             reference = dossier.reference
             await db.delete(dossier)
-            await db.commit()
             
+            # Deletions are recorded in the same transaction
             logger = ActivityLogger(db)
             await logger.log(
                 user_id=str(current_user.id),
@@ -62,8 +64,11 @@ async def handler(req, context):
                 entity_type="dossier",
                 entity_id=str(dossier_id),
                 entity_reference=reference,
-                description=f"Dossier {reference} deleted"
+                description=f"Dossier {reference} deleted",
+                durable=True
             )
+            await db.commit()
+            autocomplete_index.remove("dossier", dossier_id)
             
             return {"status": 204, "body": {}}
         except ValueError as e:
@@ -3,6 +3,7 @@ from uuid import UUID
 from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token
 from app.models.dossier import Dossier
+from app.services.review_snapshot import get_snapshot, serialize_dossier
 
 config = {
     "name": "GetDossier",
@@ -14,6 +15,7 @@ config = {
         "reference": {"type": "string"},
         "process_id": {"type": "string", "format": "uuid"},
         "installer_id": {"type": "string", "format": "uuid"},
+        "assigned_validator_id": {"type": "string", "format": "uuid"},
         "status": {"type": "string"},
         "priority": {"type": "string"},
         "beneficiary_name": {"type": "string"},
@@ -66,6 +68,14 @@ async def handler(req, context):
             # Authenticate user
             current_user = await get_current_user_from_token(token, db)
             
+            # Served from the review snapshot while it is current
+            snapshot = await get_snapshot(db, dossier_id, rebuild=False)
+            if snapshot is not None:
+                return {
+                    "status": 200,
+                    "body": snapshot[1]["dossier"]
+                }
+            
             # Get dossier
             from sqlalchemy import select
             result = await db.execute(
@@ -81,23 +91,7 @@ async def handler(req, context):
             
             return {
                 "status": 200,
-                "body": {
-                    "id": str(dossier.id),
-                    "reference": dossier.reference,
-                    "process_id": str(dossier.process_id),
-                    "installer_id": str(dossier.installer_id),
-                    "status": dossier.status.value if hasattr(dossier.status, "value") else str(dossier.status),
-                    "priority": dossier.priority.value if hasattr(dossier.priority, "value") else str(dossier.priority),
-                    "beneficiary_name": dossier.beneficiary_name,
-                    "beneficiary_address": dossier.beneficiary_address,
-                    "beneficiary_city": dossier.beneficiary_city,
-                    "beneficiary_postal_code": dossier.beneficiary_postal_code,
-                    "beneficiary_email": dossier.beneficiary_email,
-                    "beneficiary_phone": dossier.beneficiary_phone,
-                    "precarity_status": dossier.precarity_status,
-                    "created_at": dossier.created_at.isoformat() if dossier.created_at else None,
-                    "updated_at": dossier.updated_at.isoformat() if dossier.updated_at else None
-                }
+                "body": serialize_dossier(dossier)
             }
         except ValueError as e:
             return {
@@ -132,14 +132,14 @@ async def handler(req, context):
                 "body": {
                     "dossiers": [
                         {
-                            "id": str(d.id),
+                            "id": d.id,
                             "reference": d.reference,
-                            "process_id": str(d.process_id),
-                            "installer_id": str(d.installer_id),
-                            "status": d.status.value if hasattr(d.status, "value") else str(d.status),
-                            "priority": d.priority.value if hasattr(d.priority, "value") else str(d.priority),
+                            "process_id": d.process_id,
+                            "installer_id": d.installer_id,
+                            "status": d.status,
+                            "priority": d.priority,
                             "beneficiary_name": d.beneficiary_name,
-                            "created_at": d.created_at.isoformat() if d.created_at else None
+                            "created_at": d.created_at
                         }
                         for d in dossiers
                     ],
@@ -6,6 +6,7 @@ from app.models.user import UserRole
 from app.models.dossier import Dossier
 from app.schemas.dossier import DossierUpdate
 from app.services.activity import ActivityLogger
+from app.services.events import publish_dossier_status
 from sqlalchemy import select
 
 config = {
@@ -13,6 +14,7 @@ config = {
     "type": "api",
     "path": "/api/dossiers/{dossier_id}",
     "method": "PATCH",
+    "invalidates": ["dossier:{dossier_id}"],
     "bodySchema": {
         "process_id": {"type": "string", "format": "uuid"},
         "installer_id": {"type": "string", "format": "uuid"},
@@ -76,6 +78,7 @@ async def handler(req, context):
             if not dossier:
                 return {"status": 404, "body": {"detail": "Dossier not found"}}
             
+            previous_status = dossier.status
             dossier_data = DossierUpdate(**body)
             update_data = dossier_data.model_dump(exclude_unset=True)
             
@@ -96,6 +99,8 @@ async def handler(req, context):
             
             await db.commit()
             await db.refresh(dossier)
+            if dossier.status != previous_status:
+                await publish_dossier_status(dossier, previous_status)
             
             logger = ActivityLogger(db)
             await logger.log(
@@ -0,0 +1,119 @@
+"""Server-sent events stream of dossier and document status changes."""
+from uuid import UUID
+from aiohttp import web
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.models.dossier import Dossier
+from app.models.installer import Installer
+from app.services.events import event_bus, dossier_channel, validator_channel
+from sqlalchemy import select
+
+config = {
+    "name": "StreamEvents",
+    "type": "api",
+    "path": "/api/events",
+    "method": "GET"
+}
+
+async def handler(req, context):
+    """Stream status events for ``dossier_id`` and/or ``validator_id``.
+    
+    Sends ``dossier.status``, ``document.status`` and ``validation.result``
+    events. Browsers' EventSource cannot set headers, so the token may also
+    be passed as ``access_token``; ``Last-Event-ID`` (or ``last_event_id``)
+    resumes after a reconnect.
+    """
+    headers = req.get("headers", {})
+    query = req.get("query", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if auth_header.startswith("Bearer "):
+        token = auth_header.replace("Bearer ", "")
+    elif query.get("access_token"):
+        token = query["access_token"]
+    else:
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    if not settings.EVENTS_ENABLED:
+        return {"status": 404, "body": {"detail": "Not found"}}
+    
+    dossier_id_str = query.get("dossier_id")
+    validator_id_str = query.get("validator_id")
+    if not dossier_id_str and not validator_id_str:
+        return {"status": 400, "body": {"detail": "dossier_id or validator_id is required"}}
+    
+    try:
+        dossier_id = UUID(dossier_id_str) if dossier_id_str else None
+        validator_id = UUID(validator_id_str) if validator_id_str else None
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Invalid UUID format"}}
+    
+    last_event_id_str = headers.get("last-event-id") or headers.get("Last-Event-ID") or query.get("last_event_id")
+    try:
+        last_event_id = int(last_event_id_str) if last_event_id_str else None
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Invalid last event id"}}
+    
+    # Authorize, then release the database session before streaming
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            
+            channels = []
+            if validator_id:
+                current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR, UserRole.VALIDATOR])
+                if current_user.role == UserRole.VALIDATOR and validator_id != current_user.id:
+                    return {"status": 403, "body": {"detail": "Validators can only follow their own queue"}}
+                channels.append(validator_channel(validator_id))
+            
+            if dossier_id:
+                dossier_query = select(Dossier.id).where(Dossier.id == dossier_id)
+                if current_user.role == UserRole.INSTALLER:
+                    dossier_query = dossier_query.join(Installer, Installer.id == Dossier.installer_id).where(
+                        Installer.user_id == current_user.id
+                    )
+                dossier_result = await db.execute(dossier_query)
+                if dossier_result.scalar_one_or_none() is None:
+                    return {"status": 404, "body": {"detail": "Dossier not found"}}
+                channels.append(dossier_channel(dossier_id))
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error opening event stream: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
+    
+    response = web.StreamResponse(
+        status=200,
+        headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Credentials": "true"
+        }
+    )
+    await response.prepare(context.request)
+    
+    with event_bus.subscribe(channels, last_event_id) as subscription:
+        try:
+            await response.write(b"retry: 3000\n\n")
+            while not subscription.closed:
+                events = await subscription.next(timeout=settings.EVENTS_HEARTBEAT_SECONDS)
+                if subscription.overflowed:
+                    # Too far behind: disconnect, the client resumes from its last event id
+                    break
+                if not events:
+                    await response.write(b": heartbeat\n\n")
+                    continue
+                await response.write(b"".join(event.frame for event in events))
+        except ConnectionResetError:
+            pass
+    
+    return response
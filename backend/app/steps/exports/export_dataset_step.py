@@ -0,0 +1,64 @@
+"""Streaming export endpoint step."""
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.services.export import DATASETS, export_chunks, export_filename, get_writer, stream_response
+
+config = {
+    "name": "ExportDataset",
+    "type": "api",
+    "path": "/api/exports/{dataset}",
+    "method": "GET"
+}
+
+async def handler(req, context):
+    """Stream ``feedback``, ``invoices``, ``dossiers`` or ``activity_logs`` rows.
+    
+    ``format`` is csv (default), jsonl, json or parquet; the other query
+    parameters are the dataset's filters (``date_from``/``date_to`` for all).
+    Rows are read with a server-side cursor and written as they are encoded.
+    """
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    path_params = req.get("pathParams", {})
+    query_params = req.get("query", {})
+    
+    dataset = DATASETS.get(path_params.get("dataset"))
+    if dataset is None:
+        return {"status": 404, "body": {"detail": f"Unknown dataset. Available: {', '.join(DATASETS)}"}}
+    
+    try:
+        writer = get_writer(query_params.get("format", "csv"), dataset.columns)
+        query = dataset.build_query(query_params)
+    except RuntimeError as e:
+        return {"status": 501, "body": {"detail": str(e)}}
+    except ValueError as e:
+        return {"status": 400, "body": {"detail": str(e)}}
+    
+    # The session stays open while the rows are streamed
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error exporting {dataset.name}: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
+        
+        return await stream_response(
+            context.request,
+            export_chunks(db, query, writer),
+            writer.content_type,
+            filename=export_filename(dataset, writer)
+        )
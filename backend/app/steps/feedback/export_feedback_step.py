@@ -1,11 +1,8 @@
 """Export feedback endpoint step."""
-import json
-from datetime import datetime
 from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token, require_role_from_user
 from app.models.user import UserRole
-from app.models.feedback import HumanFeedback
-from sqlalchemy import select
+from app.services.export import DATASETS, export_chunks, export_filename, get_writer, stream_response
 
 config = {
     "name": "ExportFeedback",
@@ -13,7 +10,7 @@ config = {
     "path": "/api/feedback/export",
     "method": "POST",
     "bodySchema": {
-        "format": {"type": "string", "enum": ["json", "csv"]},
+        "format": {"type": "string", "enum": ["json", "csv", "jsonl", "parquet"]},
         "used_for_training_only": {"type": "boolean"}
     },
     "responseSchema": {
@@ -22,10 +19,7 @@ config = {
             "items": {"type": "object"}
         },
         "total": {"type": "integer"},
-        "exported_at": {"type": "string", "format": "date-time"},
-        "file_content": {"type": "string", "format": "binary"},
-        "content_type": {"type": "string"},
-        "filename": {"type": "string"}
+        "exported_at": {"type": "string", "format": "date-time"}
     }
 }
 
@@ -45,78 +39,32 @@ async def handler(req, context):
     body = req.get("body", {})
     
     export_format = body.get("format", "json")
-    used_for_training_only = body.get("used_for_training_only", False)
+    dataset = DATASETS["feedback"]
     
+    try:
+        writer = get_writer(export_format, dataset.columns)
+        query = dataset.build_query({"used_for_training_only": body.get("used_for_training_only", False)})
+    except RuntimeError as e:
+        return {"status": 501, "body": {"detail": str(e)}}
+    except ValueError as e:
+        return {"status": 400, "body": {"detail": str(e)}}
+    
+    # The session stays open while the rows are streamed
     session_maker = get_session_maker()
     async with session_maker() as db:
         try:
             current_user = await get_current_user_from_token(token, db)
-            require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
-            
-            # Build query
-            query = select(HumanFeedback)
-            if used_for_training_only:
-                query = query.where(HumanFeedback.used_for_training == True)
-            
-            result = await db.execute(query.order_by(HumanFeedback.created_at.desc()))
-            feedbacks = result.scalars().all()
-            
-            # Format data
-            export_data = []
-            for feedback in feedbacks:
-                export_data.append({
-                    "id": str(feedback.id),
-                    "dossier_id": str(feedback.dossier_id) if feedback.dossier_id else None,
-                    "document_id": str(feedback.document_id) if feedback.document_id else None,
-                    "extracted_field_id": str(feedback.extracted_field_id) if feedback.extracted_field_id else None,
-                    "feedback_type": feedback.feedback_type,
-                    "original_value": feedback.original_value,
-                    "corrected_value": feedback.corrected_value,
-                    "field_name": feedback.field_name,
-                    "document_type": feedback.document_type,
-                    "context_data": feedback.context_data,
-                    "model_used": feedback.model_used,
-                    "model_version": feedback.model_version,
-                    "confidence_before": float(feedback.confidence_before) if feedback.confidence_before else None,
-                    "validator_id": str(feedback.validator_id),
-                    "notes": feedback.notes,
-                    "used_for_training": feedback.used_for_training,
-                    "created_at": feedback.created_at.isoformat() if feedback.created_at else None
-                })
-            
-            if export_format == "csv":
-                import csv
-                import io
-                
-                if not export_data:
-                    csv_content = "No data to export\n"
-                else:
-                    output = io.StringIO()
-                    writer = csv.DictWriter(output, fieldnames=export_data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(export_data)
-                    csv_content = output.getvalue()
-                
-                return {
-                    "status": 200,
-                    "body": {
-                        "file_content": csv_content.encode("utf-8"),
-                        "content_type": "text/csv",
-                        "filename": f"feedback_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                    }
-                }
-            else:
-                return {
-                    "status": 200,
-                    "body": {
-                        "data": export_data,
-                        "total": len(export_data),
-                        "exported_at": datetime.utcnow().isoformat()
-                    }
-                }
+            await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
         except ValueError as e:
-            return {"status": 401, "body": {"detail": str(e)}}
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
         except Exception as e:
             context.logger.error(f"Error exporting feedback: {e}", exc_info=True)
             return {"status": 500, "body": {"detail": "Internal server error"}}
-
+        
+        # JSON keeps the {"data", "total", "exported_at"} document; CSV is an attachment
+        return await stream_response(
+            context.request,
+            export_chunks(db, query, writer),
+            writer.content_type,
+            filename=export_filename(dataset, writer) if export_format == "csv" else None
+        )
@@ -0,0 +1,116 @@
+"""Bulk ingestion endpoint step."""
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.installer import Installer
+from app.models.user import UserRole
+from app.services.ingestion import (
+    MAX_REPORTED_ERRORS,
+    ingestion_service,
+    receive_upload,
+    serialize_job,
+    validate_manifest,
+)
+from sqlalchemy import select
+
+config = {
+    "name": "CreateIngestionJob",
+    "type": "api",
+    "path": "/api/ingestion/jobs",
+    "method": "POST",
+    # The multipart body is streamed to disk by the handler
+    "streamBody": True,
+    "bodySchema": {
+        "archive": {
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "content": {"type": "string", "format": "binary"}
+            }
+        },
+        "manifest": {"type": "string"},
+        "files": {"type": "array", "items": {"type": "string", "format": "binary"}}
+    },
+    "responseSchema": {
+        "id": {"type": "string", "format": "uuid"},
+        "status": {"type": "string"},
+        "total_dossiers": {"type": "integer"},
+        "total_documents": {"type": "integer"},
+        "status_url": {"type": "string"}
+    }
+}
+
+async def handler(req, context):
+    """Handle bulk ingestion request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    
+    session_maker = get_session_maker()
+    # Short session for authentication: no connection is held while the body streams in
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            
+            # Installers ingest for their own installer account; administrators name it in the manifest
+            installer_id = None
+            if current_user.role == UserRole.INSTALLER:
+                installer_result = await db.execute(
+                    select(Installer).where(Installer.user_id == current_user.id)
+                )
+                installer = installer_result.scalar_one_or_none()
+                if not installer:
+                    return {"status": 403, "body": {"detail": "Installer record not found for this user"}}
+                installer_id = installer.id
+            else:
+                current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        user_id = current_user.id
+        await db.commit()
+    
+    try:
+        batch = await receive_upload(context.request)
+    except ValueError as e:
+        return {"status": 413 if "exceeds maximum" in str(e) else 400, "body": {"detail": str(e)}}
+    
+    async with session_maker() as db:
+        try:
+            errors = await validate_manifest(db, batch, installer_id)
+            if errors:
+                batch.close()
+                return {
+                    "status": 422,
+                    "body": {
+                        "detail": "Invalid manifest",
+                        "errors": errors[:MAX_REPORTED_ERRORS],
+                        "error_count": len(errors)
+                    }
+                }
+            
+            job = await ingestion_service.create_job(db, batch, user_id)
+        except Exception as e:
+            batch.close()
+            context.logger.error(f"Error creating ingestion job: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
+    
+    # Runs in the background; the batch is deleted when it ends
+    ingestion_service.start(job.id, batch, user_id)
+    context.logger.info(
+        f"Ingestion job {job.id} queued: {job.total_dossiers} dossiers, {job.total_documents} documents"
+    )
+    
+    return {
+        "status": 202,
+        "body": {
+            **serialize_job(job, include_results=False),
+            "status_url": f"/api/ingestion/jobs/{job.id}"
+        }
+    }
@@ -0,0 +1,94 @@
+"""Get bulk ingestion job endpoint step."""
+from uuid import UUID
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.ingestion_job import IngestionJob
+from app.models.installer import Installer
+from app.models.user import UserRole
+from app.services.ingestion import serialize_job
+from sqlalchemy import select
+
+config = {
+    "name": "GetIngestionJob",
+    "type": "api",
+    "path": "/api/ingestion/jobs/{job_id}",
+    "method": "GET",
+    "responseSchema": {
+        "id": {"type": "string", "format": "uuid"},
+        "status": {"type": "string"},
+        "total_dossiers": {"type": "integer"},
+        "total_documents": {"type": "integer"},
+        "processed_dossiers": {"type": "integer"},
+        "processed_documents": {"type": "integer"},
+        "progress": {"type": "number"},
+        "dossiers_per_minute": {"type": "number"},
+        "error": {"type": "string"},
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer"},
+                    "external_id": {"type": "string"},
+                    "dossier_id": {"type": "string", "format": "uuid"},
+                    "reference": {"type": "string"},
+                    "documents": {"type": "integer"}
+                }
+            }
+        }
+    }
+}
+
+async def handler(req, context):
+    """Handle get ingestion job request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    path_params = req.get("pathParams", {})
+    job_id_str = path_params.get("job_id")
+    
+    if not job_id_str:
+        return {"status": 400, "body": {"detail": "job_id is required"}}
+    
+    try:
+        job_id = UUID(job_id_str)
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Invalid job_id format"}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            
+            query = select(IngestionJob).where(IngestionJob.id == job_id)
+            # Installers only see the jobs of their own installer account
+            if current_user.role == UserRole.INSTALLER:
+                query = query.join(Installer, Installer.id == IngestionJob.installer_id).where(
+                    Installer.user_id == current_user.id
+                )
+            else:
+                current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+            
+            result = await db.execute(query)
+            job = result.scalar_one_or_none()
+            
+            if not job:
+                return {"status": 404, "body": {"detail": "Ingestion job not found"}}
+            
+            return {
+                "status": 200,
+                "body": serialize_job(job)
+            }
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error getting ingestion job: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
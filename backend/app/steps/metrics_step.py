@@ -0,0 +1,21 @@
+"""Prometheus metrics endpoint step."""
+from app.core.config import settings
+from app.core.metrics import registry
+
+config = {
+    "name": "Metrics",
+    "type": "api",
+    "path": "/metrics",
+    "method": "GET"
+}
+
+async def handler(req, context):
+    """Handle metrics scrape request."""
+    if not settings.METRICS_ENABLED:
+        return {"status": 404, "body": {"detail": "Not found"}}
+    
+    return {
+        "status": 200,
+        "body": registry.render().encode(),
+        "headers": {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+    }
@@ -4,6 +4,7 @@ from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token, require_role_from_user
 from app.models.user import UserRole
 from app.models.process import Process
+from app.services.cache import cache_service, CacheNamespace
 from sqlalchemy import select
 
 config = {
@@ -87,6 +88,7 @@ async def handler(req, context):
             clone = Process(**clone_data)
             db.add(clone)
             await db.commit()
+            await cache_service.invalidate(CacheNamespace.PROCESSES)
             await db.refresh(clone)
             
             return {
@@ -4,6 +4,7 @@ from app.core.dependencies import get_current_user_from_token, require_role_from
 from app.models.user import UserRole
 from app.models.process import Process
 from app.schemas.process import ProcessCreate
+from app.services.cache import cache_service, CacheNamespace
 from sqlalchemy import select
 
 config = {
@@ -67,6 +68,7 @@ async def handler(req, context):
             process = Process(**process_data.model_dump())
             db.add(process)
             await db.commit()
+            await cache_service.invalidate(CacheNamespace.PROCESSES)
             await db.refresh(process)
             
             return {
@@ -1,14 +1,18 @@
 """List processes endpoint step."""
 from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token
-from app.models.process import Process
-from sqlalchemy import select
+from app.services.cache.reference_data import list_processes
 
 config = {
     "name": "ListProcesses",
     "type": "api",
     "path": "/api/processes",
     "method": "GET",
+    "cache": {
+        "ttl": 300,
+        "scope": "user",
+        "tags": ["processes"]
+    },
     "responseSchema": {
         "type": "array",
         "items": {
@@ -47,30 +51,15 @@ async def handler(req, context):
         try:
             current_user = await get_current_user_from_token(token, db)
             
-            query_obj = select(Process)
-            
-            if is_active is not None:
-                query_obj = query_obj.where(Process.is_active == (is_active.lower() == "true"))
-            if category:
-                query_obj = query_obj.where(Process.category == category)
-            
-            query_obj = query_obj.order_by(Process.code)
-            result = await db.execute(query_obj)
-            processes = result.scalars().all()
+            processes = await list_processes(
+                db,
+                is_active=(is_active.lower() == "true") if is_active is not None else None,
+                category=category
+            )
             
             return {
                 "status": 200,
-                "body": [
-                    {
-                        "id": str(p.id),
-                        "code": p.code,
-                        "name": p.name,
-                        "category": p.category,
-                        "is_active": p.is_active,
-                        "created_at": p.created_at.isoformat() if p.created_at else None
-                    }
-                    for p in processes
-                ]
+                "body": processes
             }
         except ValueError as e:
             return {"status": 401, "body": {"detail": str(e)}}
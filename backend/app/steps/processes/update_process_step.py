@@ -5,6 +5,7 @@ from app.core.dependencies import get_current_user_from_token, require_role_from
 from app.models.user import UserRole
 from app.models.process import Process
 from app.schemas.process import ProcessUpdate
+from app.services.cache import cache_service, CacheNamespace
 from sqlalchemy import select
 
 config = {
@@ -79,6 +80,7 @@ async def handler(req, context):
                 setattr(process, field, value)
             
             await db.commit()
+            await cache_service.invalidate(CacheNamespace.PROCESSES)
             await db.refresh(process)
             
             return {
@@ -0,0 +1,84 @@
+"""Claim next dossier from the review queue endpoint step."""
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.dossier import DossierStatus
+from app.models.user import UserRole
+from app.services.activity import ActivityLogger
+from app.services.cache import cache_service
+from app.services.events import publish_dossier_status
+from app.services.work_queue import AT_CAPACITY, EMPTY, work_queue
+
+config = {
+    "name": "ClaimNextDossier",
+    "type": "api",
+    "path": "/api/queue/next",
+    "method": "POST",
+    "responseSchema": {
+        "dossier": {"type": "object"},
+        "reason": {"type": "string"}
+    }
+}
+
+def serialize_claim(dossier) -> dict:
+    return {
+        "id": str(dossier.id),
+        "reference": dossier.reference,
+        "status": dossier.status.value,
+        "priority": dossier.priority.value,
+        "submitted_at": dossier.submitted_at.isoformat() if dossier.submitted_at else None,
+        "claimed_at": dossier.claimed_at.isoformat() if dossier.claimed_at else None,
+        "lease_expires_at": dossier.lease_expires_at.isoformat() if dossier.lease_expires_at else None
+    }
+
+async def handler(req, context):
+    """Handle claim next dossier request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            current_user = await require_role_from_user(current_user, [UserRole.VALIDATOR])
+            
+            outcome, dossier = await work_queue.claim_next(db, current_user.id)
+            if outcome == AT_CAPACITY:
+                await db.rollback()
+                return {
+                    "status": 409,
+                    "body": {"detail": "You already hold the maximum number of dossiers in review"}
+                }
+            if outcome == EMPTY:
+                await db.rollback()
+                return {"status": 200, "body": {"dossier": None, "reason": "queue_empty"}}
+            
+            await db.commit()
+            # The claimed dossier is not in the path, so its cache tag is invalidated here
+            await cache_service.invalidate_tags([f"dossier:{dossier.id}"])
+            await publish_dossier_status(dossier, DossierStatus.AWAITING_REVIEW)
+            
+            logger = ActivityLogger(db)
+            await logger.log(
+                user_id=str(current_user.id),
+                action_type="dossier.claimed",
+                entity_type="dossier",
+                entity_id=str(dossier.id),
+                entity_reference=dossier.reference,
+                description=f"Dossier {dossier.reference} claimed from the review queue"
+            )
+            
+            return {"status": 200, "body": {"dossier": serialize_claim(dossier), "reason": None}}
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error claiming next dossier: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
@@ -0,0 +1,51 @@
+"""Review queue statistics endpoint step."""
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.services.work_queue import work_queue
+
+config = {
+    "name": "GetReviewQueueStats",
+    "type": "api",
+    "path": "/api/queue/stats",
+    "method": "GET",
+    "responseSchema": {
+        "depth": {"type": "integer"},
+        "by_priority": {"type": "object"},
+        "in_review": {"type": "integer"},
+        "expired_leases": {"type": "integer"},
+        "validators": {"type": "array", "items": {"type": "object"}}
+    }
+}
+
+async def handler(req, context):
+    """Handle review queue statistics request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            current_user = await require_role_from_user(
+                current_user, [UserRole.ADMINISTRATOR, UserRole.VALIDATOR]
+            )
+            
+            return {
+                "status": 200,
+                "body": await work_queue.stats(db)
+            }
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error getting review queue stats: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
@@ -0,0 +1,74 @@
+"""Release dossier back to the review queue endpoint step."""
+from uuid import UUID
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.dossier import DossierStatus
+from app.models.user import UserRole
+from app.services.activity import ActivityLogger
+from app.services.events import publish_dossier_status
+from app.services.work_queue import work_queue
+
+config = {
+    "name": "ReleaseReviewDossier",
+    "type": "api",
+    "path": "/api/queue/dossiers/{dossier_id}/release",
+    "method": "POST",
+    "invalidates": ["dossier:{dossier_id}"],
+    "responseSchema": {
+        "id": {"type": "string", "format": "uuid"},
+        "status": {"type": "string"}
+    }
+}
+
+async def handler(req, context):
+    """Handle release dossier request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    dossier_id_str = req.get("pathParams", {}).get("dossier_id")
+    
+    try:
+        dossier_id = UUID(dossier_id_str)
+    except (TypeError, ValueError):
+        return {"status": 400, "body": {"detail": "Invalid dossier_id format"}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            current_user = await require_role_from_user(current_user, [UserRole.VALIDATOR])
+            
+            dossier = await work_queue.release(db, dossier_id, current_user.id)
+            if dossier is None:
+                await db.rollback()
+                return {"status": 409, "body": {"detail": "You do not hold this dossier"}}
+            await db.commit()
+            await publish_dossier_status(dossier, DossierStatus.IN_REVIEW, current_user.id)
+            
+            logger = ActivityLogger(db)
+            await logger.log(
+                user_id=str(current_user.id),
+                action_type="dossier.released",
+                entity_type="dossier",
+                entity_id=str(dossier.id),
+                entity_reference=dossier.reference,
+                description=f"Dossier {dossier.reference} returned to the review queue"
+            )
+            
+            return {
+                "status": 200,
+                "body": {"id": str(dossier.id), "status": dossier.status.value}
+            }
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error releasing dossier: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
@@ -0,0 +1,62 @@
+"""Renew review lease endpoint step."""
+from uuid import UUID
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.services.work_queue import work_queue
+
+config = {
+    "name": "RenewReviewLease",
+    "type": "api",
+    "path": "/api/queue/dossiers/{dossier_id}/lease",
+    "method": "POST",
+    "responseSchema": {
+        "id": {"type": "string", "format": "uuid"},
+        "lease_expires_at": {"type": "string", "format": "date-time"}
+    }
+}
+
+async def handler(req, context):
+    """Handle renew review lease request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    dossier_id_str = req.get("pathParams", {}).get("dossier_id")
+    
+    try:
+        dossier_id = UUID(dossier_id_str)
+    except (TypeError, ValueError):
+        return {"status": 400, "body": {"detail": "Invalid dossier_id format"}}
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            current_user = await require_role_from_user(current_user, [UserRole.VALIDATOR])
+            
+            dossier = await work_queue.renew(db, dossier_id, current_user.id)
+            if dossier is None:
+                await db.rollback()
+                return {"status": 409, "body": {"detail": "You no longer hold this dossier"}}
+            await db.commit()
+            
+            return {
+                "status": 200,
+                "body": {
+                    "id": str(dossier.id),
+                    "lease_expires_at": dossier.lease_expires_at.isoformat()
+                }
+            }
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error renewing review lease: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
@@ -3,6 +3,7 @@ from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token, require_role_from_user
 from app.models.user import UserRole
 from app.models.validation_rule import ValidationRule
+from app.services.cache import cache_service, CacheNamespace
 from sqlalchemy import select
 
 config = {
@@ -65,6 +66,7 @@ async def handler(req, context):
             rule = ValidationRule(**body, created_by=current_user.id)
             db.add(rule)
             await db.commit()
+            await cache_service.invalidate(CacheNamespace.VALIDATION_RULES)
             await db.refresh(rule)
             
             return {
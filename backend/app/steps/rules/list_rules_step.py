@@ -11,6 +11,11 @@ config = {
     "type": "api",
     "path": "/api/rules",
     "method": "GET",
+    "cache": {
+        "ttl": 300,
+        "scope": "user",
+        "tags": ["validation_rules"]
+    },
     "responseSchema": {
         "type": "array",
         "items": {
@@ -4,6 +4,7 @@ from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token, require_role_from_user
 from app.models.user import UserRole
 from app.models.validation_rule import ValidationRule
+from app.services.cache import cache_service, CacheNamespace
 from sqlalchemy import select
 
 config = {
@@ -59,6 +60,7 @@ async def handler(req, context):
             # Toggle active status
             rule.is_active = not rule.is_active
             await db.commit()
+            await cache_service.invalidate(CacheNamespace.VALIDATION_RULES)
             await db.refresh(rule)
             
             # Log activity
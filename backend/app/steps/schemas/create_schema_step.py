@@ -3,6 +3,7 @@ from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token, require_role_from_user
 from app.models.user import UserRole
 from app.models.field_schema import FieldSchema
+from app.services.cache import cache_service, CacheNamespace
 
 config = {
     "name": "CreateSchema",
@@ -55,6 +56,7 @@ async def handler(req, context):
             schema = FieldSchema(**body)
             db.add(schema)
             await db.commit()
+            await cache_service.invalidate(CacheNamespace.FIELD_SCHEMAS)
             await db.refresh(schema)
             
             return {
@@ -2,14 +2,18 @@
 from uuid import UUID
 from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token
-from app.models.field_schema import FieldSchema
-from sqlalchemy import select
+from app.services.cache.reference_data import get_active_field_schemas
 
 config = {
     "name": "GetSchemaFields",
     "type": "api",
     "path": "/api/schemas/{schema_id}/fields",
     "method": "GET",
+    "cache": {
+        "ttl": 300,
+        "scope": "user",
+        "tags": ["field_schemas"]
+    },
     "responseSchema": {
         "schema_id": {"type": "string", "format": "uuid"},
         "fields": {
@@ -63,29 +67,7 @@ async def handler(req, context):
             # Get fields for this schema (by document_type_id)
             # Note: schema_id here refers to document_type_id or we need to check the schema model
             # For now, assuming schema_id is document_type_id
-            fields_result = await db.execute(
-                select(FieldSchema).where(
-                    FieldSchema.document_type_id == schema_id,
-                    FieldSchema.is_active == True
-                ).order_by(FieldSchema.display_order)
-            )
-            fields = fields_result.scalars().all()
-            
-            fields_list = []
-            for field in fields:
-                fields_list.append({
-                    "id": str(field.id),
-                    "field_name": field.field_name,
-                    "display_name": field.display_name,
-                    "description": field.description,
-                    "data_type": field.data_type,
-                    "is_required": field.is_required,
-                    "validation_pattern": field.validation_pattern,
-                    "extraction_hints": field.extraction_hints,
-                    "default_value": field.default_value,
-                    "display_order": field.display_order,
-                    "is_active": field.is_active
-                })
+            fields_list = await get_active_field_schemas(db, [schema_id])
             
             return {
                 "status": 200,
@@ -4,6 +4,7 @@ from app.core.database import get_session_maker
 from app.core.dependencies import get_current_user_from_token, require_role_from_user
 from app.models.user import UserRole
 from app.models.field_schema import FieldSchema
+from app.services.cache import cache_service, CacheNamespace
 from sqlalchemy import select
 
 config = {
@@ -72,6 +73,7 @@ async def handler(req, context):
                     setattr(schema, field, value)
             
             await db.commit()
+            await cache_service.invalidate(CacheNamespace.FIELD_SCHEMAS)
             await db.refresh(schema)
             
             return {
@@ -0,0 +1,84 @@
+"""Autocomplete endpoint step."""
+import time
+
+from sqlalchemy import select
+
+from app.core import metrics
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token
+from app.models.installer import Installer
+from app.models.user import UserRole
+from app.services.search import autocomplete_index
+
+config = {
+    "name": "Autocomplete",
+    "type": "api",
+    "path": "/api/search/autocomplete",
+    "method": "GET",
+    "responseSchema": {
+        "type": "object",
+        "properties": {
+            "suggestions": {"type": "array", "items": {"type": "object"}},
+            "ready": {"type": "boolean"},
+            "took_ms": {"type": "number"}
+        }
+    }
+}
+
+MAX_LIMIT = 50
+
+async def handler(req, context):
+    """Handle autocomplete request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    query = req.get("query", {})
+    q = query.get("q") or ""
+    
+    try:
+        limit = min(max(int(query.get("limit", 10)), 1), MAX_LIMIT)
+    except ValueError:
+        return {"status": 400, "body": {"detail": "Query parameter 'limit' must be an integer"}}
+    types = [t for t in (query.get("types") or "").split(",") if t] or None
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            
+            # Installers only see their own dossiers and company
+            installer_id = None
+            if current_user.role == UserRole.INSTALLER:
+                installer_result = await db.execute(
+                    select(Installer.id).where(Installer.user_id == current_user.id)
+                )
+                installer_id = installer_result.scalar_one_or_none()
+                if installer_id is None:
+                    return {"status": 200, "body": {"suggestions": [], "ready": autocomplete_index.ready, "took_ms": 0.0}}
+            
+            started = time.perf_counter()
+            suggestions = autocomplete_index.suggest(q, limit, installer_id=installer_id, types=types)
+            elapsed = time.perf_counter() - started
+            metrics.record_timing("autocomplete", elapsed)
+            
+            return {
+                "status": 200,
+                "body": {
+                    "suggestions": suggestions,
+                    "ready": autocomplete_index.ready,
+                    "took_ms": round(elapsed * 1000, 3)
+                }
+            }
+        except ValueError as e:
+            return {"status": 401, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error getting autocomplete suggestions: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
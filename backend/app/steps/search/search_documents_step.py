@@ -43,7 +43,7 @@ async def handler(req, context):
         try:
             current_user = await get_current_user_from_token(token, db)
             
-            service = SearchService()
+            service = SearchService(scope=f"user:{current_user.id}")
             result = await service.search_documents(q, page=page, per_page=per_page)
             
             return {
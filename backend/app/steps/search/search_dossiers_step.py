@@ -48,7 +48,7 @@ async def handler(req, context):
         try:
             current_user = await get_current_user_from_token(token, db)
             
-            service = SearchService()
+            service = SearchService(scope=f"user:{current_user.id}")
             filters = {}
             if status:
                 filters["status"] = status
@@ -0,0 +1,52 @@
+"""Search indexing status endpoint step."""
+from app.core.database import get_session_maker
+from app.core.dependencies import get_current_user_from_token, require_role_from_user
+from app.models.user import UserRole
+from app.services.search import search_backend_status, search_indexer
+
+config = {
+    "name": "GetSearchIndexStatus",
+    "type": "api",
+    "path": "/api/search/status",
+    "method": "GET",
+    "responseSchema": {
+        "pending": {"type": "integer"},
+        "pending_by_collection": {"type": "object"},
+        "oldest_pending_at": {"type": "string", "format": "date-time"},
+        "lag_seconds": {"type": "number"},
+        "last_run_at": {"type": "string", "format": "date-time"},
+        "last_error": {"type": "string"},
+        "ready": {"type": "boolean"},
+        "backend": {"type": "object"}
+    }
+}
+
+async def handler(req, context):
+    """Handle search indexing status request."""
+    headers = req.get("headers", {})
+    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    
+    if not auth_header.startswith("Bearer "):
+        return {
+            "status": 401,
+            "body": {"detail": "Could not validate credentials"},
+            "headers": {"WWW-Authenticate": "Bearer"}
+        }
+    
+    token = auth_header.replace("Bearer ", "")
+    
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        try:
+            current_user = await get_current_user_from_token(token, db)
+            current_user = await require_role_from_user(current_user, [UserRole.ADMINISTRATOR])
+            
+            return {
+                "status": 200,
+                "body": {**await search_indexer.status(db), "backend": search_backend_status()}
+            }
+        except ValueError as e:
+            return {"status": 401 if "credentials" in str(e) else 403, "body": {"detail": str(e)}}
+        except Exception as e:
+            context.logger.error(f"Error getting search index status: {e}", exc_info=True)
+            return {"status": 500, "body": {"detail": "Internal server error"}}
@@ -5,6 +5,7 @@ from app.core.dependencies import get_current_user_from_token, require_role_from
 from app.models.user import UserRole
 from app.models.dossier import Dossier, DossierStatus
 from app.services.activity import ActivityLogger
+from app.services.events import publish_dossier_status
 from sqlalchemy import select
 
 config = {
@@ -12,6 +13,7 @@ config = {
     "type": "api",
     "path": "/api/dossiers/{dossier_id}/approve",
     "method": "POST",
+    "invalidates": ["dossier:{dossier_id}"],
     "bodySchema": {
         "notes": {"type": "string"}
     },
@@ -60,11 +62,10 @@ async def handler(req, context):
                 return {"status": 404, "body": {"detail": "Dossier not found"}}
             
             # TODO: Implement dossier approval logic
+            previous_status = dossier.status
             dossier.status = DossierStatus.APPROVED
             
-            await db.commit()
-            await db.refresh(dossier)
-            
+            # Decisions are recorded in the same transaction as the status change
             logger = ActivityLogger(db)
             await logger.log(
                 user_id=str(current_user.id),
@@ -72,9 +73,14 @@ async def handler(req, context):
                 entity_type="dossier",
                 entity_id=str(dossier.id),
                 entity_reference=dossier.reference,
-                description=f"Dossier {dossier.reference} approved"
+                description=f"Dossier {dossier.reference} approved",
+                durable=True
             )
             
+            await db.commit()
+            await db.refresh(dossier)
+            await publish_dossier_status(dossier, previous_status)
+            
             return {
                 "status": 200,
                 "body": {
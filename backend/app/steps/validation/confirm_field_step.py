@@ -13,6 +13,7 @@ config = {
     "type": "api",
     "path": "/api/dossiers/{dossier_id}/fields/{field_id}/confirm",
     "method": "POST",
+    "invalidates": ["dossier:{dossier_id}"],
     "bodySchema": {},
     "responseSchema": {
         "id": {"type": "string", "format": "uuid"},
@@ -12,6 +12,7 @@ config = {
     "type": "api",
     "path": "/api/dossiers/{dossier_id}/fields/{field_id}",
     "method": "PATCH",
+    "invalidates": ["dossier:{dossier_id}"],
     "bodySchema": {
         "value": {"type": ["string", "number", "boolean", "object", "array"]}
     },
@@ -0,0 +1,239 @@
+"""End-to-end benchmark of the Motia app against a seeded database.
+
+Runs ``create_motia_app()`` in-process behind aiohttp's test server and drives
+a weighted mix of read endpoints with concurrent clients. Reports throughput,
+p50/p95/p99 latency and SQL statements per request (from ``Server-Timing``)
+per endpoint, and saves the results as JSON. ``--compare`` checks a previous
+run and exits non-zero when p95 latency regresses beyond ``--tolerance``.
+
+Seed data first with scripts/generate_dataset.py.
+
+Usage: python scripts/benchmark.py [--duration 30] [--concurrency 16] [--output bench.json] [--compare baseline.json]
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from aiohttp.test_utils import TestClient, TestServer
+from sqlalchemy import select
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.core.security import create_access_token
+from app.models.dossier import Dossier
+from app.models.installer import Installer
+from app.models.user import User, UserRole
+
+SERVER_TIMING_QUERIES = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+@dataclass
+class Endpoint:
+    """A request template in the benchmark mix."""
+    name: str
+    weight: int
+    role: UserRole
+    path: Callable[[dict, random.Random], str]
+
+
+MIX = [
+    Endpoint("ListDossiers", 20, UserRole.ADMINISTRATOR, lambda s, r: "/api/dossiers?page=1&limit=20"),
+    Endpoint("ListDossiers:installer", 10, UserRole.ADMINISTRATOR,
+             lambda s, r: f"/api/dossiers?installer_id={r.choice(s['installer_ids'])}"),
+    Endpoint("ListDossiers:status", 10, UserRole.VALIDATOR,
+             lambda s, r: "/api/dossiers?status=awaiting_review"),
+    Endpoint("GetDossier", 15, UserRole.ADMINISTRATOR,
+             lambda s, r: f"/api/dossiers/{r.choice(s['dossier_ids'])}"),
+    Endpoint("GetValidationState", 15, UserRole.VALIDATOR,
+             lambda s, r: f"/api/dossiers/{r.choice(s['dossier_ids'])}/validation"),
+    Endpoint("GetExtractedFields", 10, UserRole.VALIDATOR,
+             lambda s, r: f"/api/dossiers/{r.choice(s['dossier_ids'])}/fields"),
+    Endpoint("ListProcesses", 5, UserRole.VALIDATOR, lambda s, r: "/api/processes"),
+    Endpoint("ListActivities", 5, UserRole.ADMINISTRATOR,
+             lambda s, r: f"/api/activity?entity_type=dossier&entity_id={r.choice(s['dossier_ids'])}"),
+    Endpoint("ListInvoices", 5, UserRole.ADMINISTRATOR, lambda s, r: "/api/billing/invoices"),
+    Endpoint("DashboardMetrics", 5, UserRole.ADMINISTRATOR, lambda s, r: "/api/analytics/dashboard"),
+]
+
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def load_samples(sample_size: int) -> dict:
+    """Ids and tokens the request templates draw from."""
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        dossier_ids = [str(row[0]) for row in (await db.execute(
+            select(Dossier.id).order_by(Dossier.created_at.desc()).limit(sample_size)
+        )).all()]
+        installer_ids = [str(row[0]) for row in (await db.execute(select(Installer.id).limit(sample_size))).all()]
+        tokens = {}
+        for role in (UserRole.ADMINISTRATOR, UserRole.VALIDATOR):
+            user = (await db.execute(
+                select(User).where(User.role == role, User.active == True).limit(1)
+            )).scalar_one_or_none()
+            if user is None:
+                raise SystemExit(f"No active {role.value} user; seed the database first (scripts/generate_dataset.py)")
+            tokens[role] = create_access_token({"sub": str(user.id)})
+    if not dossier_ids:
+        raise SystemExit("No dossiers found; seed the database first (scripts/generate_dataset.py)")
+    return {"dossier_ids": dossier_ids, "installer_ids": installer_ids, "tokens": tokens}
+
+
+async def worker(client, samples, deadline, rng, results, weights):
+    while time.perf_counter() < deadline:
+        endpoint = rng.choices(MIX, cum_weights=weights)[0]
+        path = endpoint.path(samples, rng)
+        headers = {"Authorization": f"Bearer {samples['tokens'][endpoint.role]}", "Accept-Encoding": "gzip"}
+        start = time.perf_counter()
+        async with client.get(path, headers=headers) as response:
+            await response.read()
+            elapsed = time.perf_counter() - start
+            match = SERVER_TIMING_QUERIES.search(response.headers.get("Server-Timing", ""))
+            results[endpoint.name].append((elapsed, response.status, int(match.group(1)) if match else None))
+
+
+def summarize(results: Dict[str, list], duration: float) -> dict:
+    endpoints = {}
+    all_latencies = []
+    for name, samples in sorted(results.items()):
+        latencies = [s[0] * 1000 for s in samples]
+        statements = [s[2] for s in samples if s[2] is not None]
+        errors = sum(1 for s in samples if s[1] >= 400)
+        all_latencies.extend(latencies)
+        endpoints[name] = {
+            "requests": len(samples),
+            "errors": errors,
+            "rps": round(len(samples) / duration, 2),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "sql_statements_mean": round(sum(statements) / len(statements), 2) if statements else None,
+        }
+    return {
+        "total": {
+            "requests": len(all_latencies),
+            "errors": sum(e["errors"] for e in endpoints.values()),
+            "rps": round(len(all_latencies) / duration, 2),
+            "p50_ms": round(percentile(all_latencies, 50), 2),
+            "p95_ms": round(percentile(all_latencies, 95), 2),
+            "p99_ms": round(percentile(all_latencies, 99), 2),
+        },
+        "endpoints": endpoints,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=backend_dir, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> bool:
+    """Print p95 deltas against a baseline. Returns False on regression."""
+    ok = True
+    print(f"\nCompared with {baseline.get('revision')} ({baseline.get('timestamp')}):")
+    for name, current in report["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if not previous or not previous["p95_ms"]:
+            continue
+        delta = (current["p95_ms"] - previous["p95_ms"]) / previous["p95_ms"] * 100
+        regressed = delta > tolerance
+        ok = ok and not regressed
+        print(f"  {name:<26} p95 {previous['p95_ms']:>8.1f} -> {current['p95_ms']:>8.1f} ms ({delta:+.0f}%)"
+              + ("  REGRESSION" if regressed else ""))
+    return ok
+
+
+async def run(args) -> dict:
+    # Per-request statement counts come from the metrics middleware
+    settings.METRICS_ENABLED = True
+    settings.SERVER_TIMING_ENABLED = True
+    from app.motia_server import create_motia_app
+
+    samples = await load_samples(args.sample_size)
+    rng = random.Random(args.seed)
+    weights = []
+    total = 0
+    for endpoint in MIX:
+        total += endpoint.weight
+        weights.append(total)
+
+    async with TestClient(TestServer(create_motia_app())) as client:
+        if args.warmup:
+            await asyncio.gather(*(
+                worker(client, samples, time.perf_counter() + args.warmup, random.Random(rng.random()),
+                       defaultdict(list), weights)
+                for _ in range(args.concurrency)
+            ))
+        results = defaultdict(list)
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            worker(client, samples, start + args.duration, random.Random(rng.random()), results, weights)
+            for _ in range(args.concurrency)
+        ))
+        duration = time.perf_counter() - start
+
+    report = summarize(results, duration)
+    report.update({
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {"duration": args.duration, "concurrency": args.concurrency, "seed": args.seed},
+    })
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Unmeasured seconds before the run")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sample-size", type=int, default=1000, help="Ids sampled for path parameters")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=10.0, help="Allowed p95 regression in percent")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    total = report["total"]
+    print(f"{total['requests']:,} requests, {total['rps']} req/s, {total['errors']} errors, "
+          f"p50 {total['p50_ms']} ms, p95 {total['p95_ms']} ms, p99 {total['p99_ms']} ms\n")
+    print(f"{'endpoint':<26} {'req':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'sql':>6}")
+    for name, e in report["endpoints"].items():
+        sql = f"{e['sql_statements_mean']:.1f}" if e["sql_statements_mean"] is not None else "-"
+        print(f"{name:<26} {e['requests']:>7} {e['errors']:>5} {e['rps']:>8.1f} "
+              f"{e['p50_ms']:>8.1f} {e['p95_ms']:>8.1f} {e['p99_ms']:>8.1f} {sql:>6}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\nReport written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if not compare(report, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
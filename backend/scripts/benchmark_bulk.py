@@ -0,0 +1,128 @@
+"""Compare N single-dossier assignments with one bulk request.
+
+Runs ``create_motia_app()`` in-process behind aiohttp's test server, assigns
+N synthetic dossiers to one validator with N calls to
+``POST /api/dossiers/{id}/assign``, then reassigns the same dossiers to a
+second validator with a single ``POST /api/dossiers/bulk`` request, and
+reports wall time and SQL statements (from ``Server-Timing``) for both.
+
+Only synthetic dossiers (``SYN-`` references from scripts/generate_dataset.py)
+are touched; their validator assignment is changed.
+
+Usage: python scripts/benchmark_bulk.py [--count 200] [--concurrency 8] [--rounds 3]
+"""
+import argparse
+import asyncio
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from aiohttp.test_utils import TestClient, TestServer
+from sqlalchemy import select
+from app.core.config import settings
+from app.core.database import get_session_maker
+from app.core.security import create_access_token
+from app.models.dossier import Dossier
+from app.models.user import User, UserRole
+
+SERVER_TIMING_QUERIES = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+async def load_fixtures(count: int) -> dict:
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        dossier_ids = [str(row[0]) for row in (await db.execute(
+            select(Dossier.id).where(Dossier.reference.like("SYN-%")).order_by(Dossier.id).limit(count)
+        )).all()]
+        validators = [str(row[0]) for row in (await db.execute(
+            select(User.id).where(User.role == UserRole.VALIDATOR, User.active == True).limit(2)
+        )).all()]
+        admin = (await db.execute(
+            select(User.id).where(User.role == UserRole.ADMINISTRATOR, User.active == True).limit(1)
+        )).scalar_one_or_none()
+    if len(dossier_ids) < count or len(validators) < 2 or admin is None:
+        raise SystemExit(
+            f"Need {count} synthetic dossiers, two validators and an administrator; "
+            "seed the database first (scripts/generate_dataset.py)"
+        )
+    return {
+        "dossier_ids": dossier_ids,
+        "validators": validators,
+        "token": create_access_token({"sub": str(admin)}),
+    }
+
+
+def statements(response) -> int:
+    match = SERVER_TIMING_QUERIES.search(response.headers.get("Server-Timing", ""))
+    return int(match.group(1)) if match else 0
+
+
+async def single_calls(client, fixtures, validator_id, concurrency) -> tuple[float, int]:
+    headers = {"Authorization": f"Bearer {fixtures['token']}"}
+    semaphore = asyncio.Semaphore(concurrency)
+    total_statements = 0
+
+    async def assign(dossier_id):
+        nonlocal total_statements
+        async with semaphore:
+            async with client.post(
+                f"/api/dossiers/{dossier_id}/assign", json={"validator_id": validator_id}, headers=headers
+            ) as response:
+                await response.read()
+                if response.status != 200:
+                    raise SystemExit(f"Single assign failed with HTTP {response.status}")
+                total_statements += statements(response)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(assign(dossier_id) for dossier_id in fixtures["dossier_ids"]))
+    return time.perf_counter() - start, total_statements
+
+
+async def bulk_call(client, fixtures, validator_id) -> tuple[float, int]:
+    headers = {"Authorization": f"Bearer {fixtures['token']}"}
+    start = time.perf_counter()
+    async with client.post("/api/dossiers/bulk", json={
+        "action": "assign",
+        "dossier_ids": fixtures["dossier_ids"],
+        "validator_id": validator_id,
+    }, headers=headers) as response:
+        body = await response.json()
+        if response.status != 200 or body["succeeded"] != len(fixtures["dossier_ids"]):
+            raise SystemExit(f"Bulk assign failed with HTTP {response.status}: {body}")
+        return time.perf_counter() - start, statements(response)
+
+
+async def run(args) -> None:
+    settings.METRICS_ENABLED = True
+    settings.SERVER_TIMING_ENABLED = True
+    settings.BULK_MAX_DOSSIERS = max(settings.BULK_MAX_DOSSIERS, args.count)
+    from app.motia_server import create_motia_app
+
+    fixtures = await load_fixtures(args.count)
+    first, second = fixtures["validators"]
+
+    print(f"{'round':<6} {'single (s)':>11} {'stmts':>7} {'bulk (s)':>9} {'stmts':>7} {'speedup':>8}")
+    async with TestClient(TestServer(create_motia_app())) as client:
+        for round_number in range(1, args.rounds + 1):
+            single_time, single_statements = await single_calls(client, fixtures, first, args.concurrency)
+            bulk_time, bulk_statements = await bulk_call(client, fixtures, second)
+            print(f"{round_number:<6} {single_time:>11.3f} {single_statements:>7} "
+                  f"{bulk_time:>9.3f} {bulk_statements:>7} {single_time / bulk_time:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200, help="Dossiers per operation")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent single calls")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
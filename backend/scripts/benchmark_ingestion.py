@@ -0,0 +1,224 @@
+"""Measure bulk ingestion throughput in dossiers per minute.
+
+Generates a batch of synthetic dossiers with small PDF documents and ingests
+it with the bulk ingestion service (chunked set-based inserts, concurrent
+storage uploads), then creates the same number of dossiers the way
+``CreateDossier`` plus one ``UploadDocument`` per file do (one transaction
+per dossier and per document) for comparison; ``--skip-baseline`` skips the
+latter. HTTP transfer is not included in either figure. References use a
+separate prefix (``BEN`` by default) so real numbering is untouched; the
+dossiers, their stored files, the counter and the job are removed afterwards
+unless ``--keep`` is given. Run against a development database and storage:
+it needs at least one process, one installer and one user.
+
+Usage:
+    python scripts/benchmark_ingestion.py
+    python scripts/benchmark_ingestion.py --dossiers 1000 --documents 3 --document-kb 200 --chunk-size 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import delete, select
+
+from app.core.config import settings
+from app.core.database import get_engine, get_session_maker
+from app.models.document import Document, ProcessingStatus
+from app.models.dossier import Dossier, DossierStatus
+from app.models.ingestion_job import IngestionJob, IngestionStatus
+from app.models.installer import Installer
+from app.models.process import Process
+from app.models.reference_counter import ReferenceCounter
+from app.models.user import User, UserRole
+from app.services.ingestion import batch_from_directory, ingestion_service, validate_manifest
+from app.services.pdf_storage import pdf_storage_service
+from app.services.reference_numbers import next_reference
+
+
+def pdf_bytes(size: int) -> bytes:
+    """A minimal PDF padded with a comment to about ``size`` bytes."""
+    body = b"%PDF-1.4\n1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n" \
+           b"2 0 obj << /Type /Pages /Kids [] /Count 0 >> endobj\n"
+    trailer = b"trailer << /Root 1 0 R >>\n%%EOF\n"
+    padding = max(0, size - len(body) - len(trailer) - 2)
+    return body + b"%" + b"x" * padding + b"\n" + trailer
+
+
+def build_batch_directory(args, process_id) -> tuple:
+    """Write the documents and manifest of a synthetic batch. Returns (directory, manifest bytes)."""
+    workdir = tempfile.mkdtemp(prefix="ingest-benchmark-")
+    content = pdf_bytes(args.document_kb * 1024)
+    dossiers = []
+    for i in range(args.dossiers):
+        documents = []
+        for j in range(args.documents):
+            name = f"{i:06d}/document-{j}.pdf"
+            os.makedirs(os.path.join(workdir, f"{i:06d}"), exist_ok=True)
+            with open(os.path.join(workdir, name), "wb") as f:
+                f.write(content)
+            documents.append({"file": name})
+        dossiers.append({
+            "external_id": f"benchmark-{i}",
+            "process_id": str(process_id),
+            "beneficiary": {
+                "name": f"Beneficiaire {i}",
+                "address": f"{i} rue du Test",
+                "city": "Paris",
+                "postal_code": "75001",
+            },
+            "documents": documents,
+        })
+    return workdir, json.dumps({"dossiers": dossiers}).encode()
+
+
+async def run_bulk(args, process_id, installer_id, user_id, job_ids: list) -> float:
+    """Ingest a synthetic batch with the ingestion service. Returns elapsed seconds."""
+    workdir, manifest = build_batch_directory(args, process_id)
+    batch = batch_from_directory(workdir, manifest)
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        errors = await validate_manifest(db, batch, installer_id)
+        if errors:
+            batch.close()
+            raise SystemExit(f"Invalid benchmark manifest: {errors[:3]}")
+        job = await ingestion_service.create_job(db, batch, user_id)
+    job_ids.append(job.id)
+
+    started = time.perf_counter()
+    status = await ingestion_service.run_job(job.id, batch, user_id, reference_prefix=args.prefix)
+    elapsed = time.perf_counter() - started
+    if status != IngestionStatus.COMPLETED:
+        async with session_maker() as db:
+            error = (await db.execute(select(IngestionJob.error).where(IngestionJob.id == job.id))).scalar()
+        raise SystemExit(f"Ingestion job failed: {error}")
+    return elapsed
+
+
+class _Upload:
+    """File-like upload, as built by the upload endpoint."""
+
+    def __init__(self, filename: str, content: bytes):
+        self.filename = filename
+        self.content_type = "application/pdf"
+        self._file = BytesIO(content)
+
+    async def read(self):
+        return self._file.read()
+
+
+async def run_baseline(args, process_id, installer_id) -> float:
+    """Create dossiers one by one, as CreateDossier + UploadDocument do. Returns elapsed seconds."""
+    content = pdf_bytes(args.document_kb * 1024)
+    session_maker = get_session_maker()
+    started = time.perf_counter()
+    for i in range(args.dossiers):
+        async with session_maker() as db:
+            dossier = Dossier(
+                reference=await next_reference(db, args.prefix),
+                process_id=process_id,
+                installer_id=installer_id,
+                status=DossierStatus.DRAFT,
+                beneficiary_name=f"Beneficiaire {i}",
+                beneficiary_address=f"{i} rue du Test",
+                beneficiary_city="Paris",
+                beneficiary_postal_code="75001",
+            )
+            db.add(dossier)
+            await db.commit()
+            for j in range(args.documents):
+                filename = f"document-{j}.pdf"
+                storage_path, size = await pdf_storage_service.save_file(_Upload(filename, content), dossier.id)
+                db.add(Document(
+                    dossier_id=dossier.id,
+                    filename=storage_path.split("/")[-1],
+                    original_filename=filename,
+                    storage_path=storage_path,
+                    mime_type="application/pdf",
+                    file_size=size,
+                    processing_status=ProcessingStatus.PENDING,
+                ))
+                await db.commit()
+    return time.perf_counter() - started
+
+
+async def cleanup(prefix: str, job_ids: list) -> None:
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        dossier_ids = select(Dossier.id).where(Dossier.reference.like(f"{prefix}-%"))
+        paths = (await db.execute(select(Document.storage_path).where(Document.dossier_id.in_(dossier_ids)))).scalars().all()
+        for path in paths:
+            await pdf_storage_service.delete_file(path)
+        if job_ids:
+            await db.execute(delete(IngestionJob).where(IngestionJob.id.in_(job_ids)))
+        await db.execute(delete(Dossier).where(Dossier.reference.like(f"{prefix}-%")))
+        await db.execute(delete(ReferenceCounter).where(ReferenceCounter.prefix == prefix))
+        await db.commit()
+
+
+def report(label: str, args, elapsed: float) -> float:
+    rate = args.dossiers / elapsed * 60
+    print(f"{label:<10} {args.dossiers} dossiers, {args.dossiers * args.documents} documents "
+          f"in {elapsed:.2f}s: {rate:,.0f} dossiers/minute")
+    return rate
+
+
+async def run(args) -> int:
+    if args.chunk_size:
+        settings.INGEST_CHUNK_SIZE = args.chunk_size
+    if args.concurrency:
+        settings.INGEST_UPLOAD_CONCURRENCY = args.concurrency
+
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        process_id = (await db.execute(select(Process.id).limit(1))).scalar()
+        installer_id = (await db.execute(select(Installer.id).limit(1))).scalar()
+        user_id = (await db.execute(
+            select(User.id).order_by((User.role == UserRole.ADMINISTRATOR).desc()).limit(1)
+        )).scalar()
+    if process_id is None or installer_id is None or user_id is None:
+        print("Needs at least one process, one installer and one user")
+        return 1
+
+    print(f"Storage: {'S3 ' + settings.S3_BUCKET_NAME if settings.USE_S3 else settings.UPLOAD_DIR}, "
+          f"chunk size {settings.INGEST_CHUNK_SIZE}, upload concurrency {settings.INGEST_UPLOAD_CONCURRENCY}")
+    job_ids = []
+    try:
+        bulk_rate = report("Bulk", args, await run_bulk(args, process_id, installer_id, user_id, job_ids))
+        if not args.skip_baseline:
+            baseline_rate = report("Baseline", args, await run_baseline(args, process_id, installer_id))
+            print(f"Speedup: {bulk_rate / baseline_rate:.1f}x")
+    finally:
+        if not args.keep:
+            await cleanup(args.prefix, job_ids)
+        await get_engine().dispose()
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dossiers", type=int, default=500, help="Dossiers per run (default: 500)")
+    parser.add_argument("--documents", type=int, default=3, help="Documents per dossier (default: 3)")
+    parser.add_argument("--document-kb", type=int, default=100, help="Size of each document in KB (default: 100)")
+    parser.add_argument("--chunk-size", type=int, help="Override INGEST_CHUNK_SIZE")
+    parser.add_argument("--concurrency", type=int, help="Override INGEST_UPLOAD_CONCURRENCY")
+    parser.add_argument("--skip-baseline", action="store_true", help="Only measure bulk ingestion")
+    parser.add_argument("--prefix", default="BEN", help="Reference prefix used for the benchmark (default: BEN)")
+    parser.add_argument("--keep", action="store_true", help="Keep the created dossiers, files, counter and job")
+    args = parser.parse_args()
+    if args.prefix in ("DOS", "INV"):
+        parser.error("use a prefix that is not used for real references")
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark response serialization for a ListDossiers-shaped payload.
+
+Compares the previous path (manual str()/isoformat() + stdlib json) with the
+serializers in app.core.serialization, and reports compressed sizes.
+
+Usage: python scripts/benchmark_serialization.py [--rows 1000] [--repeat 200]
+"""
+import argparse
+import enum
+import gzip
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core import serialization
+
+
+class Status(str, enum.Enum):
+    PROCESSING = "processing"
+    AWAITING_REVIEW = "awaiting_review"
+
+
+class Priority(str, enum.Enum):
+    NORMAL = "normal"
+    HIGH = "high"
+
+
+class Row:
+    """Stand-in for a Dossier ORM row."""
+
+    def __init__(self, i: int):
+        self.id = uuid.uuid4()
+        self.reference = f"CEE-2026-{i:06d}"
+        self.process_id = uuid.uuid4()
+        self.installer_id = uuid.uuid4()
+        self.status = Status.AWAITING_REVIEW if i % 3 else Status.PROCESSING
+        self.priority = Priority.HIGH if i % 10 == 0 else Priority.NORMAL
+        self.beneficiary_name = f"Beneficiary {i}"
+        self.created_at = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i)
+
+
+def manual_payload(rows):
+    return {
+        "dossiers": [
+            {
+                "id": str(d.id),
+                "reference": d.reference,
+                "process_id": str(d.process_id),
+                "installer_id": str(d.installer_id),
+                "status": d.status.value,
+                "priority": d.priority.value,
+                "beneficiary_name": d.beneficiary_name,
+                "created_at": d.created_at.isoformat()
+            }
+            for d in rows
+        ],
+        "total": len(rows), "page": 1, "limit": len(rows)
+    }
+
+
+def native_payload(rows):
+    return {
+        "dossiers": [
+            {
+                "id": d.id,
+                "reference": d.reference,
+                "process_id": d.process_id,
+                "installer_id": d.installer_id,
+                "status": d.status,
+                "priority": d.priority,
+                "beneficiary_name": d.beneficiary_name,
+                "created_at": d.created_at
+            }
+            for d in rows
+        ],
+        "total": len(rows), "page": 1, "limit": len(rows)
+    }
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = [Row(i) for i in range(args.rows)]
+    cases = [
+        ("manual + json.dumps", lambda: json.dumps(manual_payload(rows)).encode()),
+        ("native + stdlib", lambda: serialization.StdlibJSONSerializer().dumps(native_payload(rows))),
+    ]
+    if serialization.ORJSON_AVAILABLE:
+        orjson_serializer = serialization.OrjsonSerializer()
+        cases.append(("native + orjson", lambda: orjson_serializer.dumps(native_payload(rows))))
+
+    print(f"{args.rows} rows, {args.repeat} iterations")
+    for name, fn in cases:
+        print(f"  {name:<22} {timed(fn, args.repeat):8.2f} ms/response")
+
+    body = serialization.dumps(native_payload(rows))
+    print(f"\nbody: {len(body):,} bytes")
+    for level in (1, 6, 9):
+        start = time.perf_counter()
+        size = len(gzip.compress(body, compresslevel=level))
+        print(f"  gzip -{level}: {size:,} bytes ({(time.perf_counter() - start) * 1000:.2f} ms)")
+    if serialization.BROTLI_AVAILABLE:
+        for quality in (4, 11):
+            start = time.perf_counter()
+            size = len(serialization.brotli.compress(body, quality=quality))
+            print(f"  br q{quality}: {size:,} bytes ({(time.perf_counter() - start) * 1000:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Build training batches from feedback that is not in a batch yet.
+
+Each batch claims up to ``TRAINING_BATCH_MAX_FEEDBACK`` feedback rows, writes
+deduplicated records (feedback, extracted field context and page region) as
+compressed shards under ``training/batches/<batch_id>/`` in storage with a
+``manifest.json``, and stamps the rows with the batch id. Runs are
+incremental: already batched feedback is never read again, so the script can
+run from cron.
+
+Usage: python scripts/build_training_dataset.py [--format jsonl|parquet] [--shard-size 10000] [--max-feedback 100000] [--all]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import get_session_maker
+from app.services.training_dataset import FORMATS, TrainingDatasetBuilder
+
+
+async def run(args) -> None:
+    session_maker = get_session_maker()
+    built = 0
+    while True:
+        async with session_maker() as db:
+            batch = await TrainingDatasetBuilder(
+                db, export_format=args.format, shard_size=args.shard_size, max_feedback=args.max_feedback
+            ).build()
+        if batch is None:
+            break
+        built += 1
+        print(f"{batch.batch_id}: {batch.feedback_count} feedback, {batch.record_count} records, "
+              f"{batch.duplicate_count} duplicates, {len(batch.shards)} shards -> {batch.manifest_key}")
+        if not args.all:
+            break
+    if not built:
+        print("No new feedback")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", choices=sorted(FORMATS), help="Default TRAINING_DATASET_FORMAT")
+    parser.add_argument("--shard-size", type=int, help="Records per shard (default TRAINING_SHARD_SIZE)")
+    parser.add_argument("--max-feedback", type=int, help="Feedback per batch (default TRAINING_BATCH_MAX_FEEDBACK)")
+    parser.add_argument("--all", action="store_true", help="Build batches until all feedback is batched")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
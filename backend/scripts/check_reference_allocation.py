@@ -0,0 +1,114 @@
+"""Create dossiers concurrently and check their references are unique and gapless.
+
+Each dossier is created in its own transaction, as the create endpoint does:
+allocate a reference, insert the row, commit. A share of the transactions
+can be rolled back after allocating (``--rollback-every``) to check that
+their numbers are reused. References use a separate prefix (``TST`` by
+default) so real numbering is untouched; the rows and the counter are
+removed afterwards unless ``--keep`` is given. Run against a development
+database: it needs at least one process and one installer.
+
+Usage:
+    python scripts/check_reference_allocation.py
+    python scripts/check_reference_allocation.py --count 1000 --concurrency 15 --rollback-every 10
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import delete, insert, select
+
+from app.core.database import get_engine, get_session_maker
+from app.models.dossier import Dossier, DossierStatus, Priority
+from app.models.installer import Installer
+from app.models.process import Process
+from app.models.reference_counter import ReferenceCounter
+from app.services.reference_numbers import next_reference
+
+
+async def create_dossier(session_maker, semaphore, prefix: str, process_id, installer_id, rollback: bool):
+    async with semaphore:
+        async with session_maker() as db:
+            reference = await next_reference(db, prefix)
+            await db.execute(insert(Dossier).values(
+                reference=reference,
+                process_id=process_id,
+                installer_id=installer_id,
+                status=DossierStatus.DRAFT,
+                priority=Priority.NORMAL,
+                beneficiary_name="Allocation check",
+                beneficiary_address="1 rue du Test",
+                beneficiary_city="Paris",
+                beneficiary_postal_code="75001",
+            ))
+            if rollback:
+                await db.rollback()
+                return None
+            await db.commit()
+            return reference
+
+
+async def run(args) -> int:
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        process_id = (await db.execute(select(Process.id).limit(1))).scalar()
+        installer_id = (await db.execute(select(Installer.id).limit(1))).scalar()
+    if process_id is None or installer_id is None:
+        print("Needs at least one process and one installer")
+        return 1
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        create_dossier(
+            session_maker, semaphore, args.prefix, process_id, installer_id,
+            rollback=bool(args.rollback_every) and i % args.rollback_every == args.rollback_every - 1
+        )
+        for i in range(args.count)
+    ), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+
+    errors = [r for r in results if isinstance(r, Exception)]
+    references = [r for r in results if isinstance(r, str)]
+    numbers = sorted(int(reference.rsplit("-", 1)[1]) for reference in references)
+    duplicates = len(numbers) - len(set(numbers))
+    gapless = numbers == list(range(1, len(numbers) + 1))
+
+    print(f"Created {len(references)} dossiers ({args.count - len(references) - len(errors)} rolled back) "
+          f"in {elapsed:.2f}s ({args.count / elapsed:.0f}/s) with concurrency {args.concurrency}")
+    print(f"Errors: {len(errors)}" + (f" (first: {errors[0]!r})" if errors else ""))
+    print(f"Duplicates: {duplicates}")
+    print(f"Gapless: {gapless}" + ("" if gapless or not numbers else f" (numbers {numbers[0]}..{numbers[-1]})"))
+
+    if not args.keep:
+        async with session_maker() as db:
+            await db.execute(delete(Dossier).where(Dossier.reference.like(f"{args.prefix}-%")))
+            await db.execute(delete(ReferenceCounter).where(ReferenceCounter.prefix == args.prefix))
+            await db.commit()
+
+    await get_engine().dispose()
+    return 0 if not errors and not duplicates and gapless else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000, help="Dossiers to create (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=15,
+                        help="Transactions in flight (default: 15, the default connection pool size)")
+    parser.add_argument("--rollback-every", type=int, default=0, help="Roll back every Nth creation after allocating")
+    parser.add_argument("--prefix", default="TST", help="Reference prefix used for the check (default: TST)")
+    parser.add_argument("--keep", action="store_true", help="Keep the created dossiers and counter")
+    args = parser.parse_args()
+    if args.prefix in ("DOS", "INV"):
+        parser.error("use a prefix that is not used for real references")
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
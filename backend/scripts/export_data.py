@@ -0,0 +1,54 @@
+"""Export a dataset to storage without going through an HTTP request.
+
+Rows are streamed from a server-side cursor into a spooled temporary file and
+uploaded to S3 (or the local upload directory), so large exports run in
+constant memory and can be scheduled from cron or a worker.
+
+Usage:
+    python scripts/export_data.py dossiers --format parquet
+    python scripts/export_data.py activity_logs --format jsonl --filter date_from=2024-01-01
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.export import DATASETS, WRITERS, export_to_storage
+
+
+def parse_filters(values) -> dict:
+    filters = {}
+    for value in values or []:
+        name, _, filter_value = value.partition("=")
+        if not filter_value:
+            raise SystemExit(f"Invalid filter {value!r}, expected name=value")
+        filters[name] = filter_value
+    return filters
+
+
+async def run(args) -> None:
+    dataset = DATASETS[args.dataset]
+    filters = parse_filters(args.filter)
+    unknown = set(filters) - set(dataset.filters)
+    if unknown:
+        raise SystemExit(f"Unknown filters for {dataset.name}: {', '.join(sorted(unknown))}")
+    result = await export_to_storage(dataset, args.format, filters, key=args.key)
+    print(f"{result['rows']} rows, {result['bytes']} bytes -> {result['location']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dataset", choices=sorted(DATASETS))
+    parser.add_argument("--format", choices=sorted(WRITERS), default="csv")
+    parser.add_argument("--filter", action="append", metavar="NAME=VALUE", help="Dataset filter, repeatable")
+    parser.add_argument("--key", help="Storage key (default exports/<dataset>/<timestamp>.<ext>)")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
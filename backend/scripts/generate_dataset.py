@@ -0,0 +1,294 @@
+"""Seed the database with a synthetic dataset at production-like volumes.
+
+Defaults produce 100k dossiers, 1M documents, 10M extracted fields, 500k
+activity logs and ~30k invoices. Rows are streamed in chunks with COPY, so
+memory stays flat whatever the volume. Installer load follows a Zipf
+distribution (``--skew``) and creation dates are biased towards recent days,
+like real traffic.
+
+Synthetic rows are tagged (references ``SYN-``, e-mails ``@synthetic.invalid``)
+so ``--reset`` can remove them without touching real data.
+
+Usage: python scripts/generate_dataset.py [--dossiers 100000] [--skew 1.1] [--reset]
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from app.core.database import get_engine
+from app.core.security import get_password_hash
+
+SYNTHETIC_PREFIX = "SYN-"
+SYNTHETIC_DOMAIN = "synthetic.invalid"
+
+# Enum columns store member names
+DOSSIER_STATUSES = {
+    "DRAFT": 5, "SUBMITTED": 10, "AWAITING_REVIEW": 25, "IN_REVIEW": 10,
+    "APPROVED": 35, "REJECTED": 10, "ARCHIVED": 5,
+}
+APPROVED_SHARE = DOSSIER_STATUSES["APPROVED"] / sum(DOSSIER_STATUSES.values())
+PRIORITIES = {"LOW": 15, "NORMAL": 65, "HIGH": 15, "URGENT": 5}
+FIELD_STATUSES = {"UNREVIEWED": 55, "CONFIRMED": 35, "CORRECTED": 7, "MARKED_WRONG": 3}
+DOCUMENT_STATUSES = {"COMPLETED": 85, "EXTRACTED": 5, "PENDING": 5, "FAILED": 5}
+
+FIELD_NAMES = [
+    ("beneficiary_name", "Beneficiary name", "string"),
+    ("beneficiary_address", "Beneficiary address", "string"),
+    ("postal_code", "Postal code", "string"),
+    ("siret", "SIRET", "string"),
+    ("invoice_date", "Invoice date", "date"),
+    ("invoice_amount", "Invoice amount", "number"),
+    ("surface_m2", "Insulated surface (m²)", "number"),
+    ("thermal_resistance", "Thermal resistance", "number"),
+    ("signature_date", "Signature date", "date"),
+    ("rge_number", "RGE number", "string"),
+]
+ACTIONS = ["dossier_created", "document_uploaded", "field_confirmed", "field_updated", "dossier_approved"]
+CITIES = [("Paris", "75"), ("Lyon", "69"), ("Marseille", "13"), ("Lille", "59"), ("Nantes", "44"), ("Toulouse", "31")]
+
+
+def weighted(choices: dict):
+    """Return a sampler for a {value: weight} mapping."""
+    values = list(choices)
+    cum_weights = []
+    total = 0
+    for value in values:
+        total += choices[value]
+        cum_weights.append(total)
+    return lambda rng: rng.choices(values, cum_weights=cum_weights)[0]
+
+
+def zipf_sampler(items: list, skew: float):
+    """Sample items with Zipf-distributed popularity (skew=0 is uniform)."""
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, len(items) + 1):
+        total += 1.0 / rank ** skew
+        cum_weights.append(total)
+    return lambda rng: rng.choices(items, cum_weights=cum_weights)[0]
+
+
+class DatasetGenerator:
+    """Streams synthetic rows into the database with COPY."""
+
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.now = datetime.now(timezone.utc)
+        self.counts = {}
+        self.dossier_status = weighted(DOSSIER_STATUSES)
+        self.priority = weighted(PRIORITIES)
+        self.field_status = weighted(FIELD_STATUSES)
+        self.document_status = weighted(DOCUMENT_STATUSES)
+
+    def created_at(self) -> datetime:
+        # Exponential recency bias over the configured window
+        age_days = min(self.rng.expovariate(3.0 / self.args.days), self.args.days)
+        return self.now - timedelta(days=age_days, seconds=self.rng.randint(0, 86399))
+
+    async def copy(self, raw, table: str, columns: list, records: list) -> None:
+        if records:
+            await raw.copy_records_to_table(table, records=records, columns=columns)
+            self.counts[table] = self.counts.get(table, 0) + len(records)
+
+    async def reset(self, conn) -> None:
+        """Delete previously generated rows."""
+        like = f"{SYNTHETIC_PREFIX}%"
+        await conn.execute(text("DELETE FROM activity_logs WHERE entity_reference LIKE :like"), {"like": like})
+        await conn.execute(text("DELETE FROM invoices WHERE invoice_number LIKE :like"), {"like": like})
+        await conn.execute(text("DELETE FROM dossiers WHERE reference LIKE :like"), {"like": like})
+        await conn.execute(text("DELETE FROM installers WHERE siret LIKE '99%' AND contact_email LIKE :domain"),
+                           {"domain": f"%@{SYNTHETIC_DOMAIN}"})
+        await conn.execute(text("DELETE FROM validators WHERE user_id IN (SELECT id FROM users WHERE email LIKE :domain)"),
+                           {"domain": f"%@{SYNTHETIC_DOMAIN}"})
+        await conn.execute(text("DELETE FROM users WHERE email LIKE :domain"), {"domain": f"%@{SYNTHETIC_DOMAIN}"})
+        await conn.execute(text("DELETE FROM processes WHERE code LIKE :like"), {"like": like})
+
+    async def seed_reference_data(self, conn, raw):
+        """Validators, installers and processes that dossiers point at."""
+        args = self.args
+        password_hash = get_password_hash("synthetic")
+
+        validator_ids = [uuid.uuid4() for _ in range(args.validators)]
+        await self.copy(raw, "users", ["id", "email", "password_hash", "name", "role", "active"], [
+            (user_id, f"validator{i}@{SYNTHETIC_DOMAIN}", password_hash, f"Validator {i}", "VALIDATOR", True)
+            for i, user_id in enumerate(validator_ids)
+        ])
+        admin_id = uuid.uuid4()
+        await self.copy(raw, "users", ["id", "email", "password_hash", "name", "role", "active"], [
+            (admin_id, f"admin@{SYNTHETIC_DOMAIN}", password_hash, "Synthetic Admin", "ADMINISTRATOR", True)
+        ])
+
+        installer_ids = [uuid.uuid4() for _ in range(args.installers)]
+        records = []
+        for i, installer_id in enumerate(installer_ids):
+            city, department = self.rng.choice(CITIES)
+            siret = f"99{i:012d}"
+            records.append((
+                installer_id, f"Synthetic Installer {i}", siret, siret[:9], f"{i} rue de la Paix", city,
+                f"{department}000", f"Contact {i}", f"installer{i}@{SYNTHETIC_DOMAIN}", "verified", "[]", True
+            ))
+        await self.copy(raw, "installers", [
+            "id", "company_name", "siret", "siren", "address", "city", "postal_code",
+            "contact_name", "contact_email", "rge_status", "qualifications", "active"
+        ], records)
+
+        process_ids = [row[0] for row in (await conn.execute(
+            text("SELECT id FROM processes WHERE is_active")
+        )).all()]
+        if not process_ids:
+            process_ids = [uuid.uuid4() for _ in range(5)]
+            await self.copy(raw, "processes", [
+                "id", "code", "name", "category", "version", "is_active", "is_coup_de_pouce",
+                "valid_from", "required_documents"
+            ], [
+                (process_id, f"{SYNTHETIC_PREFIX}PROC-{i}", f"Synthetic process {i}", "residential", "1.0",
+                 True, i % 2 == 0, date(2024, 1, 1), "[]")
+                for i, process_id in enumerate(process_ids)
+            ])
+
+        document_type_ids = [row[0] for row in (await conn.execute(text("SELECT id FROM document_types"))).all()]
+        return validator_ids, installer_ids, process_ids, document_type_ids or [None]
+
+    async def seed_dossiers(self, raw, validator_ids, installer_ids, process_ids, document_type_ids):
+        args = self.args
+        rng = self.rng
+        pick_installer = zipf_sampler(installer_ids, args.skew)
+        pick_process = zipf_sampler(process_ids, args.skew)
+        start = time.perf_counter()
+
+        for chunk_start in range(0, args.dossiers, args.chunk_size):
+            dossiers, documents, fields, activities, invoices = [], [], [], [], []
+            for n in range(chunk_start, min(chunk_start + args.chunk_size, args.dossiers)):
+                dossier_id = uuid.uuid4()
+                installer_id = pick_installer(rng)
+                status = self.dossier_status(rng)
+                created_at = self.created_at()
+                reference = f"{SYNTHETIC_PREFIX}{created_at.year}-{n:07d}"
+                city, department = rng.choice(CITIES)
+                assigned = rng.choice(validator_ids) if status in ("AWAITING_REVIEW", "IN_REVIEW", "APPROVED", "REJECTED") else None
+                dossiers.append((
+                    dossier_id, reference, pick_process(rng), installer_id, assigned, status, self.priority(rng),
+                    f"Beneficiary {n}", f"{n} avenue des Tests", city, f"{department}{n % 1000:03d}",
+                    round(rng.uniform(0.5, 1.0), 4), created_at + timedelta(hours=1) if status != "DRAFT" else None,
+                    created_at, created_at
+                ))
+
+                for d in range(max(1, int(rng.gauss(args.documents_per_dossier, 2)))):
+                    document_id = uuid.uuid4()
+                    documents.append((
+                        document_id, dossier_id, rng.choice(document_type_ids), f"{document_id}.pdf", f"scan_{d}.pdf",
+                        f"dossiers/{dossier_id}/{document_id}.pdf", "application/pdf", rng.randint(50_000, 5_000_000),
+                        rng.randint(1, 12), self.document_status(rng), round(rng.uniform(0.6, 1.0), 4),
+                        created_at, created_at
+                    ))
+                    for f in range(args.fields_per_document):
+                        field_name, display_name, data_type = FIELD_NAMES[f % len(FIELD_NAMES)]
+                        value = json.dumps(f"{field_name}-{n}-{d}")
+                        fields.append((
+                            uuid.uuid4(), document_id, dossier_id, field_name, display_name, value, data_type,
+                            round(rng.uniform(0.4, 1.0), 4), self.field_status(rng), value, rng.randint(1, 3),
+                            created_at
+                        ))
+
+                for a in range(rng.randint(0, 2 * args.activity_per_dossier)):
+                    activities.append((
+                        uuid.uuid4(), assigned, rng.choice(ACTIONS), "dossier", dossier_id, reference,
+                        "{}", created_at + timedelta(minutes=5 * a)
+                    ))
+
+                if status == "APPROVED" and rng.random() < args.invoice_ratio / APPROVED_SHARE:
+                    amount = round(rng.uniform(500, 20_000), 2)
+                    invoices.append((
+                        uuid.uuid4(), dossier_id, installer_id, f"{SYNTHETIC_PREFIX}INV-{n:07d}",
+                        rng.choice(["pending", "sent", "paid"]), amount, created_at + timedelta(days=3)
+                    ))
+
+            await self.copy(raw, "dossiers", [
+                "id", "reference", "process_id", "installer_id", "assigned_validator_id", "status", "priority",
+                "beneficiary_name", "beneficiary_address", "beneficiary_city", "beneficiary_postal_code",
+                "confidence_score", "submitted_at", "created_at", "updated_at"
+            ], dossiers)
+            await self.copy(raw, "documents", [
+                "id", "dossier_id", "document_type_id", "filename", "original_filename", "storage_path",
+                "mime_type", "file_size", "page_count", "processing_status", "classification_confidence",
+                "uploaded_at", "created_at"
+            ], documents)
+            await self.copy(raw, "extracted_fields", [
+                "id", "document_id", "dossier_id", "field_name", "display_name", "extracted_value", "data_type",
+                "confidence", "status", "original_value", "page_number", "created_at"
+            ], fields)
+            await self.copy(raw, "activity_logs", [
+                "id", "user_id", "action_type", "entity_type", "entity_id", "entity_reference",
+                "metadata", "created_at"
+            ], activities)
+            await self.copy(raw, "invoices", [
+                "id", "dossier_id", "installer_id", "invoice_number", "status", "total_amount", "created_at"
+            ], invoices)
+
+            done = min(chunk_start + args.chunk_size, args.dossiers)
+            elapsed = time.perf_counter() - start
+            print(f"  {done:,}/{args.dossiers:,} dossiers ({done / elapsed:,.0f}/s)", end="\r", flush=True)
+        print()
+
+    async def run(self):
+        engine = get_engine()
+        async with engine.begin() as conn:
+            if self.args.reset:
+                print("Removing previously generated rows...")
+                await self.reset(conn)
+            if self.args.dossiers == 0:
+                return
+            raw = (await conn.get_raw_connection()).driver_connection
+            print("Seeding users, installers and processes...")
+            reference = await self.seed_reference_data(conn, raw)
+
+        # Outside a transaction each COPY batch commits on its own
+        async with engine.connect() as conn:
+            raw = (await conn.get_raw_connection()).driver_connection
+            print(f"Seeding {self.args.dossiers:,} dossiers...")
+            await self.seed_dossiers(raw, *reference)
+
+        async with engine.begin() as conn:
+            for table in self.counts:
+                await conn.execute(text(f"ANALYZE {table}"))
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dossiers", type=int, default=100_000)
+    parser.add_argument("--documents-per-dossier", type=int, default=10)
+    parser.add_argument("--fields-per-document", type=int, default=10)
+    parser.add_argument("--activity-per-dossier", type=int, default=5, help="Mean activity logs per dossier")
+    parser.add_argument("--invoice-ratio", type=float, default=0.3, help="Share of dossiers invoiced")
+    parser.add_argument("--installers", type=int, default=500)
+    parser.add_argument("--validators", type=int, default=50)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of installer/process popularity")
+    parser.add_argument("--days", type=int, default=730, help="Spread of creation dates")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Dossiers per COPY batch")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="Delete previously generated rows first")
+    args = parser.parse_args()
+
+    generator = DatasetGenerator(args)
+    start = time.perf_counter()
+    asyncio.run(generator.run())
+    for table, count in generator.counts.items():
+        print(f"  {table:<18} {count:>12,}")
+    print(f"Done in {time.perf_counter() - start:.0f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Replay hot step query shapes against a seeded database and report index usage.
+
+Each shape mirrors the query a step issues, with parameters sampled from the
+database. The plan of every query is inspected for sequential scans and
+explicit sorts on large relations, which usually point at a missing index.
+
+Usage: python scripts/index_advisor.py [--analyze] [--min-rows 1000] [--json report.json]
+"""
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import select, func, and_
+from app.core.database import get_session_maker
+from app.models.activity_log import ActivityLog
+from app.models.document import Document
+from app.models.dossier import Dossier, DossierStatus
+from app.models.extracted_field import ExtractedField, FieldStatus
+from app.models.feedback import HumanFeedback
+from app.models.invoice import Invoice
+from app.models.validation_result import ValidationResult
+
+
+@dataclass
+class QueryShape:
+    """A query issued by a step, built from sampled parameter values."""
+    name: str
+    step: str
+    build: Callable[[Dict[str, Any]], Any]
+
+
+@dataclass
+class Finding:
+    shape: str
+    step: str
+    total_cost: float
+    node_types: List[str]
+    issues: List[str] = field(default_factory=list)
+    actual_ms: Optional[float] = None
+
+
+SHAPES = [
+    QueryShape("dossiers by installer", "ListDossiers", lambda s: (
+        select(Dossier).where(Dossier.installer_id == s["installer_id"])
+        .order_by(Dossier.created_at.desc()).limit(20)
+    )),
+    QueryShape("dossiers by process", "ListDossiers", lambda s: (
+        select(Dossier).where(Dossier.process_id == s["process_id"])
+        .order_by(Dossier.created_at.desc()).limit(20)
+    )),
+    QueryShape("dossiers by status", "ListDossiers", lambda s: (
+        select(Dossier).where(Dossier.status == DossierStatus.AWAITING_REVIEW)
+        .order_by(Dossier.created_at.desc()).limit(20)
+    )),
+    QueryShape("dossiers by validator and status", "ListDossiers", lambda s: (
+        select(Dossier).where(and_(
+            Dossier.assigned_validator_id == s["user_id"],
+            Dossier.status == DossierStatus.AWAITING_REVIEW
+        )).order_by(Dossier.created_at.desc()).limit(20)
+    )),
+    QueryShape("latest dossiers", "ListDossiers", lambda s: (
+        select(Dossier).order_by(Dossier.created_at.desc()).limit(20)
+    )),
+    QueryShape("documents of dossier", "GetValidationState", lambda s: (
+        select(Document).where(Document.dossier_id == s["dossier_id"])
+    )),
+    QueryShape("validation results of dossier", "GetValidationState", lambda s: (
+        select(ValidationResult).where(ValidationResult.dossier_id == s["dossier_id"])
+    )),
+    QueryShape("unreviewed fields of dossier", "GetExtractedFields", lambda s: (
+        select(ExtractedField).where(and_(
+            ExtractedField.dossier_id == s["dossier_id"],
+            ExtractedField.status == FieldStatus.UNREVIEWED
+        ))
+    )),
+    QueryShape("invoice of dossier", "GenerateInvoice", lambda s: (
+        select(Invoice).where(Invoice.dossier_id == s["dossier_id"])
+    )),
+    QueryShape("invoices by installer", "ListInvoices", lambda s: (
+        select(Invoice).where(Invoice.installer_id == s["installer_id"])
+        .order_by(Invoice.created_at.desc()).limit(20)
+    )),
+    QueryShape("feedback by type", "ListFeedback", lambda s: (
+        select(HumanFeedback).where(HumanFeedback.feedback_type == "field_correction")
+        .order_by(HumanFeedback.created_at.desc()).limit(20)
+    )),
+    QueryShape("feedback of dossier", "ListFeedback", lambda s: (
+        select(HumanFeedback).where(HumanFeedback.dossier_id == s["dossier_id"])
+        .order_by(HumanFeedback.created_at.desc())
+    )),
+    QueryShape("entity timeline", "ListActivities", lambda s: (
+        select(ActivityLog).where(and_(
+            ActivityLog.entity_type == "dossier",
+            ActivityLog.entity_id == s["dossier_id"]
+        )).order_by(ActivityLog.created_at.desc()).limit(50)
+    )),
+    QueryShape("user timeline", "ListActivities", lambda s: (
+        select(ActivityLog).where(ActivityLog.user_id == s["user_id"])
+        .order_by(ActivityLog.created_at.desc()).limit(50)
+    )),
+    QueryShape("dossier count by status", "GetDashboardMetrics", lambda s: (
+        select(Dossier.status, func.count(Dossier.id)).group_by(Dossier.status)
+    )),
+]
+
+
+async def sample_parameters(db) -> Dict[str, Any]:
+    """Pick representative ids from the seeded data."""
+    row = (await db.execute(
+        select(Dossier.id, Dossier.installer_id, Dossier.process_id, Dossier.assigned_validator_id)
+        .where(Dossier.assigned_validator_id.isnot(None))
+        .limit(1)
+    )).first() or (await db.execute(
+        select(Dossier.id, Dossier.installer_id, Dossier.process_id, Dossier.assigned_validator_id).limit(1)
+    )).first()
+    if row is None:
+        raise SystemExit("No dossiers found; seed the database first")
+    return {
+        "dossier_id": row[0],
+        "installer_id": row[1],
+        "process_id": row[2],
+        "user_id": row[3] or row[0],
+    }
+
+
+def walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+def analyze_plan(shape: QueryShape, plan: dict, min_rows: int) -> Finding:
+    root = plan["Plan"]
+    finding = Finding(
+        shape=shape.name,
+        step=shape.step,
+        total_cost=root.get("Total Cost", 0.0),
+        node_types=[node["Node Type"] for node in walk(root)],
+        actual_ms=plan.get("Execution Time"),
+    )
+    for node in walk(root):
+        rows = node.get("Actual Rows", node.get("Plan Rows", 0))
+        if node["Node Type"] == "Seq Scan":
+            filtered = node.get("Rows Removed by Filter", 0)
+            if rows + filtered >= min_rows or (node.get("Filter") and node.get("Total Cost", 0) >= min_rows):
+                finding.issues.append(
+                    f"sequential scan on {node.get('Relation Name')}"
+                    + (f" filtering {node['Filter']}" if node.get("Filter") else "")
+                )
+        elif node["Node Type"] in ("Sort", "Incremental Sort") and rows >= min_rows:
+            finding.issues.append(f"explicit sort of ~{rows} rows on {', '.join(node.get('Sort Key', []))}")
+    return finding
+
+
+async def run(analyze: bool, min_rows: int) -> List[Finding]:
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    findings = []
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        samples = await sample_parameters(db)
+        dialect = db.bind.dialect
+        for shape in SHAPES:
+            statement = shape.build(samples)
+            sql = str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+            conn = await db.connection()
+            plan = (await conn.exec_driver_sql(f"EXPLAIN ({options}) {sql}")).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            findings.append(analyze_plan(shape, plan[0], min_rows))
+        await db.rollback()
+    return findings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--analyze", action="store_true", help="Use EXPLAIN ANALYZE (executes the queries)")
+    parser.add_argument("--min-rows", type=int, default=1000, help="Relation size worth an index")
+    parser.add_argument("--json", dest="json_path", help="Write the report to this file")
+    args = parser.parse_args()
+
+    findings = asyncio.run(run(args.analyze, args.min_rows))
+
+    for finding in findings:
+        status = "WARN" if finding.issues else "ok  "
+        timing = f" {finding.actual_ms:.1f} ms" if finding.actual_ms is not None else ""
+        print(f"[{status}] {finding.step:<20} {finding.shape:<34} cost={finding.total_cost:.0f}{timing}")
+        for issue in finding.issues:
+            print(f"         - {issue}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps([asdict(f) for f in findings], indent=2))
+        print(f"\nReport written to {args.json_path}")
+
+    if any(finding.issues for finding in findings):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Create upcoming activity_logs partitions and archive expired ones.
+
+The API server runs the same maintenance every
+``ACTIVITY_LOG_MAINTENANCE_INTERVAL_HOURS``; this script is for cron jobs or
+one-off runs. Expired partitions are exported to gzipped JSON Lines under
+``archives/activity_logs/`` in storage, then detached and dropped.
+
+Usage: python scripts/maintain_activity_partitions.py [--months-ahead 3] [--retention-months 12] [--list]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import get_session_maker
+from app.services.activity.partitions import list_partitions, maintain_partitions
+
+
+async def show_partitions() -> None:
+    session_maker = get_session_maker()
+    async with session_maker() as db:
+        for partition in await list_partitions(db):
+            print(f"{partition['name']:<28} {partition['bound']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--months-ahead", type=int, help="Defaults to ACTIVITY_LOG_PARTITION_MONTHS_AHEAD")
+    parser.add_argument("--retention-months", type=int,
+                        help="Defaults to ACTIVITY_LOG_RETENTION_MONTHS (0 keeps everything)")
+    parser.add_argument("--list", action="store_true", help="Only list the current partitions")
+    args = parser.parse_args()
+
+    if args.list:
+        asyncio.run(show_partitions())
+        return
+
+    result = asyncio.run(maintain_partitions(args.months_ahead, args.retention_months))
+    if result["skipped"]:
+        print("Maintenance is already running elsewhere; nothing done")
+        return
+    print(f"Created {len(result['created'])} partition(s){': ' + ', '.join(result['created']) if result['created'] else ''}")
+    for archive in result["archived"]:
+        print(f"Archived {archive['partition']}: {archive['rows']:,} rows -> {archive['location']}")
+
+
+if __name__ == "__main__":
+    main()
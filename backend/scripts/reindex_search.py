@@ -0,0 +1,68 @@
+"""Rebuild Typesense collections from the database without downtime.
+
+Each collection is built into a new ``<name>_<timestamp>`` collection, then
+the ``<name>`` alias is switched to it and the previous collection dropped.
+Changes made meanwhile stay in the search outbox and are applied afterwards.
+
+Usage:
+    python scripts/reindex_search.py                 # all collections
+    python scripts/reindex_search.py dossiers
+    python scripts/reindex_search.py --status        # outbox backlog and lag
+    python scripts/reindex_search.py --drain         # apply pending outbox rows now
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import get_session_maker
+from app.services.search import async_typesense_client, search_indexer
+from app.services.search.typesense_client import COLLECTIONS
+
+
+async def run(args) -> None:
+    try:
+        if args.status:
+            session_maker = get_session_maker()
+            async with session_maker() as db:
+                status = await search_indexer.status(db)
+            for name, value in status.items():
+                print(f"{name:<22} {value}")
+            return
+
+        if args.drain:
+            total = 0
+            while True:
+                processed = await search_indexer.run_once()
+                total += processed
+                if processed < search_indexer.batch_size:
+                    break
+            print(f"Applied {total} outbox rows")
+            return
+
+        for collection in args.collections or list(COLLECTIONS):
+            result = await search_indexer.reindex(collection)
+            print(f"{collection}: {result['documents']} documents -> {result['target']} "
+                  f"(previous {result['previous']}) in {result['seconds']}s")
+    finally:
+        await async_typesense_client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("collections", nargs="*", help=f"Collections to rebuild ({', '.join(COLLECTIONS)})")
+    parser.add_argument("--status", action="store_true", help="Show the outbox backlog and indexing lag")
+    parser.add_argument("--drain", action="store_true", help="Apply pending outbox rows and exit")
+    args = parser.parse_args()
+    unknown = set(args.collections) - set(COLLECTIONS)
+    if unknown:
+        parser.error(f"unknown collections: {', '.join(sorted(unknown))}")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()